@@ -6,6 +6,7 @@ from django.utils import timezone
 from apps.gamification.models import Badge, ChildBadge
 from apps.challenges.models import ChallengeAttempt, PlayerRating
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
 
 
 class BadgeAwarder:
@@ -167,5 +168,4 @@ class BadgeAwarder:
 
         # Award bonus points
         if badge.points_bonus > 0:
-            self.child.total_points = (self.child.total_points or 0) + badge.points_bonus
-            self.child.save(update_fields=['total_points'])
+            PointsService.award(self.child, badge.points_bonus, PointsService.Reason.BADGE_BONUS, badge.id)
@@ -11,18 +11,29 @@ Caching Strategy:
    - Stories: Content doesn't change once published
    - Games: Game definitions are static
 
-2. USER PROGRESS (5-15 min TTL) - Redis only:
+2. USER PROGRESS (hours TTL) - Redis only:
    - Child progress: Updates frequently during sessions
-   - SRS word progress: Critical for learning, short cache
+   - SRS word progress: Critical for learning
    - Game history: Recent activity
 
-3. HOMEPAGE DATA (1-5 min TTL) - Redis:
+3. HOMEPAGE DATA (1h TTL) - Redis:
    - Curriculum stats: Aggregated counts
    - Streak/XP: Frequently updated
 
+   Progress and homepage keys embed a per-child generation counter. Any
+   write for a child (SRS review, story progress, points, streaks, badges,
+   levels) bumps it, which orphans every cached entry for that child in
+   O(1) - so these can use long TTLs without serving stale data.
+
 4. API RESPONSE CACHING:
-   - Use @cache_response decorator for expensive queries
-   - Automatic cache invalidation on data changes
+   - Use @cache_response decorator for expensive GET views
+   - Stores rendered bytes + headers, keyed per user/child/tier as declared
+   - Early refresh (XFetch) and single-flight recompute prevent stampedes
+   - ETag / If-None-Match answered with 304
+
+5. WORKER MEMORY (LocalCache) - in front of Redis:
+   - Curriculum lists are also held in a small per-worker LRU
+   - invalidate_language() bumps a version stamp so every worker drops them
 
 Cache Key Patterns:
 ==================
@@ -32,17 +43,30 @@ Cache Key Patterns:
 - curriculum:{lang}:grammar:topics   - Grammar topics
 - curriculum:{lang}:stories          - Stories list
 - curriculum:{lang}:games            - Games list
-- progress:{child_id}:summary        - Child progress summary
-- progress:{child_id}:srs            - SRS due words
-- homepage:{child_id}:stats          - Homepage statistics
+- gen:child:{child_id}                       - Child generation counter
+- progress:{child_id}:g{gen}:summary         - Child progress summary
+- progress:{child_id}:g{gen}:srs[:{theme}]   - SRS due words
+- homepage:{child_id}:g{gen}:{lang}:stats    - Homepage statistics
+- gen:games:{child_id}                       - Game stats generation (GameStatsGeneration)
+- games:stats:{child_id}:g{gen}:{lang|all}   - Per-game session totals
+- resp:{prefix}:{hash}                       - Cached API response
 """
 
 import hashlib
 import logging
+import math
+import random
+import time
+from collections import Counter, defaultdict
 from typing import Any, Optional, Callable
 from functools import wraps
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+from apps.core.local_cache import LocalCache
+from apps.core.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +77,15 @@ class CacheConfig:
     # Static curriculum content - cache for 24 hours
     CURRICULUM_TTL = 86400  # 24 hours
 
-    # User progress - cache for 5 minutes
-    PROGRESS_TTL = 300  # 5 minutes
+    # User progress - invalidated by generation bump, so cache for hours
+    PROGRESS_TTL = 21600  # 6 hours
 
-    # Homepage stats - cache for 1 minute
-    HOMEPAGE_TTL = 60  # 1 minute
+    # Homepage stats - includes date-relative fields (streak is_active)
+    HOMEPAGE_TTL = 3600  # 1 hour
 
-    # SRS due words - cache for 2 minutes (needs to be fresh)
-    SRS_TTL = 120  # 2 minutes
+    # SRS due words - words fall due as time passes with no write to bump
+    # the generation, so this bounds how late a newly due word can appear
+    SRS_TTL = 600  # 10 minutes
 
     # Game sessions - cache for 10 minutes
     GAME_TTL = 600  # 10 minutes
@@ -69,87 +94,111 @@ class CacheConfig:
 class CurriculumCacheService:
     """Cache service for curriculum content."""
 
+    # Per-worker tier in front of Redis, scoped by language
+    _local = LocalCache(
+        'curriculum',
+        max_bytes=getattr(settings, 'LOCAL_CACHE_CURRICULUM_BYTES', 8 * 1024 * 1024),
+        ttl=300,
+    )
+
     @classmethod
     def _make_key(cls, *parts: str) -> str:
         """Generate cache key from parts."""
         return ":".join(["curriculum"] + list(parts))
 
+    @classmethod
+    def _get(cls, key: str, scope: str) -> Optional[Any]:
+        """Read from worker memory, then Redis (filling memory on a hit)."""
+        value = cls._local.get(key, scope=scope)
+        if value is not None:
+            return value
+        value = cache.get(key)
+        if value is not None:
+            cls._local.set(key, value, scope=scope)
+        return value
+
+    @classmethod
+    def _set(cls, key: str, value: Any, scope: str) -> None:
+        """Write to Redis and worker memory."""
+        cache.set(key, value, CacheConfig.CURRICULUM_TTL)
+        cls._local.set(key, value, scope=scope)
+
     @classmethod
     def get_scripts(cls, language: str) -> Optional[list]:
         """Get cached scripts for a language."""
         key = cls._make_key(language, "scripts")
-        return cache.get(key)
+        return cls._get(key, scope=language)
 
     @classmethod
     def set_scripts(cls, language: str, scripts: list) -> None:
         """Cache scripts for a language."""
         key = cls._make_key(language, "scripts")
-        cache.set(key, scripts, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, scripts, scope=language)
         logger.debug(f"Cached scripts for {language}")
 
     @classmethod
     def get_vocab_themes(cls, language: str) -> Optional[list]:
         """Get cached vocabulary themes."""
         key = cls._make_key(language, "vocab", "themes")
-        return cache.get(key)
+        return cls._get(key, scope=language)
 
     @classmethod
     def set_vocab_themes(cls, language: str, themes: list) -> None:
         """Cache vocabulary themes."""
         key = cls._make_key(language, "vocab", "themes")
-        cache.set(key, themes, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, themes, scope=language)
         logger.debug(f"Cached {len(themes)} vocab themes for {language}")
 
     @classmethod
     def get_vocab_words(cls, theme_id: str) -> Optional[list]:
         """Get cached vocabulary words for a theme."""
         key = cls._make_key("vocab", "words", theme_id)
-        return cache.get(key)
+        return cls._get(key, scope="vocab_words")
 
     @classmethod
     def set_vocab_words(cls, theme_id: str, words: list) -> None:
         """Cache vocabulary words for a theme."""
         key = cls._make_key("vocab", "words", theme_id)
-        cache.set(key, words, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, words, scope="vocab_words")
         logger.debug(f"Cached {len(words)} words for theme {theme_id}")
 
     @classmethod
     def get_grammar_topics(cls, language: str) -> Optional[list]:
         """Get cached grammar topics."""
         key = cls._make_key(language, "grammar", "topics")
-        return cache.get(key)
+        return cls._get(key, scope=language)
 
     @classmethod
     def set_grammar_topics(cls, language: str, topics: list) -> None:
         """Cache grammar topics."""
         key = cls._make_key(language, "grammar", "topics")
-        cache.set(key, topics, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, topics, scope=language)
         logger.debug(f"Cached {len(topics)} grammar topics for {language}")
 
     @classmethod
     def get_stories(cls, language: str) -> Optional[list]:
         """Get cached stories."""
         key = cls._make_key(language, "stories")
-        return cache.get(key)
+        return cls._get(key, scope=language)
 
     @classmethod
     def set_stories(cls, language: str, stories: list) -> None:
         """Cache stories."""
         key = cls._make_key(language, "stories")
-        cache.set(key, stories, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, stories, scope=language)
         logger.debug(f"Cached {len(stories)} stories for {language}")
 
     @classmethod
     def get_games(cls, language: str) -> Optional[list]:
         """Get cached games."""
         key = cls._make_key(language, "games")
-        return cache.get(key)
+        return cls._get(key, scope=language)
 
     @classmethod
     def set_games(cls, language: str, games: list) -> None:
         """Cache games."""
         key = cls._make_key(language, "games")
-        cache.set(key, games, CacheConfig.CURRICULUM_TTL)
+        cls._set(key, games, scope=language)
         logger.debug(f"Cached {len(games)} games for {language}")
 
     @classmethod
@@ -163,16 +212,66 @@ class CurriculumCacheService:
             cls._make_key(language, "games"),
         ]
         cache.delete_many(keys)
+        cls._local.invalidate(language)
         logger.info(f"Invalidated curriculum cache for {language}")
 
 
+class ChildCacheGeneration:
+    """
+    Per-child generation counter folded into progress and homepage keys.
+
+    Counters start at the current time in microseconds rather than 1, so a
+    counter evicted from Redis comes back larger than before and can't make
+    old entries valid again. Subclasses with their own PREFIX version a
+    narrower set of entries.
+    """
+
+    PREFIX = "gen:child"
+
+    @classmethod
+    def _key(cls, child_id: str) -> str:
+        return f"{cls.PREFIX}:{child_id}"
+
+    @classmethod
+    def get(cls, child_id: str) -> int:
+        """Current generation for a child (initialized on first use)."""
+        key = cls._key(child_id)
+        generation = cache.get(key)
+        if generation is None:
+            cache.add(key, time.time_ns() // 1000, None)
+            generation = cache.get(key)
+        return generation
+
+    @classmethod
+    def bump(cls, child_id: str) -> None:
+        """
+        Invalidate every cached entry for a child.
+
+        Deferred until the surrounding transaction commits, so a concurrent
+        read can't cache pre-commit data under the new generation.
+        """
+        transaction.on_commit(lambda: cls._incr(str(child_id)))
+
+    @classmethod
+    def _incr(cls, child_id: str) -> None:
+        key = cls._key(child_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Counter missing or evicted - restart above any previous value
+            cache.add(key, time.time_ns() // 1000, None)
+        except Exception as e:
+            logger.warning(f"Failed to bump cache generation for child {child_id}: {e}")
+
+
 class ProgressCacheService:
     """Cache service for user progress data."""
 
     @classmethod
-    def _make_key(cls, *parts: str) -> str:
-        """Generate cache key from parts."""
-        return ":".join(["progress"] + list(parts))
+    def _make_key(cls, child_id: str, *parts: str) -> str:
+        """Generate generation-stamped cache key from parts."""
+        generation = ChildCacheGeneration.get(child_id)
+        return ":".join(["progress", str(child_id), f"g{generation}"] + list(parts))
 
     @classmethod
     def get_child_summary(cls, child_id: str) -> Optional[dict]:
@@ -189,27 +288,25 @@ class ProgressCacheService:
     @classmethod
     def get_srs_due(cls, child_id: str, theme_id: str = None) -> Optional[list]:
         """Get cached SRS due words."""
-        parts = [child_id, "srs"]
+        parts = ["srs"]
         if theme_id:
-            parts.append(theme_id)
-        key = cls._make_key(*parts)
+            parts.append(str(theme_id))
+        key = cls._make_key(child_id, *parts)
         return cache.get(key)
 
     @classmethod
     def set_srs_due(cls, child_id: str, due_words: list, theme_id: str = None) -> None:
         """Cache SRS due words."""
-        parts = [child_id, "srs"]
+        parts = ["srs"]
         if theme_id:
-            parts.append(theme_id)
-        key = cls._make_key(*parts)
+            parts.append(str(theme_id))
+        key = cls._make_key(child_id, *parts)
         cache.set(key, due_words, CacheConfig.SRS_TTL)
 
     @classmethod
     def invalidate_child_progress(cls, child_id: str) -> None:
-        """Invalidate all progress cache for a child."""
-        # Note: In production, use Redis KEYS pattern or maintain a key registry
-        key = cls._make_key(child_id, "summary")
-        cache.delete(key)
+        """Invalidate all progress (and homepage) cache for a child."""
+        ChildCacheGeneration.bump(child_id)
         logger.debug(f"Invalidated progress cache for child {child_id}")
 
 
@@ -218,8 +315,9 @@ class HomepageCacheService:
 
     @classmethod
     def _make_key(cls, child_id: str, *parts: str) -> str:
-        """Generate cache key from parts."""
-        return ":".join(["homepage", child_id] + list(parts))
+        """Generate generation-stamped cache key from parts."""
+        generation = ChildCacheGeneration.get(child_id)
+        return ":".join(["homepage", str(child_id), f"g{generation}"] + list(parts))
 
     @classmethod
     def get_stats(cls, child_id: str, language: str) -> Optional[dict]:
@@ -235,48 +333,179 @@ class HomepageCacheService:
 
     @classmethod
     def invalidate_child(cls, child_id: str) -> None:
-        """Invalidate homepage cache for a child."""
-        # Will be re-fetched on next request
-        pass
+        """Invalidate homepage (and progress) cache for a child."""
+        ChildCacheGeneration.bump(child_id)
+
+
+# Per-worker cache_response counters: {key_prefix: Counter(hit/miss/refresh/not_modified)}
+_response_metrics = defaultdict(Counter)
 
+# Response headers never replayed from the cache
+_UNCACHED_HEADERS = {'set-cookie', 'content-length', 'date'}
+
+
+def response_cache_stats() -> dict:
+    """Hit/miss counters for cache_response in this worker."""
+    stats = {}
+    for prefix, counts in _response_metrics.items():
+        lookups = counts['hit'] + counts['miss']
+        stats[prefix] = dict(counts, hit_rate=round(counts['hit'] / lookups, 4) if lookups else 0.0)
+    return stats
 
-def cache_response(ttl: int = 300, key_prefix: str = "api"):
+
+def _response_cache_key(request, key_prefix, vary, vary_headers, args, kwargs) -> str:
+    parts = [
+        request.path,
+        str(args),
+        str(sorted(kwargs.items())),
+        str(sorted(request.query_params.items())),
+    ]
+    user = getattr(request, 'user', None)
+    # A child id alone is guessable - always scope it to the owning user
+    if 'user' in vary or 'child' in vary:
+        parts.append(f"user={getattr(user, 'pk', None)}")
+    if 'child' in vary:
+        child_id = kwargs.get('child_id') or request.query_params.get('child_id', '')
+        parts.append(f"child={child_id}")
+    if 'tier' in vary:
+        parts.append(f"tier={getattr(user, 'subscription_tier', '')}")
+    for header in vary_headers:
+        parts.append(f"{header}={request.headers.get(header, '')}")
+
+    digest = hashlib.md5(":".join(parts).encode()).hexdigest()
+    return f"resp:{key_prefix}:{digest}"
+
+
+def _etag_matches(request, etag: str) -> bool:
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    for candidate in header.split(','):
+        if candidate.strip().removeprefix('W/') in (etag, '*'):
+            return True
+    return False
+
+
+def _response_from_entry(request, entry: dict, cache_status: str) -> HttpResponse:
+    """Rebuild a response from cached bytes (or a 304 if the client has it)."""
+    if _etag_matches(request, entry['etag']):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(entry['body'], status=entry['status'])
+        for header, value in entry['headers']:
+            response[header] = value
+    response['ETag'] = entry['etag']
+    response['X-Cache'] = cache_status
+    return response
+
+
+def _render_and_store(view, request, response, cache_key, ttl, started, args, kwargs) -> Optional[dict]:
+    """Render a fresh 200 response and store its bytes; returns the entry."""
+    if getattr(response, 'status_code', None) != 200:
+        return None
+
+    if hasattr(response, 'render') and not getattr(response, 'is_rendered', True):
+        # DRF Response: pick the negotiated renderer now so we can cache bytes
+        view.finalize_response(request, response, *args, **kwargs)
+        response.render()
+
+    body = response.content
+    now = time.time()
+    entry = {
+        'body': body,
+        'status': response.status_code,
+        'headers': [
+            (header, value) for header, value in response.items()
+            if header.lower() not in _UNCACHED_HEADERS
+        ],
+        'etag': f'"{hashlib.md5(body).hexdigest()}"',
+        'delta': now - started,  # recompute cost, used by XFetch
+        'expiry': now + ttl,
+    }
+    cache.set(cache_key, entry, ttl)
+    response['ETag'] = entry['etag']
+    return entry
+
+
+def cache_response(
+    ttl: int = 300,
+    key_prefix: str = "api",
+    vary: tuple = (),
+    vary_headers: tuple = ('Accept', 'Accept-Language'),
+    beta: float = 1.0,
+):
     """
-    Decorator to cache API response.
+    Decorator to cache GET responses of an APIView/ViewSet method.
+
+    Caches rendered bytes and headers (never a pickled Response). The key
+    covers path, URL kwargs, query params and `vary_headers`, plus:
+        vary=('user',)   - per authenticated user
+        vary=('child',)  - per child_id (URL kwarg or query param), scoped to user
+        vary=('tier',)   - per subscription tier
+    Only use an empty `vary` when the response is the same for every caller
+    who passes the view's permission checks.
+
+    Entries are refreshed early with probability rising as they near expiry
+    (XFetch, weighted by `beta` and how long the view took), by a single
+    request holding a lock while the rest keep serving the cached copy. Cold
+    misses are coalesced with SingleFlight.
 
     Usage:
-        @cache_response(ttl=300, key_prefix="scripts")
-        def get(self, request, child_id):
+        @cache_response(ttl=300, key_prefix="scripts", vary=('user',))
+        def get(self, request, child_id=None):
             ...
     """
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(self, request, *args, **kwargs):
-            # Build cache key from request
-            cache_key_parts = [
-                key_prefix,
-                request.path,
-                str(args),
-                str(sorted(request.query_params.items())),
-            ]
-            cache_key = hashlib.md5(
-                ":".join(cache_key_parts).encode()
-            ).hexdigest()
-
-            # Check cache
-            cached = cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache hit: {key_prefix}")
-                return cached
-
-            # Execute function
-            response = func(self, request, *args, **kwargs)
-
-            # Cache successful responses
-            if hasattr(response, 'status_code') and response.status_code == 200:
-                cache.set(cache_key, response, ttl)
-                logger.debug(f"Cached: {key_prefix}")
-
+            if request.method not in ('GET', 'HEAD'):
+                return func(self, request, *args, **kwargs)
+
+            metrics = _response_metrics[key_prefix]
+            cache_key = _response_cache_key(request, key_prefix, vary, vary_headers, args, kwargs)
+
+            def compute():
+                started = time.time()
+                response = func(self, request, *args, **kwargs)
+                entry = _render_and_store(self, request, response, cache_key, ttl, started, args, kwargs)
+                return response, entry
+
+            entry = cache.get(cache_key)
+            if entry is not None:
+                # XFetch: -delta * beta * log(rand) grows as expiry approaches
+                early = entry['delta'] * beta * -math.log(random.random() or 1e-12)
+                if time.time() + early < entry['expiry']:
+                    metrics['hit'] += 1
+                    return _response_from_entry(request, entry, 'HIT')
+
+                flight = SingleFlight(cache_key, lock_ttl=max(30, int(entry['delta'] * 4)))
+                if not flight.acquire():
+                    # Someone else is refreshing - keep serving the cached copy
+                    metrics['hit'] += 1
+                    return _response_from_entry(request, entry, 'HIT')
+                try:
+                    response, new_entry = compute()
+                finally:
+                    flight.release()
+                metrics['refresh'] += 1
+            else:
+                metrics['miss'] += 1
+
+                def fetch_leader_result():
+                    published = cache.get(cache_key)
+                    return (None, published) if published is not None else None
+
+                response, new_entry = SingleFlight(cache_key).run(
+                    compute=compute, fetch=fetch_leader_result
+                )
+
+            if response is None:
+                # Follower: the leader published the entry
+                return _response_from_entry(request, new_entry, 'HIT')
+            if new_entry and _etag_matches(request, new_entry['etag']):
+                metrics['not_modified'] += 1
+                return _response_from_entry(request, new_entry, 'MISS')
+            response['X-Cache'] = 'MISS'
             return response
         return wrapper
     return decorator
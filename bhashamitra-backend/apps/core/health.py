@@ -14,6 +14,10 @@ from django.utils import timezone
 import time
 import logging
 
+from apps.core.cache_service import response_cache_stats
+from apps.core.local_cache import local_cache_stats
+from apps.core.provider_http import circuit_breaker_stats
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +95,9 @@ def detailed_health_check(request):
     checks['cache'] = check_cache()
     checks['cache']['latency_ms'] = round((time.time() - cache_start) * 1000, 2)
 
+    # Per-worker cache tiers (no I/O, always healthy)
+    local_tiers = local_cache_stats()
+
     # Overall status
     all_healthy = all(c['healthy'] for c in checks.values())
 
@@ -99,6 +106,9 @@ def detailed_health_check(request):
         'timestamp': timezone.now().isoformat(),
         'version': get_version(),
         'checks': checks,
+        'local_cache': local_tiers,
+        'response_cache': response_cache_stats(),
+        'provider_circuits': circuit_breaker_stats(),
     })
 
 
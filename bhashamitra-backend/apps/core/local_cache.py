@@ -0,0 +1,200 @@
+"""
+Bounded in-process cache tier in front of django.core.cache (Redis).
+
+A handful of values - the ~50 alphabet clips, theme lists, scripts - are
+requested by every child on every session. Serving them from worker memory
+saves a Redis round-trip each time.
+
+- Size-bounded in bytes (not entries), evicting least recently used.
+  Values larger than `max_item_bytes` are never admitted so one long story
+  page can't flush the hot set.
+- Entries carry a scope version stamp. `invalidate(scope)` bumps the stamp
+  in the shared cache; other workers notice within
+  `version_check_interval` seconds and drop their stale copies. Stamps
+  start at the current time in microseconds (like ChildCacheGeneration),
+  so a stamp evicted from Redis comes back larger than before and can't
+  revalidate old entries.
+- Hit/miss/eviction counters for monitoring (see local_cache_stats()).
+
+Values are returned by reference, not copied - treat them as read-only.
+
+Usage:
+    tier = LocalCache('curriculum', max_bytes=8 * 1024 * 1024)
+    value = tier.get(key, scope='HINDI')
+    tier.set(key, value, scope='HINDI')
+    tier.invalidate('HINDI')
+"""
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# All tiers in this process, for stats and test cleanup
+_registry: Dict[str, 'LocalCache'] = {}
+
+
+class LocalCache:
+    """Thread-safe, byte-bounded LRU with cross-worker version invalidation."""
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        max_item_bytes: Optional[int] = None,
+        ttl: float = 300,
+        version_check_interval: float = 2.0,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes or max_bytes // 8
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+
+        # key -> (value, size, scope, version, expires_at)
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._versions: Dict[str, tuple] = {}  # scope -> (version, checked_at)
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+
+        _registry[name] = self
+
+    def _version_key(self, scope: str) -> str:
+        return f"localcache:version:{self.name}:{scope}"
+
+    def _current_version(self, scope: str) -> int:
+        """Scope version, re-read from the shared cache at most every interval."""
+        now = time.monotonic()
+        known = self._versions.get(scope)
+        if known and now - known[1] < self.version_check_interval:
+            return known[0]
+        try:
+            version_key = self._version_key(scope)
+            version = cache.get(version_key)
+            if version is None:
+                cache.add(version_key, self._seed_version(), None)
+                version = cache.get(version_key) or 0
+        except Exception as e:
+            logger.warning(f"Local cache {self.name}: version check failed: {e}")
+            version = known[0] if known else 0
+        self._versions[scope] = (version, now)
+        return version
+
+    @staticmethod
+    def _seed_version() -> int:
+        return time.time_ns() // 1000
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value)
+        try:
+            return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return 0
+
+    def get(self, key: str, scope: str = 'default') -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry/stale version."""
+        version = self._current_version(scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, size, entry_scope, entry_version, expires_at = entry
+            if entry_version != version or entry_scope != scope or expires_at < time.monotonic():
+                self._remove(key)
+                self.stale += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, scope: str = 'default') -> bool:
+        """Admit a value; returns False if it is too large for this tier."""
+        if value is None:
+            return False
+        size = self._sizeof(value)
+        if not size or size > self.max_item_bytes:
+            return False
+        version = self._current_version(scope)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, scope, version, time.monotonic() + self.ttl)
+            self._size += size
+            while self._size > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry (caller holds the lock)."""
+        _, size, _, _, _ = self._entries.pop(key)
+        self._size -= size
+
+    def invalidate(self, scope: str = 'default') -> None:
+        """Invalidate a scope in this worker and, via the version stamp, all others."""
+        version_key = self._version_key(scope)
+        try:
+            seed = self._seed_version()
+            if not cache.add(version_key, seed, None):
+                version = cache.incr(version_key)
+            else:
+                version = seed
+        except Exception as e:
+            logger.warning(f"Local cache {self.name}: version bump failed: {e}")
+            version = self._versions.get(scope, (0, 0))[0] + 1
+        self._versions[scope] = (version, time.monotonic())
+
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry[2] == scope]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry in this worker (version stamps are left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        self._versions.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'stale': self.stale,
+        }
+
+
+def local_cache_stats() -> dict:
+    """Stats for every local cache tier in this worker."""
+    return {name: tier.stats() for name, tier in _registry.items()}
+
+
+def clear_local_caches() -> None:
+    """Empty every local tier in this worker (tests, management commands)."""
+    for tier in _registry.values():
+        tier.clear()
@@ -0,0 +1,190 @@
+"""
+Pooled HTTP sessions and circuit breakers for external providers.
+
+Every TTS/STT call used to go through bare ``requests.post``, paying a new
+TCP+TLS handshake each time, and the fallback chains kept retrying a
+provider that had been down for minutes. This module gives each provider:
+
+- a keep-alive ``requests.Session`` with its own connection pool and a
+  default timeout (``provider_request``)
+- a ``CircuitBreaker`` kept in the Django cache, so every gunicorn worker
+  shares the same view of provider health
+
+Breaker states:
+    closed    - requests flow; failures are counted in a rolling window
+    open      - FAILURE_THRESHOLD failures in the window; provider is skipped
+                for RECOVERY_TIMEOUT seconds
+    half_open - recovery timeout elapsed; one probe request is let through.
+                Success closes the breaker, failure re-opens it.
+
+Only transport errors, 5xx and 429 count as failures - a 400 for one bad
+input says nothing about provider health.
+
+Usage:
+    breaker = CircuitBreaker.get('google_tts')
+    if breaker.allow_request():
+        response = provider_request('google_tts', 'POST', url, json=payload)
+"""
+import logging
+import threading
+import time
+from typing import Dict
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Cache-backed circuit breaker for one provider."""
+
+    KEY_PREFIX = "circuit"
+
+    # How long a half-open probe may take before another caller may probe
+    PROBE_TIMEOUT = 60
+
+    _instances: Dict[str, 'CircuitBreaker'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, name: str, failure_threshold: int = None, recovery_timeout: int = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or getattr(
+            settings, 'PROVIDER_CIRCUIT_FAILURE_THRESHOLD', 5
+        )
+        self.recovery_timeout = recovery_timeout or getattr(
+            settings, 'PROVIDER_CIRCUIT_RECOVERY_TIMEOUT', 30
+        )
+        self._failures_key = f"{self.KEY_PREFIX}:{name}:failures"
+        self._open_until_key = f"{self.KEY_PREFIX}:{name}:open_until"
+        self._probe_key = f"{self.KEY_PREFIX}:{name}:probe"
+
+    @classmethod
+    def get(cls, name: str) -> 'CircuitBreaker':
+        """Shared breaker instance for a provider name."""
+        if name not in cls._instances:
+            with cls._instances_lock:
+                cls._instances.setdefault(name, cls(name))
+        return cls._instances[name]
+
+    @property
+    def state(self) -> str:
+        try:
+            open_until = cache.get(self._open_until_key)
+        except Exception:
+            return 'closed'
+        if open_until is None:
+            return 'closed'
+        return 'open' if time.time() < open_until else 'half_open'
+
+    def allow_request(self) -> bool:
+        """Whether the provider should be tried now (claims the half-open probe)."""
+        state = self.state
+        if state == 'closed':
+            return True
+        if state == 'open':
+            logger.info(f"Circuit open for {self.name}, skipping provider")
+            return False
+        try:
+            # One caller probes; the rest keep skipping until it reports back
+            return bool(cache.add(self._probe_key, 1, self.PROBE_TIMEOUT))
+        except Exception:
+            return True
+
+    def record_success(self) -> None:
+        try:
+            # Healthy steady state costs one read, no writes
+            current = cache.get_many([self._failures_key, self._open_until_key])
+            if not current:
+                return
+            if self._open_until_key in current:
+                logger.info(f"Circuit closed for {self.name}")
+            cache.delete_many([self._failures_key, self._open_until_key, self._probe_key])
+        except Exception as e:
+            logger.warning(f"Circuit breaker update failed for {self.name}: {e}")
+
+    def record_failure(self) -> None:
+        try:
+            if self.state == 'half_open':
+                self._open()
+                return
+
+            # Rolling window: the counter expires recovery_timeout after the first failure
+            if cache.add(self._failures_key, 1, self.recovery_timeout):
+                failures = 1
+            else:
+                failures = cache.incr(self._failures_key)
+            if failures >= self.failure_threshold:
+                self._open()
+        except Exception as e:
+            logger.warning(f"Circuit breaker update failed for {self.name}: {e}")
+
+    def _open(self) -> None:
+        # Keep the marker past the deadline so the half-open state is observable
+        cache.set(
+            self._open_until_key,
+            time.time() + self.recovery_timeout,
+            self.recovery_timeout + self.PROBE_TIMEOUT,
+        )
+        cache.delete_many([self._failures_key, self._probe_key])
+        logger.warning(
+            f"Circuit opened for {self.name} for {self.recovery_timeout}s"
+        )
+
+    def reset(self) -> None:
+        cache.delete_many([self._failures_key, self._open_until_key, self._probe_key])
+
+
+# Per-provider sessions; requests.Session is safe to share across threads
+# for plain request/response use like ours
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+DEFAULT_TIMEOUT = 30
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 10
+
+
+def provider_session(name: str) -> requests.Session:
+    """Keep-alive session with a connection pool dedicated to one provider."""
+    session = _sessions.get(name)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(name)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=getattr(settings, 'PROVIDER_HTTP_POOL_MAXSIZE', POOL_MAXSIZE),
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _sessions[name] = session
+    return session
+
+
+def provider_request(name: str, method: str, url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+    """
+    Send a request over the provider's pooled session and record its outcome.
+
+    Raises requests.RequestException exactly like requests.request would.
+    """
+    breaker = CircuitBreaker.get(name)
+    try:
+        response = provider_session(name).request(method, url, timeout=timeout, **kwargs)
+    except requests.RequestException:
+        breaker.record_failure()
+        raise
+
+    if response.status_code >= 500 or response.status_code == 429:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def circuit_breaker_stats() -> dict:
+    """States of every breaker used by this process (for health checks)."""
+    return {name: breaker.state for name, breaker in CircuitBreaker._instances.items()}
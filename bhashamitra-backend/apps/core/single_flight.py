@@ -0,0 +1,125 @@
+"""
+Distributed single-flight helper built on the Django cache.
+
+When many requests miss the same cache entry at once, only one of them
+(the "leader") should do the expensive work. The others ("followers")
+wait for the leader to publish its result and reuse it.
+
+The lock is a plain cache key claimed with ``cache.add`` (SETNX on Redis),
+so it works across gunicorn workers and hosts sharing the same cache, and
+degrades to per-process behaviour on LocMemCache.
+
+Usage:
+    flight = SingleFlight(f"tts:{cache_key}", lock_ttl=60, wait_timeout=20)
+    result = flight.run(
+        compute=lambda: expensive_call(),
+        fetch=lambda: cache.get(result_key),
+    )
+"""
+import logging
+import time
+import uuid
+from typing import Callable, Optional, TypeVar
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesce concurrent computations of the same key into one."""
+
+    LOCK_PREFIX = "singleflight:lock"
+
+    # Defaults (seconds)
+    DEFAULT_LOCK_TTL = 30
+    DEFAULT_WAIT_TIMEOUT = 15
+    DEFAULT_POLL_INTERVAL = 0.2
+
+    def __init__(
+        self,
+        key: str,
+        lock_ttl: int = DEFAULT_LOCK_TTL,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.key = key
+        self.lock_key = f"{self.LOCK_PREFIX}:{key}"
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._token = uuid.uuid4().hex
+
+    def acquire(self) -> bool:
+        """Try to become the leader for this key."""
+        try:
+            return bool(cache.add(self.lock_key, self._token, self.lock_ttl))
+        except Exception as e:
+            # If the cache is down, behave as if there were no coordination
+            logger.warning(f"Single-flight lock unavailable for {self.key}: {e}")
+            return True
+
+    def release(self) -> None:
+        """Release the lock if we still own it."""
+        try:
+            if cache.get(self.lock_key) == self._token:
+                cache.delete(self.lock_key)
+        except Exception as e:
+            logger.warning(f"Failed to release single-flight lock {self.key}: {e}")
+
+    def is_locked(self) -> bool:
+        """Check whether some leader currently holds the lock."""
+        try:
+            return cache.get(self.lock_key) is not None
+        except Exception:
+            return False
+
+    def run(
+        self,
+        compute: Callable[[], T],
+        fetch: Callable[[], Optional[T]],
+    ) -> T:
+        """
+        Run ``compute`` once across all concurrent callers.
+
+        Args:
+            compute: Does the expensive work. Must publish its result somewhere
+                ``fetch`` can see it (e.g. write the cache) before returning.
+            fetch: Cheap lookup of the leader's published result. Returns None
+                while the result is not yet available.
+
+        Returns:
+            The leader's result (for the leader) or the fetched result (for
+            followers). If the wait times out or the leader gives up without
+            publishing, the follower computes the value itself.
+        """
+        if self.acquire():
+            try:
+                return compute()
+            finally:
+                self.release()
+
+        logger.debug(f"Single-flight follower waiting on {self.key}")
+        deadline = time.monotonic() + self.wait_timeout
+
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+
+            result = fetch()
+            if result is not None:
+                return result
+
+            # Leader finished (or died) without publishing - take over
+            if not self.is_locked() and self.acquire():
+                try:
+                    return compute()
+                finally:
+                    self.release()
+
+        logger.warning(
+            f"Single-flight wait timed out after {self.wait_timeout}s for {self.key}, "
+            f"computing locally"
+        )
+        return compute()
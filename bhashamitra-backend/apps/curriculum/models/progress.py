@@ -124,17 +124,28 @@ class LessonProgress(TimeStampedModel):
     def __str__(self):
         return f"{self.child.name} - {self.lesson.code}"
 
-    def update_progress(self, score):
-        """Update lesson progress with new score."""
+    def update_progress(self, score, completed_at=None, commit=True):
+        """
+        Update lesson progress with new score.
+
+        Returns True when this score completed the lesson. With
+        commit=False nothing is saved and module progress is left to the
+        caller (bulk sync).
+        """
         self.attempts += 1
         self.score = score
         self.best_score = max(self.best_score, score)
 
         # Check if mastered
-        if score >= self.lesson.mastery_threshold and not self.is_complete:
+        newly_complete = score >= self.lesson.mastery_threshold and not self.is_complete
+        if newly_complete:
             self.is_complete = True
-            self.completed_at = timezone.now()
+            self.completed_at = completed_at or timezone.now()
+
+        if not commit:
+            return newly_complete
 
+        if newly_complete:
             # Update module progress
             module_progress, _ = ModuleProgress.objects.get_or_create(
                 child=self.child,
@@ -145,3 +156,4 @@ class LessonProgress(TimeStampedModel):
             module_progress.save(update_fields=['lessons_completed', 'total_points', 'updated_at'])
 
         self.save()
+        return newly_complete
@@ -95,13 +95,17 @@ class WordProgress(TimeStampedModel):
         db_table = 'word_progress'
         unique_together = ['child', 'word']
 
-    def update_srs(self, quality: int):
+    def update_srs(self, quality: int, reviewed_at=None, commit: bool = True):
         """
         Update SRS using SM-2 algorithm.
         quality: 0-5 (0=blackout, 3=correct with difficulty, 5=perfect)
+
+        reviewed_at backdates a review made offline; commit=False leaves
+        saving to the caller (bulk sync).
         """
+        reviewed_at = reviewed_at or timezone.now()
         self.times_reviewed += 1
-        self.last_reviewed = timezone.now()
+        self.last_reviewed = reviewed_at
 
         if quality >= 3:
             self.times_correct += 1
@@ -118,16 +122,17 @@ class WordProgress(TimeStampedModel):
 
         # Update ease factor (min 1.3)
         self.ease_factor = max(1.3, self.ease_factor + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)))
-        self.next_review = timezone.now() + timedelta(days=self.interval_days)
-        self.save()
+        self.next_review = reviewed_at + timedelta(days=self.interval_days)
 
         # Check mastery
         if self.interval_days > 21 and self.times_reviewed >= 5:
             accuracy = (self.times_correct / self.times_reviewed) * 100
             if accuracy >= 90 and not self.mastered:
                 self.mastered = True
-                self.mastered_at = timezone.now()
-                self.save()
+                self.mastered_at = reviewed_at
+
+        if commit:
+            self.save()
 
     @property
     def accuracy(self) -> float:
@@ -3,10 +3,12 @@ from .srs_service import SRSService
 from .assessment_service import AssessmentService
 from .alphabet_service import AlphabetService
 from .game_service import GameService
+from .game_analytics import GameAnalyticsService
 
 __all__ = [
     'SRSService',
     'AssessmentService',
     'AlphabetService',
     'GameService',
+    'GameAnalyticsService',
 ]
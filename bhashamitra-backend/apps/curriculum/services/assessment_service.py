@@ -7,6 +7,7 @@ from apps.curriculum.models.assessment import (
     Assessment, AssessmentQuestion, AssessmentAttempt, Certificate
 )
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
 
 
 class AssessmentService:
@@ -139,19 +140,22 @@ class AssessmentService:
         attempt.skill_breakdown = skill_scores
         attempt.save()
 
-        # Award points to child
+        # Award points to child (the award may already raise the level)
+        old_level = attempt.child.level
         if passed:
             points_earned = int(total_score * 0.5)  # 50% of score as points
-            attempt.child.total_points += points_earned
-            attempt.child.save(update_fields=['total_points'])
+            PointsService.award(
+                attempt.child, points_earned, PointsService.Reason.ASSESSMENT_PASSED, attempt.assessment_id
+            )
 
         # Generate certificate if passed level-up assessment
         certificate = None
         if passed and attempt.assessment.assessment_type == 'LEVEL_UP':
             certificate = AssessmentService.generate_certificate(attempt)
-            # Level up the child
-            if attempt.child.level < 5:
-                attempt.child.level += 1
+            # Level up the child: one level past where they started, unless
+            # the points award above already promoted them further
+            if old_level < 5 and attempt.child.level < old_level + 1:
+                attempt.child.level = old_level + 1
                 attempt.child.save(update_fields=['level'])
 
         return {
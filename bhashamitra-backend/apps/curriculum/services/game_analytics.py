@@ -0,0 +1,112 @@
+"""
+Game analytics.
+
+Per-child game stats come from one grouped aggregate over GameSession (a
+row per game the child has played, with that game's name), so memory and
+latency follow the number of distinct games, not the number of sessions.
+
+The per-game totals are cached per child (and per language) under a
+per-child stats generation. Any GameSession save or delete (game play,
+admin edits, cascades) bumps the generation after commit, so the next read
+recomputes with the grouped query. A read that raced the commit can only
+cache under the old generation, which no later read uses.
+"""
+import logging
+from typing import Dict, Optional
+
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+
+from apps.core.cache_service import CacheConfig, ChildCacheGeneration
+from apps.curriculum.models.games import GameSession
+
+logger = logging.getLogger(__name__)
+
+# Summed per game; 'sessions' counts rows
+STAT_FIELDS = ('sessions', 'points', 'time', 'score', 'correct', 'attempted', 'completed')
+
+
+class GameStatsGeneration(ChildCacheGeneration):
+    """Per-child generation for cached game stats only."""
+
+    PREFIX = "gen:games"
+
+
+class GameAnalyticsService:
+    """Aggregate and cache per-child game statistics."""
+
+    ALL_LANGUAGES = 'all'
+
+    @classmethod
+    def _key(cls, child_id: str, language: Optional[str] = None) -> str:
+        generation = GameStatsGeneration.get(child_id)
+        return f"games:stats:{child_id}:g{generation}:{language or cls.ALL_LANGUAGES}"
+
+    @staticmethod
+    def _per_game(child_id: str, language: Optional[str] = None) -> Dict[str, dict]:
+        """Totals per game for a child, in one grouped query."""
+        queryset = GameSession.objects.filter(child_id=child_id)
+        if language:
+            queryset = queryset.filter(game__language=language)
+
+        rows = queryset.values('game_id', 'game__name').annotate(
+            sessions=Count('id'),
+            points=Sum('points_earned'),
+            time=Sum('time_taken_seconds'),
+            score=Sum('score'),
+            correct=Sum('questions_correct'),
+            attempted=Sum('questions_attempted'),
+            completed=Count('id', filter=Q(completed=True)),
+        ).order_by()
+
+        return {
+            str(row['game_id']): {
+                'name': row['game__name'],
+                **{field: row[field] or 0 for field in STAT_FIELDS},
+            }
+            for row in rows
+        }
+
+    @classmethod
+    def _get_per_game(cls, child_id: str, language: Optional[str] = None) -> Dict[str, dict]:
+        key = cls._key(child_id, language)
+        per_game = cache.get(key)
+        if per_game is None:
+            per_game = cls._per_game(child_id, language)
+            cache.set(key, per_game, CacheConfig.PROGRESS_TTL)
+        return per_game
+
+    @classmethod
+    def get_child_stats(cls, child_id: str, language: str = None) -> dict:
+        """Overall game statistics for a child."""
+        per_game = cls._get_per_game(str(child_id), language)
+        totals = {field: sum(game[field] for game in per_game.values()) for field in STAT_FIELDS}
+
+        if not totals['sessions']:
+            return {
+                'total_games_played': 0,
+                'total_points_earned': 0,
+                'total_time_seconds': 0,
+                'average_score': 0,
+                'average_accuracy': 0,
+                'completion_rate': 0,
+                'favorite_game': None,
+            }
+
+        # Most played; ties go to the first name alphabetically
+        favorite = min(per_game.values(), key=lambda game: (-game['sessions'], game['name']))
+        sessions = totals['sessions']
+        return {
+            'total_games_played': sessions,
+            'total_points_earned': totals['points'],
+            'total_time_seconds': totals['time'],
+            'average_score': round(totals['score'] / sessions, 1),
+            'average_accuracy': round((totals['correct'] / totals['attempted'] * 100), 1) if totals['attempted'] else 0,
+            'completion_rate': round((totals['completed'] / sessions * 100), 1),
+            'favorite_game': favorite['name'],
+        }
+
+    @staticmethod
+    def invalidate(child_id: str) -> None:
+        """Drop a child's cached stats once the current transaction commits."""
+        GameStatsGeneration.bump(str(child_id))
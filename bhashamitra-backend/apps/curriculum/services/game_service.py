@@ -6,6 +6,8 @@ from typing import List, Optional
 from datetime import date
 from apps.curriculum.models.games import Game, GameSession, GameLeaderboard
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
+from .game_analytics import GameAnalyticsService
 
 
 class GameService:
@@ -28,11 +30,12 @@ class GameService:
     @transaction.atomic
     def start_game_session(child: Child, game: Game) -> GameSession:
         """Start a new game session."""
-        return GameSession.objects.create(
+        session = GameSession.objects.create(
             child=child,
             game=game,
             lives_remaining=game.lives
         )
+        return session
 
     @staticmethod
     @transaction.atomic
@@ -66,8 +69,7 @@ class GameService:
         session.save()
 
         # Update child's total points
-        session.child.total_points += points_earned
-        session.child.save(update_fields=['total_points'])
+        PointsService.award(session.child, points_earned, PointsService.Reason.GAME_COMPLETED, game.id)
 
         # Update leaderboard
         leaderboard, _ = GameLeaderboard.objects.get_or_create(
@@ -153,51 +155,7 @@ class GameService:
     @staticmethod
     def get_child_game_stats(child_id: str, language: str = None) -> dict:
         """Get overall game statistics for a child."""
-        queryset = GameSession.objects.filter(child_id=child_id)
-
-        if language:
-            queryset = queryset.filter(game__language=language)
-
-        sessions = list(queryset)
-
-        if not sessions:
-            return {
-                'total_games_played': 0,
-                'total_points_earned': 0,
-                'total_time_seconds': 0,
-                'average_score': 0,
-                'average_accuracy': 0,
-                'completion_rate': 0,
-                'favorite_game': None,
-            }
-
-        total_games = len(sessions)
-        total_points = sum(s.points_earned for s in sessions)
-        total_time = sum(s.time_taken_seconds for s in sessions)
-        total_score = sum(s.score for s in sessions)
-        total_correct = sum(s.questions_correct for s in sessions)
-        total_attempted = sum(s.questions_attempted for s in sessions)
-        completed_count = sum(1 for s in sessions if s.completed)
-
-        # Find favorite game (most played)
-        game_counts = {}
-        for session in sessions:
-            game_id = str(session.game_id)
-            if game_id not in game_counts:
-                game_counts[game_id] = {'count': 0, 'name': session.game.name}
-            game_counts[game_id]['count'] += 1
-
-        favorite_game = max(game_counts.values(), key=lambda x: x['count'])['name'] if game_counts else None
-
-        return {
-            'total_games_played': total_games,
-            'total_points_earned': total_points,
-            'total_time_seconds': total_time,
-            'average_score': round(total_score / total_games, 1),
-            'average_accuracy': round((total_correct / total_attempted * 100), 1) if total_attempted else 0,
-            'completion_rate': round((completed_count / total_games * 100), 1),
-            'favorite_game': favorite_game,
-        }
+        return GameAnalyticsService.get_child_stats(child_id, language)
 
     @staticmethod
     def get_games_played_today(child_id: str) -> int:
@@ -2,6 +2,7 @@
 from django.utils import timezone
 from django.db import transaction
 from typing import List, Optional
+from apps.core.cache_service import ProgressCacheService
 from apps.curriculum.models.vocabulary import VocabularyWord, WordProgress, VocabularyTheme
 
 
@@ -51,6 +52,8 @@ class SRSService:
             word_id=word_id,
             defaults={'next_review': timezone.now()}
         )
+        if created:
+            ProgressCacheService.invalidate_child_progress(child_id)
         return progress
 
     @staticmethod
@@ -77,6 +80,7 @@ class SRSService:
 
         # Update SRS using the model method
         progress.update_srs(quality)
+        ProgressCacheService.invalidate_child_progress(child_id)
 
         return {
             'word_id': str(word_id),
@@ -0,0 +1,15 @@
+"""Curriculum signal receivers."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache_service import ProgressCacheService
+from apps.curriculum.models.games import GameSession
+from apps.curriculum.services.game_analytics import GameAnalyticsService
+
+
+@receiver(post_save, sender=GameSession)
+@receiver(post_delete, sender=GameSession)
+def invalidate_game_stats(sender, instance, **kwargs):
+    """Drop cached game stats (and report snapshots) when a child's session changes."""
+    GameAnalyticsService.invalidate(instance.child_id)
+    ProgressCacheService.invalidate_child_progress(instance.child_id)
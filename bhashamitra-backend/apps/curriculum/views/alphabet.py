@@ -4,6 +4,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from apps.children.models import Child
+from apps.core.cache_service import cache_response
 from apps.curriculum.models.script import Script, Letter, LetterProgress
 from apps.curriculum.models.verified_content import VerifiedLetter
 from apps.curriculum.serializers.script import (
@@ -20,6 +21,7 @@ class ScriptListView(APIView):
     """List available scripts/alphabets."""
     permission_classes = [IsAuthenticated]
 
+    @cache_response(ttl=3600, key_prefix="scripts", vary=('user',))
     def get(self, request, child_id=None):
         """Get scripts available for the child's language (optional child_id)."""
         language = None
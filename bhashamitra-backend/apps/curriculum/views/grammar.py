@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.db import transaction
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
 from apps.curriculum.models.grammar import GrammarTopic, GrammarRule, GrammarExercise, GrammarProgress
 from apps.curriculum.serializers.grammar import (
     GrammarTopicSerializer,
@@ -188,8 +189,7 @@ class ExerciseSubmitView(APIView):
         if result['is_correct']:
             progress.exercises_correct += 1
             # Award points
-            child.total_points += result['points']
-            child.save(update_fields=['total_points'])
+            PointsService.award(child, result['points'], PointsService.Reason.GRAMMAR_EXERCISE, exercise.id)
 
         # Check for mastery (80% accuracy with at least 10 exercises)
         if progress.exercises_attempted >= 10 and progress.accuracy >= 80:
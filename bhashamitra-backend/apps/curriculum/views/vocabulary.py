@@ -13,6 +13,7 @@ from apps.curriculum.serializers.vocabulary import (
     WordProgressSerializer,
 )
 from apps.curriculum.services.srs_service import SRSService
+from apps.gamification.services.points import PointsService
 from apps.core.validators import safe_level, safe_limit, safe_int
 
 
@@ -223,8 +224,7 @@ class FlashcardReviewView(APIView):
         points_earned = 0
         if result['correct']:
             points_earned = 5  # 5 XP per correct review
-            child.total_points += points_earned
-            child.save(update_fields=['total_points'])
+            PointsService.award(child, points_earned, PointsService.Reason.FLASHCARD_REVIEW, word_id)
 
         result['points_earned'] = points_earned
         result['total_points'] = child.total_points
@@ -282,7 +282,6 @@ class FlashcardSessionView(APIView):
 
         # Award points to child
         if result['points_earned'] > 0:
-            child.total_points += result['points_earned']
-            child.save(update_fields=['total_points'])
+            PointsService.award(child, result['points_earned'], PointsService.Reason.FLASHCARD_REVIEW)
 
         return Response({'data': result})
@@ -242,10 +242,12 @@ class FestivalProgress(models.Model):
 
             self.save()
 
-            # Update child's total points if the field exists
-            if hasattr(self.child, 'total_points'):
-                self.child.total_points += self.points_earned
-                self.child.save(update_fields=['total_points'])
+            # Update child's total points
+            from apps.gamification.services.points import PointsService
+            PointsService.award(
+                self.child, self.points_earned, PointsService.Reason.FESTIVAL_ACTIVITY,
+                self.activity_id or self.festival_id
+            )
 
             return self.points_earned
         return 0
@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
 from django.db.models import Count, Q, Sum
 
+from apps.core.cache_service import cache_response
 from apps.festivals.models import Festival, FestivalStory, FestivalActivity, FestivalProgress
 from apps.festivals.serializers import (
     FestivalSerializer,
@@ -49,6 +50,11 @@ class FestivalViewSet(viewsets.ReadOnlyModelViewSet):
         # Ensure ordering by month (January to December)
         return queryset.order_by('typical_month', 'name')
 
+    @cache_response(ttl=3600, key_prefix="festivals")
+    def list(self, request, *args, **kwargs):
+        """List festivals (same for every user - cached without vary)."""
+        return super().list(request, *args, **kwargs)
+
     def get_serializer_context(self):
         """Add child language to context."""
         context = super().get_serializer_context()
@@ -2,7 +2,7 @@
 from django.contrib import admin
 from .models import (
     # Existing models
-    Badge, ChildBadge, Streak, VoiceRecording,
+    Badge, BadgeCounter, ChildBadge, PointsEvent, Streak, VoiceRecording,
     # Peppi Outfits & Accessories
     PeppiOutfit, PeppiOutfitTranslation, PeppiAccessory,
     # Child Peppi State
@@ -42,6 +42,21 @@ class StreakAdmin(admin.ModelAdmin):
     ordering = ['-current_streak']
 
 
+@admin.register(BadgeCounter)
+class BadgeCounterAdmin(admin.ModelAdmin):
+    list_display = ['child', 'criteria_type', 'value', 'updated_at']
+    list_filter = ['criteria_type']
+    search_fields = ['child__name']
+
+
+@admin.register(PointsEvent)
+class PointsEventAdmin(admin.ModelAdmin):
+    list_display = ['child', 'points', 'reason', 'reference', 'created_at']
+    list_filter = ['reason']
+    search_fields = ['child__name', 'reference']
+    readonly_fields = ['id', 'child', 'points', 'reason', 'reference', 'created_at', 'updated_at']
+
+
 @admin.register(VoiceRecording)
 class VoiceRecordingAdmin(admin.ModelAdmin):
     list_display = ['child', 'story', 'page_number', 'duration_ms', 'recorded_at']
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:51
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0008_alter_child_peppi_addressing'),
+        ('gamification', '0003_alter_badge_options_badge_available_from_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BadgeCounter',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('criteria_type', models.CharField(choices=[('STORIES_COMPLETED', 'Stories Completed'), ('STREAK_DAYS', 'Streak Days'), ('POINTS_EARNED', 'Points Earned'), ('TIME_SPENT_MINUTES', 'Time Spent'), ('VOICE_RECORDINGS', 'Voice Recordings'), ('LETTERS_MASTERED', 'Letters Mastered'), ('WORDS_MASTERED', 'Words Mastered'), ('CHALLENGES_COMPLETED', 'Challenges Completed'), ('CHALLENGES_WON', 'Challenges Won'), ('CHALLENGE_WIN_STREAK', 'Challenge Win Streak'), ('PERFECT_CHALLENGES', 'Perfect Challenges'), ('UNDERDOG_WINS', 'Underdog Wins'), ('GIANT_SLAYER', 'Giant Slayer Wins'), ('FRIENDS_INVITED', 'Friends Invited'), ('FRIENDS_CONVERTED', 'Friends Converted to Users'), ('MULTIPLAYER_GAMES', 'Multiplayer Games'), ('RATING_ACHIEVED', 'Rating Achieved'), ('ACCURACY_ACHIEVED', 'Accuracy Percentage')], max_length=30)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'badge_counters',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='badge',
+            index=models.Index(fields=['criteria_type', 'criteria_value'], name='badges_criteri_c49000_idx'),
+        ),
+        migrations.AddField(
+            model_name='badgecounter',
+            name='child',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='badge_counters', to='children.child'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='badgecounter',
+            unique_together={('child', 'criteria_type')},
+        ),
+    ]
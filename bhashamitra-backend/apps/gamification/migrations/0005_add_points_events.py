@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:56
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0008_alter_child_peppi_addressing'),
+        ('gamification', '0004_add_badge_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PointsEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('points', models.IntegerField()),
+                ('reason', models.CharField(choices=[('STORY_STARTED', 'Story Started'), ('PAGE_READ', 'Pages Read'), ('STORY_COMPLETED', 'Story Completed'), ('VOICE_RECORDING', 'Voice Recording'), ('MIMIC_ATTEMPT', 'Mimic Attempt'), ('FLASHCARD_REVIEW', 'Flashcard Review'), ('GRAMMAR_EXERCISE', 'Grammar Exercise'), ('GAME_COMPLETED', 'Game Completed'), ('ASSESSMENT_PASSED', 'Assessment Passed'), ('FESTIVAL_ACTIVITY', 'Festival Activity'), ('LEARNING_SESSION', 'Learning Session'), ('GOAL_COMPLETED', 'Goal Completed'), ('BADGE_BONUS', 'Badge Bonus'), ('OFFLINE_SYNC', 'Offline Sync'), ('OTHER', 'Other')], default='OTHER', max_length=30)),
+                ('reference', models.CharField(blank=True, help_text='Id of the story, badge, game... that earned the points', max_length=100)),
+                ('child', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='points_events', to='children.child')),
+            ],
+            options={
+                'db_table': 'points_events',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['child', '-created_at'], name='points_even_child_i_644ad5_idx')],
+            },
+        ),
+    ]
@@ -181,6 +181,10 @@ class Badge(TimeStampedModel):
     class Meta:
         db_table = 'badges'
         ordering = ['category', 'display_order']
+        indexes = [
+            # BadgeService looks badges up by (criteria, threshold reached)
+            models.Index(fields=['criteria_type', 'criteria_value']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.rarity})"
@@ -201,6 +205,67 @@ class ChildBadge(TimeStampedModel):
         return f"{self.child.name} - {self.badge.name}"
 
 
+class BadgeCounter(TimeStampedModel):
+    """
+    Running per-child total behind a count-based badge criterion.
+
+    Kept incrementally by BadgeService.record so badge checks don't re-run
+    COUNT/SUM queries over the child's history.
+    """
+
+    child = models.ForeignKey(Child, on_delete=models.CASCADE, related_name='badge_counters')
+    criteria_type = models.CharField(max_length=30, choices=Badge.CriteriaType.choices)
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'badge_counters'
+        unique_together = ['child', 'criteria_type']
+
+    def __str__(self):
+        return f"{self.child.name} - {self.criteria_type}: {self.value}"
+
+
+class PointsEvent(TimeStampedModel):
+    """
+    Immutable ledger entry for points awarded to a child.
+
+    Child.total_points is the running sum of these, maintained by
+    PointsService.award with an atomic F() increment.
+    """
+
+    class Reason(models.TextChoices):
+        STORY_STARTED = 'STORY_STARTED', 'Story Started'
+        PAGE_READ = 'PAGE_READ', 'Pages Read'
+        STORY_COMPLETED = 'STORY_COMPLETED', 'Story Completed'
+        VOICE_RECORDING = 'VOICE_RECORDING', 'Voice Recording'
+        MIMIC_ATTEMPT = 'MIMIC_ATTEMPT', 'Mimic Attempt'
+        FLASHCARD_REVIEW = 'FLASHCARD_REVIEW', 'Flashcard Review'
+        GRAMMAR_EXERCISE = 'GRAMMAR_EXERCISE', 'Grammar Exercise'
+        GAME_COMPLETED = 'GAME_COMPLETED', 'Game Completed'
+        ASSESSMENT_PASSED = 'ASSESSMENT_PASSED', 'Assessment Passed'
+        FESTIVAL_ACTIVITY = 'FESTIVAL_ACTIVITY', 'Festival Activity'
+        LEARNING_SESSION = 'LEARNING_SESSION', 'Learning Session'
+        GOAL_COMPLETED = 'GOAL_COMPLETED', 'Goal Completed'
+        BADGE_BONUS = 'BADGE_BONUS', 'Badge Bonus'
+        OFFLINE_SYNC = 'OFFLINE_SYNC', 'Offline Sync'
+        OTHER = 'OTHER', 'Other'
+
+    child = models.ForeignKey(Child, on_delete=models.CASCADE, related_name='points_events')
+    points = models.IntegerField()
+    reason = models.CharField(max_length=30, choices=Reason.choices, default=Reason.OTHER)
+    reference = models.CharField(max_length=100, blank=True, help_text='Id of the story, badge, game... that earned the points')
+
+    class Meta:
+        db_table = 'points_events'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['child', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.child.name} {self.points:+d} ({self.reason})"
+
+
 class Streak(TimeStampedModel):
     """Streak tracking for daily activity."""
 
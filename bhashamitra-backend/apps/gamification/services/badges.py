@@ -1,63 +1,148 @@
-"""Badge service."""
-from django.db.models import Sum, Count
-from ..models import Badge, ChildBadge
+"""
+Badge service.
+
+Badges are awarded incrementally. Callers report what just changed:
+
+    BadgeService.record(
+        child,
+        increments={Badge.CriteriaType.STORIES_COMPLETED: 1},
+        values={Badge.CriteriaType.POINTS_EARNED: child.total_points},
+    )
+
+- increments bump per-child BadgeCounter rows (seeded from the source
+  tables the first time a counter is touched)
+- values are metrics the caller already holds (points, current streak)
+- only badges of the changed criteria whose threshold is now reached are
+  fetched, in one query on the (criteria_type, criteria_value) index
+
+so a check costs O(changed criteria), not O(badges x queries).
+"""
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+from apps.core.cache_service import ProgressCacheService
+from ..models import Badge, BadgeCounter, ChildBadge
+from .points import PointsService
 
 
 class BadgeService:
     """Service for managing badges."""
 
-    @staticmethod
-    def check_and_award_badges(child) -> list:
-        """Check and award any earned badges."""
-        earned_badge_ids = set(
-            ChildBadge.objects.filter(child=child).values_list('badge_id', flat=True)
+    # Criteria backed by a BadgeCounter (the rest are passed as values)
+    COUNTED_CRITERIA = (
+        Badge.CriteriaType.STORIES_COMPLETED,
+        Badge.CriteriaType.VOICE_RECORDINGS,
+        Badge.CriteriaType.TIME_SPENT_MINUTES,
+    )
+
+    @classmethod
+    def record(cls, child, increments: dict = None, values: dict = None) -> list:
+        """
+        Update counters and award badges for the criteria that changed.
+
+        TIME_SPENT_MINUTES increments are in seconds (the counter keeps
+        seconds; thresholds are minutes). Returns the new ChildBadge rows.
+        """
+        metrics = dict(values or {})
+        increments = {criteria: delta for criteria, delta in (increments or {}).items() if delta}
+        if increments:
+            metrics.update(cls._increment(child, increments))
+        if not metrics:
+            return []
+        return cls._award(child, metrics)
+
+    @classmethod
+    def check_and_award_badges(cls, child) -> list:
+        """
+        Check and award any earned badges, recounting every criterion.
+
+        Resets the child's counters from the source tables; use record()
+        for the per-event path.
+        """
+        metrics = {criteria: cls.measure(child, criteria) for criteria in cls.COUNTED_CRITERIA}
+        for criteria, value in metrics.items():
+            BadgeCounter.objects.update_or_create(
+                child=child, criteria_type=criteria, defaults={'value': value}
+            )
+        metrics[Badge.CriteriaType.POINTS_EARNED] = child.total_points
+        metrics[Badge.CriteriaType.STREAK_DAYS] = cls.measure(child, Badge.CriteriaType.STREAK_DAYS)
+        return cls._award(child, metrics)
+
+    @classmethod
+    def _increment(cls, child, increments: dict) -> dict:
+        """Bump counters with F() and return their new values."""
+        now = timezone.now()
+        for criteria, delta in increments.items():
+            updated = BadgeCounter.objects.filter(child=child, criteria_type=criteria).update(
+                value=F('value') + delta, updated_at=now
+            )
+            if not updated:
+                # First touch: the source tables already include this event
+                BadgeCounter.objects.get_or_create(
+                    child=child, criteria_type=criteria,
+                    defaults={'value': cls.measure(child, criteria)},
+                )
+        return dict(
+            BadgeCounter.objects.filter(child=child, criteria_type__in=list(increments))
+            .values_list('criteria_type', 'value')
         )
 
-        new_badges = []
+    @staticmethod
+    def _threshold(criteria, value: int) -> int:
+        """Counter value in the units of Badge.criteria_value."""
+        if criteria == Badge.CriteriaType.TIME_SPENT_MINUTES:
+            return value // 60
+        return value
 
-        for badge in Badge.objects.exclude(id__in=earned_badge_ids):
-            if BadgeService._check_criteria(child, badge):
-                child_badge = ChildBadge.objects.create(child=child, badge=badge)
-                new_badges.append(child_badge)
+    @classmethod
+    def _award(cls, child, metrics: dict) -> list:
+        """Award every unearned badge whose threshold the metrics reach."""
+        reached = Q()
+        for criteria, value in metrics.items():
+            reached |= Q(criteria_type=criteria, criteria_value__lte=cls._threshold(criteria, value or 0))
+
+        candidates = Badge.objects.filter(reached, is_active=True).exclude(child_badges__child=child)
 
+        new_badges = []
+        for badge in candidates:
+            child_badge, created = ChildBadge.objects.get_or_create(child=child, badge=badge)
+            if created:
+                new_badges.append(child_badge)
                 # Award bonus points
-                if badge.points_bonus > 0:
-                    child.total_points += badge.points_bonus
-                    child.save(update_fields=['total_points'])
+                PointsService.award(child, badge.points_bonus, PointsService.Reason.BADGE_BONUS, badge.id)
 
+        if new_badges:
+            ProgressCacheService.invalidate_child_progress(child.id)
         return new_badges
 
     @staticmethod
-    def _check_criteria(child, badge) -> bool:
-        """Check if child meets badge criteria."""
+    def measure(child, criteria) -> int:
+        """Recount a criterion from its source table (counter seeding/rebuild)."""
         from apps.progress.models import Progress
 
-        if badge.criteria_type == Badge.CriteriaType.STORIES_COMPLETED:
-            count = Progress.objects.filter(
+        if criteria == Badge.CriteriaType.STORIES_COMPLETED:
+            return Progress.objects.filter(
                 child=child, status=Progress.Status.COMPLETED
             ).count()
-            return count >= badge.criteria_value
 
-        elif badge.criteria_type == Badge.CriteriaType.STREAK_DAYS:
+        elif criteria == Badge.CriteriaType.STREAK_DAYS:
             from ..models import Streak
             streak = Streak.objects.filter(child=child).first()
-            return streak and streak.current_streak >= badge.criteria_value
+            return streak.current_streak if streak else 0
 
-        elif badge.criteria_type == Badge.CriteriaType.POINTS_EARNED:
-            return child.total_points >= badge.criteria_value
+        elif criteria == Badge.CriteriaType.POINTS_EARNED:
+            return child.total_points
 
-        elif badge.criteria_type == Badge.CriteriaType.VOICE_RECORDINGS:
+        elif criteria == Badge.CriteriaType.VOICE_RECORDINGS:
             from ..models import VoiceRecording
-            count = VoiceRecording.objects.filter(child=child).count()
-            return count >= badge.criteria_value
+            return VoiceRecording.objects.filter(child=child).count()
 
-        elif badge.criteria_type == Badge.CriteriaType.TIME_SPENT_MINUTES:
-            total_seconds = Progress.objects.filter(child=child).aggregate(
+        elif criteria == Badge.CriteriaType.TIME_SPENT_MINUTES:
+            # Seconds; compared in minutes (see _threshold)
+            return Progress.objects.filter(child=child).aggregate(
                 total=Sum('time_spent_seconds')
             )['total'] or 0
-            return (total_seconds // 60) >= badge.criteria_value
 
-        return False
+        return 0
 
     @staticmethod
     def get_badges_for_child(child) -> dict:
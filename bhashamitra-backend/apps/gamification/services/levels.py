@@ -1,5 +1,6 @@
 """Level service."""
 from django.conf import settings
+from apps.core.cache_service import ProgressCacheService
 
 
 class LevelService:
@@ -28,6 +29,7 @@ class LevelService:
         if new_level > current_level:
             child.level = new_level
             child.save(update_fields=['level'])
+            ProgressCacheService.invalidate_child_progress(child.id)
             return {
                 'leveled_up': True,
                 'old_level': current_level,
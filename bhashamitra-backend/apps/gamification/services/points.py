@@ -1,10 +1,27 @@
-"""Points service."""
+"""
+Points service.
+
+Points are awarded through a ledger: every award appends an immutable
+PointsEvent and bumps Child.total_points with an atomic F() increment, so
+concurrent awards never overwrite each other. The same UPDATE raises
+Child.level to whatever LEVEL_THRESHOLDS the new total reaches, so level
+never lags behind points.
+"""
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.db.models.lookups import GreaterThanOrEqual
+from apps.children.models import Child
+from apps.core.cache_service import ProgressCacheService
+from ..models import PointsEvent
 
 
 class PointsService:
     """Service for calculating points."""
 
+    Reason = PointsEvent.Reason
+
     @staticmethod
     def calculate_story_completion_points(level: int) -> int:
         """Calculate points for story completion."""
@@ -21,8 +38,48 @@ class PointsService:
         return settings.POINTS_CONFIG['VOICE_RECORDING']
 
     @staticmethod
-    def award_points(child, points: int, reason: str = None):
+    def _level_expression(total):
+        """SQL CASE mapping a points total to its LEVEL_THRESHOLDS level."""
+        thresholds = sorted(settings.LEVEL_THRESHOLDS.items(), key=lambda item: item[1], reverse=True)
+        return Case(
+            *[When(GreaterThanOrEqual(total, threshold), then=Value(level)) for level, threshold in thresholds],
+            default=Value(1),
+        )
+
+    @classmethod
+    def award(cls, child, points: int, reason: str = PointsEvent.Reason.OTHER, reference: str = '') -> dict:
+        """
+        Record a points event and apply it to the child atomically.
+
+        Refreshes child.total_points and child.level in place. Returns the
+        new total and a level_up dict in LevelService.check_level_up's shape.
+
+        Callers award right after recording an activity, so the child's
+        progress caches are invalidated even when points is 0.
+        """
+        old_level = child.level
+        if not points:
+            ProgressCacheService.invalidate_child_progress(child.pk)
+            return {'total_points': child.total_points, 'level_up': {'leveled_up': False}}
+
+        new_total = F('total_points') + points
+        with transaction.atomic():
+            PointsEvent.objects.create(child_id=child.pk, points=points, reason=reason, reference=str(reference or ''))
+            Child.all_objects.filter(pk=child.pk).update(
+                total_points=new_total,
+                # Levels only go up (assessments can promote past the threshold)
+                level=Greatest(F('level'), cls._level_expression(new_total)),
+            )
+        child.refresh_from_db(fields=['total_points', 'level'])
+        ProgressCacheService.invalidate_child_progress(child.pk)
+
+        if child.level > old_level:
+            level_up = {'leveled_up': True, 'old_level': old_level, 'new_level': child.level}
+        else:
+            level_up = {'leveled_up': False}
+        return {'total_points': child.total_points, 'level_up': level_up}
+
+    @classmethod
+    def award_points(cls, child, points: int, reason: str = None, reference: str = ''):
         """Award points to a child."""
-        child.total_points += points
-        child.save(update_fields=['total_points'])
-        return child.total_points
+        return cls.award(child, points, reason or PointsEvent.Reason.OTHER, reference)['total_points']
@@ -1,6 +1,7 @@
 """Streak service."""
 from django.utils import timezone
 from datetime import timedelta
+from apps.core.cache_service import ProgressCacheService
 from ..models import Streak
 
 
@@ -10,27 +11,39 @@ class StreakService:
     @staticmethod
     def update_streak(child) -> Streak:
         """Update streak based on activity."""
-        streak, created = Streak.objects.get_or_create(child=child)
-        today = timezone.now().date()
+        return StreakService.record_activity_dates(child, [timezone.now().date()])
+
+    @staticmethod
+    def record_activity_dates(child, dates) -> Streak:
+        """
+        Advance the streak over a set of activity dates in one save.
+
+        Used by offline sync, where a day (or several) of activity arrives
+        at once. Dates before the last recorded activity can't extend the
+        streak and are ignored.
+        """
+        streak, _ = Streak.objects.get_or_create(child=child)
 
-        if created or streak.last_activity_date is None:
-            streak.current_streak = 1
-            streak.longest_streak = 1
-            streak.last_activity_date = today
-        elif streak.last_activity_date == today:
-            # Already active today, no change
-            pass
-        elif streak.last_activity_date == today - timedelta(days=1):
-            # Consecutive day
-            streak.current_streak += 1
-            streak.longest_streak = max(streak.longest_streak, streak.current_streak)
-            streak.last_activity_date = today
-        else:
-            # Streak broken
-            streak.current_streak = 1
-            streak.last_activity_date = today
+        for day in sorted(set(dates)):
+            if streak.last_activity_date is None:
+                streak.current_streak = 1
+                streak.longest_streak = max(streak.longest_streak, 1)
+                streak.last_activity_date = day
+            elif day <= streak.last_activity_date:
+                # Already active that day (or earlier), no change
+                continue
+            elif day == streak.last_activity_date + timedelta(days=1):
+                # Consecutive day
+                streak.current_streak += 1
+                streak.longest_streak = max(streak.longest_streak, streak.current_streak)
+                streak.last_activity_date = day
+            else:
+                # Streak broken
+                streak.current_streak = 1
+                streak.last_activity_date = day
 
         streak.save()
+        ProgressCacheService.invalidate_child_progress(child.id)
         return streak
 
     @staticmethod
@@ -5,9 +5,10 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from apps.children.models import Child
 from .services.badges import BadgeService
+from .services.points import PointsService
 from .services.streaks import StreakService
 from .services.levels import LevelService
-from .models import VoiceRecording
+from .models import Badge, VoiceRecording
 
 
 class BadgeListView(APIView):
@@ -90,12 +91,19 @@ class RecordingListView(APIView):
         )
 
         # Award points
-        from django.conf import settings
-        points = settings.POINTS_CONFIG['VOICE_RECORDING']
-        child.total_points += points
-        child.save(update_fields=['total_points'])
+        points = PointsService.calculate_recording_points()
+        PointsService.award(child, points, PointsService.Reason.VOICE_RECORDING, recording.id)
+
+        new_badges = BadgeService.record(
+            child,
+            increments={Badge.CriteriaType.VOICE_RECORDINGS: 1},
+            values={Badge.CriteriaType.POINTS_EARNED: child.total_points},
+        )
 
         return Response({
             'data': {'id': recording.id},
-            'meta': {'points_awarded': points}
+            'meta': {
+                'points_awarded': points,
+                'new_badges': [b.badge.name for b in new_badges],
+            }
         }, status=status.HTTP_201_CREATED)
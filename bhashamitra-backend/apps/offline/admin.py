@@ -1,14 +1,16 @@
 """Admin configuration for offline models."""
 from django.contrib import admin
-from .models import OfflinePackage, ChildOfflineContent
+from .models import OfflinePackage, ChildOfflineContent, OfflineSyncEvent
 
 
 @admin.register(OfflinePackage)
 class OfflinePackageAdmin(admin.ModelAdmin):
-    list_display = ['name', 'package_type', 'language', 'version', 'size_mb', 'is_active']
+    list_display = ['name', 'package_type', 'language', 'version', 'size_mb', 'is_active', 'created_at']
     list_filter = ['package_type', 'language', 'is_active']
-    search_fields = ['name']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    search_fields = ['name', 'content_hash']
+    readonly_fields = [
+        'id', 'content_hash', 'bundle_path', 'bundle_size_bytes', 'deltas', 'created_at', 'updated_at'
+    ]
 
 
 @admin.register(ChildOfflineContent)
@@ -17,3 +19,11 @@ class ChildOfflineContentAdmin(admin.ModelAdmin):
     list_filter = ['sync_status']
     search_fields = ['child__name', 'package__name']
     readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(OfflineSyncEvent)
+class OfflineSyncEventAdmin(admin.ModelAdmin):
+    list_display = ['child', 'event_type', 'idempotency_key', 'occurred_at', 'created_at']
+    list_filter = ['event_type']
+    search_fields = ['child__name', 'idempotency_key']
+    readonly_fields = ['id', 'created_at', 'updated_at']
@@ -0,0 +1,58 @@
+"""
+Management command to build offline content packages.
+
+Compiles each language's letters, vocabulary, stories, festivals and cached
+TTS audio into a content-addressed bundle, plus delta bundles from recent
+versions. Languages whose content hasn't changed keep their current version.
+
+Usage:
+    python manage.py build_offline_packages
+    python manage.py build_offline_packages --language HINDI --language TAMIL
+    python manage.py build_offline_packages --type FREE_TIER --force
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.children.models import Child
+from apps.offline.models import OfflinePackage
+from apps.offline.services import OfflinePackageBuilder
+
+
+class Command(BaseCommand):
+    help = 'Build content-addressed offline packages and deltas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            action='append',
+            help='Language to build (repeatable; default: all languages)'
+        )
+        parser.add_argument(
+            '--type',
+            default=OfflinePackage.PackageType.LANGUAGE_PACK,
+            choices=OfflinePackage.PackageType.values,
+            help='Package type to build'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Cut a new version even if content is unchanged'
+        )
+
+    def handle(self, *args, **options):
+        languages = [language.upper() for language in options.get('language') or Child.Language.values]
+        unknown = set(languages) - set(Child.Language.values)
+        if unknown:
+            raise CommandError(f"Unknown language(s): {', '.join(sorted(unknown))}")
+
+        for language in languages:
+            package, created = OfflinePackageBuilder.build(
+                language, options['type'], force=options['force']
+            )
+            if created:
+                self.stdout.write(self.style.SUCCESS(
+                    f"  {language}: built {package.version} "
+                    f"({len(package.content_manifest.get('files', {}))} files, "
+                    f"{package.bundle_size_bytes} bytes, {len(package.deltas)} deltas)"
+                ))
+            else:
+                self.stdout.write(f"  {language}: unchanged at {package.version}")
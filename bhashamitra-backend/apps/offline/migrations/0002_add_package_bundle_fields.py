@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offline', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offlinepackage',
+            name='bundle_path',
+            field=models.CharField(blank=True, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='offlinepackage',
+            name='bundle_size_bytes',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='offlinepackage',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='sha256 of the manifest file list; unchanged content keeps the version', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='offlinepackage',
+            name='deltas',
+            field=models.JSONField(blank=True, default=dict, help_text='Delta bundles by source version: {version: {path, size_bytes, chunk_count}}'),
+        ),
+    ]
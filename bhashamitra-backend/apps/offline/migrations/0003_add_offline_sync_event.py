@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:47
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0008_alter_child_peppi_addressing'),
+        ('offline', '0002_add_package_bundle_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfflineSyncEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('idempotency_key', models.CharField(max_length=64)),
+                ('event_type', models.CharField(choices=[('STORY_PAGE', 'Story Page Read'), ('STORY_COMPLETE', 'Story Completed'), ('LESSON_SCORE', 'Lesson Score'), ('WORD_REVIEW', 'Word Review')], max_length=20)),
+                ('occurred_at', models.DateTimeField(help_text='When the event happened on the device')),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('child', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offline_sync_events', to='children.child')),
+            ],
+            options={
+                'db_table': 'offline_sync_events',
+                'indexes': [models.Index(fields=['child', '-created_at'], name='offline_syn_child_i_31ad14_idx')],
+                'unique_together': {('child', 'idempotency_key')},
+            },
+        ),
+    ]
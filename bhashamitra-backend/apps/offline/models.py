@@ -29,6 +29,21 @@ class OfflinePackage(TimeStampedModel):
     is_active = models.BooleanField(default=True)
     min_app_version = models.CharField(max_length=20, default='1.0.0')
 
+    # Built bundle (see apps.offline.services.OfflinePackageBuilder)
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        help_text='sha256 of the manifest file list; unchanged content keeps the version'
+    )
+    bundle_path = models.CharField(max_length=500, blank=True)
+    bundle_size_bytes = models.BigIntegerField(default=0)
+    deltas = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text='Delta bundles by source version: {version: {path, size_bytes, chunk_count}}'
+    )
+
     class Meta:
         db_table = 'offline_packages'
         indexes = [
@@ -84,3 +99,38 @@ class ChildOfflineContent(TimeStampedModel):
 
     def __str__(self):
         return f"{self.child.name} - {self.package.name}"
+
+
+class OfflineSyncEvent(TimeStampedModel):
+    """
+    A progress event uploaded by a device after working offline.
+
+    Devices generate the idempotency key, so retried uploads of the same
+    batch are recognised and applied only once.
+    """
+
+    class EventType(models.TextChoices):
+        STORY_PAGE = 'STORY_PAGE', 'Story Page Read'
+        STORY_COMPLETE = 'STORY_COMPLETE', 'Story Completed'
+        LESSON_SCORE = 'LESSON_SCORE', 'Lesson Score'
+        WORD_REVIEW = 'WORD_REVIEW', 'Word Review'
+
+    child = models.ForeignKey(
+        'children.Child',
+        on_delete=models.CASCADE,
+        related_name='offline_sync_events'
+    )
+    idempotency_key = models.CharField(max_length=64)
+    event_type = models.CharField(max_length=20, choices=EventType.choices)
+    occurred_at = models.DateTimeField(help_text='When the event happened on the device')
+    payload = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        db_table = 'offline_sync_events'
+        unique_together = ['child', 'idempotency_key']
+        indexes = [
+            models.Index(fields=['child', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.child.name} - {self.event_type} ({self.idempotency_key})"
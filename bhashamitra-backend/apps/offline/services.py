@@ -0,0 +1,447 @@
+"""
+Offline package builder.
+
+Compiles a language's learning content - letters, vocabulary themes,
+stories, festivals and the cached TTS audio for their text - into one
+downloadable bundle, so a device going offline makes one request instead
+of thousands of per-item API calls.
+
+Bundles are content-addressed:
+- every file (letters.json, one JSON document per theme/story/festival,
+  audio/<cache_key>.<format>) is split into CHUNK_SIZE chunks named by
+  their sha256
+- manifest.json lists each file's hash, size and chunk hashes
+- chunks are kept once in default storage (offline/chunks/), shared across
+  versions and languages
+
+Bundle layout (zip):
+    manifest.json
+    chunks/<sha256>
+
+A new version is only cut when the manifest's content hash changes. For
+each of the last KEEP_DELTAS versions a delta bundle is written with the
+new manifest, delta.json (removed paths) and only the chunks that version
+lacks; a device reassembles changed files from chunks it already holds.
+
+Usage:
+    package, created = OfflinePackageBuilder.build('HINDI')
+    python manage.py build_offline_packages --language HINDI
+"""
+import hashlib
+import json
+import logging
+import tempfile
+import zipfile
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from apps.offline.models import OfflinePackage
+
+logger = logging.getLogger(__name__)
+
+
+class OfflinePackageBuilder:
+    """Build versioned, delta-updatable offline bundles."""
+
+    # Bump when the bundle/manifest layout changes
+    FORMAT_VERSION = 1
+
+    CHUNK_SIZE = 64 * 1024
+    STORAGE_PREFIX = 'offline'
+    KEEP_DELTAS = 3
+
+    # SQLite caps bound parameters; keep IN (...) lists below that
+    LOOKUP_BATCH = 500
+
+    # Which content sections each package type carries
+    SECTIONS = {
+        OfflinePackage.PackageType.FREE_TIER: ('letters', 'vocabulary', 'stories', 'festivals'),
+        OfflinePackage.PackageType.LANGUAGE_PACK: ('letters', 'vocabulary', 'stories', 'festivals'),
+        OfflinePackage.PackageType.CURRICULUM_MODULE: ('letters', 'vocabulary'),
+        OfflinePackage.PackageType.FESTIVAL_PACK: ('festivals',),
+    }
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        language: str,
+        package_type: str = OfflinePackage.PackageType.LANGUAGE_PACK,
+        force: bool = False,
+    ) -> Tuple[OfflinePackage, bool]:
+        """
+        Build the package for a language if its content changed.
+
+        Returns (package, created). Unchanged content returns the current
+        package with created=False unless force is set.
+        """
+        language = language.upper()
+        manifest = cls.make_manifest(cls.collect(language, package_type))
+
+        previous = list(
+            OfflinePackage.objects.filter(language=language, package_type=package_type)
+            .exclude(bundle_path='')
+            .order_by('-created_at')
+        )
+        latest = previous[0] if previous else None
+        if latest and latest.content_hash == manifest['content_hash'] and not force:
+            logger.info(f"Offline package {language}/{package_type} unchanged at {latest.version}")
+            return latest, False
+
+        version = cls.next_version(latest.version if latest else None)
+        manifest['package'] = {
+            'language': language,
+            'package_type': package_type,
+            'version': version,
+        }
+        base_path = f"{cls.STORAGE_PREFIX}/packages/{language}/{package_type}/{version}"
+
+        all_chunks = cls._manifest_chunks(manifest)
+        bundle_path, bundle_size = cls._write_bundle(
+            f"{base_path}/bundle.zip", manifest, all_chunks
+        )
+
+        with transaction.atomic():
+            OfflinePackage.objects.filter(
+                language=language, package_type=package_type, is_active=True
+            ).update(is_active=False)
+            package = OfflinePackage.objects.create(
+                name=f"{language.replace('_', ' ').title()} {OfflinePackage.PackageType(package_type).label}",
+                package_type=package_type,
+                language=language,
+                version=version,
+                size_mb=(Decimal(bundle_size) / Decimal(1024 * 1024)).quantize(Decimal('0.01')),
+                content_manifest=manifest,
+                content_hash=manifest['content_hash'],
+                bundle_path=bundle_path,
+                bundle_size_bytes=bundle_size,
+                is_active=True,
+            )
+
+        deltas = {}
+        for old in previous[:cls.KEEP_DELTAS]:
+            delta = cls._write_delta(base_path, old, manifest, all_chunks)
+            if delta:
+                deltas[old.version] = delta
+        if deltas:
+            package.deltas = deltas
+            package.save(update_fields=['deltas', 'updated_at'])
+
+        logger.info(
+            f"Built offline package {language}/{package_type} {version}: "
+            f"{len(manifest['files'])} files, {bundle_size} bytes, {len(deltas)} deltas"
+        )
+        return package, True
+
+    @staticmethod
+    def next_version(version: Optional[str]) -> str:
+        """Bump the patch number ('1.0.4' -> '1.0.5'); first build is 1.0.0."""
+        if not version:
+            return '1.0.0'
+        try:
+            major, minor, patch = (int(part) for part in version.split('.'))
+        except ValueError:
+            return '1.0.0'
+        return f"{major}.{minor}.{patch + 1}"
+
+    # ------------------------------------------------------------------
+    # Manifest and chunks
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def chunk_path(cls, chunk_hash: str) -> str:
+        return f"{cls.STORAGE_PREFIX}/chunks/{chunk_hash[:2]}/{chunk_hash}"
+
+    @classmethod
+    def make_manifest(cls, files: Iterator[Tuple[str, bytes]]) -> dict:
+        """
+        Chunk and hash files, storing chunks that aren't stored yet.
+
+        Files are consumed one at a time so audio never has to sit in
+        memory all at once.
+        """
+        entries = {}
+        for path, data in files:
+            chunks = []
+            for offset in range(0, len(data), cls.CHUNK_SIZE) or [0]:
+                chunk = data[offset:offset + cls.CHUNK_SIZE]
+                chunk_hash = hashlib.sha256(chunk).hexdigest()
+                storage_path = cls.chunk_path(chunk_hash)
+                if not default_storage.exists(storage_path):
+                    default_storage.save(storage_path, ContentFile(chunk))
+                chunks.append(chunk_hash)
+            entries[path] = {
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'size': len(data),
+                'chunks': chunks,
+            }
+
+        listing = json.dumps(entries, sort_keys=True, separators=(',', ':'))
+        return {
+            'format': cls.FORMAT_VERSION,
+            'chunk_size': cls.CHUNK_SIZE,
+            'content_hash': hashlib.sha256(listing.encode()).hexdigest(),
+            'files': entries,
+        }
+
+    @staticmethod
+    def _manifest_chunks(manifest: dict) -> List[str]:
+        """Distinct chunk hashes of a manifest, in first-use order."""
+        return list(dict.fromkeys(
+            chunk for entry in manifest.get('files', {}).values() for chunk in entry['chunks']
+        ))
+
+    @classmethod
+    def _write_zip(cls, path: str, documents: Dict[str, dict], chunks: List[str]) -> Tuple[str, int]:
+        """Write JSON documents plus stored chunks to a zip in default storage."""
+        with tempfile.TemporaryFile() as tmp:
+            with zipfile.ZipFile(tmp, 'w') as bundle:
+                for name, document in documents.items():
+                    bundle.writestr(
+                        name,
+                        json.dumps(document, ensure_ascii=False, sort_keys=True),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                    )
+                for chunk_hash in chunks:
+                    with default_storage.open(cls.chunk_path(chunk_hash), 'rb') as f:
+                        # Audio is already compressed; store chunks as-is
+                        bundle.writestr(f"chunks/{chunk_hash}", f.read(), compress_type=zipfile.ZIP_STORED)
+            size = tmp.tell()
+            tmp.seek(0)
+            if default_storage.exists(path):
+                default_storage.delete(path)
+            saved = default_storage.save(path, File(tmp))
+        return saved, size
+
+    @classmethod
+    def _write_bundle(cls, path: str, manifest: dict, chunks: List[str]) -> Tuple[str, int]:
+        return cls._write_zip(path, {'manifest.json': manifest}, chunks)
+
+    @classmethod
+    def _write_delta(
+        cls,
+        base_path: str,
+        old: OfflinePackage,
+        manifest: dict,
+        all_chunks: List[str],
+    ) -> Optional[dict]:
+        """Delta bundle from an older version: new manifest + chunks it lacks."""
+        old_manifest = old.content_manifest or {}
+        if old_manifest.get('format') != cls.FORMAT_VERSION:
+            return None  # old clients get the full bundle
+
+        held = set(cls._manifest_chunks(old_manifest))
+        missing = [chunk for chunk in all_chunks if chunk not in held]
+        delta = {
+            'from_version': old.version,
+            'to_version': manifest['package']['version'],
+            'removed': sorted(set(old_manifest.get('files', {})) - set(manifest['files'])),
+            'chunks': missing,
+        }
+        path, size = cls._write_zip(
+            f"{base_path}/delta-from-{old.version}.zip",
+            {'manifest.json': manifest, 'delta.json': delta},
+            missing,
+        )
+        return {'path': path, 'size_bytes': size, 'chunk_count': len(missing)}
+
+    # ------------------------------------------------------------------
+    # Content
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(document) -> bytes:
+        # Deterministic bytes: unchanged content must hash the same
+        return json.dumps(document, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode()
+
+    @classmethod
+    def collect(cls, language: str, package_type: str) -> Iterator[Tuple[str, bytes]]:
+        """Yield (bundle path, bytes) for every file in the package."""
+        sections = cls.SECTIONS.get(package_type, cls.SECTIONS[OfflinePackage.PackageType.LANGUAGE_PACK])
+        free_only = package_type == OfflinePackage.PackageType.FREE_TIER
+        texts: List[str] = []
+
+        if 'letters' in sections:
+            document = cls._letters(language, texts)
+            if document:
+                yield 'letters.json', cls._encode(document)
+
+        if 'vocabulary' in sections:
+            for theme_id, document in cls._vocabulary(language, free_only, texts):
+                yield f"vocabulary/{theme_id}.json", cls._encode(document)
+
+        story_ids = set()
+        if 'festivals' in sections:
+            for festival_id, document in cls._festivals(language):
+                story_ids.update(document['story_ids'])
+                yield f"festivals/{festival_id}.json", cls._encode(document)
+
+        for story_id, document in cls._stories(
+            language, free_only, story_ids if 'stories' not in sections else None, texts
+        ):
+            yield f"stories/{story_id}.json", cls._encode(document)
+
+        yield from cls._audio(language, texts)
+
+    @staticmethod
+    def _letters(language: str, texts: List[str]) -> Optional[dict]:
+        from apps.curriculum.models import Letter, Script
+
+        script = Script.objects.filter(language=language).first()
+        if not script:
+            return None
+        letters = (
+            Letter.objects.filter(category__script=script, is_active=True)
+            .select_related('category')
+            .order_by('category__order', 'order')
+        )
+        items = []
+        for letter in letters:
+            texts.extend(t for t in (letter.character, letter.example_word) if t)
+            items.append({
+                'id': str(letter.id),
+                'category': letter.category.category_type,
+                'character': letter.character,
+                'romanization': letter.romanization,
+                'ipa': letter.ipa,
+                'pronunciation_guide': letter.pronunciation_guide,
+                'example_word': letter.example_word,
+                'example_word_romanization': letter.example_word_romanization,
+                'example_word_translation': letter.example_word_translation,
+                'order': letter.order,
+            })
+        return {
+            'script': {'name': script.name, 'name_native': script.name_native},
+            'letters': items,
+        }
+
+    @staticmethod
+    def _vocabulary(language: str, free_only: bool, texts: List[str]):
+        from apps.curriculum.models import VocabularyTheme
+
+        themes = VocabularyTheme.objects.filter(language=language, is_active=True)
+        if free_only:
+            themes = themes.filter(is_premium=False)
+        for theme in themes.prefetch_related('words').order_by('level', 'order'):
+            words = []
+            for word in sorted(theme.words.all(), key=lambda w: w.order):
+                texts.append(word.word)
+                words.append({
+                    'id': str(word.id),
+                    'word': word.word,
+                    'romanization': word.romanization,
+                    'translation': word.translation,
+                    'part_of_speech': word.part_of_speech,
+                    'example_sentence': word.example_sentence,
+                    'image_url': word.image_url,
+                })
+            yield theme.id, {
+                'id': str(theme.id),
+                'name': theme.name,
+                'name_native': theme.name_native,
+                'level': theme.level,
+                'icon': theme.icon,
+                'words': words,
+            }
+
+    @staticmethod
+    def _festivals(language: str):
+        from apps.festivals.models import Festival
+
+        festivals = Festival.objects.filter(is_active=True).prefetch_related(
+            'activities', 'festival_stories__story'
+        )
+        for festival in festivals:
+            yield festival.id, {
+                'id': str(festival.id),
+                'name': festival.get_name_for_language(language),
+                'name_native': festival.name_native,
+                'description': festival.description,
+                'significance': festival.significance,
+                'typical_month': festival.typical_month,
+                'image_url': festival.image_url,
+                'story_ids': sorted(
+                    str(link.story_id) for link in festival.festival_stories.all()
+                    if link.story.language == language and link.story.is_active
+                ),
+                'activities': [
+                    {
+                        'id': str(activity.id),
+                        'title': activity.title,
+                        'activity_type': activity.activity_type,
+                        'description': activity.description,
+                        'instructions': activity.instructions,
+                        'duration_minutes': activity.duration_minutes,
+                    }
+                    for activity in festival.activities.all() if activity.is_active
+                ],
+            }
+
+    @staticmethod
+    def _stories(language: str, free_only: bool, only_ids, texts: List[str]):
+        from apps.stories.models import Story
+
+        stories = Story.objects.filter(language=language, is_active=True)
+        if free_only:
+            stories = stories.filter(tier=Story.Tier.FREE)
+        if only_ids is not None:
+            stories = stories.filter(id__in=only_ids)
+        for story in stories.prefetch_related('pages').order_by('sort_order', 'title'):
+            pages = []
+            for page in story.pages.all():
+                texts.append(page.text_content)
+                pages.append({
+                    'page_number': page.page_number,
+                    'text': page.text_content,
+                    'image_url': page.image_url,
+                })
+            yield story.id, {
+                'id': str(story.id),
+                'title': story.title,
+                'title_translit': story.title_translit,
+                'level': story.level,
+                'tier': story.tier,
+                'cover_image_url': story.cover_image_url,
+                'pages': pages,
+            }
+
+    @classmethod
+    def _audio(cls, language: str, texts: List[str]) -> Iterator[Tuple[str, bytes]]:
+        """Stored TTS audio for the package's texts, plus a text -> file index."""
+        from apps.speech.models import AudioCache
+        from apps.speech.services.audio_store import AudioStore
+
+        by_hash = {AudioStore.text_hash(text): AudioStore.normalize_text(text) for text in texts}
+        hashes = sorted(by_hash)
+
+        index = {}
+        for start in range(0, len(hashes), cls.LOOKUP_BATCH):
+            rows = (
+                AudioCache.objects.filter(language=language, text_hash__in=hashes[start:start + cls.LOOKUP_BATCH])
+                .exclude(audio_file='')
+                .only('cache_key', 'text_hash', 'audio_file', 'audio_format', 'audio_duration_ms')
+                .order_by('text_hash', '-access_count')
+            )
+            for row in rows:
+                text = by_hash[row.text_hash]
+                if text in index:
+                    continue  # most-used voice wins
+                try:
+                    with row.audio_file.open('rb') as f:
+                        data = f.read()
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable audio {row.cache_key}: {e}")
+                    continue
+                path = f"audio/{row.cache_key}.{row.audio_format}"
+                index[text] = {'path': path, 'duration_ms': row.audio_duration_ms}
+                yield path, data
+
+        yield 'audio/index.json', cls._encode(index)
@@ -0,0 +1,557 @@
+"""
+Bulk offline progress sync.
+
+A device that was offline queues progress events locally and uploads them
+in one request when it reconnects. Each event carries a device-generated
+idempotency key, so retrying an upload (e.g. after a dropped connection)
+never double-counts.
+
+One sync:
+- validates events and drops keys already seen (in the batch or in
+  OfflineSyncEvent)
+- loads every affected Progress / LessonProgress / WordProgress row and
+  DailyActivity day with one query per table
+- replays the events in occurrence order in memory, following the same
+  rules as the per-event paths (ProgressService, LessonProgress.update_progress,
+  WordProgress.update_srs)
+- writes with bulk_create / bulk_update and records the points as a
+  single ledger event
+- advances the streak, checks badges and levels once for the whole batch
+
+Event format:
+    {"idempotency_key": "...", "type": "STORY_PAGE", "occurred_at": "<ISO 8601>",
+     "story_id": "...", "current_page": 3, "time_spent_seconds": 40}
+    STORY_COMPLETE: story_id, time_spent_seconds
+    LESSON_SCORE:   lesson_id, score (0-100)
+    WORD_REVIEW:    word_id, quality (0-5)
+"""
+import logging
+import uuid
+from collections import defaultdict
+from datetime import timedelta, timezone as dt_timezone
+from typing import List
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.core.cache_service import ProgressCacheService
+from apps.gamification.services.points import PointsService
+from apps.offline.models import ChildOfflineContent, OfflineSyncEvent
+
+logger = logging.getLogger(__name__)
+
+EventType = OfflineSyncEvent.EventType
+
+# Content id each event type refers to
+_ID_FIELDS = {
+    EventType.STORY_PAGE: 'story_id',
+    EventType.STORY_COMPLETE: 'story_id',
+    EventType.LESSON_SCORE: 'lesson_id',
+    EventType.WORD_REVIEW: 'word_id',
+}
+# Integer payload fields with their (min, max) bounds
+_INT_FIELDS = {
+    EventType.STORY_PAGE: {'current_page': (0, None), 'time_spent_seconds': (0, None)},
+    EventType.STORY_COMPLETE: {'time_spent_seconds': (0, None)},
+    EventType.LESSON_SCORE: {'score': (0, 100)},
+    EventType.WORD_REVIEW: {'quality': (0, 5)},
+}
+
+
+class OfflineSyncError(ValueError):
+    """An uploaded event can't be applied."""
+
+
+class OfflineSyncService:
+    """Apply a batch of offline progress events in one transaction."""
+
+    CURSOR_SALT = 'offline-sync'
+
+    @classmethod
+    def max_events(cls) -> int:
+        return getattr(settings, 'OFFLINE_SYNC_MAX_EVENTS', 1000)
+
+    @classmethod
+    def max_age(cls) -> timedelta:
+        return timedelta(days=getattr(settings, 'OFFLINE_SYNC_MAX_AGE_DAYS', 30))
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def sync(cls, child, raw_events: List[dict]) -> dict:
+        """
+        Apply uploaded events for a child.
+
+        Returns a summary with the accepted count, duplicate and rejected
+        keys, derived point/streak/badge/level changes and the new cursor.
+        """
+        events, rejected = cls._parse(raw_events)
+
+        # Dedupe within the batch (first wins), then against stored keys
+        unique, duplicates = {}, []
+        for event in events:
+            if event['idempotency_key'] in unique:
+                duplicates.append(event['idempotency_key'])
+            else:
+                unique[event['idempotency_key']] = event
+
+        with transaction.atomic():
+            # Serialize syncs per child so a retried upload racing the
+            # original can't pass the duplicate check twice
+            type(child).objects.select_for_update().filter(pk=child.pk).first()
+            seen = set(
+                OfflineSyncEvent.objects.filter(
+                    child=child, idempotency_key__in=list(unique)
+                ).values_list('idempotency_key', flat=True)
+            )
+            duplicates.extend(key for key in unique if key in seen)
+            pending = sorted(
+                (event for key, event in unique.items() if key not in seen),
+                key=lambda event: event['occurred_at'],
+            )
+
+            applier = _BatchApplier(child, pending)
+            applied = []
+            for event in pending:
+                try:
+                    applier.apply(event)
+                except OfflineSyncError as e:
+                    rejected.append({'idempotency_key': event['idempotency_key'], 'detail': str(e)})
+                else:
+                    applied.append(event)
+
+            applier.flush()
+            OfflineSyncEvent.objects.bulk_create([
+                OfflineSyncEvent(
+                    child=child,
+                    idempotency_key=event['idempotency_key'],
+                    event_type=event['type'],
+                    occurred_at=event['occurred_at'],
+                    payload=event['payload'],
+                )
+                for event in applied
+            ])
+            derived = applier.finish()
+
+            synced_at = timezone.now()
+            cursor = cls.make_cursor(child)
+            ChildOfflineContent.objects.filter(child=child).update(
+                sync_status=ChildOfflineContent.SyncStatus.SYNCED,
+                last_sync_at=synced_at,
+                offline_progress={'cursor': cursor, 'last_batch': len(applied)},
+                updated_at=synced_at,
+            )
+
+        logger.info(
+            f"Offline sync for child {child.id}: {len(applied)} applied, "
+            f"{len(duplicates)} duplicate, {len(rejected)} rejected"
+        )
+        return {
+            'cursor': cursor,
+            'accepted': len(applied),
+            'duplicates': duplicates,
+            'rejected': rejected,
+            **derived,
+        }
+
+    @classmethod
+    def make_cursor(cls, child) -> str:
+        """
+        Compact signed acknowledgement of everything synced so far.
+
+        `n` counts events the server holds for the child and `t` is the
+        latest occurred_at among them; devices can drop queued events up
+        to `t` once they hold this cursor.
+        """
+        stats = OfflineSyncEvent.objects.filter(child=child).aggregate(n=Count('id'), t=Max('occurred_at'))
+        return signing.dumps(
+            {'n': stats['n'], 't': int(stats['t'].timestamp()) if stats['t'] else 0},
+            salt=cls.CURSOR_SALT,
+            compress=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _parse(cls, raw_events):
+        events, rejected = [], []
+        now = timezone.now()
+        oldest = now - cls.max_age()
+
+        for raw in raw_events:
+            key = raw.get('idempotency_key') if isinstance(raw, dict) else None
+            if not isinstance(key, str) or not key or len(key) > 64:
+                rejected.append({'idempotency_key': key, 'detail': 'idempotency_key is required (max 64 chars)'})
+                continue
+            try:
+                events.append(cls._parse_event(raw, now, oldest))
+            except OfflineSyncError as e:
+                rejected.append({'idempotency_key': key, 'detail': str(e)})
+        return events, rejected
+
+    @staticmethod
+    def _parse_event(raw: dict, now, oldest) -> dict:
+        event_type = raw.get('type')
+        if event_type not in _ID_FIELDS:
+            raise OfflineSyncError(f"Unknown event type '{event_type}'")
+
+        occurred_at = parse_datetime(str(raw.get('occurred_at') or ''))
+        if occurred_at is None:
+            raise OfflineSyncError('occurred_at must be an ISO 8601 datetime')
+        if timezone.is_naive(occurred_at):
+            occurred_at = timezone.make_aware(occurred_at, dt_timezone.utc)
+        if occurred_at < oldest:
+            raise OfflineSyncError('Event is too old to sync')
+        # Device clocks drift; never record activity in the future
+        occurred_at = min(occurred_at, now)
+
+        id_field = _ID_FIELDS[event_type]
+        payload = {id_field: str(raw.get(id_field) or '')}
+        if not payload[id_field]:
+            raise OfflineSyncError(f"{id_field} is required")
+
+        for field, (low, high) in _INT_FIELDS[event_type].items():
+            try:
+                value = int(raw.get(field, 0))
+            except (TypeError, ValueError):
+                raise OfflineSyncError(f"Invalid integer value for {field}")
+            if value < low or (high is not None and value > high):
+                raise OfflineSyncError(f"{field} out of range")
+            payload[field] = value
+
+        return {
+            'idempotency_key': raw['idempotency_key'],
+            'type': event_type,
+            'occurred_at': occurred_at,
+            'payload': payload,
+        }
+
+
+def _valid_uuids(values) -> List[uuid.UUID]:
+    valid = []
+    for value in values:
+        try:
+            valid.append(uuid.UUID(value))
+        except ValueError:
+            continue
+    return valid
+
+
+class _BatchApplier:
+    """
+    In-memory replay of a sync batch.
+
+    Every row the batch touches is loaded up front (one query per table),
+    mutated per event and written back in flush().
+    """
+
+    def __init__(self, child, events: List[dict]):
+        self.child = child
+        self.start_level = child.level
+        self.points = 0
+        self.stories_completed = 0
+        self.reading_seconds = 0
+        self.active_dates = set()
+        self.daily = defaultdict(lambda: defaultdict(int))
+        self._created = set()
+        self._dirty = set()
+        self.module_completions = defaultdict(lambda: [0, 0])
+        self._load(events)
+
+    def _load(self, events: List[dict]):
+        """Load every row the batch touches, one query per table."""
+        from apps.curriculum.models import Lesson, LessonProgress, VocabularyWord, WordProgress
+        from apps.progress.models import Progress
+        from apps.stories.models import Story
+
+        ids = defaultdict(set)
+        for event in events:
+            id_field = _ID_FIELDS[event['type']]
+            ids[id_field].add(event['payload'][id_field])
+
+        story_ids = _valid_uuids(ids['story_id'])
+        lesson_ids = _valid_uuids(ids['lesson_id'])
+        word_ids = _valid_uuids(ids['word_id'])
+
+        self._stories = {str(s.id): s for s in Story.objects.filter(id__in=story_ids, is_active=True)}
+        self._progress = {
+            str(p.story_id): p for p in Progress.objects.filter(child=self.child, story_id__in=story_ids)
+        }
+        self._lessons = {
+            str(lesson.id): lesson
+            for lesson in Lesson.objects.filter(id__in=lesson_ids).only(
+                'id', 'module_id', 'mastery_threshold', 'points_available'
+            )
+        }
+        self._lesson_progress = {
+            str(lp.lesson_id): lp
+            for lp in LessonProgress.objects.filter(child=self.child, lesson_id__in=lesson_ids)
+        }
+        self._words = set(
+            str(pk) for pk in VocabularyWord.objects.filter(id__in=word_ids).values_list('id', flat=True)
+        )
+        self._word_progress = {
+            str(wp.word_id): wp for wp in WordProgress.objects.filter(child=self.child, word_id__in=word_ids)
+        }
+
+    # ------------------------------------------------------------------
+
+    def apply(self, event: dict):
+        handler = {
+            EventType.STORY_PAGE: self._story_page,
+            EventType.STORY_COMPLETE: self._story_complete,
+            EventType.LESSON_SCORE: self._lesson_score,
+            EventType.WORD_REVIEW: self._word_review,
+        }[event['type']]
+        handler(event['payload'], event['occurred_at'])
+        self.active_dates.add(timezone.localdate(event['occurred_at']))
+
+    def _mark(self, obj, created=False):
+        (self._created if created else self._dirty).add((type(obj), obj.pk))
+
+    def _add_daily(self, occurred_at, **counts):
+        day = self.daily[timezone.localdate(occurred_at)]
+        for field, value in counts.items():
+            day[field] += value
+
+    # Stories (mirrors ProgressService.start_story/update_progress/complete_story)
+
+    def _start_story(self, story, occurred_at):
+        from apps.progress.models import Progress
+
+        progress = self._progress.get(str(story.id))
+        if progress is not None:
+            return progress
+        points = settings.POINTS_CONFIG['STORY_STARTED']
+        progress = Progress(
+            child=self.child,
+            story=story,
+            status=Progress.Status.IN_PROGRESS,
+            started_at=occurred_at,
+            last_read_at=occurred_at,
+            points_earned=points,
+        )
+        self._progress[str(story.id)] = progress
+        self._mark(progress, created=True)
+        self.points += points
+        self._add_daily(occurred_at, stories_started=1, points_earned=points)
+        return progress
+
+    def _story(self, payload):
+        story = self._stories.get(payload['story_id'])
+        if story is None:
+            raise OfflineSyncError('Story not found')
+        return story
+
+    def _story_page(self, payload, occurred_at):
+        from apps.progress.models import Progress
+
+        story = self._story(payload)
+        progress = self._start_story(story, occurred_at)
+        if progress.status == Progress.Status.COMPLETED:
+            return
+
+        current_page = min(payload['current_page'], story.page_count)
+        pages_read = max(0, current_page - progress.current_page)
+        time_spent = payload['time_spent_seconds']
+
+        progress.current_page = current_page
+        progress.pages_completed = current_page
+        progress.time_spent_seconds += time_spent
+        self.reading_seconds += time_spent
+        progress.last_read_at = max(progress.last_read_at or occurred_at, occurred_at)
+        if progress.status == Progress.Status.NOT_STARTED:
+            progress.status = Progress.Status.IN_PROGRESS
+            progress.started_at = occurred_at
+
+        if pages_read > 0:
+            points = pages_read * settings.POINTS_CONFIG['PAGE_READ']
+            progress.points_earned += points
+            self.points += points
+            self._add_daily(occurred_at, pages_read=pages_read, time_spent_seconds=time_spent, points_earned=points)
+        self._mark(progress)
+
+    def _story_complete(self, payload, occurred_at):
+        from apps.progress.models import Progress
+
+        story = self._story(payload)
+        progress = self._start_story(story, occurred_at)
+        if progress.status == Progress.Status.COMPLETED:
+            return
+
+        remaining_pages = max(0, story.page_count - progress.pages_completed)
+        points = (
+            remaining_pages * settings.POINTS_CONFIG['PAGE_READ']
+            + settings.POINTS_CONFIG['STORY_COMPLETED_BASE'] * story.level
+        )
+        time_spent = payload['time_spent_seconds']
+
+        progress.status = Progress.Status.COMPLETED
+        self.stories_completed += 1
+        progress.current_page = story.page_count
+        progress.pages_completed = story.page_count
+        progress.time_spent_seconds += time_spent
+        self.reading_seconds += time_spent
+        progress.completed_at = occurred_at
+        progress.last_read_at = max(progress.last_read_at or occurred_at, occurred_at)
+        progress.points_earned += points
+        self.points += points
+        self._add_daily(
+            occurred_at, stories_completed=1, pages_read=remaining_pages,
+            time_spent_seconds=time_spent, points_earned=points
+        )
+        self._mark(progress)
+
+    # Lessons (mirrors LessonProgressUpdateView)
+
+    def _lesson_score(self, payload, occurred_at):
+        from apps.curriculum.models import LessonProgress
+
+        lesson = self._lessons.get(payload['lesson_id'])
+        if lesson is None:
+            raise OfflineSyncError('Lesson not found')
+        progress = self._lesson_progress.get(payload['lesson_id'])
+        if progress is None:
+            progress = LessonProgress(child=self.child, lesson=lesson)
+            self._lesson_progress[payload['lesson_id']] = progress
+            self._mark(progress, created=True)
+        else:
+            progress.lesson = lesson
+            self._mark(progress)
+
+        if progress.update_progress(payload['score'], completed_at=occurred_at, commit=False):
+            completion = self.module_completions[lesson.module_id]
+            completion[0] += 1
+            completion[1] += lesson.points_available
+
+    # Vocabulary (mirrors SRSService.record_review)
+
+    def _word_review(self, payload, occurred_at):
+        from apps.curriculum.models import WordProgress
+
+        word_id = payload['word_id']
+        if word_id not in self._words:
+            raise OfflineSyncError('Word not found')
+        progress = self._word_progress.get(word_id)
+        if progress is None:
+            progress = WordProgress(child=self.child, word_id=word_id, next_review=occurred_at)
+            self._word_progress[word_id] = progress
+            self._mark(progress, created=True)
+        else:
+            self._mark(progress)
+        progress.update_srs(payload['quality'], reviewed_at=occurred_at, commit=False)
+
+    # ------------------------------------------------------------------
+
+    def flush(self):
+        """Write all touched rows with bulk_create / bulk_update."""
+        from apps.curriculum.models import LessonProgress, ModuleProgress, WordProgress
+        from apps.progress.models import DailyActivity, Progress
+
+        now = timezone.now()
+        tables = (
+            (Progress, self._progress, [
+                'status', 'current_page', 'pages_completed', 'time_spent_seconds',
+                'points_earned', 'started_at', 'completed_at', 'last_read_at', 'updated_at',
+            ]),
+            (LessonProgress, self._lesson_progress, [
+                'score', 'attempts', 'best_score', 'is_complete', 'completed_at', 'updated_at',
+            ]),
+            (WordProgress, self._word_progress, [
+                'ease_factor', 'interval_days', 'repetitions', 'next_review', 'last_reviewed',
+                'times_reviewed', 'times_correct', 'mastered', 'mastered_at', 'updated_at',
+            ]),
+        )
+        for model, rows, fields in tables:
+            if not rows:
+                continue
+            created = [obj for obj in rows.values() if (model, obj.pk) in self._created]
+            updated = [
+                obj for obj in rows.values()
+                if (model, obj.pk) in self._dirty and (model, obj.pk) not in self._created
+            ]
+            for obj in updated:
+                obj.updated_at = now
+            if created:
+                model.objects.bulk_create(created)
+            if updated:
+                model.objects.bulk_update(updated, fields)
+
+        for module_id, (lessons, points) in self.module_completions.items():
+            ModuleProgress.objects.get_or_create(child=self.child, module_id=module_id)
+            ModuleProgress.objects.filter(child=self.child, module_id=module_id).update(
+                lessons_completed=F('lessons_completed') + lessons,
+                total_points=F('total_points') + points,
+                updated_at=now,
+            )
+
+        if self.daily:
+            existing = {
+                activity.date: activity
+                for activity in DailyActivity.objects.filter(child=self.child, date__in=list(self.daily))
+            }
+            created, updated = [], []
+            for day, counts in self.daily.items():
+                activity = existing.get(day)
+                if activity is None:
+                    created.append(DailyActivity(child=self.child, date=day, **counts))
+                    continue
+                for field, value in counts.items():
+                    setattr(activity, field, getattr(activity, field) + value)
+                activity.updated_at = now
+                updated.append(activity)
+            if created:
+                DailyActivity.objects.bulk_create(created)
+            if updated:
+                DailyActivity.objects.bulk_update(updated, [
+                    'stories_started', 'stories_completed', 'pages_read',
+                    'time_spent_seconds', 'points_earned', 'updated_at',
+                ])
+
+        # One ledger event for the whole batch
+        PointsService.award(self.child, self.points, PointsService.Reason.OFFLINE_SYNC)
+
+    def finish(self) -> dict:
+        """Streak, badges and level, computed once for the whole batch."""
+        from apps.gamification.models import Badge
+        from apps.gamification.services.badges import BadgeService
+        from apps.gamification.services.streaks import StreakService
+
+        derived = {'points_awarded': self.points, 'new_badges': [], 'level_up': {'leveled_up': False}}
+        if not self.active_dates:
+            return derived
+
+        streak = StreakService.record_activity_dates(self.child, self.active_dates)
+        new_badges = BadgeService.record(
+            self.child,
+            increments={
+                Badge.CriteriaType.STORIES_COMPLETED: self.stories_completed,
+                Badge.CriteriaType.TIME_SPENT_MINUTES: self.reading_seconds,
+            },
+            values={
+                Badge.CriteriaType.POINTS_EARNED: self.child.total_points,
+                Badge.CriteriaType.STREAK_DAYS: streak.current_streak,
+            },
+        )
+        derived.update({
+            'streak': {
+                'current_streak': streak.current_streak,
+                'longest_streak': streak.longest_streak,
+            },
+            'new_badges': [child_badge.badge.name for child_badge in new_badges],
+        })
+        # The points ledger moves the level with the points (badge bonuses included)
+        if self.child.level > self.start_level:
+            derived['level_up'] = {
+                'leveled_up': True, 'old_level': self.start_level, 'new_level': self.child.level,
+            }
+        ProgressCacheService.invalidate_child_progress(self.child.id)
+        return derived
@@ -0,0 +1,18 @@
+"""Offline package URL configuration."""
+from django.urls import path
+
+from apps.offline.views import (
+    OfflinePackageDownloadView,
+    OfflinePackageListView,
+    OfflinePackageManifestView,
+    OfflineSyncView,
+)
+
+app_name = 'offline'
+
+urlpatterns = [
+    path('packages/', OfflinePackageListView.as_view(), name='package-list'),
+    path('packages/<uuid:package_id>/manifest/', OfflinePackageManifestView.as_view(), name='package-manifest'),
+    path('packages/<uuid:package_id>/download/', OfflinePackageDownloadView.as_view(), name='package-download'),
+    path('children/<uuid:child_id>/sync/', OfflineSyncView.as_view(), name='sync'),
+]
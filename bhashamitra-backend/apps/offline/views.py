@@ -0,0 +1,179 @@
+"""Offline package API views."""
+import logging
+
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponseRedirect
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.children.models import Child
+from apps.offline.models import OfflinePackage
+from apps.offline.sync_service import OfflineSyncService
+from apps.speech.services.audio_delivery import (
+    DELIVERY_REDIRECT,
+    apply_cache_headers,
+    get_delivery_mode,
+    is_not_modified,
+    not_modified_response,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bundles are tier-gated, so browsers may keep them but shared caches must not
+PRIVATE_IMMUTABLE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+
+
+def _visible_packages(user):
+    """
+    Built packages the user's subscription tier may download.
+
+    LANGUAGE_PACK, CURRICULUM_MODULE and FESTIVAL_PACK carry premium stories
+    and themes, so FREE users only get FREE_TIER (like the story and
+    vocabulary endpoints, which filter by tier).
+    """
+    packages = OfflinePackage.objects.exclude(bundle_path='')
+    user_tier = (getattr(user, 'subscription_tier', 'FREE') or 'FREE').upper()
+    if user_tier == 'FREE':
+        packages = packages.filter(package_type=OfflinePackage.PackageType.FREE_TIER)
+    return packages
+
+
+def _cache_headers(response, etag_key):
+    apply_cache_headers(response, etag_key)
+    response['Cache-Control'] = PRIVATE_IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def _package_summary(package):
+    return {
+        'id': str(package.id),
+        'name': package.name,
+        'package_type': package.package_type,
+        'language': package.language,
+        'version': package.version,
+        'content_hash': package.content_hash,
+        'size_bytes': package.bundle_size_bytes,
+        'min_app_version': package.min_app_version,
+        'delta_from': sorted(package.deltas),
+    }
+
+
+class OfflinePackageListView(APIView):
+    """
+    GET /api/v1/offline/packages/?language=HINDI
+
+    Active built packages; devices compare content_hash with what they hold.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        packages = _visible_packages(request.user).filter(is_active=True)
+        language = request.query_params.get('language')
+        if language:
+            packages = packages.filter(language=language.upper())
+        packages = packages.defer('content_manifest').order_by('language', 'package_type')
+        return Response({'data': [_package_summary(package) for package in packages]})
+
+
+class OfflinePackageManifestView(APIView):
+    """
+    GET /api/v1/offline/packages/<id>/manifest/
+
+    File -> chunk hashes of a package version. A version never changes, so
+    the content hash is a strong ETag.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, package_id):
+        package = get_object_or_404(_visible_packages(request.user), id=package_id)
+        if is_not_modified(request, package.content_hash):
+            return _cache_headers(not_modified_response(package.content_hash), package.content_hash)
+        response = Response({'data': package.content_manifest})
+        return _cache_headers(response, package.content_hash)
+
+
+class OfflinePackageDownloadView(APIView):
+    """
+    GET /api/v1/offline/packages/<id>/download/?from_version=1.0.2
+
+    Serves the delta bundle from `from_version` when one was built,
+    otherwise the full bundle. X-Bundle-Type tells the client which.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, package_id):
+        package = get_object_or_404(_visible_packages(request.user), id=package_id)
+
+        from_version = request.query_params.get('from_version')
+        delta = package.deltas.get(from_version) if from_version else None
+        if delta:
+            path, bundle_type = delta['path'], 'delta'
+            etag_key = f"{package.content_hash}-{from_version}"
+        else:
+            path, bundle_type = package.bundle_path, 'full'
+            etag_key = package.content_hash
+
+        if is_not_modified(request, etag_key):
+            return _cache_headers(not_modified_response(etag_key), etag_key)
+
+        if get_delivery_mode() == DELIVERY_REDIRECT:
+            try:
+                response = HttpResponseRedirect(default_storage.url(path))
+                response['X-Bundle-Type'] = bundle_type
+                return response
+            except NotImplementedError:
+                pass
+
+        try:
+            bundle = default_storage.open(path, 'rb')
+        except (FileNotFoundError, OSError) as e:
+            logger.error(f"Offline bundle missing for package {package.id}: {path} ({e})")
+            return Response(
+                {'detail': 'Package bundle is not available.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        filename = f"{package.language.lower()}-{package.package_type.lower()}-{package.version}"
+        if delta:
+            filename += f"-from-{from_version}"
+        response = FileResponse(
+            bundle,
+            as_attachment=True,
+            filename=f"{filename}.zip",
+            content_type='application/zip',
+        )
+        response['X-Bundle-Type'] = bundle_type
+        return _cache_headers(response, etag_key)
+
+
+class OfflineSyncView(APIView):
+    """
+    POST /api/v1/offline/children/<child_id>/sync/
+
+    Upload a batch of progress events recorded offline:
+        {"events": [{"idempotency_key": "...", "type": "STORY_PAGE", ...}, ...]}
+
+    Events already synced are reported as duplicates instead of being
+    applied again, so a device can safely retry the whole batch.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, child_id):
+        try:
+            child = Child.objects.get(pk=child_id, user=request.user)
+        except Child.DoesNotExist:
+            return Response({'detail': 'Child not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        events = request.data.get('events')
+        if not isinstance(events, list):
+            return Response({'detail': 'events must be a list'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(events) > OfflineSyncService.max_events():
+            return Response(
+                {'detail': f"At most {OfflineSyncService.max_events()} events per sync"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({'data': OfflineSyncService.sync(child, events)})
@@ -4,11 +4,11 @@ Parent Dashboard Serializers.
 
 from rest_framework import serializers
 from django.utils import timezone
-from django.db.models import Sum
 from datetime import timedelta
 
 from apps.children.models import Child
 from apps.progress.models import DailyProgress, ActivityLog
+from apps.progress.rollup_service import ActivityRollupService
 from apps.parent_engagement.models import LearningGoal
 
 
@@ -39,17 +39,8 @@ class ChildSummarySerializer(serializers.ModelSerializer):
             return 0
 
     def get_xp_this_week(self, obj):
-        """Calculate XP earned this week."""
-        today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
-
-        xp_this_week = DailyProgress.objects.filter(
-            child=obj,
-            date__gte=week_start,
-            date__lte=today
-        ).aggregate(total_xp=Sum('points_earned'))['total_xp'] or 0
-
-        return xp_this_week
+        """XP earned this week, from the child's activity rollup."""
+        return ActivityRollupService.get(obj)['week']['points_earned']
 
     def get_recent_activity_count(self, obj):
         """Count activities in the last 7 days."""
@@ -14,7 +14,9 @@ from django.db.models import Sum, Count, Avg
 from datetime import timedelta
 
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
 from apps.progress.models import DailyProgress, ActivityLog
+from apps.progress.rollup_service import ActivityRollupService
 from apps.parent_engagement.models import LearningGoal
 
 from .serializers import (
@@ -89,23 +91,9 @@ class ChildSummaryView(APIView):
         )
 
         today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
 
-        # Get this week's progress
-        weekly_progress = DailyProgress.objects.filter(
-            child=child,
-            date__gte=week_start,
-            date__lte=today
-        ).aggregate(
-            total_time=Sum('time_spent_minutes'),
-            total_lessons=Sum('lessons_completed'),
-            total_exercises=Sum('exercises_completed'),
-            total_games=Sum('games_played'),
-            total_points=Sum('points_earned'),
-        )
-
-        # Calculate current streak
-        streak = self._calculate_streak(child, today)
+        # This week's totals and the streak come precomputed
+        rollup = ActivityRollupService.get(child)
 
         # Get recent achievements
         recent_achievements = ActivityLog.objects.filter(
@@ -125,42 +113,12 @@ class ChildSummaryView(APIView):
 
         return Response({
             'child': ChildBasicSerializer(child).data,
-            'weekly_summary': {
-                'time_spent_minutes': weekly_progress['total_time'] or 0,
-                'lessons_completed': weekly_progress['total_lessons'] or 0,
-                'exercises_completed': weekly_progress['total_exercises'] or 0,
-                'games_played': weekly_progress['total_games'] or 0,
-                'points_earned': weekly_progress['total_points'] or 0,
-            },
-            'current_streak': streak,
+            'weekly_summary': rollup['week'],
+            'current_streak': rollup['current_streak'],
             'recent_achievements': recent_achievements,
             'active_goals': goals_data,
         })
 
-    def _calculate_streak(self, child, today):
-        """Calculate consecutive days of activity."""
-        streak = 0
-        current_date = today
-
-        while True:
-            has_activity = DailyProgress.objects.filter(
-                child=child,
-                date=current_date,
-                time_spent_minutes__gt=0
-            ).exists()
-
-            if has_activity:
-                streak += 1
-                current_date -= timedelta(days=1)
-            else:
-                break
-
-            # Cap at 365 to prevent infinite loops
-            if streak >= 365:
-                break
-
-        return streak
-
 
 class ChildActivityView(generics.ListAPIView):
     """
@@ -490,10 +448,10 @@ class ProgressUpdateView(APIView):
             activity_log_type = 'LESSON_COMPLETED'
 
         daily_progress.save()
+        ActivityRollupService.record_day(daily_progress)
 
         # Update child's total points
-        child.total_points += points
-        child.save(update_fields=['total_points'])
+        PointsService.award(child, points, PointsService.Reason.LEARNING_SESSION)
 
         # Create activity log entry
         description = details.get('description', f'Completed {activity_type}')
@@ -554,8 +512,7 @@ class ProgressUpdateView(APIView):
                         description=f'Goal completed: {goal_title}',
                         points_earned=50,  # Bonus points for completing goal
                     )
-                    child.total_points += 50
-                    child.save(update_fields=['total_points'])
+                    PointsService.award(child, 50, PointsService.Reason.GOAL_COMPLETED, goal.id)
 
 
 class ParentPreferencesView(APIView):
@@ -741,6 +698,9 @@ class ChildReportCardView(APIView):
 
     Get comprehensive report card for a child.
 
+    Served from a precomputed snapshot; 'snapshot' in the response says
+    when it was generated and whether newer activity is still pending.
+
     Query Parameters:
     - period: Number of days to include (default 30, max 365)
     """
@@ -754,18 +714,17 @@ class ChildReportCardView(APIView):
             deleted_at__isnull=True
         )
 
-        from apps.progress.report_card_service import ReportCardService
+        from apps.progress.snapshot_service import ReportSnapshotService
 
         # Get period from query params (default 30 days)
         period = request.query_params.get('period', 30)
         try:
-            period = min(int(period), 365)
+            period = max(1, min(int(period), 365))
         except ValueError:
             period = 30
 
-        report = ReportCardService.get_comprehensive_report(
-            child_id=str(child.id),
-            period_days=period
+        report = ReportSnapshotService.get(
+            child, ReportSnapshotService.ReportType.COMPREHENSIVE, period
         )
 
         return Response(report)
@@ -821,17 +780,16 @@ class ChildMonthlyStatsView(APIView):
             deleted_at__isnull=True
         )
 
-        from apps.progress.report_card_service import ReportCardService
+        from apps.progress.snapshot_service import ReportSnapshotService
 
         months = request.query_params.get('months', 3)
         try:
-            months = min(int(months), 12)
+            months = max(1, min(int(months), 12))
         except ValueError:
             months = 3
 
-        comparison = ReportCardService.get_monthly_comparison(
-            child_id=str(child.id),
-            months=months
+        comparison = ReportSnapshotService.get(
+            child, ReportSnapshotService.ReportType.MONTHLY, months
         )
 
         return Response(comparison)
@@ -152,6 +152,11 @@ class SendMessageSerializer(serializers.Serializer):
         allow_blank=True,
         help_text="URL of voice recording (for voice input)"
     )
+    personalized = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text="Skip the shared response cache (reply depends on the child)"
+    )
 
     def validate_content(self, value):
         if not value or not value.strip():
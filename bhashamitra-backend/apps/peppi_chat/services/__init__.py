@@ -3,10 +3,15 @@ from .gemini_service import GeminiAIService
 from .content_moderator import ContentModerator
 from .context_builder import ContextBuilder
 from .prompt_templates import PromptTemplates
+from .response_cache import PeppiResponseCache
+from .streaming import SentenceStreamModerator, sse_event
 
 __all__ = [
     'GeminiAIService',
     'ContentModerator',
     'ContextBuilder',
     'PromptTemplates',
+    'PeppiResponseCache',
+    'SentenceStreamModerator',
+    'sse_event',
 ]
@@ -91,6 +91,7 @@ class ContextBuilder:
         cls,
         child,
         lesson=None,
+        shared: bool = False,
     ) -> dict:
         """
         Build context for curriculum help mode.
@@ -98,6 +99,8 @@ class ContextBuilder:
         Args:
             child: Child model instance
             lesson: Optional Lesson model instance
+            shared: Leave out the child's own progress (recent words, areas
+                to improve) so the reply can be cached for other children
 
         Returns:
             Context dictionary for prompt template
@@ -112,11 +115,11 @@ class ContextBuilder:
                 level_name = getattr(level, 'name_english', None) or getattr(level, 'name', 'Beginner')
                 level_code = getattr(level, 'code', 'L1')
 
-            # Get recent vocabulary from child's progress
-            recent_words = cls._get_recent_vocabulary(child)
-
-            # Get areas needing improvement
-            areas_to_improve = cls._get_areas_to_improve(child)
+            # Get recent vocabulary and areas needing improvement from child's progress
+            recent_words = areas_to_improve = ""
+            if not shared:
+                recent_words = cls._get_recent_vocabulary(child)
+                areas_to_improve = cls._get_areas_to_improve(child)
 
             # Build lesson content if provided
             lesson_title = ""
@@ -282,6 +285,7 @@ class ContextBuilder:
         cls,
         conversation,
         child,
+        shared: bool = False,
     ) -> dict:
         """
         Build complete context based on conversation mode.
@@ -289,6 +293,8 @@ class ContextBuilder:
         Args:
             conversation: PeppiConversation instance
             child: Child instance
+            shared: Build a context without per-child progress data (for
+                replies stored in PeppiResponseCache)
 
         Returns:
             Context dictionary for prompt template
@@ -312,6 +318,7 @@ class ContextBuilder:
             return cls.build_curriculum_help_context(
                 child,
                 conversation.lesson,
+                shared=shared,
             )
 
         else:  # GENERAL
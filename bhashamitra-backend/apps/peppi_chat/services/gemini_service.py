@@ -2,7 +2,7 @@
 import logging
 import time
 import traceback
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator, Optional
 
 from django.conf import settings
 
@@ -39,6 +39,12 @@ class GeminiAIService:
     TOP_P = 0.9
     TOP_K = 40
 
+    # Shown to the child when the API call fails
+    ERROR_MESSAGE = (
+        "अरे! Peppi को कुछ problem हो गई। 😅 "
+        "Ek minute mein phir try karo!"
+    )
+
     # Language code mapping
     LANGUAGE_CODES = {
         'HINDI': 'hi',
@@ -147,6 +153,36 @@ class GeminiAIService:
 
         return contents
 
+    @classmethod
+    def build_generation_config(cls):
+        """Generation settings shared by every call (child-safe thresholds)."""
+        from google.genai import types
+
+        return types.GenerateContentConfig(
+            temperature=cls.get_temperature(),
+            top_p=cls.TOP_P,
+            top_k=cls.TOP_K,
+            max_output_tokens=cls.get_max_tokens(),
+            safety_settings=[
+                types.SafetySetting(
+                    category='HARM_CATEGORY_HARASSMENT',
+                    threshold='BLOCK_MEDIUM_AND_ABOVE'
+                ),
+                types.SafetySetting(
+                    category='HARM_CATEGORY_HATE_SPEECH',
+                    threshold='BLOCK_MEDIUM_AND_ABOVE'
+                ),
+                types.SafetySetting(
+                    category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
+                    threshold='BLOCK_LOW_AND_ABOVE'
+                ),
+                types.SafetySetting(
+                    category='HARM_CATEGORY_DANGEROUS_CONTENT',
+                    threshold='BLOCK_MEDIUM_AND_ABOVE'
+                ),
+            ],
+        )
+
     @classmethod
     async def generate_response(
         cls,
@@ -155,6 +191,7 @@ class GeminiAIService:
         system_prompt: str,
         language: str = 'HINDI',
         stream: bool = False,
+        contents: Optional[list] = None,
     ) -> AsyncGenerator[str, None]:
         """
         Generate a response from Gemini (async version).
@@ -165,6 +202,8 @@ class GeminiAIService:
             system_prompt: The system prompt with Peppi personality
             language: The response language
             stream: Whether to stream the response
+            contents: Prebuilt conversation contents. Pass these when calling
+                from an async context - building them queries the database.
 
         Yields:
             Response chunks (if streaming) or full response
@@ -172,43 +211,19 @@ class GeminiAIService:
         start_time = time.time()
 
         try:
-            from google.genai import types
-
             client = cls.get_client()
             model_id = cls.get_model_id()
 
             # Build conversation contents
-            contents = cls.build_conversation_contents(
-                conversation,
-                user_message,
-                system_prompt
-            )
+            if contents is None:
+                contents = cls.build_conversation_contents(
+                    conversation,
+                    user_message,
+                    system_prompt
+                )
 
             # Configure generation settings
-            config = types.GenerateContentConfig(
-                temperature=cls.get_temperature(),
-                top_p=cls.TOP_P,
-                top_k=cls.TOP_K,
-                max_output_tokens=cls.get_max_tokens(),
-                safety_settings=[
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_HARASSMENT',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_HATE_SPEECH',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
-                        threshold='BLOCK_LOW_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_DANGEROUS_CONTENT',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                ],
-            )
+            config = cls.build_generation_config()
 
             if stream:
                 # Streaming response
@@ -246,11 +261,7 @@ class GeminiAIService:
 
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
-            error_msg = (
-                "अरे! Peppi को कुछ problem हो गई। 😅 "
-                "Ek minute mein phir try karo!"
-            )
-            yield error_msg
+            yield cls.ERROR_MESSAGE
 
     @classmethod
     def generate_response_sync(
@@ -275,8 +286,6 @@ class GeminiAIService:
         start_time = time.time()
 
         try:
-            from google.genai import types
-
             client = cls.get_client()
             model_id = cls.get_model_id()
 
@@ -288,30 +297,7 @@ class GeminiAIService:
             )
 
             # Configure generation settings
-            config = types.GenerateContentConfig(
-                temperature=cls.get_temperature(),
-                top_p=cls.TOP_P,
-                top_k=cls.TOP_K,
-                max_output_tokens=cls.get_max_tokens(),
-                safety_settings=[
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_HARASSMENT',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_HATE_SPEECH',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_SEXUALLY_EXPLICIT',
-                        threshold='BLOCK_LOW_AND_ABOVE'
-                    ),
-                    types.SafetySetting(
-                        category='HARM_CATEGORY_DANGEROUS_CONTENT',
-                        threshold='BLOCK_MEDIUM_AND_ABOVE'
-                    ),
-                ],
-            )
+            config = cls.build_generation_config()
 
             # Generate response
             response = client.models.generate_content(
@@ -340,11 +326,38 @@ class GeminiAIService:
             logger.error(f"Gemini API error: {str(e)}")
             logger.error(f"Gemini API full traceback:\n{error_details}")
             latency_ms = int((time.time() - start_time) * 1000)
-            error_msg = (
-                "अरे! Peppi को कुछ problem हो गई। 😅 "
-                "Ek minute mein phir try karo!"
+            return cls.ERROR_MESSAGE, 0, latency_ms
+
+    @classmethod
+    def stream_response_sync(cls, contents: list) -> Iterator[str]:
+        """
+        Stream a response synchronously, yielding text chunks as they arrive.
+
+        Used by the SSE endpoint when served over WSGI; under ASGI the view
+        uses generate_response(stream=True) instead.
+        """
+        start_time = time.time()
+        full_text = ""
+
+        try:
+            response = cls.get_client().models.generate_content_stream(
+                model=cls.get_model_id(),
+                contents=contents,
+                config=cls.build_generation_config(),
             )
-            return error_msg, 0, latency_ms
+            for chunk in response:
+                if chunk.text:
+                    full_text += chunk.text
+                    yield chunk.text
+
+            latency_ms = int((time.time() - start_time) * 1000)
+            logger.info(
+                f"Gemini sync streaming response completed: "
+                f"{len(full_text)} chars, {latency_ms}ms"
+            )
+        except Exception as e:
+            logger.error(f"Gemini API streaming error: {str(e)}")
+            yield cls.ERROR_MESSAGE
 
     @classmethod
     def count_tokens(cls, text: str) -> int:
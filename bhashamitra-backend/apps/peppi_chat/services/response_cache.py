@@ -0,0 +1,140 @@
+"""
+Response cache for deterministic Peppi chat turns.
+
+Most CURRICULUM_HELP traffic is a first turn asking a near-identical
+question ("what does क mean?"). Those replies are cached on:
+
+    (mode, language, age group, level, lesson, Peppi voice settings,
+     normalized user message)
+
+The prompt for a cacheable turn is built with a shared context
+(ContextBuilder.build_conversation_context(shared=True)), which leaves out
+the child's recent words and areas to improve, so nothing in a cached
+reply comes from one child's learning data.
+
+Only first turns are cached - later turns depend on conversation history.
+The lookup runs after ContentModerator.moderate_input, and is skipped for
+flagged input and for turns the client marks `personalized`. Only replies
+that passed output moderation unchanged and didn't ask for escalation are
+stored. The child's name is swapped for a placeholder so a cached reply
+greets whoever asks.
+
+Entries expire after PEPPI_RESPONSE_CACHE_TTL; Redis's eviction policy
+drops cold ones under memory pressure. invalidate_all() bumps a version
+(e.g. after prompt template changes).
+"""
+import hashlib
+import logging
+import re
+import string
+import unicodedata
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the child's name inside cached replies
+NAME_PLACEHOLDER = '⟨child_name⟩'
+
+# ASCII punctuation plus Devanagari danda/double danda
+_PUNCTUATION = string.punctuation + '।॥¿¡'
+_PUNCTUATION_RE = re.compile(f"[{re.escape(_PUNCTUATION)}]")
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _is_word_char(char: str) -> bool:
+    # Letters, digits and combining marks (Indic matras aren't matched by \w)
+    return char == '_' or unicodedata.category(char)[0] in 'LMN'
+
+
+def _replace_word(text: str, word: str, replacement: str) -> str:
+    """Replace whole-word occurrences only ("An" stays inside "Animals")."""
+    def substitute(match):
+        start, end = match.span()
+        if (start and _is_word_char(text[start - 1])) or (end < len(text) and _is_word_char(text[end])):
+            return match.group()
+        return replacement
+
+    return re.sub(re.escape(word), substitute, text)
+
+
+class PeppiResponseCache:
+    """Cache of moderated first-turn Peppi replies."""
+
+    CACHEABLE_MODES = ('CURRICULUM_HELP',)
+
+    # Replies longer than this aren't worth the memory
+    MAX_RESPONSE_CHARS = 4000
+
+    VERSION_KEY = "peppi:response_cache:version"
+
+    @classmethod
+    def get_ttl(cls) -> int:
+        return getattr(settings, 'PEPPI_RESPONSE_CACHE_TTL', 86400 * 7)
+
+    @classmethod
+    def normalize_message(cls, message: str) -> str:
+        """Case/punctuation/whitespace-insensitive form of a question."""
+        text = unicodedata.normalize('NFC', message).casefold()
+        text = _PUNCTUATION_RE.sub(' ', text)
+        return _WHITESPACE_RE.sub(' ', text).strip()
+
+    @classmethod
+    def age_group(cls, age: int) -> str:
+        if age <= 6:
+            return '4-6'
+        if age <= 9:
+            return '7-9'
+        return '10+'
+
+    @classmethod
+    def is_cacheable(cls, conversation, moderation_action: str, personalized: bool) -> bool:
+        """First, unflagged, non-personalized turn of a cacheable mode."""
+        return (
+            not personalized
+            and moderation_action == 'ALLOWED'
+            and conversation.mode in cls.CACHEABLE_MODES
+            # Only Peppi's greeting so far
+            and conversation.messages_count <= 1
+        )
+
+    @classmethod
+    def make_key(cls, conversation, child, child_age: int, user_message: str) -> str:
+        version = cache.get(cls.VERSION_KEY) or 0
+        parts = [
+            f"v{version}",
+            conversation.mode,
+            conversation.language,
+            cls.age_group(child_age),
+            str(getattr(child, 'level', '')),
+            str(conversation.lesson_id or ''),
+            getattr(child, 'peppi_gender', 'FEMALE'),
+            getattr(child, 'peppi_addressing', 'BY_NAME'),
+            cls.normalize_message(user_message),
+        ]
+        digest = hashlib.md5("|".join(parts).encode()).hexdigest()
+        return f"peppi:response:{digest}"
+
+    @classmethod
+    def get(cls, cache_key: str, child_name: str) -> Optional[str]:
+        template = cache.get(cache_key)
+        if template is None:
+            return None
+        logger.info(f"Peppi response cache hit: {cache_key}")
+        return template.replace(NAME_PLACEHOLDER, child_name)
+
+    @classmethod
+    def set(cls, cache_key: str, response_text: str, child_name: str) -> None:
+        if not response_text or len(response_text) > cls.MAX_RESPONSE_CHARS:
+            return
+        template = _replace_word(response_text, child_name, NAME_PLACEHOLDER) if child_name else response_text
+        cache.set(cache_key, template, cls.get_ttl())
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Orphan every cached reply (e.g. after prompt changes)."""
+        if not cache.add(cls.VERSION_KEY, 1, None):
+            cache.incr(cls.VERSION_KEY)
+        logger.info("Peppi response cache invalidated")
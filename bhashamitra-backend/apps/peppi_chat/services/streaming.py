@@ -0,0 +1,106 @@
+"""
+Sentence-level moderation and SSE framing for streamed Peppi replies.
+
+Gemini streams arbitrary text fragments. Nothing reaches the child until a
+full sentence has passed ContentModerator.moderate_output, so a blocked
+phrase can't leak out half-typed; the first sentence still arrives well
+before the full reply is generated.
+"""
+import json
+import re
+from typing import List, Tuple
+
+from rest_framework.renderers import BaseRenderer
+
+from .content_moderator import ContentModerator
+
+ESCALATION_FLAG = '[NEEDS_ESCALATION]'
+
+# Sentence ends: Latin punctuation, Devanagari danda/double danda, newlines
+_SENTENCE_END_RE = re.compile(r'[.!?।॥\n]+\s*')
+
+
+def sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets clients send `Accept: text/event-stream` to the streaming endpoint.
+
+    The stream itself bypasses renderers; this only formats responses
+    returned before streaming starts as a single event: `error` for
+    failures, `done` for a reply answered without the model (blocked input).
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get('response')
+        event = 'error' if response is not None and response.status_code >= 400 else 'done'
+        return sse_event(event, data if data is not None else {}).encode(self.charset)
+
+
+class SentenceStreamModerator:
+    """
+    Buffer streamed text and release it one moderated sentence at a time.
+
+    Usage:
+        moderator = SentenceStreamModerator(child_age)
+        for chunk in stream:
+            for text in moderator.feed(chunk):
+                send(text)
+        for text in moderator.flush():
+            send(text)
+    """
+
+    def __init__(self, child_age: int = 8):
+        self.child_age = child_age
+        self.raw_text = ''
+        self.safe_text = ''
+        self.issues: List[str] = []
+        self.needs_escalation = False
+        self._buffer = ''
+
+    @property
+    def was_modified(self) -> bool:
+        return bool(self.issues)
+
+    def feed(self, chunk: str) -> List[str]:
+        """Add a streamed fragment; returns any sentences now safe to send."""
+        self.raw_text += chunk
+        self._buffer += chunk
+
+        released = []
+        last_end = 0
+        for match in _SENTENCE_END_RE.finditer(self._buffer):
+            released.append(self._moderate(self._buffer[last_end:match.end()]))
+            last_end = match.end()
+        self._buffer = self._buffer[last_end:]
+        return [text for text in released if text]
+
+    def flush(self) -> List[str]:
+        """Release whatever is left once the stream ends."""
+        remaining, self._buffer = self._buffer, ''
+        text = self._moderate(remaining)
+        return [text] if text else []
+
+    def _moderate(self, segment: str) -> str:
+        if ESCALATION_FLAG in segment:
+            self.needs_escalation = True
+            segment = segment.replace(ESCALATION_FLAG, '')
+        if not segment.strip():
+            return ''
+
+        safe, modified, issues = ContentModerator.moderate_output(segment, self.child_age)
+        if modified:
+            self.issues.extend(issues)
+        self.safe_text += safe
+        return safe
+
+    def result(self) -> Tuple[str, str]:
+        """(raw reply without the escalation flag, moderated reply)."""
+        raw = self.raw_text.replace(ESCALATION_FLAG, '').strip()
+        return raw, self.safe_text.strip()
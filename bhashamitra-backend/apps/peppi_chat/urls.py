@@ -60,6 +60,14 @@ urlpatterns = [
         name='peppi-chat-messages'
     ),
 
+    # Send message, streaming the reply as Server-Sent Events
+    # POST /api/v1/children/{child_id}/peppi-chat/{conversation_id}/messages/stream/
+    path(
+        '<uuid:pk>/messages/stream/',
+        PeppiChatViewSet.as_view({'post': 'stream_message'}),
+        name='peppi-chat-messages-stream'
+    ),
+
     # End conversation
     # POST /api/v1/children/{child_id}/peppi-chat/{conversation_id}/end/
     path(
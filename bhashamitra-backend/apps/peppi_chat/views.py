@@ -1,11 +1,16 @@
 """API views for Peppi Chat."""
 import logging
+import time
 
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
@@ -36,7 +41,11 @@ from .services import (
     ContentModerator,
     ContextBuilder,
     PromptTemplates,
+    PeppiResponseCache,
+    SentenceStreamModerator,
+    sse_event,
 )
+from .services.streaming import ESCALATION_FLAG, EventStreamRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -198,16 +207,17 @@ class PeppiChatViewSet(ViewSet):
             'greeting': PeppiChatMessageSerializer(greeting_msg).data,
         }, status=status.HTTP_201_CREATED)
 
-    @action(detail=True, methods=['post'], url_path='messages')
-    def send_message(self, request, child_id=None, pk=None):
+    def _prepare_message(self, request, child_id, pk):
         """
-        Send a message in an existing conversation.
+        Validate, rate-limit and moderate an incoming chat message.
 
-        POST /api/children/{child_id}/peppi-chat/{conversation_id}/messages/
+        Shared by send_message and stream_message. Returns (prepared, None)
+        with everything needed to call the model, or (None, response) when
+        the request is answered without it (errors, blocked input).
         """
         child, error = self.get_child(request, child_id)
         if error:
-            return error
+            return None, error
 
         conversation = get_object_or_404(
             PeppiConversation,
@@ -219,7 +229,7 @@ class PeppiChatViewSet(ViewSet):
         # Check tier access with conversation mode (FREE users can only use CURRICULUM_HELP)
         has_access, tier_or_msg = self.check_tier_access(request.user, mode=conversation.mode)
         if not has_access:
-            return Response(
+            return None, Response(
                 {'error': tier_or_msg},
                 status=status.HTTP_403_FORBIDDEN
             )
@@ -227,14 +237,14 @@ class PeppiChatViewSet(ViewSet):
         # Check rate limits
         is_allowed, limit_msg = ContentModerator.check_rate_limit(child, tier_or_msg)
         if not is_allowed:
-            return Response(
+            return None, Response(
                 {'error': limit_msg},
                 status=status.HTTP_429_TOO_MANY_REQUESTS
             )
 
         serializer = SendMessageSerializer(data=request.data)
         if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            return None, Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         user_content = serializer.validated_data['content']
         input_type = serializer.validated_data.get('input_type', InputType.TEXT)
@@ -282,7 +292,7 @@ class PeppiChatViewSet(ViewSet):
             conversation.messages_count += 2
             conversation.save(update_fields=['messages_count', 'last_message_at'])
 
-            return Response({
+            return None, Response({
                 'user_message': PeppiChatMessageSerializer(user_msg).data,
                 'assistant_message': PeppiChatMessageSerializer(assistant_msg).data,
                 'was_moderated': True,
@@ -299,8 +309,33 @@ class PeppiChatViewSet(ViewSet):
             original_content=user_content if was_modified else '',
         )
 
-        # Build context and system prompt
-        context = ContextBuilder.build_conversation_context(conversation, child)
+        # First-turn curriculum questions are often identical across children
+        response_cache_key = None
+        if PeppiResponseCache.is_cacheable(
+            conversation, action, serializer.validated_data.get('personalized', False)
+        ):
+            response_cache_key = PeppiResponseCache.make_key(
+                conversation, child, child_age, user_content
+            )
+            cached_reply = PeppiResponseCache.get(response_cache_key, child.name)
+            if cached_reply is not None:
+                assistant_msg = self._save_assistant_reply(
+                    {'child': child, 'conversation': conversation, 'input_type': input_type},
+                    cached_reply, cached_reply, [], 0, 0, False,
+                )
+                return None, Response({
+                    'user_message': PeppiChatMessageSerializer(user_msg).data,
+                    'assistant_message': PeppiChatMessageSerializer(assistant_msg).data,
+                    'was_moderated': was_modified,
+                    'needs_escalation': False,
+                    'cached': True,
+                })
+
+        # Build context and system prompt. A reply that will be cached for
+        # other children must not be tailored to this child's progress.
+        context = ContextBuilder.build_conversation_context(
+            conversation, child, shared=response_cache_key is not None
+        )
 
         # Get Peppi settings from child model
         peppi_gender = getattr(child, 'peppi_gender', 'FEMALE').lower()
@@ -321,31 +356,32 @@ class PeppiChatViewSet(ViewSet):
             f"language={conversation.language}, system_prompt_length={len(system_prompt)}"
         )
 
-        # Generate AI response (synchronous for now)
-        try:
-            response_text, token_count, latency_ms = GeminiAIService.generate_response_sync(
-                conversation=conversation,
-                user_message=user_content,
-                system_prompt=system_prompt,
-                language=conversation.language,
-            )
-        except Exception as e:
-            logger.error(f"Gemini API error: {e}")
-            response_text = "अरे! Peppi को कुछ problem हो गई। 😅 Ek minute mein phir try karo!"
-            token_count = 0
-            latency_ms = 0
-
-        # Check for escalation flag
-        needs_escalation = '[NEEDS_ESCALATION]' in response_text
-        if needs_escalation:
-            # Strip the escalation flag from the response
-            response_text = response_text.replace('[NEEDS_ESCALATION]', '').strip()
-
-        # Moderate output
-        safe_response, output_modified, output_issues = ContentModerator.moderate_output(
-            response_text,
-            child_age
-        )
+        return {
+            'child': child,
+            'child_age': child_age,
+            'conversation': conversation,
+            'user_msg': user_msg,
+            'user_content': user_content,
+            'input_type': input_type,
+            'was_modified': was_modified,
+            'system_prompt': system_prompt,
+            'response_cache_key': response_cache_key,
+        }, None
+
+    def _save_assistant_reply(
+        self,
+        prepared: dict,
+        response_text: str,
+        safe_response: str,
+        output_issues: list,
+        token_count: int,
+        latency_ms: int,
+        needs_escalation: bool,
+    ) -> PeppiChatMessage:
+        """Persist the assistant reply and update conversation/usage stats."""
+        child = prepared['child']
+        conversation = prepared['conversation']
+        output_modified = bool(output_issues)
 
         if output_modified:
             ContentModerator.create_safety_log(
@@ -374,11 +410,21 @@ class PeppiChatViewSet(ViewSet):
         conversation.total_tokens_used += token_count
         conversation.save(update_fields=['messages_count', 'total_tokens_used', 'last_message_at'])
 
+        # Only clean replies are shared with other children
+        cache_key = prepared.get('response_cache_key')
+        if (
+            cache_key
+            and not needs_escalation
+            and not output_modified
+            and response_text != GeminiAIService.ERROR_MESSAGE
+        ):
+            PeppiResponseCache.set(cache_key, safe_response, child.name)
+
         # Update daily usage
         usage = PeppiChatUsage.get_or_create_today(child)
         usage.messages_sent += 1
         usage.tokens_used += token_count
-        if input_type == InputType.VOICE:
+        if prepared['input_type'] == InputType.VOICE:
             usage.voice_messages_sent += 1
         usage.save()
 
@@ -386,14 +432,150 @@ class PeppiChatViewSet(ViewSet):
             f"Peppi message: conv={conversation.id}, tokens={token_count}, "
             f"latency={latency_ms}ms, needs_escalation={needs_escalation}"
         )
+        return assistant_msg
+
+    @action(detail=True, methods=['post'], url_path='messages')
+    def send_message(self, request, child_id=None, pk=None):
+        """
+        Send a message in an existing conversation.
+
+        POST /api/children/{child_id}/peppi-chat/{conversation_id}/messages/
+        """
+        prepared, error = self._prepare_message(request, child_id, pk)
+        if error:
+            return error
+
+        conversation = prepared['conversation']
+
+        # Generate AI response
+        try:
+            response_text, token_count, latency_ms = GeminiAIService.generate_response_sync(
+                conversation=conversation,
+                user_message=prepared['user_content'],
+                system_prompt=prepared['system_prompt'],
+                language=conversation.language,
+            )
+        except Exception as e:
+            logger.error(f"Gemini API error: {e}")
+            response_text = GeminiAIService.ERROR_MESSAGE
+            token_count = 0
+            latency_ms = 0
+
+        # Check for escalation flag
+        needs_escalation = ESCALATION_FLAG in response_text
+        if needs_escalation:
+            # Strip the escalation flag from the response
+            response_text = response_text.replace(ESCALATION_FLAG, '').strip()
+
+        # Moderate output
+        safe_response, output_modified, output_issues = ContentModerator.moderate_output(
+            response_text,
+            prepared['child_age']
+        )
+
+        assistant_msg = self._save_assistant_reply(
+            prepared, response_text, safe_response, output_issues,
+            token_count, latency_ms, needs_escalation,
+        )
 
         return Response({
-            'user_message': PeppiChatMessageSerializer(user_msg).data,
+            'user_message': PeppiChatMessageSerializer(prepared['user_msg']).data,
             'assistant_message': PeppiChatMessageSerializer(assistant_msg).data,
-            'was_moderated': was_modified or output_modified,
+            'was_moderated': prepared['was_modified'] or output_modified,
             'needs_escalation': needs_escalation,
         })
 
+    @action(
+        detail=True,
+        methods=['post'],
+        url_path='messages/stream',
+        renderer_classes=[JSONRenderer, EventStreamRenderer],
+    )
+    def stream_message(self, request, child_id=None, pk=None):
+        """
+        Send a message and stream Peppi's reply as Server-Sent Events.
+
+        POST /api/children/{child_id}/peppi-chat/{conversation_id}/messages/stream/
+
+        Events:
+        - start: {"user_message": {...}}
+        - delta: {"text": "..."} - one moderated sentence at a time
+        - done:  {"assistant_message": {...}, "was_moderated": bool, "needs_escalation": bool}
+
+        Under ASGI the model call runs on the event loop, so a slow reply
+        doesn't hold a worker thread. Under WSGI it still streams, but
+        occupies the worker for the duration. Errors before the model call
+        (access, rate limit, blocked input) return the same JSON as
+        send_message.
+        """
+        prepared, error = self._prepare_message(request, child_id, pk)
+        if error:
+            return error
+
+        conversation = prepared['conversation']
+        # Built here: it queries the database, which the async stream can't
+        contents = GeminiAIService.build_conversation_contents(
+            conversation,
+            prepared['user_content'],
+            prepared['system_prompt'],
+        )
+        start_event = sse_event('start', {
+            'user_message': PeppiChatMessageSerializer(prepared['user_msg']).data,
+        })
+        moderator = SentenceStreamModerator(prepared['child_age'])
+        start_time = time.time()
+
+        if isinstance(request._request, ASGIRequest):
+            async def events():
+                yield start_event
+                async for chunk in GeminiAIService.generate_response(
+                    conversation=conversation,
+                    user_message=prepared['user_content'],
+                    system_prompt=prepared['system_prompt'],
+                    language=conversation.language,
+                    stream=True,
+                    contents=contents,
+                ):
+                    for text in moderator.feed(chunk):
+                        yield sse_event('delta', {'text': text})
+                for text in moderator.flush():
+                    yield sse_event('delta', {'text': text})
+                done = await sync_to_async(self._finish_stream)(prepared, moderator, start_time)
+                yield sse_event('done', done)
+        else:
+            def events():
+                yield start_event
+                for chunk in GeminiAIService.stream_response_sync(contents):
+                    for text in moderator.feed(chunk):
+                        yield sse_event('delta', {'text': text})
+                for text in moderator.flush():
+                    yield sse_event('delta', {'text': text})
+                yield sse_event('done', self._finish_stream(prepared, moderator, start_time))
+
+        response = StreamingHttpResponse(events(), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _finish_stream(self, prepared: dict, moderator: SentenceStreamModerator, start_time: float) -> dict:
+        """Save the streamed reply and build the final `done` event payload."""
+        response_text, safe_response = moderator.result()
+        assistant_msg = self._save_assistant_reply(
+            prepared,
+            response_text,
+            safe_response,
+            moderator.issues,
+            token_count=GeminiAIService.count_tokens(response_text),
+            latency_ms=int((time.time() - start_time) * 1000),
+            needs_escalation=moderator.needs_escalation,
+        )
+        return {
+            'assistant_message': PeppiChatMessageSerializer(assistant_msg).data,
+            'was_moderated': prepared['was_modified'] or moderator.was_modified,
+            'needs_escalation': moderator.needs_escalation,
+        }
+
     @action(detail=True, methods=['get'], url_path='history')
     def get_history(self, request, child_id=None, pk=None):
         """
@@ -1,6 +1,6 @@
 """Progress admin configuration."""
 from django.contrib import admin
-from .models import Progress, DailyActivity
+from .models import Progress, DailyActivity, ActivityRollup, ReportSnapshot
 
 
 @admin.register(Progress)
@@ -18,3 +18,19 @@ class DailyActivityAdmin(admin.ModelAdmin):
     list_filter = ['date']
     search_fields = ['child__name']
     ordering = ['-date']
+
+
+@admin.register(ActivityRollup)
+class ActivityRollupAdmin(admin.ModelAdmin):
+    list_display = ['child', 'current_streak', 'longest_streak', 'last_active_date', 'week_time_minutes']
+    search_fields = ['child__name']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(ReportSnapshot)
+class ReportSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['child', 'report_type', 'period', 'generated_at']
+    list_filter = ['report_type']
+    search_fields = ['child__name']
+    ordering = ['-generated_at']
+    readonly_fields = ['created_at', 'updated_at']
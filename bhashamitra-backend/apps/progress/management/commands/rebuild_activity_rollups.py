@@ -0,0 +1,32 @@
+"""
+Rebuild activity rollups from DailyProgress history.
+
+Usage:
+    python manage.py rebuild_activity_rollups
+    python manage.py rebuild_activity_rollups --child <child_id>
+"""
+from django.core.management.base import BaseCommand
+from apps.children.models import Child
+from apps.progress.rollup_service import ActivityRollupService
+
+
+class Command(BaseCommand):
+    help = 'Recompute parent dashboard activity rollups (streaks, week/month totals)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--child',
+            help='Only rebuild this child (UUID)'
+        )
+
+    def handle(self, *args, **options):
+        children = Child.objects.filter(daily_progress__isnull=False).distinct()
+        if options['child']:
+            children = children.filter(id=options['child'])
+
+        count = 0
+        for child in children.iterator():
+            ActivityRollupService.rebuild(child)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt activity rollups for {count} children'))
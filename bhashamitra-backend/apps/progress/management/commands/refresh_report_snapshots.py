@@ -0,0 +1,65 @@
+"""
+Rebuild stale report card snapshots.
+
+Run nightly (after midnight every snapshot is a day old) and optionally more
+often to pick up children with new activity.
+
+Usage:
+    python manage.py refresh_report_snapshots
+    python manage.py refresh_report_snapshots --chunk-size 100
+    python manage.py refresh_report_snapshots --child <child_id> --force
+"""
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from apps.children.models import Child
+from apps.progress.snapshot_service import ReportSnapshotService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild stale report card snapshots for recently active children'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='Children loaded per batch (default: 200)'
+        )
+        parser.add_argument(
+            '--active-days',
+            type=int,
+            default=30,
+            help='Also build default reports for children active this many days (default: 30)'
+        )
+        parser.add_argument(
+            '--child',
+            help='Only refresh this child (UUID)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rebuild fresh snapshots too'
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now().date() - timedelta(days=options['active_days'])
+        children = Child.objects.filter(
+            Q(report_snapshots__isnull=False) | Q(daily_progress__date__gte=since)
+        )
+        if options['child']:
+            children = children.filter(id=options['child'])
+        child_ids = list(children.values_list('id', flat=True).distinct().order_by('id'))
+
+        chunk_size = max(1, options['chunk_size'])
+        rebuilt = 0
+        for offset in range(0, len(child_ids), chunk_size):
+            chunk = Child.objects.in_bulk(child_ids[offset:offset + chunk_size])
+            for child in chunk.values():
+                rebuilt += ReportSnapshotService.refresh_stale(child, force=options['force'])
+            self.stdout.write(f'  Processed {min(offset + chunk_size, len(child_ids))}/{len(child_ids)} children')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {rebuilt} report snapshots for {len(child_ids)} children'
+        ))
@@ -11,6 +11,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from apps.children.models import Child
 from apps.progress.models import DailyProgress, ActivityLog
+from apps.progress.rollup_service import ActivityRollupService
 from apps.speech.models import PeppiMimicAttempt, PeppiMimicChallenge
 
 
@@ -188,6 +189,7 @@ class Command(BaseCommand):
                         created_at=attempt_time,
                     )
 
+        ActivityRollupService.rebuild(child)
         self.stdout.write(f'    Created data for {child.name}')
 
     def _get_feedback(self, score):
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:59
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0008_alter_child_peppi_addressing'),
+        ('progress', '0002_activitylog_dailyprogress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityRollup',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('current_streak', models.IntegerField(default=0, help_text='Run of active days ending at last_active_date')),
+                ('longest_streak', models.IntegerField(default=0)),
+                ('last_active_date', models.DateField(blank=True, null=True)),
+                ('week_start', models.DateField(blank=True, null=True)),
+                ('week_time_minutes', models.IntegerField(default=0)),
+                ('week_lessons_completed', models.IntegerField(default=0)),
+                ('week_exercises_completed', models.IntegerField(default=0)),
+                ('week_games_played', models.IntegerField(default=0)),
+                ('week_points_earned', models.IntegerField(default=0)),
+                ('month_start', models.DateField(blank=True, null=True)),
+                ('month_time_minutes', models.IntegerField(default=0)),
+                ('month_points_earned', models.IntegerField(default=0)),
+                ('month_days_active', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'activity_rollups',
+            },
+        ),
+        migrations.AddField(
+            model_name='activityrollup',
+            name='child',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='activity_rollup', to='children.child'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 21:05
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('children', '0008_alter_child_peppi_addressing'),
+        ('progress', '0003_add_activity_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportSnapshot',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('report_type', models.CharField(choices=[('COMPREHENSIVE', 'Comprehensive Report'), ('MONTHLY', 'Monthly Comparison')], max_length=20)),
+                ('period', models.PositiveSmallIntegerField(help_text='Days (comprehensive) or months (monthly)')),
+                ('data', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('generated_at', models.DateTimeField()),
+                ('source_generation', models.BigIntegerField(blank=True, help_text='Child cache generation the data reflects', null=True)),
+            ],
+            options={
+                'db_table': 'report_snapshots',
+            },
+        ),
+        migrations.AddField(
+            model_name='reportsnapshot',
+            name='child',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_snapshots', to='children.child'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='reportsnapshot',
+            unique_together={('child', 'report_type', 'period')},
+        ),
+    ]
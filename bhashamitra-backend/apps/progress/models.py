@@ -1,4 +1,5 @@
 """Progress models."""
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from apps.core.models import TimeStampedModel
 from apps.children.models import Child
@@ -79,6 +80,72 @@ class DailyProgress(TimeStampedModel):
         return f"{self.child.name} - {self.date}"
 
 
+class ActivityRollup(TimeStampedModel):
+    """
+    Per-child rollup of DailyProgress for dashboards.
+
+    Maintained by ActivityRollupService whenever a DailyProgress day
+    changes, so streaks and week/month totals are a single-row read.
+    Week/month buckets belong to week_start/month_start; a bucket for an
+    earlier period means no activity in the current one.
+    """
+
+    child = models.OneToOneField(Child, on_delete=models.CASCADE, related_name='activity_rollup')
+
+    # Streak over days with time_spent_minutes > 0
+    current_streak = models.IntegerField(default=0, help_text='Run of active days ending at last_active_date')
+    longest_streak = models.IntegerField(default=0)
+    last_active_date = models.DateField(null=True, blank=True)
+
+    # Calendar week (Monday start)
+    week_start = models.DateField(null=True, blank=True)
+    week_time_minutes = models.IntegerField(default=0)
+    week_lessons_completed = models.IntegerField(default=0)
+    week_exercises_completed = models.IntegerField(default=0)
+    week_games_played = models.IntegerField(default=0)
+    week_points_earned = models.IntegerField(default=0)
+
+    # Calendar month
+    month_start = models.DateField(null=True, blank=True)
+    month_time_minutes = models.IntegerField(default=0)
+    month_points_earned = models.IntegerField(default=0)
+    month_days_active = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'activity_rollups'
+
+    def __str__(self):
+        return f"{self.child.name} - {self.current_streak} day streak"
+
+
+class ReportSnapshot(TimeStampedModel):
+    """
+    Precomputed parent report for a child and period.
+
+    Built by ReportSnapshotService. A snapshot is fresh while it was built
+    today and the child's cache generation hasn't moved since (any progress,
+    points, streak or badge write bumps it).
+    """
+
+    class ReportType(models.TextChoices):
+        COMPREHENSIVE = 'COMPREHENSIVE', 'Comprehensive Report'
+        MONTHLY = 'MONTHLY', 'Monthly Comparison'
+
+    child = models.ForeignKey(Child, on_delete=models.CASCADE, related_name='report_snapshots')
+    report_type = models.CharField(max_length=20, choices=ReportType.choices)
+    period = models.PositiveSmallIntegerField(help_text='Days (comprehensive) or months (monthly)')
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    generated_at = models.DateTimeField()
+    source_generation = models.BigIntegerField(null=True, blank=True, help_text='Child cache generation the data reflects')
+
+    class Meta:
+        db_table = 'report_snapshots'
+        unique_together = ['child', 'report_type', 'period']
+
+    def __str__(self):
+        return f"{self.child.name} - {self.report_type} ({self.period})"
+
+
 class ActivityLog(TimeStampedModel):
     """Activity log entries for tracking child learning activities."""
 
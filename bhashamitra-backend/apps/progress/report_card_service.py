@@ -11,7 +11,7 @@ Generates comprehensive learning reports by aggregating data from:
 from datetime import date, timedelta
 from typing import Optional, Dict, List, Any
 import logging
-from django.db.models import Sum, Count, Avg, Max, F
+from django.db.models import Sum, Count, Avg, Max, Q
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -228,8 +228,8 @@ class ReportCardService:
             completed_at__gte=start_date,
             completed_at__lte=end_date
         ).aggregate(
-            completed=Count('id', filter=F('status') == 'COMPLETED'),
-            in_progress=Count('id', filter=F('status') == 'IN_PROGRESS'),
+            completed=Count('id', filter=Q(status='COMPLETED')),
+            in_progress=Count('id', filter=Q(status='IN_PROGRESS')),
             total_pages=Sum('pages_completed'),
         )
 
@@ -307,7 +307,7 @@ class ReportCardService:
                 total_attempts=Count('id'),
                 avg_score=Avg('final_score'),
                 total_stars=Sum('stars'),
-                perfect_count=Count('id', filter=F('stars') == 3),
+                perfect_count=Count('id', filter=Q(stars=3)),
             )
 
             mastered = PeppiMimicProgress.objects.filter(
@@ -333,53 +333,15 @@ class ReportCardService:
 
     @classmethod
     def _get_streak_info(cls, child) -> Dict[str, Any]:
-        """Calculate streak information."""
-        from apps.progress.models import DailyProgress
-
-        today = timezone.now().date()
-        current_streak = 0
-        longest_streak = 0
-        temp_streak = 0
-        current_date = today
-
-        # Calculate current streak
-        while True:
-            has_activity = DailyProgress.objects.filter(
-                child=child,
-                date=current_date,
-                time_spent_minutes__gt=0
-            ).exists()
-
-            if has_activity:
-                current_streak += 1
-                current_date -= timedelta(days=1)
-            else:
-                break
-
-            if current_streak >= 365:
-                break
-
-        # Calculate longest streak (look back 90 days)
-        progress_days = DailyProgress.objects.filter(
-            child=child,
-            date__gte=today - timedelta(days=90),
-            time_spent_minutes__gt=0
-        ).values_list('date', flat=True).order_by('date')
+        """Streak information from the child's activity rollup."""
+        from apps.progress.rollup_service import ActivityRollupService
 
-        prev_date = None
-        for d in progress_days:
-            if prev_date is None or (d - prev_date).days == 1:
-                temp_streak += 1
-            else:
-                longest_streak = max(longest_streak, temp_streak)
-                temp_streak = 1
-            prev_date = d
-
-        longest_streak = max(longest_streak, temp_streak)
+        rollup = ActivityRollupService.get(child)
+        current_streak = rollup['current_streak']
 
         return {
             'current_streak': current_streak,
-            'longest_streak': longest_streak,
+            'longest_streak': rollup['longest_streak'],
             'streak_status': cls._get_streak_status(current_streak),
         }
 
@@ -461,38 +423,38 @@ class ReportCardService:
         except Child.DoesNotExist:
             return {'error': 'Child not found'}
 
-        monthly_data = []
         today = timezone.now().date()
 
-        for i in range(months):
-            # Calculate month boundaries
-            if i == 0:
-                end = today
-            else:
-                end = (today.replace(day=1) - timedelta(days=1))
-                for _ in range(i - 1):
-                    end = (end.replace(day=1) - timedelta(days=1))
-
+        # Month windows, newest first
+        windows = []
+        end = today
+        for _ in range(months):
             start = end.replace(day=1)
+            windows.append((start, end))
+            end = start - timedelta(days=1)
+
+        # One aggregate for all months
+        aggregates = {}
+        for i, (start, end) in enumerate(windows):
+            in_month = Q(date__gte=start, date__lte=end)
+            aggregates[f'time_{i}'] = Sum('time_spent_minutes', filter=in_month)
+            aggregates[f'points_{i}'] = Sum('points_earned', filter=in_month)
+            aggregates[f'days_{i}'] = Count('id', filter=in_month & Q(time_spent_minutes__gt=0))
+        totals = DailyProgress.objects.filter(
+            child=child,
+            date__gte=windows[-1][0] if windows else today,
+            date__lte=today
+        ).aggregate(**aggregates) if windows else {}
 
-            # Get stats for this month
-            progress = DailyProgress.objects.filter(
-                child=child,
-                date__gte=start,
-                date__lte=end
-            ).aggregate(
-                time=Sum('time_spent_minutes'),
-                points=Sum('points_earned'),
-                days=Count('id', filter=F('time_spent_minutes') > 0),
-            )
-
+        monthly_data = []
+        for i, (start, end) in enumerate(windows):
             monthly_data.append({
                 'month': start.strftime('%B %Y'),
                 'start_date': start.isoformat(),
                 'end_date': end.isoformat(),
-                'total_time_minutes': progress['time'] or 0,
-                'points_earned': progress['points'] or 0,
-                'days_active': progress['days'] or 0,
+                'total_time_minutes': totals[f'time_{i}'] or 0,
+                'points_earned': totals[f'points_{i}'] or 0,
+                'days_active': totals[f'days_{i}'] or 0,
             })
 
         return {
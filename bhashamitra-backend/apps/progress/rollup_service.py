@@ -0,0 +1,172 @@
+"""
+Activity rollups for parent dashboards.
+
+Dashboards used to derive streaks by walking back one day at a time with a
+DailyProgress EXISTS query per day (up to 365 per request), each view in
+its own way. ActivityRollup keeps the answer instead:
+
+- record_day() is called whenever a DailyProgress day changes; it extends
+  or resets the streak in O(1) and refreshes the current week/month
+  totals with one aggregate over at most a month of rows
+- get() is a single indexed read; buckets from an earlier week/month mean
+  no activity in the current one and read as zeros
+- rebuild() recomputes a child's rollup from history (backfill, edits to
+  past days) - see the rebuild_activity_rollups command
+
+A day counts as active when time_spent_minutes > 0. A streak is current
+while the last active day is today or yesterday.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from apps.core.cache_service import ProgressCacheService
+from .models import ActivityRollup, DailyProgress
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityRollupService:
+    """Maintain and read per-child activity rollups."""
+
+    @staticmethod
+    def _periods(today: date):
+        return today - timedelta(days=today.weekday()), today.replace(day=1)
+
+    @classmethod
+    @transaction.atomic
+    def record_day(cls, daily_progress: DailyProgress) -> ActivityRollup:
+        """Fold a changed DailyProgress day into the child's rollup."""
+        # The day's time and counts feed report cards and dashboards too
+        ProgressCacheService.invalidate_child_progress(daily_progress.child_id)
+        rollup, created = ActivityRollup.objects.select_for_update().get_or_create(
+            child_id=daily_progress.child_id
+        )
+        if created:
+            return cls._rebuild(rollup)
+
+        day = daily_progress.date
+        last = rollup.last_active_date
+        if daily_progress.time_spent_minutes > 0:
+            if last is None or day > last + timedelta(days=1):
+                rollup.current_streak = 1
+                rollup.last_active_date = day
+            elif day == last + timedelta(days=1):
+                rollup.current_streak += 1
+                rollup.last_active_date = day
+            elif day < last:
+                # A past day changed; the run may now bridge a gap
+                return cls._rebuild(rollup)
+            rollup.longest_streak = max(rollup.longest_streak, rollup.current_streak)
+        elif last is not None and day <= last:
+            # An active day was zeroed out; the run may now be split
+            return cls._rebuild(rollup)
+
+        cls._refresh_periods(rollup)
+        rollup.save()
+        return rollup
+
+    @classmethod
+    def _refresh_periods(cls, rollup: ActivityRollup) -> None:
+        """Recompute this week's and month's totals in one query."""
+        week_start, month_start = cls._periods(timezone.now().date())
+        in_week = Q(date__gte=week_start)
+        totals = DailyProgress.objects.filter(
+            child_id=rollup.child_id, date__gte=min(week_start, month_start)
+        ).aggregate(
+            week_time=Sum('time_spent_minutes', filter=in_week),
+            week_lessons=Sum('lessons_completed', filter=in_week),
+            week_exercises=Sum('exercises_completed', filter=in_week),
+            week_games=Sum('games_played', filter=in_week),
+            week_points=Sum('points_earned', filter=in_week),
+            month_time=Sum('time_spent_minutes', filter=Q(date__gte=month_start)),
+            month_points=Sum('points_earned', filter=Q(date__gte=month_start)),
+            month_days=Count('id', filter=Q(date__gte=month_start, time_spent_minutes__gt=0)),
+        )
+        rollup.week_start = week_start
+        rollup.week_time_minutes = totals['week_time'] or 0
+        rollup.week_lessons_completed = totals['week_lessons'] or 0
+        rollup.week_exercises_completed = totals['week_exercises'] or 0
+        rollup.week_games_played = totals['week_games'] or 0
+        rollup.week_points_earned = totals['week_points'] or 0
+        rollup.month_start = month_start
+        rollup.month_time_minutes = totals['month_time'] or 0
+        rollup.month_points_earned = totals['month_points'] or 0
+        rollup.month_days_active = totals['month_days'] or 0
+
+    @classmethod
+    def _rebuild(cls, rollup: ActivityRollup) -> ActivityRollup:
+        active_days = DailyProgress.objects.filter(
+            child_id=rollup.child_id, time_spent_minutes__gt=0
+        ).order_by('date').values_list('date', flat=True)
+
+        current = longest = 0
+        previous = None
+        for day in active_days.iterator():
+            current = current + 1 if previous and day == previous + timedelta(days=1) else 1
+            longest = max(longest, current)
+            previous = day
+
+        rollup.current_streak = current
+        rollup.longest_streak = longest
+        rollup.last_active_date = previous
+        cls._refresh_periods(rollup)
+        rollup.save()
+        return rollup
+
+    @classmethod
+    def rebuild(cls, child) -> ActivityRollup:
+        """Recompute a child's rollup from all of their DailyProgress."""
+        with transaction.atomic():
+            rollup, _ = ActivityRollup.objects.select_for_update().get_or_create(child=child)
+            return cls._rebuild(rollup)
+
+    @classmethod
+    def get_rollup(cls, child) -> ActivityRollup:
+        rollup = ActivityRollup.objects.filter(child=child).first()
+        if rollup is None:
+            # Not backfilled yet
+            rollup = cls.rebuild(child)
+        return rollup
+
+    @staticmethod
+    def _live_streak(rollup: ActivityRollup) -> int:
+        """Current streak; 0 once a full day passes without activity."""
+        yesterday = timezone.now().date() - timedelta(days=1)
+        if rollup.last_active_date and rollup.last_active_date >= yesterday:
+            return rollup.current_streak
+        return 0
+
+    @classmethod
+    def current_streak(cls, child) -> int:
+        return cls._live_streak(cls.get_rollup(child))
+
+    @classmethod
+    def get(cls, child) -> Dict[str, Any]:
+        """Streaks plus this week's and month's totals for dashboards."""
+        rollup = cls.get_rollup(child)
+        week_start, month_start = cls._periods(timezone.now().date())
+        this_week = rollup.week_start == week_start
+        this_month = rollup.month_start == month_start
+
+        return {
+            'current_streak': cls._live_streak(rollup),
+            'longest_streak': rollup.longest_streak,
+            'last_active_date': rollup.last_active_date,
+            'week': {
+                'time_spent_minutes': rollup.week_time_minutes if this_week else 0,
+                'lessons_completed': rollup.week_lessons_completed if this_week else 0,
+                'exercises_completed': rollup.week_exercises_completed if this_week else 0,
+                'games_played': rollup.week_games_played if this_week else 0,
+                'points_earned': rollup.week_points_earned if this_week else 0,
+            },
+            'month': {
+                'time_spent_minutes': rollup.month_time_minutes if this_month else 0,
+                'points_earned': rollup.month_points_earned if this_month else 0,
+                'days_active': rollup.month_days_active if this_month else 0,
+            },
+        }
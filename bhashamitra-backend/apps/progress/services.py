@@ -2,6 +2,8 @@
 from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
+from apps.core.cache_service import ProgressCacheService
+from apps.gamification.services.points import PointsService
 from .models import Progress, DailyActivity
 
 
@@ -24,12 +26,12 @@ class ProgressService:
 
         if created:
             points = settings.POINTS_CONFIG['STORY_STARTED']
-            child.total_points += points
-            child.save(update_fields=['total_points'])
+            PointsService.award(child, points, PointsService.Reason.STORY_STARTED, story.id)
             progress.points_earned = points
             progress.save()
 
             ProgressService._update_daily_activity(child, stories_started=1, points=points)
+            ProgressCacheService.invalidate_child_progress(child.id)
 
         return progress
 
@@ -50,18 +52,29 @@ class ProgressService:
 
         if pages_read > 0:
             points = pages_read * settings.POINTS_CONFIG['PAGE_READ']
-            progress.child.total_points += points
-            progress.child.save(update_fields=['total_points'])
+            PointsService.award(progress.child, points, PointsService.Reason.PAGE_READ, progress.story_id)
             progress.points_earned += points
             ProgressService._update_daily_activity(
                 progress.child, pages_read=pages_read, time_spent=time_spent, points=points
             )
 
         progress.save()
+        ProgressCacheService.invalidate_child_progress(progress.child_id)
 
         # Update streak
+        from apps.gamification.models import Badge
+        from apps.gamification.services.badges import BadgeService
         from apps.gamification.services.streaks import StreakService
-        StreakService.update_streak(progress.child)
+        streak = StreakService.update_streak(progress.child)
+
+        BadgeService.record(
+            progress.child,
+            increments={Badge.CriteriaType.TIME_SPENT_MINUTES: time_spent},
+            values={
+                Badge.CriteriaType.POINTS_EARNED: progress.child.total_points,
+                Badge.CriteriaType.STREAK_DAYS: streak.current_streak,
+            },
+        )
 
         return progress
 
@@ -69,35 +82,55 @@ class ProgressService:
     @transaction.atomic
     def complete_story(progress, time_spent: int = 0) -> dict:
         """Mark story as completed."""
-        remaining_pages = progress.story.page_count - progress.pages_completed
+        # Re-completing a finished story only records the extra reading time
+        newly_completed = progress.status != Progress.Status.COMPLETED
+        remaining_pages = max(0, progress.story.page_count - progress.pages_completed)
         page_points = remaining_pages * settings.POINTS_CONFIG['PAGE_READ']
-        completion_points = settings.POINTS_CONFIG['STORY_COMPLETED_BASE'] * progress.story.level
+        completion_points = (
+            settings.POINTS_CONFIG['STORY_COMPLETED_BASE'] * progress.story.level
+            if newly_completed else 0
+        )
         total_points = page_points + completion_points
 
         progress.status = Progress.Status.COMPLETED
         progress.current_page = progress.story.page_count
         progress.pages_completed = progress.story.page_count
         progress.time_spent_seconds += time_spent
-        progress.completed_at = timezone.now()
+        if newly_completed:
+            progress.completed_at = timezone.now()
         progress.points_earned += total_points
         progress.save()
 
-        progress.child.total_points += total_points
-        progress.child.save(update_fields=['total_points'])
+        old_level = progress.child.level
+        PointsService.award(progress.child, total_points, PointsService.Reason.STORY_COMPLETED, progress.story_id)
 
         ProgressService._update_daily_activity(
-            progress.child, stories_completed=1, pages_read=remaining_pages,
+            progress.child, stories_completed=1 if newly_completed else 0, pages_read=remaining_pages,
             time_spent=time_spent, points=total_points
         )
 
         # Update streak and check badges
+        from apps.gamification.models import Badge
         from apps.gamification.services.streaks import StreakService
         from apps.gamification.services.badges import BadgeService
-        from apps.gamification.services.levels import LevelService
 
-        StreakService.update_streak(progress.child)
-        new_badges = BadgeService.check_and_award_badges(progress.child)
-        level_up = LevelService.check_level_up(progress.child)
+        streak = StreakService.update_streak(progress.child)
+        increments = {Badge.CriteriaType.TIME_SPENT_MINUTES: time_spent}
+        if newly_completed:
+            increments[Badge.CriteriaType.STORIES_COMPLETED] = 1
+        new_badges = BadgeService.record(
+            progress.child,
+            increments=increments,
+            values={
+                Badge.CriteriaType.POINTS_EARNED: progress.child.total_points,
+                Badge.CriteriaType.STREAK_DAYS: streak.current_streak,
+            },
+        )
+        # The points ledger moves the level with the points (badge bonuses included)
+        if progress.child.level > old_level:
+            level_up = {'leveled_up': True, 'old_level': old_level, 'new_level': progress.child.level}
+        else:
+            level_up = {'leveled_up': False}
 
         return {
             'progress': progress,
@@ -0,0 +1,149 @@
+"""
+Report card snapshots.
+
+ReportCardService fans out into ~20 aggregates per report, and parents open
+report cards at the same peak times. Reports are served from ReportSnapshot
+rows instead:
+
+- A snapshot is fresh while it was built today and the child's cache
+  generation (ChildCacheGeneration) is unchanged. The writers behind a
+  report bump it via ProgressCacheService.invalidate_child_progress:
+  progress and SRS services, PointsService.award (zero-point awards
+  included), streak/level/badge services, DailyProgress days through
+  ActivityRollupService.record_day, and GameSession saves/deletes
+  (apps.curriculum.signals). New writers must do the same.
+- A fresh snapshot is a single-row read.
+- A stale snapshot is rebuilt by one request (single-flight); concurrent
+  requests get the stale copy, flagged as such, rather than queueing up.
+- A missing snapshot is built inline; concurrent requests wait for it.
+- The refresh_report_snapshots command rebuilds stale snapshots in chunks
+  (run nightly, after the date rolls over, and as often as needed between).
+"""
+import logging
+from typing import Any, Dict, Optional
+
+from django.utils import timezone
+
+from apps.core.cache_service import ChildCacheGeneration
+from apps.core.single_flight import SingleFlight
+from .models import ReportSnapshot
+from .report_card_service import ReportCardService
+
+logger = logging.getLogger(__name__)
+
+
+class ReportSnapshotService:
+    """Serve and refresh precomputed report cards."""
+
+    ReportType = ReportSnapshot.ReportType
+
+    # Built for every active child by the batch command
+    DEFAULT_PERIODS = {
+        ReportSnapshot.ReportType.COMPREHENSIVE: 30,
+        ReportSnapshot.ReportType.MONTHLY: 3,
+    }
+
+    @staticmethod
+    def _build(child, report_type: str, period: int) -> Dict[str, Any]:
+        if report_type == ReportSnapshot.ReportType.MONTHLY:
+            return ReportCardService.get_monthly_comparison(child_id=str(child.id), months=period)
+        return ReportCardService.get_comprehensive_report(child_id=str(child.id), period_days=period)
+
+    @staticmethod
+    def is_fresh(snapshot: ReportSnapshot, generation: Optional[int] = None) -> bool:
+        """Built today, with no writes for the child since."""
+        if generation is None:
+            generation = ChildCacheGeneration.get(snapshot.child_id)
+        return (
+            snapshot.source_generation == generation
+            and timezone.localdate(snapshot.generated_at) == timezone.localdate()
+        )
+
+    @classmethod
+    def refresh(cls, child, report_type: str, period: int) -> Optional[ReportSnapshot]:
+        """Rebuild and store one snapshot."""
+        # Read the generation first: writes during the build leave it stale
+        generation = ChildCacheGeneration.get(child.id)
+        data = cls._build(child, report_type, period)
+        if 'error' in data:
+            return None
+
+        snapshot, _ = ReportSnapshot.objects.update_or_create(
+            child=child,
+            report_type=report_type,
+            period=period,
+            defaults={
+                'data': data,
+                'generated_at': timezone.now(),
+                'source_generation': generation,
+            },
+        )
+        return snapshot
+
+    @staticmethod
+    def _payload(snapshot: ReportSnapshot, stale: bool) -> Dict[str, Any]:
+        return {
+            **snapshot.data,
+            'snapshot': {
+                'generated_at': snapshot.generated_at.isoformat(),
+                'stale': stale,
+            },
+        }
+
+    @classmethod
+    def get(cls, child, report_type: str, period: int) -> Dict[str, Any]:
+        """Report data plus snapshot freshness for a child and period."""
+        snapshot = ReportSnapshot.objects.filter(
+            child=child, report_type=report_type, period=period
+        ).first()
+        generation = ChildCacheGeneration.get(child.id)
+        if snapshot and cls.is_fresh(snapshot, generation):
+            return cls._payload(snapshot, stale=False)
+
+        flight = SingleFlight(f"report:{child.id}:{report_type}:{period}", lock_ttl=60)
+        if snapshot:
+            if not flight.acquire():
+                # Someone else is rebuilding it
+                return cls._payload(snapshot, stale=True)
+            try:
+                refreshed = cls.refresh(child, report_type, period)
+            finally:
+                flight.release()
+            return cls._payload(refreshed or snapshot, stale=refreshed is None)
+
+        def fetch():
+            built = ReportSnapshot.objects.filter(
+                child=child, report_type=report_type, period=period
+            ).first()
+            return built if built and cls.is_fresh(built) else None
+
+        built = flight.run(compute=lambda: cls.refresh(child, report_type, period), fetch=fetch)
+        if built is None:
+            return cls._build(child, report_type, period)
+        return cls._payload(built, stale=False)
+
+    @classmethod
+    def refresh_stale(cls, child, force: bool = False) -> int:
+        """
+        Rebuild a child's stale snapshots and the default ones.
+
+        Returns the number of snapshots rebuilt.
+        """
+        generation = ChildCacheGeneration.get(child.id)
+        existing = {
+            (snapshot.report_type, snapshot.period): snapshot
+            for snapshot in ReportSnapshot.objects.filter(child=child)
+        }
+        wanted = set(existing) | set(cls.DEFAULT_PERIODS.items())
+
+        rebuilt = 0
+        for report_type, period in sorted(wanted):
+            snapshot = existing.get((report_type, period))
+            if snapshot and not force and cls.is_fresh(snapshot, generation):
+                continue
+            try:
+                if cls.refresh(child, report_type, period):
+                    rebuilt += 1
+            except Exception as e:
+                logger.error(f"Failed to refresh {report_type}/{period} report for child {child.id}: {e}")
+        return rebuilt
@@ -1,7 +1,7 @@
 """Speech admin configuration."""
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import AudioCache, TTSUsageLog, VoiceCharacter
+from .models import AudioCache, TTSJob, TTSUsageLog, VoiceCharacter
 
 
 @admin.register(AudioCache)
@@ -25,7 +25,10 @@ class AudioCacheAdmin(admin.ModelAdmin):
         'generation_time_ms',
         'generation_cost_usd',
         'access_count',
-        'last_accessed_at'
+        'last_accessed_at',
+        'loudness_dbfs',
+        'peak_dbfs',
+        'probed_at'
     ]
     ordering = ['-created_at']
 
@@ -70,6 +73,23 @@ class TTSUsageLogAdmin(admin.ModelAdmin):
     status_badge.short_description = 'Status'
 
 
+@admin.register(TTSJob)
+class TTSJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'created_at',
+        'status',
+        'language',
+        'voice_style',
+        'provider',
+        'attempts',
+        'completed_at'
+    ]
+    list_filter = ['status', 'language', 'created_at']
+    search_fields = ['text_content', 'cache_key']
+    readonly_fields = ['cache_key', 'audio_cache', 'started_at', 'completed_at']
+    ordering = ['-created_at']
+
+
 @admin.register(VoiceCharacter)
 class VoiceCharacterAdmin(admin.ModelAdmin):
     list_display = [
@@ -2,22 +2,25 @@
 Management command to cache audio for all curriculum content across all languages.
 Uses Svara TTS (free tier) to generate pronunciation audio.
 
+Items are synthesized in parallel by PrewarmEngine (deduped by cache key,
+rate limited per provider). Pass --checkpoint to make a long run resumable.
+
 Usage:
     python manage.py cache_all_audio                      # Cache all languages
     python manage.py cache_all_audio --language TAMIL     # Cache specific language
     python manage.py cache_all_audio --type letters       # Cache only letters
     python manage.py cache_all_audio --dry-run            # Show what would be cached
+    python manage.py cache_all_audio --checkpoint /tmp/all_audio.json
 """
-import time
 from django.core.management.base import BaseCommand
-from django.db import models
 
-from apps.speech.models import AudioCache
-from apps.speech.services.tts_service import TTSService, TTSServiceError
+from apps.speech.services.prewarm_engine import PrewarmEngine, PrewarmItem
 from apps.curriculum.models import (
-    Script, Letter, Matra, VocabularyWord, VocabularyTheme, PeppiPhrase
+    Script, Letter, Matra, VocabularyWord, PeppiPhrase
 )
 
+VOICE_STYLE = 'kid_friendly'
+
 
 class Command(BaseCommand):
     help = 'Cache TTS audio for all curriculum content across all languages using Svara'
@@ -47,10 +50,22 @@ class Command(BaseCommand):
             help='Regenerate even if already cached'
         )
         parser.add_argument(
-            '--delay',
+            '--workers',
+            type=int,
+            default=None,
+            help='Parallel synthesis workers (capped by the provider limit)'
+        )
+        parser.add_argument(
+            '--rate',
             type=float,
-            default=0.3,
-            help='Delay between API calls in seconds (default: 0.3)'
+            default=None,
+            help='Max provider requests per second (capped by the provider limit)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=None,
+            help='Checkpoint file; an interrupted run resumes from it'
         )
         parser.add_argument(
             '--batch-size',
@@ -63,9 +78,6 @@ class Command(BaseCommand):
         language = options['language']
         content_type = options['type']
         dry_run = options['dry_run']
-        force = options['force']
-        delay = options['delay']
-        batch_size = options['batch_size']
 
         self.stdout.write(self.style.NOTICE("=" * 60))
         self.stdout.write(self.style.NOTICE("BhashaMitra Multi-Language Audio Cache"))
@@ -87,283 +99,148 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR("No languages found in database. Run seed commands first."))
             return
 
-        # Track overall stats
-        total_stats = {
-            'total': 0,
-            'cached': 0,
-            'generated': 0,
-            'failed': 0,
-        }
-
+        items = []
         for lang in languages:
             self.stdout.write(f"\n{'=' * 40}")
-            self.stdout.write(self.style.SUCCESS(f"Processing: {lang}"))
+            self.stdout.write(self.style.SUCCESS(f"Collecting: {lang}"))
             self.stdout.write("=" * 40)
 
-            lang_stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
-
-            # Cache letters
             if content_type in ['letters', 'all']:
-                self.stdout.write("\n>>> Caching Letters...")
-                letter_stats = self._cache_letters(lang, dry_run, force, delay, batch_size)
-                self._add_stats(lang_stats, letter_stats)
-
-            # Cache matras
+                items += self._letter_items(lang)
             if content_type in ['matras', 'all']:
-                self.stdout.write("\n>>> Caching Matras...")
-                matra_stats = self._cache_matras(lang, dry_run, force, delay, batch_size)
-                self._add_stats(lang_stats, matra_stats)
-
-            # Cache vocabulary
+                items += self._matra_items(lang)
             if content_type in ['vocabulary', 'all']:
-                self.stdout.write("\n>>> Caching Vocabulary...")
-                vocab_stats = self._cache_vocabulary(lang, dry_run, force, delay, batch_size)
-                self._add_stats(lang_stats, vocab_stats)
-
-            # Cache Peppi phrases
+                items += self._vocabulary_items(lang)
             if content_type in ['peppi', 'all']:
-                self.stdout.write("\n>>> Caching Peppi Phrases...")
-                peppi_stats = self._cache_peppi_phrases(lang, dry_run, force, delay, batch_size)
-                self._add_stats(lang_stats, peppi_stats)
-
-            # Language summary
-            self.stdout.write(f"\n{lang} Summary: "
-                            f"Total={lang_stats['total']}, "
-                            f"Cached={lang_stats['cached']}, "
-                            f"Generated={lang_stats['generated']}, "
-                            f"Failed={lang_stats['failed']}")
-
-            self._add_stats(total_stats, lang_stats)
+                items += self._peppi_phrase_items(lang)
+
+        engine = PrewarmEngine(
+            tts_provider='svara',
+            workers=options['workers'],
+            rate=options['rate'],
+            checkpoint_path=options['checkpoint'],
+            force=options['force'],
+            dry_run=dry_run,
+            progress_every=options['batch_size'],
+            log=self.stdout.write,
+        )
+        report = engine.run(items)
 
         # Final summary
         self.stdout.write("\n" + "=" * 60)
         self.stdout.write(self.style.SUCCESS("COMPLETE!"))
         self.stdout.write("=" * 60)
-        self.stdout.write(f"Total items: {total_stats['total']}")
-        self.stdout.write(f"Already cached: {total_stats['cached']}")
-        self.stdout.write(f"Newly generated: {total_stats['generated']}")
-        if total_stats['failed'] > 0:
-            self.stdout.write(self.style.ERROR(f"Failed: {total_stats['failed']}"))
+        for line in report.summary_lines():
+            self.stdout.write(line)
+        if report.failed > 0:
+            self.stdout.write(self.style.ERROR(f"Failed: {report.failed}"))
         else:
             self.stdout.write(self.style.SUCCESS("No failures!"))
 
-    def _add_stats(self, target: dict, source: dict):
-        """Add source stats to target stats."""
-        for key in target:
-            target[key] += source.get(key, 0)
-
-    def _cache_letters(self, language: str, dry_run: bool, force: bool, delay: float, batch_size: int) -> dict:
-        """Cache audio for all letters in a language."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
-
+    def _letter_items(self, language: str) -> list:
+        """Letters and their example words for a language."""
         # Get letters for this language through Script -> AlphabetCategory -> Letter
         try:
             script = Script.objects.get(language=language)
         except Script.DoesNotExist:
             self.stdout.write(self.style.WARNING(f"  No script found for {language}"))
-            return stats
+            return []
 
         letters = Letter.objects.filter(
             category__script=script,
             is_active=True
         ).select_related('category').order_by('category__order', 'order')
 
-        self.stdout.write(f"  Found {letters.count()} letters")
-
-        for i, letter in enumerate(letters):
-            # Cache the letter character
-            stats['total'] += 1
-            self._generate_audio(
+        items = []
+        for letter in letters:
+            items.append(PrewarmItem(
                 text=letter.character,
                 language=language,
+                voice_style=VOICE_STYLE,
                 content_type='letter',
                 content_id=f"{letter.category.category_type}_{letter.romanization}",
-                dry_run=dry_run,
-                force=force,
-                stats=stats,
-            )
-
-            # Cache the example word if present
+            ))
             if letter.example_word:
-                stats['total'] += 1
-                self._generate_audio(
+                items.append(PrewarmItem(
                     text=letter.example_word,
                     language=language,
+                    voice_style=VOICE_STYLE,
                     content_type='letter_example',
                     content_id=f"{letter.romanization}_example",
-                    dry_run=dry_run,
-                    force=force,
-                    stats=stats,
-                )
-
-            # Progress update
-            if (i + 1) % batch_size == 0:
-                self.stdout.write(f"  Progress: {i + 1}/{letters.count()}")
-
-            if not dry_run:
-                time.sleep(delay)
-
-        return stats
+                ))
 
-    def _cache_matras(self, language: str, dry_run: bool, force: bool, delay: float, batch_size: int) -> dict:
-        """Cache audio for all matras in a language."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
+        self.stdout.write(f"  Found {len(letters)} letters")
+        return items
 
+    def _matra_items(self, language: str) -> list:
+        """Matra symbols and their consonant examples (e.g., का, கா)."""
         try:
             script = Script.objects.get(language=language)
         except Script.DoesNotExist:
-            return stats
+            return []
 
         matras = Matra.objects.filter(script=script).order_by('order')
-        self.stdout.write(f"  Found {matras.count()} matras")
 
-        for i, matra in enumerate(matras):
-            # Cache the matra symbol
-            stats['total'] += 1
-            self._generate_audio(
+        items = []
+        for matra in matras:
+            items.append(PrewarmItem(
                 text=matra.symbol,
                 language=language,
+                voice_style=VOICE_STYLE,
                 content_type='matra',
                 content_id=f"matra_{matra.name}",
-                dry_run=dry_run,
-                force=force,
-                stats=stats,
-            )
-
-            # Cache the example with consonant (e.g., का, கா)
+            ))
             if matra.example_with_ka:
-                stats['total'] += 1
-                self._generate_audio(
+                items.append(PrewarmItem(
                     text=matra.example_with_ka,
                     language=language,
+                    voice_style=VOICE_STYLE,
                     content_type='matra_example',
                     content_id=f"matra_{matra.name}_example",
-                    dry_run=dry_run,
-                    force=force,
-                    stats=stats,
-                )
-
-            if (i + 1) % batch_size == 0:
-                self.stdout.write(f"  Progress: {i + 1}/{matras.count()}")
-
-            if not dry_run:
-                time.sleep(delay)
+                ))
 
-        return stats
+        self.stdout.write(f"  Found {len(matras)} matras")
+        return items
 
-    def _cache_vocabulary(self, language: str, dry_run: bool, force: bool, delay: float, batch_size: int) -> dict:
-        """Cache audio for all vocabulary words in a language."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
+    def _vocabulary_items(self, language: str) -> list:
+        """Vocabulary words across all active themes."""
+        words = VocabularyWord.objects.filter(
+            theme__language=language,
+            theme__is_active=True,
+        ).select_related('theme').order_by('theme__order', 'order')
 
-        themes = VocabularyTheme.objects.filter(language=language, is_active=True)
-        words = VocabularyWord.objects.filter(theme__in=themes).select_related('theme').order_by('theme__order', 'order')
-
-        self.stdout.write(f"  Found {words.count()} vocabulary words across {themes.count()} themes")
-
-        for i, word in enumerate(words):
-            stats['total'] += 1
-            self._generate_audio(
+        items = [
+            PrewarmItem(
                 text=word.word,
                 language=language,
+                voice_style=VOICE_STYLE,
                 content_type=f'vocabulary_{word.theme.name}',
                 content_id=word.romanization,
-                dry_run=dry_run,
-                force=force,
-                stats=stats,
             )
+            for word in words
+        ]
 
-            if (i + 1) % batch_size == 0:
-                self.stdout.write(f"  Progress: {i + 1}/{words.count()}")
-
-            if not dry_run:
-                time.sleep(delay)
-
-        return stats
-
-    def _cache_peppi_phrases(self, language: str, dry_run: bool, force: bool, delay: float, batch_size: int) -> dict:
-        """Cache audio for Peppi phrases (currently Hindi only)."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
+        self.stdout.write(f"  Found {len(items)} vocabulary words")
+        return items
 
+    def _peppi_phrase_items(self, language: str) -> list:
+        """Peppi phrases (currently Hindi only)."""
         # PeppiPhrase model currently only has Hindi text
-        # Only cache for HINDI language
         if language != 'HINDI':
             self.stdout.write(f"  Peppi phrases only available in Hindi (skipping {language})")
-            return stats
-
-        phrases = PeppiPhrase.objects.filter(is_active=True)
-        self.stdout.write(f"  Found {phrases.count()} Peppi phrases")
-
-        for i, phrase in enumerate(phrases):
-            if phrase.text_hindi:
-                stats['total'] += 1
-                self._generate_audio(
-                    text=phrase.text_hindi,
-                    language='HINDI',
-                    content_type='peppi_phrase',
-                    content_id=f"peppi_{phrase.category}_{phrase.id}",
-                    dry_run=dry_run,
-                    force=force,
-                    stats=stats,
-                )
-
-            if (i + 1) % batch_size == 0:
-                self.stdout.write(f"  Progress: {i + 1}/{phrases.count()}")
-
-            if not dry_run:
-                time.sleep(delay)
-
-        return stats
-
-    def _generate_audio(
-        self,
-        text: str,
-        language: str,
-        content_type: str,
-        content_id: str,
-        dry_run: bool,
-        force: bool,
-        stats: dict,
-    ):
-        """Generate and cache audio for a single text item."""
-        voice_style = 'kid_friendly'
-        cache_key = TTSService._generate_cache_key(text, language, voice_style)
-
-        # Check if already cached
-        if not force:
-            existing = AudioCache.objects.filter(cache_key=cache_key).first()
-            if existing and existing.audio_file:
-                stats['cached'] += 1
-                return
-
-        if dry_run:
-            self.stdout.write(f"    [DRY-RUN] {text[:30]}...")
-            return
-
-        try:
-            # Use Svara TTS (mock user with svara provider)
-            from unittest.mock import Mock
-            mock_user = Mock()
-            mock_user.tts_provider = 'svara'
-
-            audio_bytes, provider, was_cached = TTSService.get_audio(
-                text=text,
-                language=language,
-                voice_profile=voice_style,
-                user=mock_user,
-                force_regenerate=force,
+            return []
+
+        items = [
+            PrewarmItem(
+                text=phrase.text_hindi,
+                language='HINDI',
+                voice_style=VOICE_STYLE,
+                content_type='peppi_phrase',
+                content_id=f"peppi_{phrase.category}_{phrase.id}",
             )
+            for phrase in PeppiPhrase.objects.filter(is_active=True)
+            if phrase.text_hindi
+        ]
 
-            # Update cache entry with content metadata
-            AudioCache.objects.filter(cache_key=cache_key).update(
-                content_type=content_type,
-                content_id=content_id,
-            )
-
-            stats['generated'] += 1
-
-        except TTSServiceError as e:
-            self.stdout.write(self.style.ERROR(f"    [FAIL] {text[:20]}... - {e}"))
-            stats['failed'] += 1
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"    [ERROR] {text[:20]}... - {e}"))
-            stats['failed'] += 1
+        self.stdout.write(f"  Found {len(items)} Peppi phrases")
+        return items
@@ -0,0 +1,139 @@
+"""
+Management command to merge existing audio cache entries into AudioStore.
+
+Rekeys every AudioCache row with AudioStore.make_key, which normalizes the
+text and adds the format version. Every row goes under the key the read
+paths look up (the default format); a row's real format is kept in its
+audio_format column. Along the way it:
+- folds rows whose texts only differed in whitespace/Unicode form into one
+  (access counts summed, foreign keys repointed)
+- moves legacy AudioCacheService files (`audio/tts/{key}.wav`) onto the
+  row's audio_file, or deletes them when an MP3 for the same text exists
+- drops the old `tts:audio:{key}` Redis entries
+
+Safe to re-run: rows already under their new key are skipped.
+
+Usage:
+    python manage.py merge_audio_caches --dry-run
+    python manage.py merge_audio_caches
+"""
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_probe import AudioProbe
+from apps.speech.services.audio_store import AudioStore
+from apps.speech.services.cache_service import AudioCacheService
+
+
+class Command(BaseCommand):
+    help = 'Merge TTSService and AudioCacheService entries into the content-addressed audio store'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would change without touching data'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options.get('dry_run')
+
+        stats = {'rekeyed': 0, 'merged': 0, 'legacy_moved': 0, 'legacy_deleted': 0, 'unchanged': 0}
+
+        self.stdout.write(f"\n{'=' * 50}")
+        self.stdout.write("Merging audio caches into AudioStore")
+        if dry_run:
+            self.stdout.write(self.style.WARNING("DRY RUN - no changes"))
+        self.stdout.write(f"{'=' * 50}\n")
+
+        # Most-used rows first so they survive merges
+        row_ids = list(
+            AudioCache.objects.order_by('-access_count', 'created_at').values_list('id', flat=True)
+        )
+
+        for row_id in row_ids:
+            entry = AudioCache.objects.filter(id=row_id).first()
+            if not entry:
+                continue  # merged into an earlier row
+            with transaction.atomic():
+                self._migrate_entry(entry, dry_run, stats)
+
+        self.stdout.write(f"\n{'=' * 50}")
+        self.stdout.write(self.style.SUCCESS("MERGE COMPLETE" if not dry_run else "DRY RUN COMPLETE"))
+        self.stdout.write(f"{'=' * 50}")
+        self.stdout.write(f"  Rekeyed:               {stats['rekeyed']}")
+        self.stdout.write(f"  Duplicates merged:     {stats['merged']}")
+        self.stdout.write(f"  Legacy files moved:    {stats['legacy_moved']}")
+        self.stdout.write(f"  Legacy files deleted:  {stats['legacy_deleted']}")
+        self.stdout.write(f"  Already up to date:    {stats['unchanged']}\n")
+
+    def _migrate_entry(self, entry: AudioCache, dry_run: bool, stats: dict):
+        old_key = entry.cache_key
+        legacy_path = f"{AudioCacheService.LEGACY_STORAGE_PATH_PREFIX}/{old_key}.wav"
+        has_legacy = default_storage.exists(legacy_path)
+
+        # Readers always look up the default-format key, so WAV-backed rows
+        # go under it too; audio_format records what the file really is
+        audio_format = AudioStore.DEFAULT_FORMAT
+        if not entry.audio_file and has_legacy:
+            audio_format = 'wav'
+
+        new_key = AudioStore.make_key(entry.text_content, entry.language, entry.voice_style)
+
+        if new_key == old_key and not has_legacy:
+            stats['unchanged'] += 1
+            return
+
+        self.stdout.write(f"  {old_key} -> {new_key} ({entry.text_content[:30]})")
+        if dry_run:
+            stats['rekeyed'] += 1
+            return
+
+        survivor = AudioCache.objects.filter(cache_key=new_key).exclude(id=entry.id).first()
+        if survivor:
+            self._merge_into(survivor, entry)
+            stats['merged'] += 1
+        else:
+            entry.cache_key = new_key
+            entry.text_hash = AudioStore.text_hash(entry.text_content)
+            entry.audio_format = audio_format
+            entry.save(update_fields=['cache_key', 'text_hash', 'audio_format', 'updated_at'])
+            stats['rekeyed'] += 1
+
+        if has_legacy:
+            target = survivor or entry
+            if not target.audio_file:
+                with default_storage.open(legacy_path, 'rb') as f:
+                    audio_bytes = f.read()
+                target.audio_file.save(f"{new_key}.wav", ContentFile(audio_bytes), save=True)
+                # Sniff the real format, duration and loudness from the bytes
+                AudioProbe.apply(target.cache_key, audio_bytes, 'wav')
+                stats['legacy_moved'] += 1
+            else:
+                stats['legacy_deleted'] += 1
+            default_storage.delete(legacy_path)
+
+        cache.delete(f"tts:audio:{old_key}")
+
+    def _merge_into(self, survivor: AudioCache, duplicate: AudioCache):
+        """Fold `duplicate` into `survivor` and delete it."""
+        for relation in AudioCache._meta.related_objects:
+            if not (relation.many_to_one or relation.one_to_one):
+                continue
+            relation.related_model.objects.filter(
+                **{relation.field.name: duplicate}
+            ).update(**{relation.field.name: survivor})
+
+        if not survivor.audio_file and duplicate.audio_file:
+            survivor.audio_file = duplicate.audio_file.name
+            survivor.audio_format = duplicate.audio_format
+        elif duplicate.audio_file:
+            duplicate.audio_file.delete(save=False)
+
+        survivor.access_count += duplicate.access_count
+        survivor.save(update_fields=['audio_file', 'audio_format', 'access_count', 'updated_at'])
+        duplicate.delete()
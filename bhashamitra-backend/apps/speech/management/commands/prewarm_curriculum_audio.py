@@ -2,18 +2,18 @@
 Management command to pre-generate audio for all curriculum content.
 Generates TTS for alphabets, vocabulary, stories, and festival content.
 
+Items are synthesized in parallel by PrewarmEngine (deduped by cache key,
+rate limited per provider). Pass --checkpoint to make a long run resumable.
+
 Usage:
     python manage.py prewarm_curriculum_audio --language HINDI
     python manage.py prewarm_curriculum_audio --language HINDI --type alphabet
     python manage.py prewarm_curriculum_audio --language HINDI --type stories
-    python manage.py prewarm_curriculum_audio --all
+    python manage.py prewarm_curriculum_audio --language HINDI --workers 8 --checkpoint /tmp/hindi.json
 """
-import time
-from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.core.management.base import BaseCommand
 
-from apps.speech.models import AudioCache
-from apps.speech.services.tts_service import TTSService, TTSServiceError
+from apps.speech.services.prewarm_engine import PrewarmEngine, PrewarmItem
 
 
 # NCERT-Verified Hindi Alphabet Content
@@ -142,7 +142,7 @@ class Command(BaseCommand):
         parser.add_argument(
             '--type',
             type=str,
-            choices=['alphabet', 'vocabulary', 'stories', 'all'],
+            choices=['alphabet', 'vocabulary', 'stories', 'festivals', 'all'],
             default='all',
             help='Content type to generate (default: all)'
         )
@@ -162,13 +162,30 @@ class Command(BaseCommand):
             action='store_true',
             help='Regenerate even if already cached'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Parallel synthesis workers (capped by the provider limit)'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=None,
+            help='Max provider requests per second (capped by the provider limit)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=None,
+            help='Checkpoint file; an interrupted run resumes from it'
+        )
 
     def handle(self, *args, **options):
         language = options['language']
         content_type = options['type']
         voice_style = options['voice_style']
         dry_run = options['dry_run']
-        force = options['force']
 
         self.stdout.write(f"Pre-warming audio cache for {language}...")
         self.stdout.write(f"Voice style: {voice_style}")
@@ -177,217 +194,115 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN - No audio will be generated"))
 
-        stats = {
-            'total': 0,
-            'cached': 0,
-            'generated': 0,
-            'failed': 0,
-        }
-
-        # Generate alphabet audio
+        items = []
         if content_type in ['alphabet', 'all']:
-            self.stdout.write("\n=== Generating Alphabet Audio ===")
-            alphabet_stats = self._generate_alphabet_audio(
-                language, voice_style, dry_run, force
-            )
-            for key in stats:
-                stats[key] += alphabet_stats[key]
-
-        # Generate vocabulary audio
+            items += self._alphabet_items(language, voice_style)
         if content_type in ['vocabulary', 'all']:
-            self.stdout.write("\n=== Generating Vocabulary Audio ===")
-            vocab_stats = self._generate_vocabulary_audio(
-                language, voice_style, dry_run, force
-            )
-            for key in stats:
-                stats[key] += vocab_stats[key]
-
-        # Generate story audio
+            items += self._vocabulary_items(language, voice_style)
         if content_type in ['stories', 'all']:
-            self.stdout.write("\n=== Generating Story Audio ===")
-            story_stats = self._generate_story_audio(
-                language, voice_style, dry_run, force
-            )
-            for key in stats:
-                stats[key] += story_stats[key]
+            items += self._story_items(language, voice_style)
+        if content_type in ['festivals', 'all']:
+            items += self._festival_items(language, voice_style)
+
+        # Pre-generate with Google TTS WaveNet; the cached audio is then
+        # available for Standard/Free tier users
+        engine = PrewarmEngine(
+            tts_provider='google_wavenet',
+            workers=options['workers'],
+            rate=options['rate'],
+            checkpoint_path=options['checkpoint'],
+            force=options['force'],
+            dry_run=dry_run,
+            log=self.stdout.write,
+        )
+        report = engine.run(items)
 
         # Summary
         self.stdout.write("\n" + "=" * 50)
-        self.stdout.write(self.style.SUCCESS(f"Pre-warming complete!"))
-        self.stdout.write(f"Total items: {stats['total']}")
-        self.stdout.write(f"Already cached: {stats['cached']}")
-        self.stdout.write(f"Newly generated: {stats['generated']}")
-        if stats['failed'] > 0:
-            self.stdout.write(self.style.ERROR(f"Failed: {stats['failed']}"))
-
-    def _generate_alphabet_audio(self, language, voice_style, dry_run, force):
-        """Generate audio for all alphabet letters."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
-
+        self.stdout.write(self.style.SUCCESS("Pre-warming complete!"))
+        for line in report.summary_lines():
+            self.stdout.write(line)
+        if report.failed > 0:
+            self.stdout.write(self.style.ERROR(f"Failed: {report.failed}"))
+
+    def _alphabet_items(self, language, voice_style):
+        """Alphabet letters and their example words."""
+        items = []
         for item in HINDI_ALPHABET:
-            stats['total'] += 1
-            letter = item['letter']
-            example_word = item['example_word']
-
-            # Generate audio for the letter itself
-            self._generate_single(
-                text=letter,
+            items.append(PrewarmItem(
+                text=item['letter'],
                 language=language,
                 voice_style=voice_style,
                 content_type='alphabet_letter',
                 content_id=item['transliteration'],
-                dry_run=dry_run,
-                force=force,
-                stats=stats,
-            )
-
-            # Generate audio for the example word
-            stats['total'] += 1
-            self._generate_single(
-                text=example_word,
+            ))
+            items.append(PrewarmItem(
+                text=item['example_word'],
                 language=language,
                 voice_style=voice_style,
                 content_type='alphabet_example',
                 content_id=f"{item['transliteration']}_example",
-                dry_run=dry_run,
-                force=force,
-                stats=stats,
-            )
-
-        return stats
-
-    def _generate_vocabulary_audio(self, language, voice_style, dry_run, force):
-        """Generate audio for all vocabulary words."""
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
-
-        for category, words in HINDI_VOCABULARY.items():
-            self.stdout.write(f"\nCategory: {category}")
-
-            for item in words:
-                stats['total'] += 1
-                word = item['word']
-
-                self._generate_single(
-                    text=word,
-                    language=language,
-                    voice_style=voice_style,
-                    content_type=f'vocabulary_{category}',
-                    content_id=item['transliteration'],
-                    dry_run=dry_run,
-                    force=force,
-                    stats=stats,
-                )
-
-        return stats
-
-    def _generate_single(
-        self,
-        text: str,
-        language: str,
-        voice_style: str,
-        content_type: str,
-        content_id: str,
-        dry_run: bool,
-        force: bool,
-        stats: dict,
-    ):
-        """Generate audio for a single text item."""
-        from apps.speech.services.tts_service import TTSService
-
-        cache_key = TTSService._generate_cache_key(text, language, voice_style)
-
-        # Check if already cached
-        if not force:
-            existing = AudioCache.objects.filter(cache_key=cache_key).first()
-            if existing and existing.audio_file:
-                self.stdout.write(f"  [CACHED] {text[:20]}...")
-                stats['cached'] += 1
-                return
-
-        if dry_run:
-            self.stdout.write(f"  [DRY-RUN] Would generate: {text[:30]}...")
-            return
-
-        try:
-            # Generate using the TTS service with a mock premium user
-            # This uses Google TTS WaveNet for high-quality cached audio
-            # The cached audio is then available for Standard/Free tier users
-            from unittest.mock import Mock
-            mock_user = Mock()
-            mock_user.tts_provider = 'google_wavenet'  # Use Google TTS WaveNet for pre-generation
-
-            audio_bytes, provider, was_cached = TTSService.get_audio(
-                text=text,
+            ))
+        return items
+
+    def _vocabulary_items(self, language, voice_style):
+        """Core vocabulary words by category."""
+        return [
+            PrewarmItem(
+                text=item['word'],
                 language=language,
-                voice_profile=voice_style,
-                user=mock_user,
-                force_regenerate=force,
-            )
-
-            # Update the cache entry with content type info
-            AudioCache.objects.filter(cache_key=cache_key).update(
-                content_type=content_type,
-                content_id=content_id,
+                voice_style=voice_style,
+                content_type=f'vocabulary_{category}',
+                content_id=item['transliteration'],
             )
+            for category, words in HINDI_VOCABULARY.items()
+            for item in words
+        ]
 
-            self.stdout.write(self.style.SUCCESS(f"  [OK] {text[:20]}... ({provider})"))
-            stats['generated'] += 1
-
-            # Small delay to not overwhelm the TTS provider
-            time.sleep(0.5)
-
-        except TTSServiceError as e:
-            self.stdout.write(self.style.ERROR(f"  [FAIL] {text[:20]}... - {e}"))
-            stats['failed'] += 1
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"  [ERROR] {text[:20]}... - {e}"))
-            stats['failed'] += 1
-
-    def _generate_story_audio(self, language, voice_style, dry_run, force):
-        """Generate audio for all story pages and vocabulary."""
+    def _story_items(self, language, voice_style):
+        """Story pages and story vocabulary."""
         from apps.stories.models import Story, StoryPage, StoryVocabulary
 
-        stats = {'total': 0, 'cached': 0, 'generated': 0, 'failed': 0}
-
-        # Get all stories for this language
         stories = Story.objects.filter(language=language, is_active=True)
         self.stdout.write(f"Found {stories.count()} stories for {language}")
 
-        for story in stories:
-            self.stdout.write(f"\nStory: {story.title[:50]}...")
-
-            # Generate audio for each story page
-            pages = StoryPage.objects.filter(story=story).order_by('page_number')
-            for page in pages:
-                if not page.text_content or not page.text_content.strip():
-                    continue
-
-                stats['total'] += 1
-                self._generate_single(
-                    text=page.text_content,
+        items = []
+        pages = StoryPage.objects.filter(story__in=stories).order_by('story_id', 'page_number')
+        for page in pages:
+            if not page.text_content or not page.text_content.strip():
+                continue
+            items.append(PrewarmItem(
+                text=page.text_content,
+                language=language,
+                voice_style=voice_style,
+                content_type='story_page',
+                content_id=f"{page.story_id}_page_{page.page_number}",
+            ))
+
+        for vocab in StoryVocabulary.objects.filter(story__in=stories):
+            if vocab.word_hindi:
+                items.append(PrewarmItem(
+                    text=vocab.word_hindi,
                     language=language,
                     voice_style=voice_style,
-                    content_type='story_page',
-                    content_id=f"{story.id}_page_{page.page_number}",
-                    dry_run=dry_run,
-                    force=force,
-                    stats=stats,
-                )
-
-            # Generate audio for story vocabulary
-            vocab_items = StoryVocabulary.objects.filter(story=story)
-            for vocab in vocab_items:
-                if vocab.word_hindi:
-                    stats['total'] += 1
-                    self._generate_single(
-                        text=vocab.word_hindi,
-                        language=language,
-                        voice_style=voice_style,
-                        content_type='story_vocabulary',
-                        content_id=f"{story.id}_vocab_{vocab.id}",
-                        dry_run=dry_run,
-                        force=force,
-                        stats=stats,
-                    )
-
-        return stats
+                    content_type='story_vocabulary',
+                    content_id=f"{vocab.story_id}_vocab_{vocab.id}",
+                ))
+        return items
+
+    def _festival_items(self, language, voice_style):
+        """Festival names in the target language."""
+        from apps.festivals.models import Festival
+
+        items = []
+        for festival in Festival.objects.filter(is_active=True):
+            name = festival.get_name_for_language(language)
+            if name and name != festival.name:
+                items.append(PrewarmItem(
+                    text=name,
+                    language=language,
+                    voice_style=voice_style,
+                    content_type='festival_name',
+                    content_id=str(festival.id),
+                ))
+        return items
@@ -0,0 +1,65 @@
+"""
+Management command to measure audio metadata for existing cache entries.
+
+New entries are probed as they are stored; this backfills rows whose
+duration is still a provider estimate (probed_at is null) by reading the
+stored file, parsing its headers and computing loudness.
+
+Usage:
+    python manage.py probe_audio_cache
+    python manage.py probe_audio_cache --limit 500
+    python manage.py probe_audio_cache --all
+"""
+from django.core.management.base import BaseCommand
+
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_probe import AudioProbe
+
+
+class Command(BaseCommand):
+    help = 'Measure duration, sample rate and loudness of cached TTS audio'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=0,
+            help='Maximum number of entries to probe (0 = no limit)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Re-probe entries that already have measured metadata'
+        )
+
+    def handle(self, *args, **options):
+        entries = AudioCache.objects.exclude(audio_file='').order_by('-access_count')
+        if not options.get('all'):
+            entries = entries.filter(probed_at__isnull=True)
+        if options.get('limit'):
+            entries = entries[:options['limit']]
+
+        stats = {'probed': 0, 'corrected': 0, 'failed': 0}
+
+        for entry in entries.only('id', 'cache_key', 'audio_file', 'audio_format', 'audio_duration_ms').iterator():
+            try:
+                with entry.audio_file.open('rb') as f:
+                    audio_bytes = f.read()
+            except Exception as e:
+                self.stdout.write(self.style.WARNING(f"  Unreadable {entry.cache_key}: {e}"))
+                stats['failed'] += 1
+                continue
+
+            metadata = AudioProbe.apply(entry.cache_key, audio_bytes, entry.audio_format)
+            if metadata is None:
+                stats['failed'] += 1
+                continue
+
+            stats['probed'] += 1
+            if metadata.duration_ms != entry.audio_duration_ms:
+                stats['corrected'] += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Probed {stats['probed']} entries "
+            f"({stats['corrected']} durations corrected, {stats['failed']} failed)"
+        ))
@@ -0,0 +1,95 @@
+"""
+Management command to run a background TTS synthesis worker.
+
+Processes TTSJob rows queued by the TTS views on cold cache misses.
+Run as many worker processes as needed - they coordinate through the
+database and scale independently of the web workers.
+
+Usage:
+    python manage.py run_tts_worker
+    python manage.py run_tts_worker --once
+    python manage.py run_tts_worker --max-jobs=100 --sleep=2
+"""
+import logging
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.speech.services.tts_job_service import TTSJobService
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Run a worker that processes queued TTS synthesis jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the queue once and exit instead of polling forever'
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Exit after processing this many jobs'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='Seconds to wait between polls when the queue is empty'
+        )
+
+    def handle(self, *args, **options):
+        once = options.get('once')
+        max_jobs = options.get('max_jobs')
+        sleep_seconds = options.get('sleep')
+
+        processed = 0
+        failed = 0
+
+        self.stdout.write("\nTTS worker started\n")
+
+        try:
+            while max_jobs is None or processed < max_jobs:
+                job = None
+                try:
+                    close_old_connections()
+                    TTSJobService.requeue_stale()
+
+                    job = TTSJobService.claim_next()
+                    if not job:
+                        if once:
+                            break
+                        time.sleep(sleep_seconds)
+                        continue
+
+                    job = TTSJobService.process(job)
+                except Exception as e:
+                    # One bad job or a DB hiccup must not stop the worker;
+                    # a job left RUNNING is picked up again by requeue_stale
+                    logger.exception("TTS worker iteration failed")
+                    self.stderr.write(f"  [ERROR] {job.id if job else '-'}: {e}")
+                    if job:
+                        processed += 1
+                        failed += 1
+                    time.sleep(sleep_seconds)
+                    continue
+
+                processed += 1
+
+                if job.status == job.Status.COMPLETED:
+                    self.stdout.write(
+                        self.style.SUCCESS(f"  [OK] {job.id} ({job.provider}) {job.text_content[:40]}")
+                    )
+                else:
+                    failed += 1
+                    self.stdout.write(
+                        self.style.WARNING(f"  [{job.status}] {job.id}: {job.error_message}")
+                    )
+        except KeyboardInterrupt:
+            self.stdout.write("\nInterrupted, shutting down")
+
+        self.stdout.write(f"\nProcessed {processed} jobs ({failed} not completed)\n")
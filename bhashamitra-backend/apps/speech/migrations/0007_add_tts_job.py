@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:56
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('speech', '0006_add_voice_character'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TTSJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cache_key', models.CharField(db_index=True, max_length=64)),
+                ('text_content', models.TextField()),
+                ('language', models.CharField(max_length=20)),
+                ('voice_style', models.CharField(default='default', max_length=20)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('error_message', models.TextField(blank=True)),
+                ('provider', models.CharField(blank=True, max_length=20)),
+                ('audio_cache', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='speech.audiocache')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tts_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'TTS Job',
+                'verbose_name_plural': 'TTS Jobs',
+                'db_table': 'tts_jobs',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='tts_jobs_status_17c5b9_idx')],
+            },
+        ),
+    ]
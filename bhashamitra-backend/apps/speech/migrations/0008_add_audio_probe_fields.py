@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('speech', '0007_add_tts_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiocache',
+            name='channels',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='audiocache',
+            name='loudness_dbfs',
+            field=models.FloatField(blank=True, help_text='Gated RMS loudness in dBFS', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiocache',
+            name='peak_dbfs',
+            field=models.FloatField(blank=True, help_text='Sample peak in dBFS', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiocache',
+            name='probed_at',
+            field=models.DateTimeField(blank=True, help_text='When duration/format were measured from the audio (null = provider estimate)', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 20:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('speech', '0008_add_audio_probe_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiocache',
+            name='speech_duration_ms',
+            field=models.IntegerField(blank=True, help_text='Duration with leading/trailing silence trimmed', null=True),
+        ),
+    ]
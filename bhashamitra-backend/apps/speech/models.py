@@ -65,9 +65,22 @@ class AudioCache(TimeStampedModel):
     audio_file = models.FileField(upload_to='audio_cache/', blank=True)
     audio_url = models.URLField(blank=True, help_text="URL to the cached audio file")
     audio_duration_ms = models.IntegerField(default=0, help_text="Duration in milliseconds")
+    speech_duration_ms = models.IntegerField(
+        null=True,
+        blank=True,
+        help_text="Duration with leading/trailing silence trimmed"
+    )
     audio_size_bytes = models.IntegerField(default=0, help_text="File size in bytes")
     audio_format = models.CharField(max_length=10, default='wav')
     sample_rate = models.IntegerField(default=22050)
+    channels = models.PositiveSmallIntegerField(default=1)
+    loudness_dbfs = models.FloatField(null=True, blank=True, help_text="Gated RMS loudness in dBFS")
+    peak_dbfs = models.FloatField(null=True, blank=True, help_text="Sample peak in dBFS")
+    probed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When duration/format were measured from the audio (null = provider estimate)"
+    )
 
     # Content type for curriculum linking
     content_type = models.CharField(max_length=50, blank=True)  # 'alphabet', 'vocabulary', 'phrase'
@@ -628,3 +641,66 @@ class TTSUsageLog(TimeStampedModel):
             models.Index(fields=['created_at']),
             models.Index(fields=['provider', 'was_cached']),
         ]
+
+
+class TTSJob(TimeStampedModel):
+    """
+    Background TTS synthesis job.
+
+    Long or uncached texts are queued here instead of blocking a web worker
+    on the provider fallback chain. Jobs are picked up by the
+    `run_tts_worker` management command and polled by clients via
+    GET /api/v1/speech/tts/jobs/{job_id}/.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        COMPLETED = 'COMPLETED', 'Completed'
+        FAILED = 'FAILED', 'Failed'
+
+    # Request details
+    cache_key = models.CharField(max_length=64, db_index=True)
+    text_content = models.TextField()
+    language = models.CharField(max_length=20)
+    voice_style = models.CharField(max_length=20, default='default')
+    user = models.ForeignKey(
+        'users.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='tts_jobs'
+    )
+
+    # Processing state
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    error_message = models.TextField(blank=True)
+
+    # Result
+    provider = models.CharField(max_length=20, blank=True)
+    audio_cache = models.ForeignKey(
+        AudioCache,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs'
+    )
+
+    class Meta:
+        db_table = 'tts_jobs'
+        verbose_name = 'TTS Job'
+        verbose_name_plural = 'TTS Jobs'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.status} - {self.language} - {self.text_content[:30]}..."
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.COMPLETED, self.Status.FAILED)
@@ -154,7 +154,14 @@ class MimicAttemptSerializer(serializers.ModelSerializer):
 
 class MimicAttemptSubmitSerializer(serializers.Serializer):
     """Serializer for submitting a mimic attempt."""
-    audio_url = serializers.URLField(help_text="URL to child's audio recording")
+    audio_url = serializers.URLField(
+        required=False,
+        help_text="URL to child's audio recording"
+    )
+    audio = serializers.FileField(
+        required=False,
+        help_text="Recording uploaded with the attempt (skips the separate upload call)"
+    )
     duration_ms = serializers.IntegerField(
         min_value=100,
         max_value=10000,
@@ -162,6 +169,16 @@ class MimicAttemptSubmitSerializer(serializers.Serializer):
         help_text="Recording duration in milliseconds"
     )
 
+    def validate_audio(self, value):
+        if value.size > 10 * 1024 * 1024:
+            raise serializers.ValidationError("Audio file too large (max 10MB)")
+        return value
+
+    def validate(self, data):
+        if not data.get('audio_url') and not data.get('audio'):
+            raise serializers.ValidationError("Either audio_url or audio is required")
+        return data
+
 
 class MimicAttemptResultSerializer(serializers.Serializer):
     """Serializer for mimic attempt result."""
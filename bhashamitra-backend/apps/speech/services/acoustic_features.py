@@ -0,0 +1,119 @@
+"""
+Framed acoustic features for pronunciation scoring.
+
+AudioAnalyzer used to compute one RMS over the whole recording, so a child
+who waited a second before speaking was scored as quieter and "longer"
+than one who didn't. extract_features() frames the signal instead and, in
+one vectorized pass, gives:
+
+- per-frame energy (25 ms frames, 10 ms hop) as float32
+- voice activity: frames above an adaptive threshold (noise floor + margin,
+  capped below the loudest frame), ignoring blips shorter than
+  MIN_SPEECH_MS
+- the speech span (first to last voiced frame), i.e. the recording with
+  leading/trailing silence trimmed, and total voiced time
+- RMS over the speech span only
+
+Frames are a strided view over the samples (no copy) and at most
+MAX_ANALYSIS_SECONDS are analyzed, so memory stays bounded however long
+the upload is.
+
+Dependencies:
+- numpy
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+FRAME_MS = 25
+HOP_MS = 10
+
+# Recordings are single words/phrases; anything past this is not analyzed
+MAX_ANALYSIS_SECONDS = 30
+
+# Voiced = louder than noise floor + margin, but never required to be
+# within DYNAMIC_RANGE_DB of the loudest frame (steady tones, no silence)
+VAD_MARGIN_DB = 12.0
+VAD_DYNAMIC_RANGE_DB = 30.0
+VAD_FLOOR_DBFS = -50.0
+NOISE_PERCENTILE = 10
+
+# Voiced runs shorter than this are clicks/breaths, not speech
+MIN_SPEECH_MS = 50
+
+
+@dataclass
+class SpeechFeatures:
+    """Voice activity and energy features of one recording."""
+    duration_ms: int           # Whole recording
+    speech_start_ms: int       # First voiced frame
+    speech_end_ms: int         # End of last voiced frame
+    speech_duration_ms: int    # Span with leading/trailing silence trimmed
+    voiced_ms: int             # Total voiced time inside the span
+    rms_energy: float          # RMS over the speech span
+    frame_energy: Optional[object] = field(default=None, repr=False, compare=False)
+
+    @property
+    def has_speech(self) -> bool:
+        return self.speech_duration_ms > 0
+
+
+def _to_db(power):
+    import numpy as np
+    return 10.0 * np.log10(np.maximum(power, 1e-10))
+
+
+def extract_features(samples, sample_rate: int) -> SpeechFeatures:
+    """
+    Frame-level VAD and energy for mono (or multi-channel) samples.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    x = np.asarray(samples, dtype=np.float32)
+    if x.ndim > 1:
+        x = x.mean(axis=1, dtype=np.float32)
+    duration_ms = int(len(x) / sample_rate * 1000)
+    x = x[:MAX_ANALYSIS_SECONDS * sample_rate]
+
+    frame = max(1, int(sample_rate * FRAME_MS / 1000))
+    hop = max(1, int(sample_rate * HOP_MS / 1000))
+    if len(x) < frame:
+        return SpeechFeatures(duration_ms, 0, 0, 0, 0, 0.0)
+
+    # (n_frames, frame) view; einsum sums squares without a temporary
+    frames = sliding_window_view(x, frame)[::hop]
+    energy = np.einsum('ij,ij->i', frames, frames) / np.float32(frame)
+
+    db = _to_db(energy)
+    threshold = max(
+        VAD_FLOOR_DBFS,
+        min(np.percentile(db, NOISE_PERCENTILE) + VAD_MARGIN_DB, db.max() - VAD_DYNAMIC_RANGE_DB),
+    )
+    voiced = db > threshold
+
+    # Run-length encode voiced frames and drop short runs
+    edges = np.diff(np.concatenate(([0], voiced.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    min_frames = max(1, MIN_SPEECH_MS // HOP_MS)
+    keep = (ends - starts) >= min_frames
+    starts, ends = starts[keep], ends[keep]
+
+    if not len(starts):
+        rms = float(np.sqrt(energy.mean()))
+        return SpeechFeatures(duration_ms, 0, 0, 0, 0, rms, frame_energy=energy)
+
+    first, last = int(starts[0]), int(ends[-1]) - 1
+    to_ms = 1000.0 / sample_rate
+    speech_start_ms = int(first * hop * to_ms)
+    speech_end_ms = min(duration_ms, int((last * hop + frame) * to_ms))
+
+    return SpeechFeatures(
+        duration_ms=duration_ms,
+        speech_start_ms=speech_start_ms,
+        speech_end_ms=speech_end_ms,
+        speech_duration_ms=speech_end_ms - speech_start_ms,
+        voiced_ms=int((ends - starts).sum() * HOP_MS),
+        rms_energy=float(np.sqrt(energy[first:last + 1].mean())),
+        frame_energy=energy,
+    )
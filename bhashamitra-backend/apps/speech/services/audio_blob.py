@@ -0,0 +1,179 @@
+"""
+In-memory audio buffer shared across the mimic scoring pipeline.
+
+A mimic attempt used to fetch the child's recording once for STT and again
+for acoustic analysis, and spill webm files to a temp file when soundfile
+couldn't read them. AudioBlob fetches (or receives) the bytes once; STT,
+RMS/duration analysis and storage all read the same buffer, and the
+decoded samples are memoized on the blob.
+
+Usage:
+    audio = AudioBlob.fetch(audio_url)
+    stt_service.transcribe(audio_url, language, audio=audio)
+    AudioAnalyzer.analyze_blob(audio, expected_duration_ms)
+
+Dependencies (optional, imported lazily):
+- soundfile + numpy: WAV/FLAC/OGG/MP3 decoding
+- av (PyAV): in-process WebM/Opus decoding
+"""
+
+import io
+import logging
+import time
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from apps.core.provider_http import provider_session
+
+logger = logging.getLogger(__name__)
+
+
+class AudioFetchError(Exception):
+    """Raised when a recording can't be read from storage or downloaded."""
+    pass
+
+
+class AudioBlob:
+    """Encoded audio bytes plus lazily decoded mono samples."""
+
+    DEFAULT_EXTENSION = 'wav'
+    # Browsers' MediaRecorder uploads are webm when unnamed
+    UPLOAD_DEFAULT_EXTENSION = 'webm'
+
+    # HTTP fallback for recordings outside our media storage
+    HTTP_TIMEOUT = 15
+    MAX_RETRIES = 3
+
+    def __init__(self, data: bytes, extension: str = DEFAULT_EXTENSION, source: str = ''):
+        self.data = data
+        self.extension = (extension or self.DEFAULT_EXTENSION).lower().lstrip('.')
+        self.source = source
+        self._decoded = None
+        self._decode_attempted = False
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def view(self) -> memoryview:
+        """Zero-copy view of the encoded bytes."""
+        return memoryview(self.data)
+
+    @classmethod
+    def extension_from_name(cls, name: str, default: str = DEFAULT_EXTENSION) -> str:
+        path = urlparse(name).path
+        return path.rsplit('.', 1)[-1].lower() if '.' in path else default
+
+    @classmethod
+    def from_upload(cls, uploaded_file) -> 'AudioBlob':
+        """Wrap a Django UploadedFile, reading it exactly once."""
+        return cls(
+            uploaded_file.read(),
+            extension=cls.extension_from_name(
+                uploaded_file.name or '', default=cls.UPLOAD_DEFAULT_EXTENSION
+            ),
+            source=uploaded_file.name or '',
+        )
+
+    @classmethod
+    def fetch(cls, url: str) -> 'AudioBlob':
+        """
+        Load a recording from our media storage, or download it.
+
+        Local media URLs (containing /media/) are read straight from storage
+        so the server never downloads from itself over HTTP.
+        """
+        extension = cls.extension_from_name(url)
+
+        if '/media/' in url:
+            relative_path = url.split('/media/')[-1]
+            try:
+                if default_storage.exists(relative_path):
+                    with default_storage.open(relative_path, 'rb') as f:
+                        logger.info(f"Reading audio from storage: {relative_path}")
+                        return cls(f.read(), extension=extension, source=url)
+                logger.warning(f"Audio not in storage: {relative_path}, falling back to HTTP")
+            except Exception as e:
+                logger.warning(f"Failed to read audio from storage, falling back to HTTP: {e}")
+
+        for attempt in range(cls.MAX_RETRIES):
+            try:
+                response = provider_session('media').get(url, timeout=cls.HTTP_TIMEOUT)
+                response.raise_for_status()
+                return cls(response.content, extension=extension, source=url)
+            except requests.exceptions.RequestException as e:
+                logger.warning(
+                    f"Audio download failed (attempt {attempt + 1}/{cls.MAX_RETRIES}): {e}"
+                )
+                if attempt < cls.MAX_RETRIES - 1:
+                    time.sleep(0.5 * (attempt + 1))
+
+        raise AudioFetchError(f"Failed to download audio from {url}")
+
+    def save(self, path: str) -> str:
+        """Write the buffer to default storage; returns the saved path."""
+        return default_storage.save(path, ContentFile(self.data))
+
+    def decode(self) -> Optional[Tuple['numpy.ndarray', int]]:
+        """
+        Decode to (mono float32 samples, sample_rate), memoized.
+
+        Returns None if no available decoder understands the format.
+        """
+        if not self._decode_attempted:
+            self._decode_attempted = True
+            self._decoded = self._decode_with_soundfile() or self._decode_with_av()
+            if self._decoded is None:
+                logger.warning(f"Could not decode {self.extension} audio ({len(self.data)} bytes)")
+        return self._decoded
+
+    def _decode_with_soundfile(self):
+        try:
+            import soundfile as sf
+        except ImportError:
+            logger.error("soundfile not installed; audio decoding unavailable")
+            return None
+
+        try:
+            samples, sample_rate = sf.read(io.BytesIO(self.data), dtype='float32')
+        except Exception as e:
+            logger.debug(f"soundfile could not read {self.extension} audio: {e}")
+            return None
+
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1, dtype='float32')
+        return samples, sample_rate
+
+    def _decode_with_av(self):
+        """Decode container formats libsndfile can't read (WebM/Opus) in-process."""
+        try:
+            import av
+            import numpy as np
+        except ImportError:
+            logger.debug("PyAV not installed; skipping in-process WebM/Opus decode")
+            return None
+
+        try:
+            with av.open(io.BytesIO(self.data), mode='r') as container:
+                stream = container.streams.audio[0]
+                # Normalize every frame to mono float so chunks concatenate
+                resampler = av.AudioResampler(format='flt', layout='mono')
+                chunks = []
+                sample_rate = stream.rate
+                for frame in container.decode(stream):
+                    for out in resampler.resample(frame):
+                        chunks.append(out.to_ndarray().reshape(-1))
+                        sample_rate = out.sample_rate
+                for out in resampler.resample(None):
+                    chunks.append(out.to_ndarray().reshape(-1))
+        except Exception as e:
+            logger.debug(f"PyAV could not decode {self.extension} audio: {e}")
+            return None
+
+        if not chunks or not sample_rate:
+            return None
+        return np.concatenate(chunks).astype(np.float32, copy=False), sample_rate
@@ -0,0 +1,175 @@
+"""
+URL-first delivery of cached TTS audio.
+
+Cached audio is content-addressed by its md5 cache key, so an entry never
+changes once written. That lets us:
+
+- answer conditional GETs (If-None-Match) with 304 without touching storage
+- mark responses `immutable` with a long max-age when the request itself
+  names the content (TTS text in the body). Endpoints whose URL stays the
+  same when the content is edited (story pages, curriculum items) pass
+  immutable=False and get `private, no-cache`: the browser keeps its copy
+  but revalidates the ETag on every play, and shared caches never serve
+  the authenticated audio.
+- hand the bytes off to storage or the front proxy instead of streaming
+  them through a gunicorn worker
+
+Delivery mode is picked with the TTS_AUDIO_DELIVERY setting:
+    stream      Read the file and return the bytes (default, legacy behaviour)
+    redirect    302/303 to the storage URL (signed by the storage backend if needed)
+    x-accel     Empty response with X-Accel-Redirect for nginx to serve the file
+    x-sendfile  Empty response with X-Sendfile (Apache/lighttpd, local storage only)
+"""
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import F
+from django.http import HttpResponse, HttpResponseRedirect
+
+from apps.speech.models import AudioCache
+
+logger = logging.getLogger(__name__)
+
+DELIVERY_STREAM = 'stream'
+DELIVERY_REDIRECT = 'redirect'
+DELIVERY_X_ACCEL = 'x-accel'
+DELIVERY_X_SENDFILE = 'x-sendfile'
+
+# Content-addressed audio never changes - cache it for a year
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Mutable URLs (the audio behind them changes when the text is edited)
+REVALIDATE_CACHE_CONTROL = 'private, no-cache'
+
+
+def get_delivery_mode() -> str:
+    """Configured delivery mode (see module docstring)."""
+    return getattr(settings, 'TTS_AUDIO_DELIVERY', DELIVERY_STREAM).lower()
+
+
+def audio_etag(cache_key: str) -> str:
+    """Strong ETag derived from the audio cache key."""
+    return f'"{cache_key}"'
+
+
+def is_not_modified(request, cache_key: str) -> bool:
+    """Check If-None-Match against the cache key's ETag."""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    etag = audio_etag(cache_key)
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def apply_cache_headers(response: HttpResponse, cache_key: str, immutable: bool = True) -> HttpResponse:
+    """Set ETag and Cache-Control (immutable, or revalidate for mutable URLs)."""
+    response['ETag'] = audio_etag(cache_key)
+    response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+    return response
+
+
+def not_modified_response(cache_key: str, immutable: bool = True) -> HttpResponse:
+    """304 for a client that already holds this audio."""
+    return apply_cache_headers(HttpResponse(status=304), cache_key, immutable)
+
+
+def stored_audio_url(audio_cache: Optional[AudioCache]) -> Optional[str]:
+    """Public (possibly signed) URL of a stored audio entry, if it has one."""
+    if audio_cache is None:
+        return None
+    if audio_cache.audio_file:
+        try:
+            return audio_cache.audio_file.url
+        except Exception as e:
+            logger.warning(f"Could not build audio URL for {audio_cache.cache_key}: {e}")
+    return audio_cache.audio_url or None
+
+
+def deliver_audio_file(
+    request, audio_cache: AudioCache, filename: str, immutable: bool = True
+) -> Optional[HttpResponse]:
+    """
+    Build a response that serves `audio_cache` without reading its bytes.
+
+    Returns None in stream mode, or when the entry has no stored file or the
+    storage backend can't provide the needed URL/path - callers then fall
+    back to streaming.
+    """
+    mode = get_delivery_mode()
+    if mode == DELIVERY_STREAM or not audio_cache.audio_file:
+        return None
+
+    try:
+        if mode == DELIVERY_REDIRECT:
+            response = HttpResponseRedirect(audio_cache.audio_file.url)
+            if request.method == 'POST':
+                # 303 makes clients follow with GET
+                response.status_code = 303
+            # Signed URLs expire, so only cache the redirect briefly - and not
+            # at all when the requested URL can start pointing at new audio
+            response['ETag'] = audio_etag(audio_cache.cache_key)
+            if immutable:
+                response['Cache-Control'] = (
+                    f"public, max-age={getattr(settings, 'TTS_AUDIO_REDIRECT_MAX_AGE', 3600)}"
+                )
+            else:
+                response['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+        elif mode == DELIVERY_X_ACCEL:
+            prefix = getattr(settings, 'TTS_AUDIO_ACCEL_PREFIX', '/protected-media/')
+            response = HttpResponse(content_type='audio/mpeg')
+            response['X-Accel-Redirect'] = f"{prefix.rstrip('/')}/{audio_cache.audio_file.name}"
+            apply_cache_headers(response, audio_cache.cache_key, immutable)
+        elif mode == DELIVERY_X_SENDFILE:
+            response = HttpResponse(content_type='audio/mpeg')
+            response['X-Sendfile'] = audio_cache.audio_file.path
+            apply_cache_headers(response, audio_cache.cache_key, immutable)
+        else:
+            logger.warning(f"Unknown TTS_AUDIO_DELIVERY mode '{mode}', streaming instead")
+            return None
+    except (NotImplementedError, ValueError) as e:
+        # e.g. X-Sendfile on remote storage (no local path)
+        logger.warning(f"Cannot deliver {audio_cache.cache_key} via {mode}: {e}")
+        return None
+
+    response['Content-Disposition'] = f'inline; filename="{filename}"'
+
+    # Cheap single UPDATE instead of load-modify-save
+    AudioCache.objects.filter(pk=audio_cache.pk).update(access_count=F('access_count') + 1)
+    return response
+
+
+def serve_cached_audio(
+    request, cache_key: str, filename: str, immutable: bool = True
+) -> Optional[HttpResponse]:
+    """
+    Answer from the audio cache without loading audio into the worker.
+
+    Returns a 304 when the client already has the audio, a URL-first response
+    when the entry is stored and delivery mode allows it, or None when the
+    caller should go through the normal (byte-returning) TTS path. Pass
+    immutable=False when the request URL doesn't identify the content.
+    """
+    if is_not_modified(request, cache_key):
+        return not_modified_response(cache_key, immutable)
+
+    if get_delivery_mode() == DELIVERY_STREAM:
+        return None
+
+    audio_cache = (
+        AudioCache.objects.filter(cache_key=cache_key)
+        .exclude(audio_file='')
+        .only('id', 'cache_key', 'audio_file')
+        .first()
+    )
+    if not audio_cache:
+        return None
+    return deliver_audio_file(request, audio_cache, filename, immutable)
@@ -0,0 +1,421 @@
+"""
+Exact metadata for stored TTS audio.
+
+Providers report duration however they like - Google's REST path used
+`len(audio_bytes) / 3000` - and that number ends up in
+AudioCache.audio_duration_ms, which PronunciationScorer uses as the
+expected duration of a mimic attempt. AudioProbe replaces the estimate
+with values read from the audio itself:
+
+- MP3: every MPEG audio frame header is decoded at once with numpy, then
+  the frame chain is walked from the first header that is followed by
+  another one. Duration = sum(samples per frame) / sample rate, with the
+  Xing/Info tag frame (no audio) excluded and the LAME encoder delay and
+  padding trimmed when the tag records them.
+- WAV: RIFF `fmt ` and `data` chunks give rate, channels and byte rate.
+- Loudness: gated RMS over 50 ms blocks (blocks quieter than -60 dBFS are
+  ignored, so leading/trailing silence doesn't drag the level down) and
+  sample peak, both in dBFS. PCM WAV is read straight into numpy; other
+  formats go through AudioBlob.decode().
+- Speech duration: the same samples go through acoustic_features, so
+  mimic attempts (scored with silence trimmed) are compared against the
+  reference's speech rather than its padded length.
+
+Probing runs after the AudioCache row is committed, on a small background
+pool (TTS_AUDIO_PROBE_ASYNC), so synthesis responses never wait for it.
+Rows written before this existed are backfilled with
+`python manage.py probe_audio_cache`.
+
+Dependencies (optional, imported lazily):
+- numpy: required for probing; without it the provider's estimate stays
+- soundfile / av: loudness for compressed formats (via AudioBlob)
+"""
+import logging
+import math
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from apps.speech.models import AudioCache
+from apps.speech.services.acoustic_features import extract_features
+from apps.speech.services.audio_blob import AudioBlob
+
+logger = logging.getLogger(__name__)
+
+# MPEG version codes (header bits 19-20): 0 = 2.5, 1 = reserved, 2 = 2, 3 = 1
+_MPEG1 = 3
+_MPEG_RESERVED = 1
+_LAYER_III = 1
+
+# Layer III bitrates in kbps by bitrate index
+_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0)
+_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0)
+
+# Sample rates by [version code][sample rate index]
+_SAMPLE_RATES = (
+    (11025, 12000, 8000, 0),
+    (0, 0, 0, 0),
+    (22050, 24000, 16000, 0),
+    (44100, 48000, 32000, 0),
+)
+
+# WAV format tags
+_WAVE_PCM = 1
+_WAVE_FLOAT = 3
+_WAVE_EXTENSIBLE = 0xFFFE
+
+SILENCE_DBFS = -96.0
+
+
+@dataclass
+class AudioMetadata:
+    """Measured properties of an audio file."""
+    audio_format: str
+    duration_ms: int
+    sample_rate: int
+    channels: int
+    size_bytes: int
+    loudness_dbfs: Optional[float] = None
+    peak_dbfs: Optional[float] = None
+    speech_duration_ms: Optional[int] = None
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Length of a leading ID3v2 tag (syncsafe size + 10-byte header)."""
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _mp3_frames(data: bytes):
+    """
+    Decode every candidate MPEG Layer III header in one pass.
+
+    Returns (positions, frame_lengths, samples_per_frame, sample_rates,
+    channels), each an array indexed like `positions`.
+    """
+    import numpy as np
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if len(buf) < 4:
+        return None
+
+    b0, b1, b2, b3 = buf[:-3], buf[1:-2], buf[2:-1], buf[3:]
+    version = (b1 >> 3) & 3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    candidates = (
+        (b0 == 0xFF)
+        & ((b1 & 0xE0) == 0xE0)
+        & (version != _MPEG_RESERVED)
+        & (((b1 >> 1) & 3) == _LAYER_III)
+        & (bitrate_index != 0)
+        & (bitrate_index != 15)
+        & (rate_index != 3)
+    )
+    positions = np.flatnonzero(candidates)
+    if not len(positions):
+        return None
+
+    version = version[positions].astype(np.int64)
+    bitrate_index = bitrate_index[positions].astype(np.int64)
+    is_mpeg1 = version == _MPEG1
+
+    bitrates = np.where(
+        is_mpeg1,
+        np.asarray(_BITRATES_V1)[bitrate_index],
+        np.asarray(_BITRATES_V2)[bitrate_index],
+    ) * 1000
+    sample_rates = np.asarray(_SAMPLE_RATES)[version, rate_index[positions]]
+    padding = (b2[positions] >> 1) & 1
+    frame_lengths = np.where(is_mpeg1, 144, 72) * bitrates // sample_rates + padding
+    samples_per_frame = np.where(is_mpeg1, 1152, 576)
+    channels = np.where((b3[positions] >> 6) == 3, 1, 2)
+
+    return positions, frame_lengths, samples_per_frame, sample_rates, channels
+
+
+def _info_tag_trim(data: bytes, position: int, mpeg1: bool, mono: bool) -> Optional[int]:
+    """
+    Inspect the first frame for a Xing/Info/VBRI tag (a frame with no audio).
+
+    Returns None for an ordinary audio frame, else the number of encoder
+    delay + padding samples recorded in the LAME extension (0 if absent).
+    """
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    xing_at = position + 4 + side_info
+    if data[position + 36:position + 40] == b'VBRI':
+        return 0
+    if data[xing_at:xing_at + 4] not in (b'Xing', b'Info'):
+        return None
+
+    # LAME (and ffmpeg's Lavc) extension: 12-bit delay + 12-bit padding
+    if data[xing_at + 120:xing_at + 124] in (b'LAME', b'Lavc', b'Lavf'):
+        gapless = data[xing_at + 141:xing_at + 144]
+        if len(gapless) == 3:
+            delay = (gapless[0] << 4) | (gapless[1] >> 4)
+            padding = ((gapless[1] & 0x0F) << 8) | gapless[2]
+            return delay + padding
+    return 0
+
+
+def probe_mp3(data: bytes) -> Optional[AudioMetadata]:
+    """Exact duration of an MP3 by walking its frame headers."""
+    frames = _mp3_frames(data)
+    if frames is None:
+        return None
+    positions, frame_lengths, samples_per_frame, sample_rates, channels = frames
+
+    index_at = {int(pos): i for i, pos in enumerate(positions.tolist())}
+    start = _id3v2_size(data)
+    end = len(data)
+
+    # A sync word can occur inside audio data; trust the first header whose
+    # successor is also a header (or the end of the file)
+    first = None
+    for pos, i in index_at.items():
+        if pos < start:
+            continue
+        following = pos + int(frame_lengths[i])
+        if following == end or following in index_at:
+            first = i
+            break
+    if first is None:
+        return None
+
+    walked = []
+    pos = int(positions[first])
+    while pos in index_at:
+        i = index_at[pos]
+        walked.append(i)
+        pos += int(frame_lengths[i])
+        if pos > end:
+            walked.pop()  # truncated last frame
+            break
+    if not walked:
+        return None
+
+    trim = _info_tag_trim(
+        data, int(positions[walked[0]]),
+        mpeg1=samples_per_frame[walked[0]] == 1152,
+        mono=channels[walked[0]] == 1,
+    )
+    if trim is not None:
+        walked = walked[1:]
+    if not walked:
+        return None
+
+    sample_rate = int(sample_rates[walked[0]])
+    total_samples = int(samples_per_frame[walked].sum()) - (trim or 0)
+    duration_s = max(total_samples, 0) / sample_rate
+    return AudioMetadata(
+        audio_format='mp3',
+        duration_ms=round(duration_s * 1000),
+        sample_rate=sample_rate,
+        channels=int(channels[walked[0]]),
+        size_bytes=len(data),
+    )
+
+
+def _wav_chunks(data: bytes):
+    """Parse RIFF/WAVE into (fmt fields, data offset, data size)."""
+    if len(data) < 12 or data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        return None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', data, offset)
+        body = offset + 8
+        if chunk_id == b'fmt ' and chunk_size >= 16:
+            fmt = struct.unpack_from('<HHIIHH', data, body)
+            if fmt[0] == _WAVE_EXTENSIBLE and chunk_size >= 26:
+                # Sub-format GUID starts with the real format tag
+                fmt = (struct.unpack_from('<H', data, body + 24)[0],) + fmt[1:]
+        elif chunk_id == b'data' and fmt is not None:
+            # Streaming writers leave the size at 0 or 0xFFFFFFFF
+            available = len(data) - body
+            size = chunk_size if 0 < chunk_size <= available else available
+            return fmt, body, size
+        offset = body + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _pcm_samples(data: bytes, fmt, offset: int, size: int):
+    """Mono float samples in [-1, 1] for plain PCM/float WAV, else None."""
+    import numpy as np
+
+    format_tag, channels, _, _, block_align, bits = fmt
+    dtypes = {
+        (_WAVE_PCM, 8): np.uint8,
+        (_WAVE_PCM, 16): np.int16,
+        (_WAVE_PCM, 32): np.int32,
+        (_WAVE_FLOAT, 32): np.float32,
+        (_WAVE_FLOAT, 64): np.float64,
+    }
+    dtype = dtypes.get((format_tag, bits))
+    if dtype is None or not channels or not block_align:
+        return None
+
+    frames = size // block_align
+    samples = np.frombuffer(data, dtype=dtype, count=frames * channels, offset=offset)
+    samples = samples.reshape(-1, channels).astype(np.float64)
+    if format_tag == _WAVE_PCM:
+        if bits == 8:
+            samples = (samples - 128.0) / 128.0
+        else:
+            samples /= float(2 ** (bits - 1))
+    return samples.mean(axis=1)
+
+
+def probe_wav(data: bytes):
+    """Exact WAV metadata plus PCM samples when they can be read directly."""
+    parsed = _wav_chunks(data)
+    if parsed is None:
+        return None, None
+    fmt, offset, size = parsed
+    _, channels, sample_rate, byte_rate, _, _ = fmt
+    if not byte_rate or not sample_rate:
+        return None, None
+
+    metadata = AudioMetadata(
+        audio_format='wav',
+        duration_ms=round(size * 1000 / byte_rate),
+        sample_rate=sample_rate,
+        channels=channels,
+        size_bytes=len(data),
+    )
+    return metadata, _pcm_samples(data, fmt, offset, size)
+
+
+def measure_loudness(samples, sample_rate: int, block_ms: int = 50, gate_dbfs: float = -60.0):
+    """
+    Gated RMS loudness and sample peak of mono samples, in dBFS.
+
+    Returns (loudness_dbfs, peak_dbfs).
+    """
+    import numpy as np
+
+    if samples is None or not len(samples):
+        return SILENCE_DBFS, SILENCE_DBFS
+
+    peak = float(np.max(np.abs(samples)))
+    block = max(1, int(sample_rate * block_ms / 1000))
+    usable = len(samples) - len(samples) % block or len(samples)
+    blocks = samples[:usable].reshape(-1, min(block, usable))
+    power = np.mean(blocks ** 2, axis=1)
+
+    gate = 10 ** (gate_dbfs / 10)
+    loud = power[power > gate]
+    mean_power = float(loud.mean()) if len(loud) else float(power.mean())
+
+    def to_dbfs(value: float, scale: int) -> float:
+        if value <= 0:
+            return SILENCE_DBFS
+        return round(max(SILENCE_DBFS, scale * math.log10(value)), 2)
+
+    return to_dbfs(mean_power, 10), to_dbfs(peak, 20)
+
+
+class AudioProbe:
+    """Measure stored audio and write the results back to AudioCache."""
+
+    PROBE_WORKERS = 2
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.PROBE_WORKERS,
+                        thread_name_prefix='audio-probe',
+                    )
+        return cls._executor
+
+    @classmethod
+    def probe(cls, audio_bytes: bytes, audio_format: str = '') -> Optional[AudioMetadata]:
+        """
+        Measure audio bytes. The container is sniffed from the bytes, so a
+        provider returning WAV under an 'mp3' label is still measured right.
+        """
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            logger.warning("numpy not installed; keeping provider audio metadata")
+            return None
+
+        try:
+            samples = None
+            if audio_bytes[:4] == b'RIFF':
+                metadata, samples = probe_wav(audio_bytes)
+            else:
+                metadata = probe_mp3(audio_bytes)
+            if metadata is None:
+                logger.info(f"Could not parse {audio_format or 'unknown'} audio headers")
+                return None
+
+            if samples is None:
+                decoded = AudioBlob(audio_bytes, extension=metadata.audio_format).decode()
+                if decoded is not None:
+                    samples = decoded[0]
+            if samples is not None:
+                metadata.loudness_dbfs, metadata.peak_dbfs = measure_loudness(
+                    samples, metadata.sample_rate
+                )
+                features = extract_features(samples, metadata.sample_rate)
+                if features.has_speech:
+                    metadata.speech_duration_ms = features.speech_duration_ms
+            return metadata
+        except Exception as e:
+            logger.warning(f"Audio probe failed: {e}")
+            return None
+
+    @classmethod
+    def apply(cls, cache_key: str, audio_bytes: bytes, audio_format: str = '') -> Optional[AudioMetadata]:
+        """Probe audio and update its AudioCache row with one UPDATE."""
+        metadata = cls.probe(audio_bytes, audio_format)
+        if metadata is None:
+            return None
+
+        fields = asdict(metadata)
+        fields['audio_duration_ms'] = fields.pop('duration_ms')
+        fields['audio_size_bytes'] = fields.pop('size_bytes')
+        AudioCache.objects.filter(cache_key=cache_key).update(probed_at=timezone.now(), **fields)
+        logger.debug(
+            f"Audio probed: {cache_key} {metadata.duration_ms}ms "
+            f"{metadata.sample_rate}Hz {metadata.loudness_dbfs}dBFS"
+        )
+        return metadata
+
+    @classmethod
+    def schedule(cls, cache_key: str, audio_bytes: bytes, audio_format: str = '') -> None:
+        """Probe once the row is committed, off the request thread by default."""
+        if not getattr(settings, 'TTS_AUDIO_PROBE_ASYNC', True):
+            transaction.on_commit(lambda: cls.apply(cache_key, audio_bytes, audio_format))
+            return
+        transaction.on_commit(
+            lambda: cls._get_executor().submit(cls._apply_in_thread, cache_key, audio_bytes, audio_format)
+        )
+
+    @classmethod
+    def _apply_in_thread(cls, cache_key: str, audio_bytes: bytes, audio_format: str) -> None:
+        try:
+            cls.apply(cache_key, audio_bytes, audio_format)
+        except Exception as e:
+            logger.warning(f"Audio probe for {cache_key} failed: {e}")
+        finally:
+            connections.close_all()
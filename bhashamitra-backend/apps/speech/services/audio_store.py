@@ -0,0 +1,212 @@
+"""
+Content-addressed audio store.
+
+Single home for cached TTS audio. Previously TTSService wrote
+`audio_cache/{key}.mp3` with a 30-day Redis TTL while AudioCacheService
+wrote `audio/tts/{key}.wav` with a 24h TTL - same md5 scheme, different
+formats and lookups, so the same text could be stored and missed twice.
+
+Keys are derived from:
+- normalized text (Unicode NFC, whitespace collapsed)
+- language and voice profile
+- audio format and FORMAT_VERSION (bump to invalidate every entry)
+
+The provider that actually synthesized the audio is stored on the
+AudioCache row, not in the key: the fallback chain picks it after the
+lookup, and any provider's audio is acceptable for a hit.
+
+Read path: worker memory -> Redis -> AudioCache.audio_file -> miss.
+Write path: memory + Redis + AudioCache row + file, all under the same key.
+Duration, sample rate and loudness are then measured off the request path
+(see audio_probe).
+
+Existing entries are rekeyed by `python manage.py merge_audio_caches`.
+"""
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db.models import F
+
+from apps.core.local_cache import LocalCache
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_probe import AudioProbe
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Hot clips (alphabet, common words) served from worker memory. Entries
+# never change for a key, so a long local TTL is safe.
+_local_audio = LocalCache(
+    'audio',
+    max_bytes=getattr(settings, 'LOCAL_CACHE_AUDIO_BYTES', 32 * 1024 * 1024),
+    max_item_bytes=512 * 1024,
+    ttl=3600,
+)
+
+
+class AudioStore:
+    """Content-addressed storage for synthesized audio."""
+
+    # Bump when the key recipe or stored audio format changes
+    FORMAT_VERSION = 1
+
+    # Providers in the TTS fallback chain return MP3
+    DEFAULT_FORMAT = 'mp3'
+
+    # Redis TTL (30 days)
+    REDIS_TTL = 86400 * 30
+
+    @classmethod
+    def normalize_text(cls, text: str) -> str:
+        """
+        Canonical form of a text for keying.
+
+        NFC folds the different codepoint sequences editors produce for the
+        same Indic syllable; zero-width joiners are kept since they change
+        how a conjunct is rendered and read.
+        """
+        text = unicodedata.normalize('NFC', text or '')
+        return _WHITESPACE_RE.sub(' ', text).strip()
+
+    @classmethod
+    def make_key(
+        cls,
+        text: str,
+        language: str,
+        voice_profile: str,
+        audio_format: str = DEFAULT_FORMAT,
+    ) -> str:
+        """Content address for a text/voice/format combination."""
+        content = (
+            f"v{cls.FORMAT_VERSION}:{cls.normalize_text(text)}:"
+            f"{language}:{voice_profile}:{audio_format}"
+        )
+        return hashlib.md5(content.encode()).hexdigest()
+
+    @classmethod
+    def text_hash(cls, text: str) -> str:
+        """Hash of the normalized text alone (for AudioCache.text_hash)."""
+        return hashlib.md5(cls.normalize_text(text).encode()).hexdigest()
+
+    @classmethod
+    def redis_key(cls, cache_key: str) -> str:
+        return f"audio:v{cls.FORMAT_VERSION}:{cache_key}"
+
+    @classmethod
+    def get(cls, cache_key: str) -> Optional[bytes]:
+        """
+        Get audio bytes for a key (Redis first, then stored file).
+        """
+        cached = _local_audio.get(cache_key)
+        if cached:
+            return cached
+
+        redis_key = cls.redis_key(cache_key)
+        cached = cache.get(redis_key)
+        if cached:
+            logger.debug(f"Audio store hit (Redis): {cache_key}")
+            _local_audio.set(cache_key, cached)
+            return cached
+
+        audio_cache = (
+            AudioCache.objects.filter(cache_key=cache_key)
+            .exclude(audio_file='')
+            .only('id', 'cache_key', 'audio_file')
+            .first()
+        )
+        if not audio_cache:
+            return None
+
+        try:
+            with audio_cache.audio_file.open('rb') as f:
+                audio_bytes = f.read()
+        except Exception as e:
+            logger.warning(f"Error reading audio {cache_key} from storage: {e}")
+            return None
+
+        # Repopulate Redis for the next request
+        cache.set(redis_key, audio_bytes, cls.REDIS_TTL)
+        _local_audio.set(cache_key, audio_bytes)
+        cls.touch(cache_key)
+
+        logger.debug(f"Audio store hit (storage): {cache_key}")
+        return audio_bytes
+
+    @classmethod
+    def put(
+        cls,
+        cache_key: str,
+        text: str,
+        language: str,
+        voice_profile: str,
+        audio_bytes: bytes,
+        provider: str,
+        duration_ms: int = 0,
+        audio_format: str = DEFAULT_FORMAT,
+        **metadata,
+    ) -> Optional[AudioCache]:
+        """
+        Store audio in Redis, storage and the AudioCache table.
+
+        Extra keyword arguments (generation_time_ms, story_id, page_number,
+        content_type, ...) are written to the AudioCache row.
+        """
+        cache.set(cls.redis_key(cache_key), audio_bytes, cls.REDIS_TTL)
+        _local_audio.set(cache_key, audio_bytes)
+
+        try:
+            audio_cache, _ = AudioCache.objects.update_or_create(
+                cache_key=cache_key,
+                defaults={
+                    'text_hash': cls.text_hash(text),
+                    'text_content': text,
+                    'language': language,
+                    'voice_style': voice_profile,
+                    'provider': provider,
+                    'audio_format': audio_format,
+                    'audio_size_bytes': len(audio_bytes),
+                    'audio_duration_ms': duration_ms,
+                    **metadata,
+                }
+            )
+
+            # Replace rather than add a suffixed copy (force_regenerate)
+            if audio_cache.audio_file:
+                audio_cache.audio_file.delete(save=False)
+            audio_cache.audio_file.save(
+                f"{cache_key}.{audio_format}",
+                ContentFile(audio_bytes),
+                save=True,
+            )
+
+            logger.info(f"Audio stored: {cache_key} ({provider}, {len(audio_bytes)} bytes)")
+
+            # Replace the provider's duration estimate with measured values
+            AudioProbe.schedule(cache_key, audio_bytes, audio_format)
+            return audio_cache
+        except Exception as e:
+            logger.error(f"Failed to persist audio {cache_key}: {e}")
+            return None
+
+    @classmethod
+    def touch(cls, cache_key: str) -> None:
+        """Record an access with a single UPDATE."""
+        try:
+            AudioCache.objects.filter(cache_key=cache_key).update(
+                access_count=F('access_count') + 1
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update access count: {e}")
+
+    @classmethod
+    def evict(cls, cache_key: str) -> None:
+        """Drop a key from memory and Redis (the stored file is left alone)."""
+        _local_audio.delete(cache_key)
+        cache.delete(cls.redis_key(cache_key))
@@ -1,46 +1,37 @@
 """
 Audio caching service for TTS.
-Implements a two-tier cache:
-1. Redis (fast, short-term) - 24 hour TTL
-2. S3/R2 (permanent, long-term) - Forever
 
-Strategy: Generate once, cache forever, serve unlimited users.
+Thin compatibility wrapper over AudioStore - the content-addressed store
+shared with TTSService. It used to keep its own `audio/tts/{key}.wav`
+copies with a 24h Redis TTL; `python manage.py merge_audio_caches` folds
+those legacy entries into the store.
 """
-import hashlib
 import logging
 from typing import Optional, Tuple
-from django.conf import settings
-from django.core.cache import cache
-from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
-from django.db.models import F
 
 from apps.speech.models import AudioCache
+from apps.speech.services.audio_store import AudioStore
 
 logger = logging.getLogger(__name__)
 
 
 class AudioCacheService:
     """
-    Two-tier caching for TTS audio:
-    - Tier 1: Redis (fast, 24h TTL)
-    - Tier 2: S3/R2 storage (permanent)
-    - Tier 3: Database record (metadata + URL)
+    Cache lookups and writes for TTS audio, backed by AudioStore.
     """
 
-    REDIS_TTL = getattr(settings, 'TTS_CACHE_TTL', 86400)  # 24 hours default
-    STORAGE_PATH_PREFIX = "audio/tts"
+    # Where the pre-AudioStore service wrote its files (read by the merge command)
+    LEGACY_STORAGE_PATH_PREFIX = "audio/tts"
 
     @classmethod
     def _generate_cache_key(cls, text: str, language: str, voice_style: str) -> str:
         """Generate a unique cache key for the text."""
-        content = f"{text}:{language}:{voice_style}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return AudioStore.make_key(text, language, voice_style)
 
     @classmethod
     def _generate_text_hash(cls, text: str) -> str:
         """Generate hash of just the text content."""
-        return hashlib.md5(text.encode()).hexdigest()
+        return AudioStore.text_hash(text)
 
     @classmethod
     def get_cached_audio(
@@ -59,43 +50,19 @@ class AudioCacheService:
             - audio_url: URL to the cached audio (for streaming)
         """
         cache_key = cls._generate_cache_key(text, language, voice_style)
-
-        # Tier 1: Check Redis cache (fastest)
-        redis_key = f"tts:audio:{cache_key}"
-        cached_audio = cache.get(redis_key)
-        if cached_audio:
-            logger.debug(f"Redis cache hit for {cache_key[:8]}...")
-            # Update access count in background
-            cls._update_access_count(cache_key)
-            return cached_audio, True, None
-
-        # Tier 2: Check database for URL (serves from S3/R2)
-        try:
-            audio_cache = AudioCache.objects.get(cache_key=cache_key)
-
-            # Try to get from storage
-            storage_path = f"{cls.STORAGE_PATH_PREFIX}/{cache_key}.wav"
-            if default_storage.exists(storage_path):
-                # Read from storage
-                with default_storage.open(storage_path, 'rb') as f:
-                    audio_bytes = f.read()
-
-                # Warm Redis cache for next request
-                cache.set(redis_key, audio_bytes, cls.REDIS_TTL)
-
-                # Update access count
-                audio_cache.increment_access()
-
-                logger.debug(f"Storage cache hit for {cache_key[:8]}...")
-                return audio_bytes, True, audio_cache.audio_url
-
-        except AudioCache.DoesNotExist:
-            pass
-        except Exception as e:
-            logger.warning(f"Cache lookup error: {e}")
-
-        logger.debug(f"Cache miss for {cache_key[:8]}...")
-        return None, False, None
+        audio_bytes = AudioStore.get(cache_key)
+        if not audio_bytes:
+            logger.debug(f"Cache miss for {cache_key[:8]}...")
+            return None, False, None
+
+        audio_url = None
+        audio_cache = AudioCache.objects.filter(cache_key=cache_key).only('audio_file', 'audio_url').first()
+        if audio_cache:
+            try:
+                audio_url = audio_cache.audio_file.url if audio_cache.audio_file else audio_cache.audio_url
+            except Exception:
+                audio_url = audio_cache.audio_url or None
+        return audio_bytes, True, audio_url
 
     @classmethod
     def store_audio(
@@ -106,10 +73,11 @@ class AudioCacheService:
         audio_bytes: bytes,
         generation_time_ms: int = 0,
         story_id: Optional[str] = None,
-        page_number: Optional[int] = None
-    ) -> AudioCache:
+        page_number: Optional[int] = None,
+        provider: str = 'cache',
+    ) -> Optional[AudioCache]:
         """
-        Store generated audio in all cache tiers.
+        Store generated audio in the shared audio store.
 
         Args:
             text: Original text
@@ -119,64 +87,24 @@ class AudioCacheService:
             generation_time_ms: Time taken to generate
             story_id: Optional story ID (for pre-warming)
             page_number: Optional page number
+            provider: Provider that generated the audio
 
         Returns:
-            AudioCache model instance
+            AudioCache model instance (None if it could not be persisted)
         """
         cache_key = cls._generate_cache_key(text, language, voice_style)
-        text_hash = cls._generate_text_hash(text)
-
-        # Tier 1: Store in Redis
-        redis_key = f"tts:audio:{cache_key}"
-        cache.set(redis_key, audio_bytes, cls.REDIS_TTL)
-
-        # Tier 2: Store in S3/R2 (or local storage)
-        storage_path = f"{cls.STORAGE_PATH_PREFIX}/{cache_key}.wav"
-        try:
-            saved_path = default_storage.save(storage_path, ContentFile(audio_bytes))
-            audio_url = default_storage.url(saved_path)
-        except Exception as e:
-            logger.warning(f"Failed to save to storage: {e}")
-            audio_url = ""
-
-        # Calculate estimated cost (~$0.00012/second, assume 3 seconds)
-        estimated_cost = 0.00036  # ~3 seconds of GPU time
-
-        # Tier 3: Store metadata in database
-        audio_cache, created = AudioCache.objects.update_or_create(
+        return AudioStore.put(
             cache_key=cache_key,
-            defaults={
-                'text_content': text,
-                'text_hash': text_hash,
-                'language': language,
-                'voice_style': voice_style,
-                'audio_url': audio_url,
-                'audio_size_bytes': len(audio_bytes),
-                'audio_format': 'wav',
-                'generation_time_ms': generation_time_ms,
-                'generation_cost_usd': estimated_cost,
-                'story_id': story_id,
-                'page_number': page_number,
-            }
-        )
-
-        logger.info(
-            f"Cached audio: {cache_key[:8]}... "
-            f"({len(audio_bytes)} bytes, {generation_time_ms}ms)"
+            text=text,
+            language=language,
+            voice_profile=voice_style,
+            audio_bytes=audio_bytes,
+            provider=provider,
+            generation_time_ms=generation_time_ms,
+            story_id=story_id,
+            page_number=page_number,
         )
 
-        return audio_cache
-
-    @classmethod
-    def _update_access_count(cls, cache_key: str):
-        """Update access count in background."""
-        try:
-            AudioCache.objects.filter(cache_key=cache_key).update(
-                access_count=F('access_count') + 1
-            )
-        except Exception as e:
-            logger.warning(f"Failed to update access count: {e}")
-
     @classmethod
     def get_cache_stats(cls) -> dict:
         """Get cache statistics for monitoring."""
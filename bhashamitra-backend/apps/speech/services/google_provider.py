@@ -19,6 +19,8 @@ import requests
 from typing import Tuple, Optional
 from django.conf import settings
 
+from apps.core.provider_http import provider_request
+
 logger = logging.getLogger(__name__)
 
 
@@ -467,7 +469,9 @@ class GoogleTTSProvider:
         try:
             logger.info(f"Google TTS (API Key): Generating '{text[:30]}...' in {language} with {voice_name}")
 
-            response = requests.post(
+            response = provider_request(
+                'google_tts',
+                'POST',
                 f"{cls.API_URL}?key={api_key}",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -0,0 +1,311 @@
+"""
+Phonetic text matching for pronunciation scoring.
+
+difflib.SequenceMatcher compares code points and isn't an edit distance:
+'कि' vs 'की' (short/long i) costs as much as 'कि' vs 'मा', and a matra
+change is counted as a whole-character miss. This module scores text the
+way a listener would:
+
+- Units are aksharas (grapheme clusters: consonant + virama-joined
+  consonants + matras/nukta/anusvara), so a syllable is one edit, not three.
+  Latin text (romanized transcripts) falls back to letters.
+- Substitutions are weighted: aksharas that differ only in aspiration,
+  retroflex/dental place, sibilant, vowel length or nasalization cost
+  CONFUSABLE_COST; a different vowel on the same consonant costs
+  VOWEL_COST; anything else costs 1.
+- Other Indic scripts are shifted onto the Devanagari block before folding
+  (Unicode keeps them in parallel ISCII order), so one table serves all.
+
+API:
+    similarity(a, b)                 -> 0-1, memoized per pair
+    similarity_many(query, texts)    -> batched (numpy) over candidates
+    align_words(expected, heard)     -> word alignment for feedback
+
+Dependencies (optional):
+- numpy: vectorized similarity_many; without it pairs are scored one by one
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+# Edit costs
+INDEL_COST = 1.0
+CONFUSABLE_COST = 0.25
+VOWEL_COST = 0.5
+
+# Romanization drops/adds these freely (kha/ka, namaste/namaste)
+SOFT_INDEL_LETTERS = {'h': 0.5, 'a': 0.5}
+
+MATCH_CACHE_SIZE = 16384
+
+_INDIC_START, _INDIC_END = 0x0900, 0x0E00
+_DEVANAGARI_BLOCK = 0x0080
+_ZWJ, _ZWNJ = '\u200d', '\u200c'
+_DEVANAGARI_VIRAMA = '\u094d'
+_NO_MERGE = float('inf')
+
+_MARKS = ''.join(
+    chr(cp) for cp in range(_INDIC_START, _INDIC_END)
+    if unicodedata.category(chr(cp)).startswith('M')
+)
+_VIRAMAS = ''.join(
+    chr(cp) for cp in range(_INDIC_START, _INDIC_END)
+    if unicodedata.combining(chr(cp)) == 9
+)
+
+# A base character with its marks, extended across virama (+ZWJ) joins
+_AKSHARA_RE = re.compile(
+    rf"\s|\S[{_MARKS}{_ZWJ}{_ZWNJ}]*"
+    rf"(?:(?:(?<=[{_VIRAMAS}])|(?<=[{_VIRAMAS}]{_ZWJ}))[^\s{_MARKS}][{_MARKS}{_ZWJ}{_ZWNJ}]*)*"
+)
+
+# Devanagari sound classes -> representative; None drops the character
+_PHONETIC_FOLD = str.maketrans({
+    # Aspiration and place of articulation
+    'ख': 'क', 'घ': 'ग', 'छ': 'च', 'झ': 'ज',
+    'ट': 'त', 'ठ': 'त', 'थ': 'त',
+    'ड': 'द', 'ढ': 'द', 'ध': 'द',
+    'फ': 'प', 'भ': 'ब', 'व': 'ब',
+    'ण': 'न', 'ङ': 'न', 'ञ': 'न',
+    'श': 'स', 'ष': 'स',
+    # Vowel length
+    'आ': 'अ', 'ई': 'इ', 'ऊ': 'उ', 'ऐ': 'ए', 'औ': 'ओ',
+    'ी': 'ि', 'ू': 'ु', 'ै': 'े', 'ौ': 'ो', 'ा': None,
+    # Nukta, nasalization, visarga
+    '़': None, 'ं': None, 'ँ': None, 'ः': None,
+})
+
+_LATIN_FOLD = str.maketrans({'w': 'v', 'z': 'j', 'q': 'k', 'c': 'k', 'y': 'i'})
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def aksharas(text: str) -> Tuple[str, ...]:
+    """Split text into grapheme-cluster units (NFC, whitespace collapsed)."""
+    text = ' '.join(unicodedata.normalize('NFC', text or '').split())
+    return tuple(_AKSHARA_RE.findall(text))
+
+
+def _to_devanagari(unit: str) -> str:
+    """Move a unit from any parallel Indic block onto Devanagari."""
+    chars = []
+    for char in unit:
+        cp = ord(char)
+        if _INDIC_START + _DEVANAGARI_BLOCK <= cp < _INDIC_END:
+            cp = _INDIC_START + (cp - _INDIC_START) % _DEVANAGARI_BLOCK
+        chars.append(chr(cp))
+    return ''.join(chars)
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _skeleton(unit: str) -> str:
+    """Sound-class form of a unit; confusable units share a skeleton."""
+    if unit.isascii():
+        return unit.lower().translate(_LATIN_FOLD)
+    decomposed = unicodedata.normalize('NFD', _to_devanagari(unit))
+    return decomposed.translate(_PHONETIC_FOLD)
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def substitution_cost(a: str, b: str) -> float:
+    """Weighted cost of hearing unit b where a was expected."""
+    if a == b:
+        return 0.0
+    skel_a, skel_b = _skeleton(a), _skeleton(b)
+    if skel_a == skel_b:
+        return CONFUSABLE_COST
+    if skel_a[:1] == skel_b[:1] and skel_a[:1].isalpha() and not skel_a.isascii():
+        return VOWEL_COST  # same consonant, different vowel
+    return 1.0
+
+
+def indel_cost(unit: str) -> float:
+    """Cost of a missing or extra unit."""
+    return SOFT_INDEL_LETTERS.get(unit.lower(), INDEL_COST)
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _bare(units: str) -> str:
+    """Skeleton with viramas removed: 'स्ते' and 'स' + 'ते' both become 'सते'."""
+    return _skeleton(units).replace(_DEVANAGARI_VIRAMA, '')
+
+
+def _pair_bares(units: Sequence[str]) -> List[Optional[str]]:
+    """Bare form of (unit j-1 + unit j) at index j."""
+    return [None] + [_bare(first + second) for first, second in zip(units, units[1:])]
+
+
+def _distance(a: Sequence[str], b: Sequence[str]) -> float:
+    """
+    Weighted Levenshtein distance over unit sequences.
+
+    Besides insert/delete/substitute, a conjunct may align with two units
+    that spell it without the virama (नमस्ते / नमसते) at CONFUSABLE_COST.
+    """
+    # Shared prefix/suffix cost nothing; near-misses shrink to a tiny DP
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+
+    bare_a, bare_b = [_bare(u) for u in a], [_bare(u) for u in b]
+    pairs_a, pairs_b = _pair_bares(a), _pair_bares(b)
+    insert_b = [indel_cost(u) for u in b]
+
+    before_previous = None
+    previous = [0.0]
+    for cost in insert_b:
+        previous.append(previous[-1] + cost)
+
+    for i, unit_a in enumerate(a):
+        delete = indel_cost(unit_a)
+        current = [previous[0] + delete]
+        for j, unit_b in enumerate(b):
+            best = min(
+                previous[j] + substitution_cost(unit_a, unit_b),
+                previous[j + 1] + delete,
+                current[j] + insert_b[j],
+            )
+            if j and pairs_b[j] == bare_a[i]:
+                best = min(best, previous[j - 1] + CONFUSABLE_COST)
+            if i and pairs_a[i] == bare_b[j]:
+                best = min(best, before_previous[j] + CONFUSABLE_COST)
+            current.append(best)
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def similarity(a: str, b: str) -> float:
+    """Phonetic similarity of two texts, 0 (unrelated) to 1 (identical)."""
+    if a == b:
+        return 1.0 if a else 0.0
+    units_a, units_b = aksharas(a), aksharas(b)
+    longest = max(len(units_a), len(units_b))
+    if not units_a or not units_b:
+        return 0.0
+    return max(0.0, 1.0 - _distance(units_a, units_b) / longest)
+
+
+def best_similarity(text: str, candidates: Sequence[Optional[str]]) -> float:
+    """Highest similarity of text to any non-empty candidate."""
+    return max((similarity(text, c) for c in candidates if c), default=0.0)
+
+
+def similarity_many(query: str, texts: Sequence[str]) -> List[float]:
+    """
+    Similarity of one query against many texts.
+
+    The DP runs once over the query's units with every candidate as a
+    numpy row, instead of one Python DP per pair.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [similarity(query, text) for text in texts]
+
+    if not texts:
+        return []
+    query_units = aksharas(query)
+    candidate_units = [aksharas(text) for text in texts]
+    if not query_units:
+        return [0.0] * len(texts)
+
+    # Integer ids per distinct unit; per-unit costs are looked up by id
+    vocabulary = {unit: i for i, unit in enumerate(
+        dict.fromkeys(unit for units in candidate_units for unit in units)
+    )}
+    vocab_units = list(vocabulary) or ['']
+    count = len(texts)
+    width = max(len(units) for units in candidate_units)
+    lengths = np.array([len(units) for units in candidate_units])
+    ids = np.zeros((count, width + 1), dtype=np.int64)
+    # Bare forms of each unit and of each adjacent pair, for conjunct merges
+    unit_bare = np.full((count, width + 1), None, dtype=object)
+    pair_bare = np.full((count, width + 1), None, dtype=object)
+    for row, units in enumerate(candidate_units):
+        ids[row, :len(units)] = [vocabulary[unit] for unit in units]
+        unit_bare[row, :len(units)] = [_bare(unit) for unit in units]
+        pair_bare[row, 1:len(units)] = [
+            _bare(first + second) for first, second in zip(units, units[1:])
+        ]
+    ids, unit_bare, pair_bare = ids[:, :width], unit_bare[:, :width], pair_bare[:, :width]
+
+    insert_costs = np.array([indel_cost(unit) for unit in vocab_units])[ids]
+    before_previous = None
+    previous = np.zeros((count, width + 1))
+    previous[:, 1:] = np.cumsum(insert_costs, axis=1)
+
+    for i, unit in enumerate(query_units):
+        delete = indel_cost(unit)
+        sub_costs = np.array([substitution_cost(unit, other) for other in vocab_units])[ids]
+
+        # Everything but insertions vectorizes over the whole row...
+        best = np.minimum(previous[:, :-1] + sub_costs, previous[:, 1:] + delete)
+        merges = np.where(pair_bare == _bare(unit), CONFUSABLE_COST, _NO_MERGE)
+        best[:, 1:] = np.minimum(best[:, 1:], previous[:, :-2] + merges[:, 1:])
+        if i:
+            joined = _bare(query_units[i - 1] + unit)
+            merges = np.where(unit_bare == joined, CONFUSABLE_COST, _NO_MERGE)
+            best = np.minimum(best, before_previous[:, :-1] + merges)
+
+        # ...insertions chain left to right, vectorized over candidates
+        current = np.empty_like(previous)
+        current[:, 0] = previous[:, 0] + delete
+        for j in range(width):
+            current[:, j + 1] = np.minimum(best[:, j], current[:, j] + insert_costs[:, j])
+        before_previous, previous = previous, current
+
+    distances = previous[np.arange(count), lengths]
+    longest = np.maximum(lengths, len(query_units))
+    scores = np.clip(1.0 - distances / longest, 0.0, 1.0)
+    return [
+        1.0 if text == query else (float(score) if units else 0.0)
+        for text, units, score in zip(texts, candidate_units, scores)
+    ]
+
+
+def align_words(
+    expected_words: Sequence[str],
+    heard_words: Sequence[str],
+) -> List[Tuple[Optional[int], Optional[int], float]]:
+    """
+    Align expected and heard words.
+
+    Returns (expected index or None, heard index or None, similarity) in
+    order: pairs are matched/substituted words, None marks a missed or an
+    extra word. Substituting costs 1 - similarity, skipping a word costs 1.
+    """
+    rows, cols = len(expected_words), len(heard_words)
+    similarities = [similarity_many(word, heard_words) for word in expected_words] if cols else []
+
+    cost = [[0.0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = float(i)
+    for j in range(1, cols + 1):
+        cost[0][j] = float(j)
+    for i in range(1, rows + 1):
+        for j in range(1, cols + 1):
+            cost[i][j] = min(
+                cost[i - 1][j - 1] + 1.0 - similarities[i - 1][j - 1],
+                cost[i - 1][j] + 1.0,
+                cost[i][j - 1] + 1.0,
+            )
+
+    alignment = []
+    i, j = rows, cols
+    while i or j:
+        if i and j and cost[i][j] == cost[i - 1][j - 1] + 1.0 - similarities[i - 1][j - 1]:
+            alignment.append((i - 1, j - 1, similarities[i - 1][j - 1]))
+            i, j = i - 1, j - 1
+        elif i and cost[i][j] == cost[i - 1][j] + 1.0:
+            alignment.append((i - 1, None, 0.0))
+            i -= 1
+        else:
+            alignment.append((None, j - 1, 0.0))
+            j -= 1
+    alignment.reverse()
+    return alignment
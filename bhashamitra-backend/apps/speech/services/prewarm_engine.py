@@ -0,0 +1,343 @@
+"""
+Parallel, resumable bulk audio prewarm engine.
+
+Used by the `prewarm_curriculum_audio` and `cache_all_audio` management
+commands. Commands collect PrewarmItems (alphabet, vocabulary, story and
+festival texts) and hand them to PrewarmEngine, which:
+
+1. Dedupes items by TTSService._generate_cache_key before any work
+2. Skips keys already in AudioCache (one bulk query) or in the checkpoint
+3. Synthesizes the rest on a bounded thread pool, with concurrency and
+   request rate capped per provider. get_audio picks the provider itself
+   (fallback chain, circuit breakers), so calls go through the gate of
+   the provider that served the previous call: once Google starts
+   failing over, Sarvam/Svara get their own limits, and the run speeds
+   back up when Google serves again
+4. Periodically writes a checkpoint file so a crashed run resumes where it
+   stopped
+5. Returns a PrewarmReport with throughput and estimated cost
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from django.db import connections
+
+from apps.speech.models import AudioCache
+from apps.speech.services.tts_service import TTSService
+
+logger = logging.getLogger(__name__)
+
+
+# Per-provider limits: (max concurrent requests, max requests per second).
+# Keys are User.tts_provider values (the head of the fallback chain) and the
+# providers get_audio reports, without their '_fallback' suffix.
+PROVIDER_LIMITS = {
+    'google_wavenet': (8, 10.0),
+    'google': (8, 10.0),
+    'sarvam': (2, 2.0),
+    'svara': (2, 3.0),
+    'cache_only': (4, 5.0),
+}
+DEFAULT_PROVIDER_LIMIT = (2, 2.0)
+
+
+@dataclass
+class PrewarmItem:
+    """A single text to synthesize, with the curriculum content it belongs to."""
+    text: str
+    language: str
+    voice_style: str
+    content_type: str = ''
+    content_id: str = ''
+
+    @property
+    def cache_key(self) -> str:
+        return TTSService._generate_cache_key(self.text.strip(), self.language, self.voice_style)
+
+
+@dataclass
+class PrewarmReport:
+    """Outcome of a prewarm run."""
+    total: int = 0
+    unique: int = 0
+    cached: int = 0
+    resumed: int = 0
+    generated: int = 0
+    failed: int = 0
+    characters: int = 0
+    elapsed_seconds: float = 0.0
+    cost_by_provider: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def duplicates(self) -> int:
+        return self.total - self.unique
+
+    @property
+    def throughput(self) -> float:
+        """Generated items per second."""
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.generated / self.elapsed_seconds
+
+    @property
+    def total_cost_usd(self) -> float:
+        return sum(self.cost_by_provider.values())
+
+    def summary_lines(self) -> List[str]:
+        lines = [
+            f"Total items: {self.total} ({self.duplicates} duplicates, {self.unique} unique)",
+            f"Already cached: {self.cached}",
+            f"Resumed from checkpoint: {self.resumed}",
+            f"Newly generated: {self.generated}",
+            f"Failed: {self.failed}",
+            f"Elapsed: {self.elapsed_seconds:.1f}s ({self.throughput:.2f} items/s, "
+            f"{self.characters} chars)",
+            f"Estimated cost: ${self.total_cost_usd:.4f}",
+        ]
+        for provider, cost in sorted(self.cost_by_provider.items()):
+            lines.append(f"  {provider}: ${cost:.4f}")
+        return lines
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ProviderGate:
+    """Concurrency and rate limit for one provider."""
+
+    def __init__(self, concurrency: int, rate: float):
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self.rate_limiter = RateLimiter(rate)
+
+    def __enter__(self):
+        self._slots.acquire()
+        self.rate_limiter.wait()
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
+        return False
+
+
+class PrewarmCheckpoint:
+    """Set of completed cache keys persisted to a JSON file."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done: Set[str] = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.done = set(json.load(f).get('done', []))
+
+    def mark(self, cache_key: str) -> None:
+        with self._lock:
+            self.done.add(cache_key)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            payload = {'done': sorted(self.done), 'updated_at': time.time()}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class PrewarmEngine:
+    """Synthesize and cache many texts in parallel."""
+
+    # Write the checkpoint after this many completed items
+    CHECKPOINT_EVERY = 20
+
+    def __init__(
+        self,
+        tts_provider: str = 'google_wavenet',
+        workers: Optional[int] = None,
+        rate: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+        force: bool = False,
+        dry_run: bool = False,
+        progress_every: int = 50,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        max_workers, _ = PROVIDER_LIMITS.get(tts_provider, DEFAULT_PROVIDER_LIMIT)
+        self.tts_provider = tts_provider
+        self.workers = min(workers or max_workers, max_workers)
+        self.rate = rate
+        self._gates: Dict[str, ProviderGate] = {}
+        self._gates_lock = threading.Lock()
+        # Provider expected to serve the next call
+        self._route = tts_provider
+        self.checkpoint = PrewarmCheckpoint(checkpoint_path)
+        self.force = force
+        self.dry_run = dry_run
+        self.progress_every = progress_every
+        self.log = log or logger.info
+        self._report_lock = threading.Lock()
+
+    def _dedupe(self, items: Iterable[PrewarmItem]) -> Dict[str, PrewarmItem]:
+        unique: Dict[str, PrewarmItem] = {}
+        for item in items:
+            if item.text and item.text.strip():
+                unique.setdefault(item.cache_key, item)
+        return unique
+
+    def _cached_keys(self, keys: List[str]) -> Set[str]:
+        """Keys that already have an audio file, fetched in chunks."""
+        found: Set[str] = set()
+        for i in range(0, len(keys), 500):
+            found.update(
+                AudioCache.objects.filter(cache_key__in=keys[i:i + 500])
+                .exclude(audio_file='')
+                .values_list('cache_key', flat=True)
+            )
+        return found
+
+    def _gate(self, provider: str) -> ProviderGate:
+        """Limits for a provider, capped by the run's workers and rate."""
+        with self._gates_lock:
+            gate = self._gates.get(provider)
+            if gate is None:
+                concurrency, max_rate = PROVIDER_LIMITS.get(provider, DEFAULT_PROVIDER_LIMIT)
+                gate = ProviderGate(
+                    min(concurrency, self.workers), min(self.rate or max_rate, max_rate)
+                )
+                self._gates[provider] = gate
+            return gate
+
+    def _synthesize(self, item: PrewarmItem):
+        """Generate audio for one item; returns the provider that served it."""
+        try:
+            with self._gate(self._route):
+                # get_audio only reads tts_provider off the user for routing
+                user = SimpleNamespace(tts_provider=self.tts_provider)
+                _, provider, _ = TTSService.get_audio(
+                    text=item.text,
+                    language=item.language,
+                    voice_profile=item.voice_style,
+                    user=user,
+                    force_regenerate=self.force,
+                )
+            if provider in PROVIDER_LIMITS or provider.endswith('_fallback'):
+                self._route = provider.replace('_fallback', '')
+
+            if item.content_type or item.content_id:
+                AudioCache.objects.filter(cache_key=item.cache_key).update(
+                    content_type=item.content_type,
+                    content_id=item.content_id,
+                )
+            return provider
+        finally:
+            # Pool threads get their own DB connections; don't leak them
+            connections.close_all()
+
+    @staticmethod
+    def _estimate_cost(text: str, provider: str) -> float:
+        if not provider.startswith('google'):
+            return 0.0
+        try:
+            from apps.speech.services.google_provider import GoogleTTSProvider
+            return GoogleTTSProvider.estimate_cost(text, use_wavenet=provider == 'google_wavenet')
+        except ImportError:
+            return 0.0
+
+    def run(self, items: Iterable[PrewarmItem]) -> PrewarmReport:
+        """Prewarm all items and return a summary report."""
+        start_time = time.monotonic()
+        items = list(items)
+        report = PrewarmReport(total=len(items))
+
+        unique = self._dedupe(items)
+        report.unique = len(unique)
+
+        pending = dict(unique)
+        if not self.force:
+            for key in list(pending):
+                if key in self.checkpoint.done:
+                    del pending[key]
+                    report.resumed += 1
+            for key in self._cached_keys(list(pending)):
+                del pending[key]
+                report.cached += 1
+
+        self.log(
+            f"Prewarming {len(pending)} items with {self.workers} workers "
+            f"({self.tts_provider}, {report.cached} cached, {report.resumed} resumed)"
+        )
+
+        if self.dry_run:
+            for item in pending.values():
+                self.log(f"  [DRY-RUN] Would generate: {item.text[:30]}...")
+            report.elapsed_seconds = time.monotonic() - start_time
+            return report
+
+        completed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self._synthesize, item): key
+                for key, item in pending.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                item = pending[key]
+                try:
+                    provider = future.result()
+                except Exception as e:
+                    with self._report_lock:
+                        report.failed += 1
+                        report.failures.append(f"{item.text[:30]}: {e}")
+                    self.log(f"  [FAIL] {item.text[:20]}... - {e}")
+                    continue
+
+                self.checkpoint.mark(key)
+                with self._report_lock:
+                    report.generated += 1
+                    report.characters += len(item.text)
+                    report.cost_by_provider[provider] += self._estimate_cost(item.text, provider)
+
+                completed += 1
+                if completed % self.CHECKPOINT_EVERY == 0:
+                    self.checkpoint.save()
+                if self.progress_every and completed % self.progress_every == 0:
+                    self.log(f"  Progress: {completed}/{len(pending)}")
+
+        if report.failed:
+            # Keep progress so a rerun only retries the failures
+            self.checkpoint.save()
+        else:
+            self.checkpoint.clear()
+
+        report.elapsed_seconds = time.monotonic() - start_time
+        return report
@@ -3,25 +3,27 @@ Pronunciation Scoring Service for Peppi Mimic.
 
 V2 Enhanced Scoring with Acoustic Analysis:
 - STT confidence (50%): How clearly speech was recognized
-- Text matching (30%): How close transcription matches expected
-- Audio energy (15%): RMS energy analysis (sufficient volume/clarity)
-- Duration match (5%): Recording duration similarity to reference
+- Text matching (30%): Phonetic edit distance to expected (see phonetic_match)
+- Audio energy (15%): RMS energy of the voiced part (sufficient volume/clarity)
+- Duration match (5%): Speech duration similarity to reference
 
 Dependencies:
 - soundfile: For audio file reading
-- numpy: For RMS calculation
+- numpy: For framed energy / voice activity (see acoustic_features)
+- av (optional): For WebM/Opus recordings (see audio_blob)
 """
 
-import difflib
 import re
-import tempfile
-import os
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from typing import Optional, Tuple
-import requests
 
+from .acoustic_features import extract_features
+from .audio_blob import AudioBlob, AudioFetchError
 from .feedback_service import get_pronunciation_feedback
+from .phonetic_match import best_similarity
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +35,7 @@ class AudioAnalysisResult:
     duration_match_score: float  # 0-100 based on duration similarity
     rms_energy: float        # Raw RMS value
     is_valid: bool           # Whether analysis was successful
+    speech_duration_ms: int = 0  # Duration with leading/trailing silence trimmed
 
 
 @dataclass
@@ -58,10 +61,10 @@ class AudioAnalyzer:
     """
     Analyze audio files for pronunciation scoring.
 
-    Uses RMS (Root Mean Square) energy to assess:
+    Uses framed RMS (Root Mean Square) energy and voice activity to assess:
     - Whether the child spoke clearly and loudly enough
     - Audio quality/clarity
-    - Recording duration vs expected duration
+    - Speech duration (silence trimmed) vs expected duration
     """
 
     # Minimum RMS threshold for "good" audio (empirically tuned)
@@ -73,6 +76,52 @@ class AudioAnalyzer:
     # Duration tolerance (±30% of expected is acceptable)
     DURATION_TOLERANCE = 0.30
 
+    # Background analysis runs alongside STT (see submit)
+    ANALYSIS_WORKERS = 4
+    ANALYSIS_TIMEOUT = 10  # seconds to wait once STT is done
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.ANALYSIS_WORKERS,
+                        thread_name_prefix='audio-analysis',
+                    )
+        return cls._executor
+
+    @classmethod
+    def submit(
+        cls,
+        audio: AudioBlob,
+        expected_duration_ms: Optional[int] = None
+    ) -> Future:
+        """
+        Start analyzing a recording in the background.
+
+        Decoding and RMS are CPU-bound but release the GIL in libsndfile and
+        numpy, so they overlap with the STT network call; the attempt then
+        takes max(STT, analysis) instead of their sum.
+        """
+        return cls._get_executor().submit(cls.analyze_blob, audio, expected_duration_ms)
+
+    @classmethod
+    def wait(cls, future: Future) -> AudioAnalysisResult:
+        """Collect a submitted analysis, falling back to neutral scores."""
+        try:
+            return future.result(timeout=cls.ANALYSIS_TIMEOUT)
+        except FutureTimeoutError:
+            # Drop it if still queued so a backlog doesn't pin the pool
+            future.cancel()
+            logger.warning(f"Audio analysis exceeded {cls.ANALYSIS_TIMEOUT}s, using defaults")
+        except Exception as e:
+            logger.warning(f"Audio analysis failed: {e}")
+        return cls._default_result()
+
     @classmethod
     def analyze(
         cls,
@@ -90,125 +139,53 @@ class AudioAnalyzer:
             AudioAnalysisResult with scores
         """
         try:
-            # Download audio
-            audio_data = cls._download_audio(audio_url)
-            if not audio_data:
-                return cls._default_result()
-
-            # Analyze using soundfile
-            return cls._analyze_audio_data(audio_data, expected_duration_ms)
-
-        except Exception as e:
+            audio = AudioBlob.fetch(audio_url)
+        except AudioFetchError as e:
             logger.warning(f"Audio analysis failed: {e}")
             return cls._default_result()
 
-    @classmethod
-    def _download_audio(cls, url: str, max_retries: int = 3) -> Optional[bytes]:
-        """
-        Get audio content from URL or local file.
-
-        For local media URLs (containing /media/), reads directly from disk
-        to avoid HTTP timeout issues when server downloads from itself.
-        """
-        from django.conf import settings
-        import time
-
-        # Check if this is a local media URL
-        if '/media/' in url:
-            try:
-                # Extract relative path from URL
-                # URL: https://bhashamitra.onrender.com/media/mimic_recordings/xxx/yyy.webm
-                # Relative path: mimic_recordings/xxx/yyy.webm
-                relative_path = url.split('/media/')[-1]
-                file_path = os.path.join(settings.MEDIA_ROOT, relative_path)
-
-                if os.path.exists(file_path):
-                    logger.info(f"Reading audio from local file: {file_path}")
-                    with open(file_path, 'rb') as f:
-                        return f.read()
-                else:
-                    logger.warning(f"Local file not found: {file_path}, falling back to HTTP")
-            except Exception as e:
-                logger.warning(f"Failed to read local file, falling back to HTTP: {e}")
-
-        # Fall back to HTTP download for external URLs or if local read failed
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=15)
-                response.raise_for_status()
-                return response.content
-            except requests.exceptions.Timeout:
-                logger.warning(f"Audio download timeout (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    time.sleep(1 * (attempt + 1))  # Exponential backoff
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Audio download failed (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(0.5 * (attempt + 1))
-
-        logger.error(f"Failed to download audio after {max_retries} attempts: {url}")
-        return None
+        return cls.analyze_blob(audio, expected_duration_ms)
 
     @classmethod
-    def _analyze_audio_data(
+    def analyze_blob(
         cls,
-        audio_data: bytes,
+        audio: AudioBlob,
         expected_duration_ms: Optional[int] = None
     ) -> AudioAnalysisResult:
-        """Analyze audio data using soundfile and numpy."""
+        """Analyze an already-fetched recording (decoded samples are reused)."""
         try:
-            import soundfile as sf
-            import numpy as np
-            import io
-
-            # Read audio from bytes
-            audio_bytes_io = io.BytesIO(audio_data)
-
-            try:
-                # Try to read audio file
-                samples, sample_rate = sf.read(audio_bytes_io)
-            except Exception as e:
-                # Try saving to temp file for format detection
-                logger.debug(f"Direct read failed, trying temp file: {e}")
-                with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as f:
-                    f.write(audio_data)
-                    temp_path = f.name
-
-                try:
-                    samples, sample_rate = sf.read(temp_path)
-                finally:
-                    os.unlink(temp_path)
-
-            # Convert to mono if stereo
-            if len(samples.shape) > 1:
-                samples = samples.mean(axis=1)
-
-            # Calculate RMS energy
-            rms_energy = float(np.sqrt(np.mean(samples ** 2)))
-
-            # Calculate duration
-            duration_ms = int(len(samples) / sample_rate * 1000)
+            decoded = audio.decode()
+            if decoded is None:
+                return cls._default_result()
+            samples, sample_rate = decoded
+
+            # Frame energy + voice activity in one pass
+            features = extract_features(samples, sample_rate)
+            rms_energy = features.rms_energy
 
             # Calculate energy score (0-100)
             energy_score = cls._calculate_energy_score(rms_energy)
 
-            # Calculate duration match score (0-100)
+            # Compare speech with speech: silence before/after the word
+            # shouldn't count against the child
+            speech_ms = features.speech_duration_ms if features.has_speech else features.duration_ms
             duration_match_score = cls._calculate_duration_score(
-                duration_ms, expected_duration_ms
+                speech_ms, expected_duration_ms
             )
 
             logger.info(
                 f"Audio analysis: RMS={rms_energy:.4f}, "
-                f"duration={duration_ms}ms, energy_score={energy_score:.1f}, "
-                f"duration_match={duration_match_score:.1f}"
+                f"duration={features.duration_ms}ms, speech={features.speech_duration_ms}ms, "
+                f"energy_score={energy_score:.1f}, duration_match={duration_match_score:.1f}"
             )
 
             return AudioAnalysisResult(
                 energy_score=energy_score,
-                duration_ms=duration_ms,
+                duration_ms=features.duration_ms,
                 duration_match_score=duration_match_score,
                 rms_energy=rms_energy,
-                is_valid=True
+                is_valid=True,
+                speech_duration_ms=features.speech_duration_ms,
             )
 
         except ImportError as e:
@@ -340,7 +317,9 @@ class PronunciationScorer:
         language_name: str = "Hindi",
         expected_romanization: Optional[str] = None,
         audio_url: Optional[str] = None,
-        expected_duration_ms: Optional[int] = None
+        expected_duration_ms: Optional[int] = None,
+        audio: Optional[AudioBlob] = None,
+        audio_analysis: Optional[AudioAnalysisResult] = None,
     ) -> PronunciationResult:
         """
         Score a pronunciation attempt using hybrid analysis.
@@ -352,6 +331,9 @@ class PronunciationScorer:
             expected_romanization: Optional romanization for fallback matching
             audio_url: URL to child's recording for acoustic analysis
             expected_duration_ms: Expected duration from reference audio
+            audio: Already-fetched recording; avoids downloading audio_url again
+            audio_analysis: Precomputed acoustic analysis (see AudioAnalyzer.submit);
+                takes precedence over audio/audio_url
 
         Returns:
             PronunciationResult with scores and feedback
@@ -382,9 +364,15 @@ class PronunciationScorer:
              transcription_clean == self._normalize_text(expected_romanization))
         )
 
-        # Perform acoustic analysis if audio URL provided
-        if audio_url:
-            audio_result = AudioAnalyzer.analyze(audio_url, expected_duration_ms)
+        # Perform acoustic analysis if audio provided
+        if audio_analysis is not None:
+            energy_score = audio_analysis.energy_score
+            duration_match_score = audio_analysis.duration_match_score
+        elif audio is not None or audio_url:
+            if audio is not None:
+                audio_result = AudioAnalyzer.analyze_blob(audio, expected_duration_ms)
+            else:
+                audio_result = AudioAnalyzer.analyze(audio_url, expected_duration_ms)
             energy_score = audio_result.energy_score
             duration_match_score = audio_result.duration_match_score
         else:
@@ -483,26 +471,17 @@ class PronunciationScorer:
     ) -> float:
         """
         Calculate text match score (0-100).
-        Uses sequence matching with romanization fallback.
+        Uses phonetic (akshara-level) edit distance with romanization fallback.
         """
         if not transcription or not expected:
             return 0.0
 
-        # Primary match against expected word
-        primary_ratio = difflib.SequenceMatcher(
-            None, transcription, expected
-        ).ratio()
-
-        # Secondary match against romanization (for accent variations)
-        roman_ratio = 0.0
-        if romanization:
-            roman_clean = self._normalize_text(romanization)
-            roman_ratio = difflib.SequenceMatcher(
-                None, transcription, roman_clean
-            ).ratio()
+        # Secondary match against romanization (for accent variations and
+        # transcripts that come back in Latin script)
+        roman_clean = self._normalize_text(romanization) if romanization else None
 
         # Use the better match
-        best_ratio = max(primary_ratio, roman_ratio)
+        best_ratio = best_similarity(transcription, [expected, roman_clean])
 
         return best_ratio * 100
 
@@ -10,6 +10,8 @@ import time
 import requests
 from typing import Tuple, Optional
 
+from apps.core.provider_http import provider_request
+
 logger = logging.getLogger(__name__)
 
 
@@ -142,7 +144,7 @@ class ReplicateTTSProvider:
                 raise ReplicateTTSError(f"Unexpected output format: {type(output)}")
 
             # Download the audio
-            response = requests.get(audio_url, timeout=60)
+            response = provider_request('replicate', 'GET', audio_url, timeout=60)
             response.raise_for_status()
             audio_bytes = response.content
 
@@ -6,7 +6,8 @@ Supports multiple STT providers:
 2. Sarvam AI STT (fallback - for Indian languages)
 3. Mock STT (for development/testing)
 
-The service downloads audio from URL and transcribes it.
+The service downloads audio from URL and transcribes it. Callers that
+already hold the recording pass it as an AudioBlob to skip the download.
 """
 
 import logging
@@ -17,9 +18,12 @@ import tempfile
 import requests
 from dataclasses import dataclass
 from typing import Optional, Tuple
-from urllib.parse import urlparse
 from django.conf import settings
 
+from apps.core.provider_http import CircuitBreaker, provider_request
+
+from .audio_blob import AudioBlob
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,6 +120,7 @@ class GoogleSTTClient:
         cls,
         audio_url: str,
         language: str = 'HINDI',
+        audio: Optional[AudioBlob] = None,
     ) -> STTResult:
         """
         Transcribe audio from URL using Google Cloud Speech-to-Text.
@@ -123,21 +128,24 @@ class GoogleSTTClient:
         Args:
             audio_url: URL to audio file (wav, mp3, webm)
             language: Language code (HINDI, TAMIL, etc.)
+            audio: Already-fetched recording (skips the download)
 
         Returns:
             STTResult with transcription and confidence
         """
         api_key = cls._get_api_key()
+        if audio is None:
+            audio = AudioBlob.fetch(audio_url)
 
         if api_key:
-            return cls._transcribe_with_api_key(audio_url, language, api_key)
+            return cls._transcribe_with_api_key(audio, language, api_key)
         else:
-            return cls._transcribe_with_sdk(audio_url, language)
+            return cls._transcribe_with_sdk(audio, language)
 
     @classmethod
     def _transcribe_with_api_key(
         cls,
-        audio_url: str,
+        audio: AudioBlob,
         language: str,
         api_key: str,
     ) -> STTResult:
@@ -147,15 +155,10 @@ class GoogleSTTClient:
         # Map language
         target_language = cls.LANGUAGE_MAP.get(language, 'hi-IN')
 
-        # Download audio file
-        audio_data = cls._download_audio(audio_url)
-
         # Encode audio as base64
-        audio_content_b64 = base64.b64encode(audio_data).decode('utf-8')
+        audio_content_b64 = base64.b64encode(audio.view).decode('utf-8')
 
-        # Determine encoding from URL
-        parsed = urlparse(audio_url)
-        ext = parsed.path.split('.')[-1].lower() if '.' in parsed.path else 'wav'
+        ext = audio.extension
 
         # Map extension to Google encoding
         encoding_map = {
@@ -184,7 +187,9 @@ class GoogleSTTClient:
         try:
             logger.info(f"Google STT (API Key): Transcribing audio in {language}")
 
-            response = requests.post(
+            response = provider_request(
+                'google_stt',
+                'POST',
                 f"{cls.API_URL}?key={api_key}",
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -230,7 +235,7 @@ class GoogleSTTClient:
     @classmethod
     def _transcribe_with_sdk(
         cls,
-        audio_url: str,
+        audio: AudioBlob,
         language: str,
     ) -> STTResult:
         """Transcribe using Google Cloud SDK with service account."""
@@ -245,17 +250,12 @@ class GoogleSTTClient:
         start_time = time.time()
         target_language = cls.LANGUAGE_MAP.get(language, 'hi-IN')
 
-        # Download audio file
-        audio_data = cls._download_audio(audio_url)
-
         try:
             logger.info(f"Google STT (SDK): Transcribing audio in {language}")
 
             client = speech.SpeechClient()
 
-            # Determine encoding from URL
-            parsed = urlparse(audio_url)
-            ext = parsed.path.split('.')[-1].lower() if '.' in parsed.path else 'wav'
+            ext = audio.extension
 
             # Map extension to Google encoding
             encoding_map = {
@@ -267,14 +267,14 @@ class GoogleSTTClient:
             }
             encoding = encoding_map.get(ext, speech.RecognitionConfig.AudioEncoding.LINEAR16)
 
-            audio = speech.RecognitionAudio(content=audio_data)
+            recognition_audio = speech.RecognitionAudio(content=audio.data)
             config = speech.RecognitionConfig(
                 encoding=encoding,
                 language_code=target_language,
                 enable_automatic_punctuation=False,
             )
 
-            response = client.recognize(config=config, audio=audio)
+            response = client.recognize(config=config, audio=recognition_audio)
 
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -303,40 +303,6 @@ class GoogleSTTClient:
             logger.error(f"Google STT SDK error: {e}")
             raise Exception(f"Google STT error: {e}")
 
-    @classmethod
-    def _download_audio(cls, url: str) -> bytes:
-        """
-        Get audio content from URL or local file.
-
-        For local media URLs (containing /media/), reads directly from disk
-        to avoid HTTP timeout issues when server downloads from itself.
-        """
-        # Check if this is a local media URL
-        if '/media/' in url:
-            try:
-                # Extract relative path from URL
-                # URL: https://bhashamitra.onrender.com/media/mimic_recordings/xxx/yyy.webm
-                # Relative path: mimic_recordings/xxx/yyy.webm
-                relative_path = url.split('/media/')[-1]
-                file_path = os.path.join(settings.MEDIA_ROOT, relative_path)
-
-                if os.path.exists(file_path):
-                    logger.info(f"Reading audio from local file: {file_path}")
-                    with open(file_path, 'rb') as f:
-                        return f.read()
-                else:
-                    logger.warning(f"Local file not found: {file_path}, falling back to HTTP")
-            except Exception as e:
-                logger.warning(f"Failed to read local file, falling back to HTTP: {e}")
-
-        # Fall back to HTTP download for external URLs or if local read failed
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.content
-        except Exception as e:
-            raise Exception(f"Failed to download audio from {url}: {e}")
-
 
 class SarvamSTTClient:
     """
@@ -377,7 +343,8 @@ class SarvamSTTClient:
         cls,
         audio_url: str,
         language: str = 'HINDI',
-        model: str = 'saarika:v2.5'
+        model: str = 'saarika:v2.5',
+        audio: Optional[AudioBlob] = None,
     ) -> STTResult:
         """
         Transcribe audio from URL using Sarvam AI STT.
@@ -386,6 +353,7 @@ class SarvamSTTClient:
             audio_url: URL to audio file (wav, mp3, webm)
             language: Language code (HINDI, TAMIL, etc.)
             model: Sarvam model (default: saarika:v2.5)
+            audio: Already-fetched recording (skips the download)
 
         Returns:
             STTResult with transcription and confidence
@@ -399,22 +367,20 @@ class SarvamSTTClient:
         # Map language
         target_language = cls.LANGUAGE_MAP.get(language, 'hi-IN')
 
-        # Download audio file
-        audio_data = cls._download_audio(audio_url)
+        if audio is None:
+            audio = AudioBlob.fetch(audio_url)
 
         # Prepare multipart request
         headers = {
             'API-Subscription-Key': api_key,
         }
 
-        # Determine file extension from URL
-        parsed = urlparse(audio_url)
-        ext = parsed.path.split('.')[-1] if '.' in parsed.path else 'wav'
+        ext = audio.extension
         if ext not in ['wav', 'mp3', 'webm', 'ogg', 'm4a']:
             ext = 'wav'
 
         files = {
-            'file': (f'audio.{ext}', audio_data, f'audio/{ext}')
+            'file': (f'audio.{ext}', audio.data, f'audio/{ext}')
         }
 
         data = {
@@ -423,7 +389,9 @@ class SarvamSTTClient:
         }
 
         try:
-            response = requests.post(
+            response = provider_request(
+                'sarvam_stt',
+                'POST',
                 cls.API_ENDPOINT,
                 headers=headers,
                 files=files,
@@ -467,38 +435,6 @@ class SarvamSTTClient:
         except requests.exceptions.RequestException as e:
             raise Exception(f"Sarvam STT request failed: {e}")
 
-    @classmethod
-    def _download_audio(cls, url: str) -> bytes:
-        """
-        Get audio content from URL or local file.
-
-        For local media URLs (containing /media/), reads directly from disk
-        to avoid HTTP timeout issues when server downloads from itself.
-        """
-        # Check if this is a local media URL
-        if '/media/' in url:
-            try:
-                # Extract relative path from URL
-                relative_path = url.split('/media/')[-1]
-                file_path = os.path.join(settings.MEDIA_ROOT, relative_path)
-
-                if os.path.exists(file_path):
-                    logger.info(f"Reading audio from local file: {file_path}")
-                    with open(file_path, 'rb') as f:
-                        return f.read()
-                else:
-                    logger.warning(f"Local file not found: {file_path}, falling back to HTTP")
-            except Exception as e:
-                logger.warning(f"Failed to read local file, falling back to HTTP: {e}")
-
-        # Fall back to HTTP download for external URLs or if local read failed
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.content
-        except Exception as e:
-            raise Exception(f"Failed to download audio from {url}: {e}")
-
 
 class MockSTTClient:
     """
@@ -586,6 +522,9 @@ class STTService:
     1. Google Cloud STT (primary - consistent with Google TTS)
     2. Sarvam AI STT (fallback for Indian languages)
     3. Mock STT (development/testing fallback)
+
+    Providers whose circuit breaker is open are skipped (see
+    apps.core.provider_http).
     """
 
     @classmethod
@@ -602,7 +541,8 @@ class STTService:
         cls,
         audio_url: str,
         language: str = 'HINDI',
-        expected_word: Optional[str] = None
+        expected_word: Optional[str] = None,
+        audio: Optional[AudioBlob] = None,
     ) -> STTResult:
         """
         Transcribe audio using the best available provider.
@@ -611,21 +551,22 @@ class STTService:
             audio_url: URL to audio file
             language: Language code
             expected_word: Optional expected word (for mock testing)
+            audio: Already-fetched recording, shared with every provider tried
 
         Returns:
             STTResult with transcription and confidence
         """
         # Try Google Cloud STT first (consistent with Google TTS)
-        if GoogleSTTClient.is_available():
+        if GoogleSTTClient.is_available() and CircuitBreaker.get('google_stt').allow_request():
             try:
-                return GoogleSTTClient.transcribe(audio_url, language)
+                return GoogleSTTClient.transcribe(audio_url, language, audio=audio)
             except Exception as e:
                 logger.warning(f"Google STT failed, falling back to Sarvam: {e}")
 
         # Try Sarvam AI as fallback
-        if SarvamSTTClient.is_available():
+        if SarvamSTTClient.is_available() and CircuitBreaker.get('sarvam_stt').allow_request():
             try:
-                return SarvamSTTClient.transcribe(audio_url, language)
+                return SarvamSTTClient.transcribe(audio_url, language, audio=audio)
             except Exception as e:
                 logger.warning(f"Sarvam STT failed, falling back to mock: {e}")
 
@@ -5,7 +5,11 @@ Provides:
 - Hindi to Roman transliteration (Hinglish)
 - Tamil to Roman transliteration
 - Gujarati to Roman transliteration
-- Other Indian language support
+- Other Indian language support (Bengali, Gurmukhi, Odia, Telugu, Kannada,
+  Malayalam maps derived from the Devanagari one)
+
+Each language's map is compiled once at import into a longest-match regex,
+and word transliterations are memoized.
 """
 
 import re
@@ -13,7 +17,9 @@ import unicodedata
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from difflib import SequenceMatcher
+from functools import lru_cache
+
+from .phonetic_match import align_words, similarity as phonetic_similarity
 
 logger = logging.getLogger(__name__)
 
@@ -87,17 +93,87 @@ GUJARATI_TO_ROMAN: Dict[str, str] = {
 }
 
 
+# Unicode lays out the major Indic scripts in parallel 128-codepoint blocks
+# (ISCII order), so the Devanagari map carries over to scripts without a
+# hand-written one by shifting codepoints.
+_SCRIPT_BLOCK_OFFSETS: Dict[str, int] = {
+    'BENGALI': 0x080,
+    'ASSAMESE': 0x080,
+    'PUNJABI': 0x100,   # Gurmukhi
+    'GUJARATI': 0x180,
+    'ODIA': 0x200,
+    'TAMIL': 0x280,
+    'TELUGU': 0x300,
+    'KANNADA': 0x380,
+    'MALAYALAM': 0x400,
+}
+
+# Hand-written maps take precedence over shifted entries
+_CURATED_MAPS: Dict[str, Dict[str, str]] = {
+    'TAMIL': TAMIL_TO_ROMAN,
+    'GUJARATI': GUJARATI_TO_ROMAN,
+}
+
+# Danda/double danda are shared by all these scripts
+_SHARED_PUNCTUATION = {'\u0964': '.', '\u0965': '.'}
+
+# Distinct words kept in the transliteration memo
+TRANSLITERATION_CACHE_SIZE = 8192
+
+
+def _shifted_map(offset: int) -> Dict[str, str]:
+    """Devanagari map moved onto another script's block (unassigned codepoints dropped)."""
+    shifted = dict(_SHARED_PUNCTUATION)
+    for key, roman in HINDI_TO_ROMAN.items():
+        if key in _SHARED_PUNCTUATION:
+            continue
+        target = ''.join(chr(ord(char) + offset) for char in key)
+        if all(unicodedata.name(char, None) for char in target):
+            shifted[target] = roman
+    return shifted
+
+
+def _build_char_maps() -> Dict[str, Dict[str, str]]:
+    maps = {'HINDI': HINDI_TO_ROMAN, 'FIJI_HINDI': HINDI_TO_ROMAN, 'MARATHI': HINDI_TO_ROMAN}
+    for language, offset in _SCRIPT_BLOCK_OFFSETS.items():
+        maps[language] = {**_shifted_map(offset), **_CURATED_MAPS.get(language, {})}
+    return maps
+
+
+class _Transliterator:
+    """
+    One language's map compiled into a single regex.
+
+    Keys are tried longest first (conjuncts before their parts); any other
+    non-ASCII character matches the trailing class and is dropped, while
+    ASCII passes through untouched.
+    """
+
+    def __init__(self, char_map: Dict[str, str]):
+        keys = sorted(char_map, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, keys)) + r'|[^\x00-\x7f]')
+        lookup = char_map.get
+        self._replace = lambda match: lookup(match.group(), '')
+
+    def __call__(self, word: str) -> str:
+        return self._pattern.sub(self._replace, word)
+
+
+_CHAR_MAPS: Dict[str, Dict[str, str]] = _build_char_maps()
+_TRANSLITERATORS: Dict[int, _Transliterator] = {
+    id(char_map): _Transliterator(char_map) for char_map in _CHAR_MAPS.values()
+}
+
+
 def get_char_map(language: str) -> Dict[str, str]:
     """Get the character map for a specific language."""
-    language_upper = language.upper()
-    if language_upper in ['HINDI', 'FIJI_HINDI']:
-        return HINDI_TO_ROMAN
-    elif language_upper == 'TAMIL':
-        return TAMIL_TO_ROMAN
-    elif language_upper == 'GUJARATI':
-        return GUJARATI_TO_ROMAN
-    # Default to Hindi for other Indian languages
-    return HINDI_TO_ROMAN
+    # Default to Hindi for languages without an Indic script map
+    return _CHAR_MAPS.get(language.upper(), HINDI_TO_ROMAN)
+
+
+@lru_cache(maxsize=TRANSLITERATION_CACHE_SIZE)
+def _transliterate_word(word: str, language: str) -> str:
+    return _TRANSLITERATORS[id(get_char_map(language))](word)
 
 
 def transliterate_to_roman(text: str, language: str = 'HINDI') -> str:
@@ -118,46 +194,21 @@ def transliterate_to_roman(text: str, language: str = 'HINDI') -> str:
     if not text:
         return ''
 
-    char_map = get_char_map(language)
-    result = []
-    i = 0
-    text_len = len(text)
-
-    while i < text_len:
-        # Try three-character combinations first (for conjuncts)
-        if i + 2 < text_len:
-            three_char = text[i:i+3]
-            if three_char in char_map:
-                result.append(char_map[three_char])
-                i += 3
-                continue
-
-        # Try two-character combinations
-        if i + 1 < text_len:
-            two_char = text[i:i+2]
-            if two_char in char_map:
-                result.append(char_map[two_char])
-                i += 2
-                continue
-
-        # Single character
-        char = text[i]
-        if char in char_map:
-            result.append(char_map[char])
-        elif char == ' ':
-            result.append(' ')
-        elif char.isascii():
-            result.append(char)
-        # Skip unknown characters
-
-        i += 1
-
-    # Clean up double vowels and formatting
-    roman = ''.join(result)
-    roman = re.sub(r'\s+', ' ', roman)  # Multiple spaces to single
-    return roman.strip()
+    # Words are memoized; feedback and hints keep asking for the same ones
+    language = language.upper()
+    words = text.split()
+    if len(words) == 1:
+        return _transliterate_word(words[0], language)
+    romans = [_transliterate_word(word, language) for word in words]
+    return ' '.join(roman for roman in romans if roman)
+
+
+def transliterate_many(texts: List[str], language: str = 'HINDI') -> List[str]:
+    """Transliterate a list of texts (e.g. every word of a story) in one call."""
+    return [transliterate_to_roman(text, language) for text in texts]
 
 
+@lru_cache(maxsize=TRANSLITERATION_CACHE_SIZE)
 def generate_phonetic_hint(word: str, language: str = 'HINDI') -> str:
     """
     Generate a phonetic pronunciation hint for a word.
@@ -240,68 +291,45 @@ def compare_words(
 
     comparisons = []
 
-    # Match words using sequence matching for best alignment
-    matcher = SequenceMatcher(None, expected_words, heard_words)
-
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == 'equal':
-            # Words match
-            for k in range(i2 - i1):
-                exp_word = expected_words[i1 + k]
-                heard_word = heard_words[j1 + k]
-                comparisons.append(WordComparison(
-                    expected=exp_word,
-                    expected_roman=transliterate_to_roman(exp_word, language),
-                    heard=heard_word,
-                    heard_roman=transliterate_to_roman(heard_word, language),
-                    is_correct=True,
-                    similarity=1.0,
-                ))
-        elif tag == 'replace':
-            # Words differ - pair them up
-            for k in range(max(i2 - i1, j2 - j1)):
-                exp_idx = i1 + min(k, i2 - i1 - 1) if i2 > i1 else None
-                heard_idx = j1 + min(k, j2 - j1 - 1) if j2 > j1 else None
-
-                exp_word = expected_words[exp_idx] if exp_idx is not None else ''
-                heard_word = heard_words[heard_idx] if heard_idx is not None else ''
-
-                similarity = SequenceMatcher(None, exp_word, heard_word).ratio() if exp_word and heard_word else 0
-
-                comparisons.append(WordComparison(
-                    expected=exp_word,
-                    expected_roman=transliterate_to_roman(exp_word, language) if exp_word else '',
-                    heard=heard_word,
-                    heard_roman=transliterate_to_roman(heard_word, language) if heard_word else '',
-                    is_correct=similarity >= 0.8,
-                    similarity=similarity,
-                    phonetic_hint=generate_phonetic_hint(exp_word, language) if exp_word and similarity < 0.8 else None,
-                ))
-        elif tag == 'delete':
+    # Align words by phonetic similarity so a near-miss pairs with the word
+    # it was meant to be rather than with whatever sits at the same index
+    for exp_idx, heard_idx, similarity in align_words(expected_words, heard_words):
+        exp_word = expected_words[exp_idx] if exp_idx is not None else ''
+        heard_word = heard_words[heard_idx] if heard_idx is not None else ''
+
+        if exp_word and heard_word:
+            # Words matched or were substituted
+            is_correct = similarity >= 0.8
+            comparisons.append(WordComparison(
+                expected=exp_word,
+                expected_roman=transliterate_to_roman(exp_word, language),
+                heard=heard_word,
+                heard_roman=transliterate_to_roman(heard_word, language),
+                is_correct=is_correct,
+                similarity=similarity,
+                phonetic_hint=None if is_correct else generate_phonetic_hint(exp_word, language),
+            ))
+        elif exp_word:
             # Expected word was not heard
-            for k in range(i1, i2):
-                exp_word = expected_words[k]
-                comparisons.append(WordComparison(
-                    expected=exp_word,
-                    expected_roman=transliterate_to_roman(exp_word, language),
-                    heard='',
-                    heard_roman='',
-                    is_correct=False,
-                    similarity=0.0,
-                    phonetic_hint=generate_phonetic_hint(exp_word, language),
-                ))
-        elif tag == 'insert':
+            comparisons.append(WordComparison(
+                expected=exp_word,
+                expected_roman=transliterate_to_roman(exp_word, language),
+                heard='',
+                heard_roman='',
+                is_correct=False,
+                similarity=0.0,
+                phonetic_hint=generate_phonetic_hint(exp_word, language),
+            ))
+        else:
             # Extra word was heard (not expected)
-            for k in range(j1, j2):
-                heard_word = heard_words[k]
-                comparisons.append(WordComparison(
-                    expected='',
-                    expected_roman='',
-                    heard=heard_word,
-                    heard_roman=transliterate_to_roman(heard_word, language),
-                    is_correct=False,
-                    similarity=0.0,
-                ))
+            comparisons.append(WordComparison(
+                expected='',
+                expected_roman='',
+                heard=heard_word,
+                heard_roman=transliterate_to_roman(heard_word, language),
+                is_correct=False,
+                similarity=0.0,
+            ))
 
     return comparisons
 
@@ -420,7 +448,7 @@ def evaluate_pronunciation_enhanced(
     elif expected_norm == transcribed_norm:
         similarity = 1.0
     else:
-        similarity = SequenceMatcher(None, expected_norm, transcribed_norm).ratio()
+        similarity = phonetic_similarity(expected_norm, transcribed_norm)
 
     # Calculate final score (weighted: 70% similarity, 30% confidence)
     capped_confidence = min(max(confidence, 0.0), 1.0)
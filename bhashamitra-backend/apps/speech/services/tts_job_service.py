@@ -0,0 +1,193 @@
+"""
+Background TTS job queue.
+
+Cold-miss synthesis can take several seconds per provider in the fallback
+chain (Google -> Sarvam -> Svara) and texts go up to 5000 characters.
+Instead of holding a gunicorn worker for that, views enqueue a TTSJob and
+return 202. Workers started with `python manage.py run_tts_worker` claim
+pending jobs, run TTSService.get_audio (which writes the audio cache) and
+record the result for clients polling the job-status endpoint.
+
+The queue lives in the database so it needs no extra infrastructure and
+workers can be scaled independently of the API processes.
+"""
+import logging
+from datetime import timedelta
+from typing import Optional, TYPE_CHECKING
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.speech.models import AudioCache, TTSJob
+from apps.speech.services.audio_delivery import stored_audio_url
+from apps.speech.services.tts_service import TTSService, TTSServiceError
+
+if TYPE_CHECKING:
+    from apps.users.models import User
+
+logger = logging.getLogger(__name__)
+
+
+class TTSJobService:
+    """Enqueue, claim and process background TTS jobs."""
+
+    # Retry a failing job this many times before marking it FAILED
+    MAX_ATTEMPTS = 3
+
+    # RUNNING jobs older than this are assumed to belong to a dead worker
+    STALE_AFTER_SECONDS = 300
+
+    @classmethod
+    def enqueue(
+        cls,
+        text: str,
+        language: str = 'HINDI',
+        voice_profile: str = 'default',
+        user: Optional['User'] = None,
+    ) -> TTSJob:
+        """
+        Queue synthesis for a text, reusing an in-flight job for the same audio.
+
+        Raises:
+            TTSServiceError: If the text is empty or too long
+        """
+        if not text or not text.strip():
+            raise TTSServiceError("Text cannot be empty")
+
+        text = text.strip()
+        if len(text) > TTSService.MAX_TEXT_LENGTH:
+            raise TTSServiceError(f"Text too long (max {TTSService.MAX_TEXT_LENGTH} characters)")
+
+        cache_key = TTSService._generate_cache_key(text, language, voice_profile)
+
+        # Many children opening the same page share a single job
+        existing = TTSJob.objects.filter(
+            cache_key=cache_key,
+            status__in=[TTSJob.Status.PENDING, TTSJob.Status.RUNNING],
+        ).first()
+        if existing:
+            return existing
+
+        job = TTSJob.objects.create(
+            cache_key=cache_key,
+            text_content=text,
+            language=language,
+            voice_style=voice_profile,
+            user=user,
+        )
+        logger.info(f"TTS job queued: {job.id} ({language}, {len(text)} chars)")
+        return job
+
+    @classmethod
+    def get_job(cls, job_id) -> Optional[TTSJob]:
+        """Get a job by ID."""
+        return TTSJob.objects.select_related('audio_cache').filter(id=job_id).first()
+
+    @classmethod
+    def claim_next(cls) -> Optional[TTSJob]:
+        """
+        Atomically claim the oldest pending job.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED so several workers can poll
+        the same table without handing out a job twice.
+        """
+        with transaction.atomic():
+            job = (
+                TTSJob.objects.select_for_update(skip_locked=True)
+                .filter(status=TTSJob.Status.PENDING)
+                .order_by('created_at')
+                .first()
+            )
+            if not job:
+                return None
+
+            job.status = TTSJob.Status.RUNNING
+            job.attempts += 1
+            job.started_at = timezone.now()
+            job.save(update_fields=['status', 'attempts', 'started_at', 'updated_at'])
+            return job
+
+    @classmethod
+    def process(cls, job: TTSJob) -> TTSJob:
+        """Run synthesis for a claimed job and record the outcome."""
+        try:
+            _, provider, _ = TTSService.get_audio(
+                text=job.text_content,
+                language=job.language,
+                voice_profile=job.voice_style,
+                user=job.user,
+            )
+        except Exception as e:
+            # Anything else (storage, DB, bad text) must not leave the job RUNNING
+            if not isinstance(e, TTSServiceError):
+                logger.exception(f"TTS job {job.id} raised an unexpected error")
+            job.error_message = str(e) or e.__class__.__name__
+            if job.attempts >= cls.MAX_ATTEMPTS:
+                job.status = TTSJob.Status.FAILED
+                job.completed_at = timezone.now()
+                logger.error(f"TTS job {job.id} failed after {job.attempts} attempts: {e}")
+            else:
+                job.status = TTSJob.Status.PENDING
+                logger.warning(f"TTS job {job.id} attempt {job.attempts} failed, requeued: {e}")
+            job.save(update_fields=['status', 'error_message', 'completed_at', 'updated_at'])
+            return job
+
+        job.status = TTSJob.Status.COMPLETED
+        job.provider = provider
+        job.audio_cache = AudioCache.objects.filter(cache_key=job.cache_key).first()
+        job.completed_at = timezone.now()
+        job.error_message = ''
+        job.save(update_fields=[
+            'status', 'provider', 'audio_cache', 'completed_at', 'error_message', 'updated_at'
+        ])
+        logger.info(f"TTS job {job.id} completed ({provider})")
+        return job
+
+    @classmethod
+    def requeue_stale(cls) -> int:
+        """
+        Return jobs abandoned by crashed workers to the queue.
+
+        Jobs that have already used MAX_ATTEMPTS are failed instead, so a
+        job that kills its worker every time isn't retried forever.
+        """
+        now = timezone.now()
+        stale = TTSJob.objects.filter(
+            status=TTSJob.Status.RUNNING,
+            started_at__lt=now - timedelta(seconds=cls.STALE_AFTER_SECONDS),
+        )
+        failed = stale.filter(attempts__gte=cls.MAX_ATTEMPTS).update(
+            status=TTSJob.Status.FAILED,
+            error_message='Worker stopped while processing the job',
+            completed_at=now,
+            updated_at=now,
+        )
+        count = stale.filter(attempts__lt=cls.MAX_ATTEMPTS).update(
+            status=TTSJob.Status.PENDING, updated_at=now
+        )
+        if failed:
+            logger.error(f"Failed {failed} stale TTS jobs after {cls.MAX_ATTEMPTS} attempts")
+        if count:
+            logger.warning(f"Requeued {count} stale TTS jobs")
+        return count
+
+    @classmethod
+    def get_audio_url(cls, job: TTSJob) -> Optional[str]:
+        """Public URL of the synthesized audio, once the job has completed."""
+        if job.status != TTSJob.Status.COMPLETED:
+            return None
+        return stored_audio_url(job.audio_cache)
+
+    @classmethod
+    def to_status_dict(cls, job: TTSJob) -> dict:
+        """Serialize job state for the status endpoint."""
+        failed = job.status == TTSJob.Status.FAILED
+        return {
+            'job_id': str(job.id),
+            'status': job.status,
+            'provider': job.provider or None,
+            'audio_url': cls.get_audio_url(job),
+            'error': (job.error_message or None) if failed else None,
+            'created_at': job.created_at,
+            'completed_at': job.completed_at,
+        }
@@ -22,15 +22,18 @@ Feature restrictions by tier:
 - Live Classes: PREMIUM only
 - TTS Quality: FREE/STANDARD=Standard voices, PREMIUM=WaveNet voices
 """
-import hashlib
 import logging
 import time
-from typing import Tuple, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Optional, TYPE_CHECKING
 from django.core.cache import cache
-from django.core.files.base import ContentFile
 from django.conf import settings
+from django.db import connections
 
+from apps.core.provider_http import CircuitBreaker
+from apps.core.single_flight import SingleFlight
 from apps.speech.models import AudioCache, TTSUsageLog
+from apps.speech.services.audio_store import AudioStore
 
 if TYPE_CHECKING:
     from apps.users.models import User
@@ -54,24 +57,41 @@ class TTSService:
     4. Svara TTS (emergency backup - free, lower quality)
 
     NO BHASHINI - works internationally without Indian registration.
+
+    Providers whose circuit breaker is open are skipped without a request
+    (see apps.core.provider_http).
     """
 
     # Redis cache TTL (30 days)
-    REDIS_CACHE_TTL = 86400 * 30
+    REDIS_CACHE_TTL = AudioStore.REDIS_TTL
 
     # Maximum text length
     MAX_TEXT_LENGTH = 5000
 
+    # Single-flight synthesis: lock lifetime and how long followers wait (seconds)
+    SYNTHESIS_LOCK_TTL = 60
+    SYNTHESIS_WAIT_TIMEOUT = 20
+
+    # get_audio_many: largest batch, and cold misses synthesized at once
+    BATCH_MAX_TEXTS = 50
+    BATCH_MAX_WORKERS = 4
+    # Misses one batch request may synthesize inline (the rest are queued)
+    BATCH_MAX_SYNTHESIZE = 5
+
     @classmethod
     def _generate_cache_key(cls, text: str, language: str, voice_profile: str) -> str:
-        """Generate unique cache key for audio."""
-        content = f"{text}:{language}:{voice_profile}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Generate unique cache key for audio (see AudioStore.make_key)."""
+        return AudioStore.make_key(text, language, voice_profile)
+
+    @classmethod
+    def get_cache_key(cls, text: str, language: str, voice_profile: str) -> str:
+        """Cache key for a request, normalized the same way get_audio does."""
+        return cls._generate_cache_key(text.strip(), language, voice_profile)
 
     @classmethod
     def _generate_text_hash(cls, text: str) -> str:
         """Generate hash of text content."""
-        return hashlib.md5(text.encode()).hexdigest()
+        return AudioStore.text_hash(text)
 
     @classmethod
     def get_audio(
@@ -120,20 +140,76 @@ class TTSService:
         if user:
             user_tier = user.tts_provider
 
+        if force_regenerate:
+            return cls._generate_with_fallback(
+                text, language, voice_profile, cache_key, user_tier, start_time
+            )
+
         # Step 1: Always check cache first (all tiers benefit from cache)
-        if not force_regenerate:
-            cached_audio = cls._get_from_cache(cache_key)
-            if cached_audio:
-                cls._log_usage(
-                    text_length=len(text),
-                    language=language,
-                    provider='cache',
-                    voice_profile=voice_profile,
-                    was_cached=True,
-                    response_time_ms=int((time.time() - start_time) * 1000),
-                )
-                return cached_audio, 'cache', True
+        cached_audio = cls._get_from_cache(cache_key)
+        if cached_audio:
+            cls._log_usage(
+                text_length=len(text),
+                language=language,
+                provider='cache',
+                voice_profile=voice_profile,
+                was_cached=True,
+                response_time_ms=int((time.time() - start_time) * 1000),
+            )
+            return cached_audio, 'cache', True
+
+        # Step 2: Coalesce concurrent misses so one synthesis serves every requester
+        redis_key = AudioStore.redis_key(cache_key)
+
+        def generate():
+            # Another leader may have finished between our miss and taking the lock
+            cached = cache.get(redis_key)
+            if cached:
+                return cached, 'cache', True
+            return cls._generate_with_fallback(
+                text, language, voice_profile, cache_key, user_tier, start_time
+            )
+
+        def fetch_leader_result():
+            cached = cache.get(redis_key)
+            if not cached:
+                return None
+            cls._log_usage(
+                text_length=len(text),
+                language=language,
+                provider='cache',
+                voice_profile=voice_profile,
+                was_cached=True,
+                response_time_ms=int((time.time() - start_time) * 1000),
+            )
+            return cached, 'cache', True
+
+        flight = SingleFlight(
+            f"tts:{cache_key}",
+            lock_ttl=cls.SYNTHESIS_LOCK_TTL,
+            wait_timeout=cls.SYNTHESIS_WAIT_TIMEOUT,
+        )
+        return flight.run(compute=generate, fetch=fetch_leader_result)
+
+    @classmethod
+    def _generate_with_fallback(
+        cls,
+        text: str,
+        language: str,
+        voice_profile: str,
+        cache_key: str,
+        user_tier: str,
+        start_time: float,
+    ) -> Tuple[bytes, str, bool]:
+        """
+        Synthesize audio through the provider fallback chain and cache it.
 
+        Returns:
+            Tuple of (audio_bytes, provider_name, was_cached)
+
+        Raises:
+            TTSServiceError: If every provider available to the tier fails
+        """
         # FREE tier: Use Google TTS Standard (same as Standard tier)
         # All users get audio - quality difference is in voice type (Standard vs WaveNet)
         if user_tier == 'cache_only':
@@ -148,7 +224,10 @@ class TTSService:
         try:
             from apps.speech.services.google_provider import GoogleTTSProvider
 
-            google_available = GoogleTTSProvider.is_available()
+            google_available = (
+                GoogleTTSProvider.is_available()
+                and CircuitBreaker.get('google_tts').allow_request()
+            )
             logger.info(f"Google TTS available: {google_available}")
 
             if google_available:
@@ -188,7 +267,7 @@ class TTSService:
             try:
                 from apps.speech.services.google_provider import GoogleTTSProvider
 
-                if GoogleTTSProvider.is_available():
+                if GoogleTTSProvider.is_available() and CircuitBreaker.get('google_tts').allow_request():
                     try:
                         audio_bytes, duration_ms = GoogleTTSProvider.text_to_speech(
                             text=text,
@@ -263,12 +342,15 @@ class TTSService:
             try:
                 from apps.speech.services.mms_provider import SvaraTTSProvider
 
-                if SvaraTTSProvider.is_available():
+                # Svara goes through gradio_client, so its breaker is fed here
+                svara_breaker = CircuitBreaker.get('svara')
+                if SvaraTTSProvider.is_available() and svara_breaker.allow_request():
                     try:
                         audio_bytes, duration_ms = SvaraTTSProvider.text_to_speech(
                             text=text,
                             language=language,
                         )
+                        svara_breaker.record_success()
                         cls._save_to_cache(
                             cache_key=cache_key,
                             text=text,
@@ -288,6 +370,7 @@ class TTSService:
                         )
                         return audio_bytes, 'svara_fallback', False
                     except Exception as e:
+                        svara_breaker.record_failure()
                         logger.error(f"Svara fallback TTS failed: {e}")
             except ImportError:
                 logger.error("Svara provider not available")
@@ -306,43 +389,151 @@ class TTSService:
         raise TTSServiceError("TTS service temporarily unavailable. Please try again later.")
 
     @classmethod
-    def _get_from_cache(cls, cache_key: str) -> Optional[bytes]:
+    def get_cached_audio(
+        cls,
+        text: str,
+        language: str = 'HINDI',
+        voice_profile: str = 'default',
+    ) -> Optional[bytes]:
         """
-        Get audio from cache (Redis first, then database).
+        Cache-only lookup - never calls a provider.
+
+        Used by views to decide between serving audio immediately and
+        queueing a background TTSJob on a cold miss.
         """
-        # Check Redis cache first (fastest)
-        redis_key = f"tts:audio:{cache_key}"
-        cached = cache.get(redis_key)
-        if cached:
-            logger.debug(f"TTS cache hit (Redis): {cache_key}")
-            return cached
-
-        # Check database
-        try:
-            audio_cache = AudioCache.objects.get(cache_key=cache_key)
+        if not text or not text.strip():
+            return None
+        cache_key = cls._generate_cache_key(text.strip(), language, voice_profile)
+        return cls._get_from_cache(cache_key)
 
-            # Read audio from file
-            if audio_cache.audio_file:
-                audio_cache.audio_file.open('rb')
-                audio_bytes = audio_cache.audio_file.read()
-                audio_cache.audio_file.close()
+    @classmethod
+    def get_audio_many(
+        cls,
+        texts: Iterable[str],
+        language: str = 'HINDI',
+        voice_profile: str = 'default',
+        user: Optional['User'] = None,
+        max_workers: Optional[int] = None,
+        max_synthesize: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Resolve stored audio for many texts at once (story pages, vocab themes).
+
+        Hits for the whole batch cost one AudioCache query, plus one Redis
+        get_many for keys without a stored file. Misses go through get_audio
+        (fallback chain, single-flight) on a bounded thread pool, so a cold
+        batch takes roughly ceil(misses / workers) synthesis times. Only the
+        first max_synthesize misses are synthesized (all when None); the rest
+        are left unresolved for the caller to queue.
+
+        Returns one entry per input text, in order:
+            {'text', 'cache_key', 'audio_cache', 'provider', 'was_cached', 'error'}
+        `audio_cache` is the stored AudioCache row (None if unavailable).
+        """
+        entries = []
+        pending: Dict[str, str] = {}
+        for text in texts:
+            text = (text or '').strip()
+            entry = {
+                'text': text,
+                'cache_key': None,
+                'audio_cache': None,
+                'provider': None,
+                'was_cached': False,
+                'error': None,
+            }
+            if not text:
+                entry['error'] = "Text cannot be empty"
+            elif len(text) > cls.MAX_TEXT_LENGTH:
+                entry['error'] = f"Text too long (max {cls.MAX_TEXT_LENGTH} characters)"
             else:
-                return None
+                entry['cache_key'] = cls._generate_cache_key(text, language, voice_profile)
+                pending.setdefault(entry['cache_key'], text)
+            entries.append(entry)
+
+        # key -> (audio_cache, provider, was_cached) or an error message
+        resolved: Dict[str, tuple] = {}
+        errors: Dict[str, str] = {}
+
+        for key, audio_cache in cls._stored_audio(list(pending)).items():
+            resolved[key] = (audio_cache, 'cache', True)
+
+        missing = [key for key in pending if key not in resolved]
+        if missing:
+            redis_hits = cache.get_many([AudioStore.redis_key(key) for key in missing])
+            for key in missing:
+                audio_bytes = redis_hits.get(AudioStore.redis_key(key))
+                if audio_bytes:
+                    # Cached but never persisted (storage write failed) - store it for a URL
+                    audio_cache = AudioStore.put(
+                        key, pending[key], language, voice_profile, audio_bytes,
+                        provider=AudioCache.Provider.CACHE,
+                    )
+                    resolved[key] = (audio_cache, 'cache', True)
 
-            # Repopulate Redis cache
-            cache.set(redis_key, audio_bytes, cls.REDIS_CACHE_TTL)
+        to_generate = [key for key in missing if key not in resolved]
+        if max_synthesize is not None:
+            to_generate = to_generate[:max_synthesize]
+        if to_generate:
+            def _synthesize_one(key):
+                try:
+                    _, provider, was_cached = cls.get_audio(
+                        text=pending[key],
+                        language=language,
+                        voice_profile=voice_profile,
+                        user=user,
+                    )
+                    return provider, was_cached
+                finally:
+                    # Pool threads get their own DB connections; don't leak them
+                    connections.close_all()
 
-            # Update access count
-            audio_cache.increment_access()
+            workers = min(max_workers or cls.BATCH_MAX_WORKERS, len(to_generate))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tts-batch') as executor:
+                futures = {key: executor.submit(_synthesize_one, key) for key in to_generate}
 
-            logger.debug(f"TTS cache hit (DB): {cache_key}")
-            return audio_bytes
+            generated = cls._stored_audio(to_generate)
+            for key, future in futures.items():
+                try:
+                    provider, was_cached = future.result()
+                except Exception as e:
+                    logger.warning(f"Batch TTS failed for {key}: {e}")
+                    errors[key] = str(e)
+                    continue
+                resolved[key] = (generated.get(key), provider, was_cached)
+
+        for entry in entries:
+            key = entry['cache_key']
+            if key in resolved:
+                entry['audio_cache'], entry['provider'], entry['was_cached'] = resolved[key]
+            elif key in errors:
+                entry['error'] = errors[key]
+
+        logger.info(
+            f"Batch TTS: {len(entries)} texts, {len(pending)} unique, "
+            f"{len(pending) - len(missing)} cached, {len(missing)} missed, "
+            f"{len(to_generate)} synthesized"
+        )
+        return entries
 
-        except AudioCache.DoesNotExist:
-            return None
-        except Exception as e:
-            logger.warning(f"Error reading from cache: {e}")
-            return None
+    @classmethod
+    def _stored_audio(cls, cache_keys: List[str]) -> Dict[str, AudioCache]:
+        """AudioCache rows with a stored file, keyed by cache key (one query)."""
+        if not cache_keys:
+            return {}
+        rows = (
+            AudioCache.objects.filter(cache_key__in=cache_keys)
+            .exclude(audio_file='')
+            .only('id', 'cache_key', 'audio_file', 'audio_url', 'audio_duration_ms', 'provider')
+        )
+        return {row.cache_key: row for row in rows}
+
+    @classmethod
+    def _get_from_cache(cls, cache_key: str) -> Optional[bytes]:
+        """
+        Get audio from the shared audio store (Redis first, then storage).
+        """
+        return AudioStore.get(cache_key)
 
     @classmethod
     def _save_to_cache(
@@ -356,37 +547,17 @@ class TTSService:
         provider: str,
     ):
         """
-        Save audio to both Redis and database.
+        Save audio to the shared audio store.
         """
-        # Save to Redis
-        redis_key = f"tts:audio:{cache_key}"
-        cache.set(redis_key, audio_bytes, cls.REDIS_CACHE_TTL)
-
-        # Save to database
-        try:
-            audio_cache, created = AudioCache.objects.update_or_create(
-                cache_key=cache_key,
-                defaults={
-                    'text_hash': cls._generate_text_hash(text),
-                    'text_content': text,
-                    'language': language,
-                    'voice_style': voice_profile,
-                    'provider': provider,
-                    'audio_size_bytes': len(audio_bytes),
-                    'audio_duration_ms': duration_ms,
-                }
-            )
-
-            # Save audio file (Google TTS returns MP3 format)
-            audio_cache.audio_file.save(
-                f"{cache_key}.mp3",
-                ContentFile(audio_bytes),
-                save=True,
-            )
-
-            logger.info(f"TTS cached: {cache_key} ({provider}, {len(audio_bytes)} bytes)")
-        except Exception as e:
-            logger.error(f"Failed to save to database cache: {e}")
+        AudioStore.put(
+            cache_key=cache_key,
+            text=text,
+            language=language,
+            voice_profile=voice_profile,
+            audio_bytes=audio_bytes,
+            duration_ms=duration_ms,
+            provider=provider,
+        )
 
     @classmethod
     def _log_usage(
@@ -0,0 +1,60 @@
+"""Tests for framed VAD/energy features."""
+import pytest
+
+from apps.speech.services.acoustic_features import MAX_ANALYSIS_SECONDS, extract_features
+from apps.speech.services.audio_blob import AudioBlob
+from apps.speech.services.pronunciation_scorer import AudioAnalyzer
+
+np = pytest.importorskip('numpy')
+
+RATE = 16000
+
+
+def _padded_word(silence_s=1.0, speech_s=0.6, amplitude=0.2):
+    rng = np.random.default_rng(0)
+    silence = rng.normal(0, 0.001, int(RATE * silence_s))
+    t = np.arange(int(RATE * speech_s)) / RATE
+    speech = amplitude * np.sin(2 * np.pi * 220 * t)
+    return np.concatenate([silence, speech, silence]).astype(np.float32)
+
+
+class TestExtractFeatures:
+    """Test voice activity and trimming."""
+
+    def test_leading_and_trailing_silence_trimmed(self):
+        """Test the speech span excludes silence padding on both sides."""
+        features = extract_features(_padded_word(), RATE)
+
+        assert features.duration_ms == 2600
+        assert features.speech_start_ms == pytest.approx(1000, abs=30)
+        assert features.speech_duration_ms == pytest.approx(600, abs=40)
+        # RMS of the voiced span, not diluted by silence (0.2 / sqrt(2))
+        assert features.rms_energy == pytest.approx(0.141, abs=0.01)
+
+    def test_silence_has_no_speech(self):
+        """Test a silent recording reports no speech."""
+        features = extract_features(np.zeros(RATE, dtype=np.float32), RATE)
+        assert not features.has_speech
+
+    def test_analysis_window_is_capped(self):
+        """Test long uploads only analyze the first MAX_ANALYSIS_SECONDS."""
+        long_recording = np.full(RATE * (MAX_ANALYSIS_SECONDS + 10), 0.1, dtype=np.float32)
+        features = extract_features(long_recording, RATE)
+
+        assert features.duration_ms == (MAX_ANALYSIS_SECONDS + 10) * 1000
+        assert len(features.frame_energy) <= MAX_ANALYSIS_SECONDS * 1000 // 10
+
+
+class TestSpeechDurationScoring:
+    """Test duration scoring compares speech with speech."""
+
+    def test_padding_does_not_hurt_duration_match(self):
+        """Test a well-timed word surrounded by silence scores as well-timed."""
+        audio = AudioBlob(b'', extension='wav')
+        audio._decode_attempted = True
+        audio._decoded = (_padded_word(), RATE)
+
+        result = AudioAnalyzer.analyze_blob(audio, expected_duration_ms=600)
+
+        assert result.speech_duration_ms == pytest.approx(600, abs=40)
+        assert result.duration_match_score > 90
@@ -0,0 +1,107 @@
+"""Tests for the shared in-memory audio buffer."""
+import io
+from unittest import mock
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from apps.speech.services.audio_blob import AudioBlob
+from apps.speech.services.pronunciation_scorer import AudioAnalyzer
+
+# Optional audio dependencies (not in requirements.txt)
+np = pytest.importorskip('numpy')
+sf = pytest.importorskip('soundfile')
+
+
+def _wav_bytes(seconds=0.5, sample_rate=16000, amplitude=0.1):
+    t = np.linspace(0, seconds, int(sample_rate * seconds), endpoint=False)
+    buffer = io.BytesIO()
+    sf.write(buffer, amplitude * np.sin(2 * np.pi * 440 * t), sample_rate, format='WAV')
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def media_root(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+class TestAudioBlob:
+    """Test fetching and decoding recordings once."""
+
+    def test_media_url_reads_storage_without_http(self, media_root):
+        """Test our own /media/ URLs never go over HTTP."""
+        saved = default_storage.save('mimic_recordings/c1/a.wav', ContentFile(_wav_bytes()))
+        with mock.patch('apps.speech.services.audio_blob.provider_session') as http_session:
+            audio = AudioBlob.fetch(f'https://example.com/media/{saved}')
+
+        http_session.assert_not_called()
+        assert audio.extension == 'wav'
+        assert len(audio) > 0
+
+    def test_decode_is_memoized_and_shared_with_analyzer(self):
+        """Test analysis reuses decoded samples instead of re-reading bytes."""
+        audio = AudioBlob(_wav_bytes(seconds=0.5), extension='wav')
+        with mock.patch('soundfile.read', wraps=sf.read) as sf_read:
+            first = AudioAnalyzer.analyze_blob(audio, expected_duration_ms=500)
+            AudioAnalyzer.analyze_blob(audio)
+
+        assert sf_read.call_count == 1
+        assert first.is_valid
+        assert first.duration_ms == 500
+
+    def test_unnamed_upload_defaults_to_webm(self):
+        """Test nameless MediaRecorder uploads are treated as webm, not wav."""
+        upload = ContentFile(b'webm-bytes', name='blob')
+        assert AudioBlob.from_upload(upload).extension == 'webm'
+        assert AudioBlob.from_upload(ContentFile(b'x', name='a.wav')).extension == 'wav'
+
+    def test_undecodable_audio_gives_neutral_result(self):
+        """Test garbage bytes fall back to the neutral analysis result."""
+        result = AudioAnalyzer.analyze_blob(AudioBlob(b'not audio', extension='webm'))
+        assert not result.is_valid
+        assert result.energy_score == 50.0
+
+
+class TestConcurrentAnalysis:
+    """Test analysis running alongside STT."""
+
+    def test_submitted_analysis_matches_inline(self):
+        """Test the background result equals running the analysis inline."""
+        audio = AudioBlob(_wav_bytes(seconds=0.4), extension='wav')
+        future = AudioAnalyzer.submit(audio, expected_duration_ms=400)
+        assert AudioAnalyzer.wait(future) == AudioAnalyzer.analyze_blob(audio, 400)
+
+    def test_timed_out_analysis_is_cancelled(self):
+        """Test a timeout cancels the pending analysis and uses defaults."""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        future = mock.Mock()
+        future.result.side_effect = FutureTimeoutError()
+        result = AudioAnalyzer.wait(future)
+        future.cancel.assert_called_once()
+        assert result == AudioAnalyzer._default_result()
+
+    def test_scorer_uses_precomputed_analysis(self):
+        """Test a precomputed analysis skips re-analyzing the recording."""
+        from apps.speech.services.pronunciation_scorer import (
+            AudioAnalysisResult,
+            PronunciationScorer,
+        )
+
+        analysis = AudioAnalysisResult(
+            energy_score=100.0, duration_ms=400, duration_match_score=100.0,
+            rms_energy=0.2, is_valid=True,
+        )
+        with mock.patch.object(AudioAnalyzer, 'analyze_blob') as analyze_blob:
+            result = PronunciationScorer().score(
+                transcription='नमस्ते',
+                expected_word='नमस्ते',
+                stt_confidence=0.9,
+                audio=AudioBlob(b'', extension='wav'),
+                audio_analysis=analysis,
+            )
+
+        analyze_blob.assert_not_called()
+        assert result.energy_score == 100.0
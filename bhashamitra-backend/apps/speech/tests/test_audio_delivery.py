@@ -0,0 +1,80 @@
+"""Tests for URL-first delivery of cached TTS audio."""
+import pytest
+from django.test import RequestFactory, override_settings
+
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_delivery import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    serve_cached_audio,
+)
+
+CACHE_KEY = 'a' * 32
+
+
+@pytest.fixture
+def audio_cache(db):
+    return AudioCache.objects.create(
+        cache_key=CACHE_KEY,
+        text_content='नमस्ते',
+        text_hash='b' * 32,
+        language='HINDI',
+        voice_style='kid_friendly',
+        audio_file='audio_cache/hindi/namaste.mp3',
+    )
+
+
+@pytest.mark.django_db
+class TestServeCachedAudio:
+    """Test conditional GETs and delivery modes."""
+
+    def test_matching_etag_returns_304(self):
+        """Test a client holding the audio gets 304 without a lookup."""
+        request = RequestFactory().get('/', HTTP_IF_NONE_MATCH=f'W/"{CACHE_KEY}"')
+        response = serve_cached_audio(request, CACHE_KEY, 'speech.mp3')
+        assert response.status_code == 304
+        assert response['ETag'] == f'"{CACHE_KEY}"'
+        assert response['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+
+    def test_mutable_url_revalidates(self, audio_cache):
+        """Test endpoints whose URL outlives the content aren't cached as immutable."""
+        request = RequestFactory().get('/', HTTP_IF_NONE_MATCH=f'"{CACHE_KEY}"')
+        assert serve_cached_audio(request, CACHE_KEY, 'page_1.mp3', immutable=False)['Cache-Control'] == (
+            REVALIDATE_CACHE_CONTROL
+        )
+
+        request = RequestFactory().get('/')
+        with override_settings(TTS_AUDIO_DELIVERY='redirect'):
+            response = serve_cached_audio(request, CACHE_KEY, 'page_1.mp3', immutable=False)
+        assert response.status_code == 302
+        assert response['Cache-Control'] == REVALIDATE_CACHE_CONTROL
+
+    def test_stream_mode_falls_through(self, audio_cache):
+        """Test stream mode leaves delivery to the byte-returning path."""
+        request = RequestFactory().get('/')
+        with override_settings(TTS_AUDIO_DELIVERY='stream'):
+            assert serve_cached_audio(request, CACHE_KEY, 'speech.mp3') is None
+
+    def test_redirect_mode(self, audio_cache):
+        """Test redirect mode points at storage (303 for POST) and counts access."""
+        request = RequestFactory().post('/')
+        with override_settings(TTS_AUDIO_DELIVERY='redirect'):
+            response = serve_cached_audio(request, CACHE_KEY, 'speech.mp3')
+        assert response.status_code == 303
+        assert response['Location'].endswith('audio_cache/hindi/namaste.mp3')
+        audio_cache.refresh_from_db()
+        assert audio_cache.access_count == 1
+
+    def test_x_accel_mode(self, audio_cache):
+        """Test nginx gets an internal redirect and the body stays empty."""
+        request = RequestFactory().get('/')
+        with override_settings(TTS_AUDIO_DELIVERY='x-accel'):
+            response = serve_cached_audio(request, CACHE_KEY, 'speech.mp3')
+        assert response['X-Accel-Redirect'] == '/protected-media/audio_cache/hindi/namaste.mp3'
+        assert response.content == b''
+
+    def test_uncached_key_falls_through(self):
+        """Test a miss returns None so the caller synthesizes."""
+        request = RequestFactory().get('/')
+        with override_settings(TTS_AUDIO_DELIVERY='redirect'):
+            assert serve_cached_audio(request, 'c' * 32, 'speech.mp3') is None
@@ -0,0 +1,82 @@
+"""Tests for measuring stored TTS audio metadata."""
+import io
+
+import pytest
+from django.core.cache import cache
+
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_probe import AudioProbe, probe_mp3
+from apps.speech.services.audio_store import AudioStore
+
+# Optional audio dependencies (not in requirements.txt)
+np = pytest.importorskip('numpy')
+sf = pytest.importorskip('soundfile')
+
+
+def _tone(seconds, sample_rate, amplitude=0.5):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return amplitude * np.sin(2 * np.pi * 440 * t)
+
+
+def _encode(samples, sample_rate, fmt, subtype=None):
+    buffer = io.BytesIO()
+    sf.write(buffer, samples, sample_rate, format=fmt, subtype=subtype)
+    return buffer.getvalue()
+
+
+class TestAudioProbe:
+    """Test header parsing and loudness."""
+
+    def test_wav_duration_and_loudness(self):
+        """Test WAV metadata comes from the RIFF chunks and PCM samples."""
+        audio = _encode(_tone(1.25, 16000), 16000, 'WAV', 'PCM_16')
+        metadata = AudioProbe.probe(audio, 'mp3')
+
+        assert metadata.audio_format == 'wav'
+        assert metadata.duration_ms == 1250
+        assert metadata.sample_rate == 16000
+        # A 0.5 amplitude sine is -9.03 dBFS RMS, -6.02 dBFS peak
+        assert metadata.loudness_dbfs == pytest.approx(-9.03, abs=0.05)
+        assert metadata.peak_dbfs == pytest.approx(-6.02, abs=0.05)
+
+    def test_silence_is_gated_out_of_loudness(self):
+        """Test leading silence doesn't lower the measured loudness."""
+        samples = np.concatenate([np.zeros(16000), _tone(1.0, 16000)])
+        metadata = AudioProbe.probe(_encode(samples, 16000, 'WAV', 'PCM_16'))
+        assert metadata.duration_ms == 2000
+        assert metadata.loudness_dbfs == pytest.approx(-9.03, abs=0.05)
+
+    def test_mp3_duration_from_frame_headers(self):
+        """Test MP3 duration counts frames instead of guessing from size."""
+        audio = _encode(_tone(2.0, 24000), 24000, 'MP3', 'MPEG_LAYER_III')
+        metadata = probe_mp3(b'garbage\xff\xfb' + audio)
+
+        assert metadata.sample_rate == 24000
+        # Frame count minus the LAME tag's encoder delay and padding
+        assert metadata.duration_ms == 2000
+        assert metadata.duration_ms != len(audio) // 3
+
+    def test_unknown_bytes(self):
+        """Test non-audio bytes leave the provider metadata alone."""
+        assert AudioProbe.probe(b'not audio at all') is None
+
+
+@pytest.mark.django_db
+class TestProbeOnStore:
+    """Test AudioStore writes get measured metadata after commit."""
+
+    def test_put_replaces_estimated_duration(self, tmp_path, settings, django_capture_on_commit_callbacks):
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.TTS_AUDIO_PROBE_ASYNC = False
+        cache.clear()
+        audio = _encode(_tone(0.75, 22050), 22050, 'WAV', 'PCM_16')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AudioStore.put('probe-key', 'नमस्ते', 'HINDI', 'kid_friendly', audio, 'google', duration_ms=99)
+
+        row = AudioCache.objects.get(cache_key='probe-key')
+        assert row.audio_duration_ms == 750
+        assert row.audio_format == 'wav'
+        assert row.sample_rate == 22050
+        assert row.probed_at is not None
+        cache.clear()
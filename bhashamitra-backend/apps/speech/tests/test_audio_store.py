@@ -0,0 +1,85 @@
+"""Tests for the content-addressed audio store and the cache merge command."""
+import hashlib
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from apps.core.local_cache import clear_local_caches
+from apps.speech.models import AudioCache
+from apps.speech.services.audio_store import AudioStore
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    cache.clear()
+    clear_local_caches()
+
+
+def _legacy_key(text, language, voice_style):
+    return hashlib.md5(f"{text}:{language}:{voice_style}".encode()).hexdigest()
+
+
+@pytest.mark.django_db
+class TestAudioStore:
+    """Test keying and the single read/write path."""
+
+    def test_key_normalizes_text(self):
+        """Test whitespace and Unicode form differences share one key."""
+        decomposed = '\u0928\u093c'  # NA + NUKTA
+        composed = '\u0929'  # precomposed NNNA
+        assert AudioStore.make_key(f"  {decomposed}\n", 'HINDI', 'default') == \
+            AudioStore.make_key(composed, 'HINDI', 'default')
+        assert AudioStore.make_key('नमस्ते', 'HINDI', 'default') != \
+            AudioStore.make_key('नमस्ते', 'HINDI', 'calm')
+
+    def test_put_then_get_from_storage(self):
+        """Test a stored entry is readable after Redis is flushed."""
+        key = AudioStore.make_key('नमस्ते', 'HINDI', 'default')
+        AudioStore.put(key, 'नमस्ते', 'HINDI', 'default', b'mp3-bytes', provider='google')
+        cache.clear()
+        clear_local_caches()
+
+        assert AudioStore.get(key) == b'mp3-bytes'
+        assert AudioCache.objects.get(cache_key=key).access_count == 1
+
+
+@pytest.mark.django_db
+class TestMergeAudioCaches:
+    """Test merging legacy entries into the store."""
+
+    def test_rekeys_and_merges_duplicates(self):
+        """Test whitespace-variant rows fold into one and legacy WAVs move."""
+        first = AudioCache.objects.create(
+            cache_key=_legacy_key('नमस्ते', 'HINDI', 'default'),
+            text_content='नमस्ते', text_hash='x', language='HINDI', voice_style='default',
+            access_count=5,
+        )
+        first.audio_file.save('first.mp3', ContentFile(b'mp3'), save=True)
+        second = AudioCache.objects.create(
+            cache_key=_legacy_key('नमस्ते ', 'HINDI', 'default'),
+            text_content='नमस्ते ', text_hash='y', language='HINDI', voice_style='default',
+            access_count=2,
+        )
+        legacy_only = AudioCache.objects.create(
+            cache_key=_legacy_key('आम', 'HINDI', 'default'),
+            text_content='आम', text_hash='z', language='HINDI', voice_style='default',
+        )
+        legacy_path = f"audio/tts/{legacy_only.cache_key}.wav"
+        default_storage.save(legacy_path, ContentFile(b'wav'))
+
+        call_command('merge_audio_caches')
+
+        assert AudioCache.objects.count() == 2
+        merged = AudioCache.objects.get(cache_key=AudioStore.make_key('नमस्ते', 'HINDI', 'default'))
+        assert merged.access_count == 7
+        assert not AudioCache.objects.filter(id=second.id).exists()
+
+        # Found under the key every read path uses, with its real format on the row
+        moved = AudioCache.objects.get(cache_key=AudioStore.make_key('आम', 'HINDI', 'default'))
+        assert moved.audio_format == 'wav'
+        assert moved.audio_file.read() == b'wav'
+        assert not default_storage.exists(legacy_path)
@@ -0,0 +1,58 @@
+"""Tests for akshara-level phonetic matching."""
+import pytest
+
+from apps.speech.services.phonetic_match import (
+    aksharas,
+    align_words,
+    similarity,
+    similarity_many,
+)
+from apps.speech.services.pronunciation_scorer import PronunciationScorer
+from apps.speech.services.transliteration import compare_words
+
+
+class TestSimilarity:
+    """Test weighted edit distance over aksharas."""
+
+    def test_conjuncts_and_matras_are_one_unit(self):
+        """Test a syllable with virama joins and matras is a single unit."""
+        assert aksharas('नमस्ते') == ('न', 'म', 'स्ते')
+        assert aksharas('வணக்கம்') == ('வ', 'ண', 'க்க', 'ம்')
+
+    def test_confusable_sounds_get_partial_credit(self):
+        """Test vowel length/aspiration cost less than an unrelated akshara."""
+        assert similarity('कि', 'की') > similarity('कि', 'मा')
+        assert similarity('खाना', 'काना') == pytest.approx(0.875)
+        # Dropped virama: one conjunct heard as two aksharas
+        assert similarity('नमस्ते', 'नमसते') > 0.9
+
+    def test_batch_matches_pairwise(self):
+        """Test the vectorized batch gives the same scores as single pairs."""
+        candidates = ['नमस्ते', 'नमसते', 'खाना', '', 'namaste', 'दोस्त']
+        batched = similarity_many('नमस्ते', candidates)
+        assert batched == pytest.approx([similarity('नमस्ते', c) for c in candidates])
+
+
+class TestWordAlignment:
+    """Test word alignment used by word-by-word feedback."""
+
+    def test_missing_and_extra_words(self):
+        """Test a skipped word and an extra word are reported in place."""
+        alignment = align_words(['मेरा', 'नाम', 'राम', 'है'], ['मेरा', 'राम', 'है', 'जी'])
+        assert [(i, j) for i, j, _ in alignment] == [(0, 0), (1, None), (2, 1), (3, 2), (None, 3)]
+
+    def test_compare_words_pairs_near_misses(self):
+        """Test a mispronounced word is paired with its expected word."""
+        comparisons = compare_words('मेरा नाम राम', 'मेरा काम राम')
+        assert [c.is_correct for c in comparisons] == [True, False, True]
+        assert comparisons[1].heard == 'काम'
+        assert comparisons[1].phonetic_hint
+
+
+class TestTextMatchScore:
+    """Test the scorer's text component."""
+
+    def test_romanized_transcript_matches_romanization(self):
+        """Test Latin transcripts are compared against the romanization."""
+        scorer = PronunciationScorer()
+        assert scorer._calculate_text_match('namste', 'नमस्ते', 'namaste') > 90
@@ -0,0 +1,88 @@
+"""Tests for the parallel audio prewarm engine."""
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from apps.speech.services.prewarm_engine import PrewarmEngine, PrewarmItem
+
+
+def _items(*texts):
+    return [PrewarmItem(text=t, language='HINDI', voice_style='kid_friendly') for t in texts]
+
+
+@pytest.mark.django_db
+class TestPrewarmEngine:
+    """Test dedupe, checkpointing and reporting."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_dedupes_by_cache_key(self):
+        """Test duplicate texts are synthesized once."""
+        engine = PrewarmEngine(tts_provider='google_wavenet', workers=2)
+        with mock.patch(
+            'apps.speech.services.prewarm_engine.TTSService.get_audio',
+            return_value=(b'mp3', 'google_wavenet', False),
+        ) as get_audio:
+            report = engine.run(_items('माँ', 'माँ', ' माँ ', 'पापा'))
+
+        assert get_audio.call_count == 2
+        assert report.total == 4
+        assert report.unique == 2
+        assert report.generated == 2
+        assert report.total_cost_usd > 0
+
+    def test_checkpoint_resume(self, tmp_path):
+        """Test keys recorded in a checkpoint are skipped on rerun."""
+        checkpoint = tmp_path / 'prewarm.json'
+        done_key = _items('माँ')[0].cache_key
+        checkpoint.write_text(json.dumps({'done': [done_key]}))
+
+        engine = PrewarmEngine(checkpoint_path=str(checkpoint))
+        with mock.patch(
+            'apps.speech.services.prewarm_engine.TTSService.get_audio',
+            return_value=(b'mp3', 'google', False),
+        ) as get_audio:
+            report = engine.run(_items('माँ', 'पापा'))
+
+        assert get_audio.call_count == 1
+        assert report.resumed == 1
+        # A clean run removes the checkpoint
+        assert not checkpoint.exists()
+
+    def test_failures_keep_checkpoint(self, tmp_path):
+        """Test a run with failures saves progress for the retry."""
+        checkpoint = tmp_path / 'prewarm.json'
+
+        def fake_get_audio(text, **kwargs):
+            if text == 'पापा':
+                raise Exception('provider down')
+            return b'mp3', 'google', False
+
+        engine = PrewarmEngine(checkpoint_path=str(checkpoint))
+        with mock.patch(
+            'apps.speech.services.prewarm_engine.TTSService.get_audio',
+            side_effect=fake_get_audio,
+        ):
+            report = engine.run(_items('माँ', 'पापा'))
+
+        assert report.generated == 1
+        assert report.failed == 1
+        assert json.loads(checkpoint.read_text())['done'] == [_items('माँ')[0].cache_key]
+
+    def test_fallback_provider_limits_next_calls(self):
+        """Test calls after a failover go through the fallback provider's gate."""
+        engine = PrewarmEngine(tts_provider='google_wavenet', workers=1)
+        with mock.patch(
+            'apps.speech.services.prewarm_engine.TTSService.get_audio',
+            return_value=(b'wav', 'svara_fallback', False),
+        ), mock.patch('apps.speech.services.prewarm_engine.connections') as connections:
+            report = engine.run(_items('माँ'))
+
+        assert report.generated == 1
+        assert engine._route == 'svara'
+        assert engine._gate(engine._route).rate_limiter.interval == pytest.approx(1 / 3.0)
+        # Pool threads close their DB connections
+        connections.close_all.assert_called_once()
@@ -0,0 +1,39 @@
+"""Tests for the compiled transliterator."""
+from apps.speech.services import transliteration
+from apps.speech.services.transliteration import (
+    compare_words,
+    get_char_map,
+    transliterate_many,
+    transliterate_to_roman,
+)
+
+
+class TestTransliterateToRoman:
+    """Test longest-match transliteration and script coverage."""
+
+    def test_conjuncts_match_before_their_parts(self):
+        """Test three- and two-character keys win over single characters."""
+        assert transliterate_to_roman('क्षमा') == 'kshamaaa'
+        assert transliterate_to_roman('श्रीमान') == 'shraeemaaana'
+
+    def test_ascii_kept_and_unknown_dropped(self):
+        """Test ASCII passes through, unmapped script characters vanish, spaces collapse."""
+        assert transliterate_to_roman('abc  नमस्ते\n😀 ।') == 'abc namasatae .'
+
+    def test_scripts_without_curated_map_are_derived(self):
+        """Test Telugu/Bengali no longer fall through to the Hindi map."""
+        assert get_char_map('TELUGU') is not get_char_map('HINDI')
+        assert transliterate_to_roman('నమస్తే', 'TELUGU') == 'namasatae'
+        assert transliterate_to_roman('নমস্তে', 'BENGALI') == 'namasatae'
+        # Curated entries still win over derived ones
+        assert transliterate_to_roman('ச', 'TAMIL') == 'sa'
+
+    def test_words_are_memoized(self):
+        """Test repeated words are served from the memo."""
+        transliteration._transliterate_word.cache_clear()
+        transliterate_many(['नमस्ते दोस्त', 'नमस्ते'], 'HINDI')
+        compare_words('नमस्ते दोस्त', 'नमस्ते', 'HINDI')
+
+        info = transliteration._transliterate_word.cache_info()
+        assert info.misses == 2
+        assert info.hits >= 3
@@ -0,0 +1,115 @@
+"""Tests for batch TTS resolution."""
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+
+from apps.speech.models import AudioCache
+from apps.speech.services.tts_service import TTSService, TTSServiceError
+
+
+def _store(text, language='HINDI', voice='kid_friendly'):
+    key = TTSService.get_cache_key(text, language, voice)
+    audio_cache = AudioCache.objects.create(
+        cache_key=key, text_content=text, text_hash='x', language=language,
+        voice_style=voice, provider='google', audio_duration_ms=1500,
+    )
+    audio_cache.audio_file.save(f'{key}.mp3', ContentFile(b'mp3'), save=True)
+    return audio_cache
+
+
+@pytest.fixture
+def media_root(tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    cache.clear()
+    yield tmp_path
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestGetAudioMany:
+    """Test batched cache lookup and bounded synthesis."""
+
+    def test_hits_resolved_in_bulk_and_misses_synthesized_once(self, media_root, django_assert_max_num_queries):
+        """Test duplicates share one synthesis and hits need no per-text lookups."""
+        _store('पेज एक')
+        _store('पेज दो')
+
+        with mock.patch.object(
+            TTSService, 'get_audio', return_value=(b'mp3', 'google_wavenet', False)
+        ) as get_audio, django_assert_max_num_queries(2):
+            entries = TTSService.get_audio_many(
+                ['पेज एक', 'पेज दो', 'पेज तीन', 'पेज तीन', ''],
+                voice_profile='kid_friendly',
+            )
+
+        assert get_audio.call_count == 1
+        assert [e['was_cached'] for e in entries[:3]] == [True, True, False]
+        assert entries[0]['audio_cache'].audio_duration_ms == 1500
+        assert entries[2]['provider'] == entries[3]['provider'] == 'google_wavenet'
+        assert entries[4]['error'] == 'Text cannot be empty'
+
+    def test_failures_are_reported_per_text(self, media_root):
+        """Test one failing synthesis doesn't sink the batch."""
+        _store('पेज एक')
+        with mock.patch.object(TTSService, 'get_audio', side_effect=TTSServiceError('down')):
+            entries = TTSService.get_audio_many(['पेज एक', 'पेज दो'], voice_profile='kid_friendly')
+
+        assert entries[0]['was_cached'] and entries[0]['error'] is None
+        assert entries[1]['error'] == 'down'
+
+    def test_max_synthesize_leaves_rest_unresolved(self, media_root):
+        """Test misses past the cap aren't synthesized."""
+        with mock.patch.object(
+            TTSService, 'get_audio', return_value=(b'mp3', 'google_wavenet', False)
+        ) as get_audio:
+            entries = TTSService.get_audio_many(
+                ['एक', 'दो', 'तीन'], voice_profile='kid_friendly', max_synthesize=2
+            )
+
+        assert get_audio.call_count == 2
+        assert [e['provider'] for e in entries] == ['google_wavenet', 'google_wavenet', None]
+        assert entries[2]['error'] is None
+
+
+@pytest.mark.django_db
+class TestBatchTTSView:
+    """Test the batch manifest endpoint."""
+
+    def test_story_manifest(self, auth_client, story_with_pages, media_root):
+        """Test a whole story resolves in one request, in page order."""
+        for page in story_with_pages.pages.all():
+            _store(page.text_content, language=story_with_pages.language)
+
+        response = auth_client.post(
+            '/api/v1/speech/tts/batch/', {'story_id': str(story_with_pages.id)}, format='json'
+        )
+
+        assert response.status_code == 200
+        items = response.data['data']['items']
+        assert [item['page_number'] for item in items] == [1, 2, 3, 4, 5]
+        assert all(item['audio_url'] for item in items)
+        assert response.data['data']['summary']['cached'] == 5
+
+    def test_invalid_language_and_style_rejected(self, auth_client, media_root):
+        """Test batch requests get the same option checks as the single TTS endpoint."""
+        url = '/api/v1/speech/tts/batch/'
+        response = auth_client.post(url, {'texts': ['एक'], 'language': 'KLINGON'}, format='json')
+        assert response.status_code == 400
+        response = auth_client.post(url, {'texts': ['एक'], 'voice_style': 'robot'}, format='json')
+        assert response.status_code == 400
+
+    def test_misses_past_cap_are_queued(self, auth_client, media_root):
+        """Test one request can't synthesize more than BATCH_MAX_SYNTHESIZE texts inline."""
+        texts = [f'शब्द {i}' for i in range(TTSService.BATCH_MAX_SYNTHESIZE + 2)]
+        with mock.patch.object(
+            TTSService, 'get_audio', return_value=(b'mp3', 'google_wavenet', False)
+        ) as get_audio:
+            response = auth_client.post('/api/v1/speech/tts/batch/', {'texts': texts}, format='json')
+
+        assert response.status_code == 200
+        assert get_audio.call_count == TTSService.BATCH_MAX_SYNTHESIZE
+        summary = response.data['data']['summary']
+        assert summary['queued'] == 2
+        assert all(item.get('job_id') for item in response.data['data']['items'][-2:])
@@ -0,0 +1,119 @@
+"""Tests for the background TTS job queue."""
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+
+from apps.speech.models import TTSJob
+from apps.speech.services.tts_job_service import TTSJobService
+from apps.speech.services.tts_service import TTSServiceError
+
+
+@pytest.mark.django_db
+class TestTTSJobService:
+    """Test enqueue/claim/process of TTS jobs."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_enqueue_reuses_in_flight_job(self):
+        """Test identical texts share one pending job."""
+        first = TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        second = TTSJobService.enqueue('  नमस्ते  ', 'HINDI', 'kid_friendly')
+        assert first.id == second.id
+        assert TTSJob.objects.count() == 1
+
+    def test_claim_marks_job_running(self):
+        """Test claiming hands out the oldest pending job once."""
+        job = TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        claimed = TTSJobService.claim_next()
+        assert claimed.id == job.id
+        assert claimed.status == TTSJob.Status.RUNNING
+        assert claimed.attempts == 1
+        assert TTSJobService.claim_next() is None
+
+    def test_process_success(self):
+        """Test a successful synthesis completes the job."""
+        TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        job = TTSJobService.claim_next()
+        with mock.patch(
+            'apps.speech.services.tts_job_service.TTSService.get_audio',
+            return_value=(b'mp3', 'google_wavenet', False),
+        ):
+            job = TTSJobService.process(job)
+        assert job.status == TTSJob.Status.COMPLETED
+        assert job.provider == 'google_wavenet'
+
+    def test_process_failure_requeues_then_fails(self):
+        """Test provider failures retry up to MAX_ATTEMPTS."""
+        TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        with mock.patch(
+            'apps.speech.services.tts_job_service.TTSService.get_audio',
+            side_effect=TTSServiceError('down'),
+        ):
+            for _ in range(TTSJobService.MAX_ATTEMPTS):
+                job = TTSJobService.process(TTSJobService.claim_next())
+        assert job.status == TTSJob.Status.FAILED
+        assert job.error_message == 'down'
+
+    def test_process_unexpected_error_requeues(self):
+        """Test non-TTS exceptions are recorded instead of leaving the job RUNNING."""
+        TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        with mock.patch(
+            'apps.speech.services.tts_job_service.TTSService.get_audio',
+            side_effect=OSError('disk full'),
+        ):
+            job = TTSJobService.process(TTSJobService.claim_next())
+        assert job.status == TTSJob.Status.PENDING
+        assert job.error_message == 'disk full'
+
+    def test_requeue_stale_fails_exhausted_jobs(self):
+        """Test stale jobs are requeued until they run out of attempts."""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        started_at = timezone.now() - timedelta(seconds=TTSJobService.STALE_AFTER_SECONDS + 1)
+        retry = TTSJobService.enqueue('नमस्ते', 'HINDI', 'kid_friendly')
+        exhausted = TTSJobService.enqueue('धन्यवाद', 'HINDI', 'kid_friendly')
+        TTSJob.objects.filter(id=retry.id).update(
+            status=TTSJob.Status.RUNNING, attempts=1, started_at=started_at
+        )
+        TTSJob.objects.filter(id=exhausted.id).update(
+            status=TTSJob.Status.RUNNING, attempts=TTSJobService.MAX_ATTEMPTS, started_at=started_at
+        )
+
+        assert TTSJobService.requeue_stale() == 1
+        retry.refresh_from_db()
+        exhausted.refresh_from_db()
+        assert retry.status == TTSJob.Status.PENDING
+        assert exhausted.status == TTSJob.Status.FAILED
+
+
+@pytest.mark.django_db
+class TestTTSAsyncEndpoints:
+    """Test 202 + polling flow on the TTS endpoint."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_cold_miss_returns_job(self, api_client):
+        """Test Prefer: respond-async queues a job on a cache miss."""
+        response = api_client.post(
+            '/api/v1/speech/tts/',
+            {'text': 'नमस्ते', 'language': 'HINDI'},
+            format='json',
+            HTTP_PREFER='respond-async',
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job_id = response.data['data']['job_id']
+
+        poll = api_client.get(f'/api/v1/speech/tts/jobs/{job_id}/')
+        assert poll.status_code == status.HTTP_200_OK
+        assert poll.data['data']['status'] == TTSJob.Status.PENDING
+
+    def test_unknown_job(self, api_client):
+        """Test polling an unknown job returns 404."""
+        import uuid
+        response = api_client.get(f'/api/v1/speech/tts/jobs/{uuid.uuid4()}/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -7,6 +7,8 @@ app_name = 'speech'
 urlpatterns = [
     # Main TTS endpoint (Hugging Face Indic Parler-TTS)
     path('tts/', views.TextToSpeechView.as_view(), name='tts'),
+    path('tts/batch/', views.BatchTTSView.as_view(), name='tts-batch'),
+    path('tts/jobs/<uuid:job_id>/', views.TTSJobStatusView.as_view(), name='tts-job-status'),
 
     # Speech-to-Text endpoint (Google Cloud STT with pronunciation evaluation)
     path('stt/', views.SpeechToTextView.as_view(), name='stt'),
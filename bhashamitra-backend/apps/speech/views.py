@@ -6,15 +6,90 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.throttling import ScopedRateThrottle
 from django.db import models
 from django.db.models import Count, Avg
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.http import HttpResponse
+from django.urls import reverse
 import logging
 
 from apps.speech.models import AudioCache
 from apps.speech.services.tts_service import TTSService, TTSServiceError
+from apps.speech.services.tts_job_service import TTSJobService
+from apps.speech.services.audio_delivery import (
+    apply_cache_headers,
+    deliver_audio_file,
+    is_not_modified,
+    not_modified_response,
+    serve_cached_audio,
+    stored_audio_url,
+)
 from apps.speech.services.cache_service import AudioCacheService
 
 logger = logging.getLogger(__name__)
 
+TTS_LANGUAGES = [
+    'FIJI_HINDI', 'HINDI', 'TAMIL', 'GUJARATI', 'PUNJABI', 'TELUGU', 'MALAYALAM', 'BENGALI', 'KANNADA', 'MARATHI'
+]
+
+# Kid-friendly voice styles for Indic Parler-TTS
+TTS_VOICE_STYLES = [
+    'kid_friendly',   # Default: cheerful, high-pitched, like Miss Rachel
+    'calm_story',     # Soft, gentle for bedtime stories
+    'enthusiastic',   # High energy for games
+    'male_teacher',   # Friendly male teacher voice
+    'storyteller',    # Legacy: maps to kid_friendly
+    'calm',           # Legacy: maps to calm_story
+]
+
+# Legacy styles -> current ones
+TTS_STYLE_MAPPING = {
+    'storyteller': 'kid_friendly',
+    'calm': 'calm_story',
+}
+
+
+def _validate_tts_options(language: str, voice_style: str):
+    """(voice_style, error_response): maps legacy styles and checks both fields."""
+    if language not in TTS_LANGUAGES:
+        return None, Response(
+            {"detail": f"Invalid language. Must be one of: {TTS_LANGUAGES}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    voice_style = TTS_STYLE_MAPPING.get(voice_style, voice_style)
+    if voice_style not in TTS_VOICE_STYLES:
+        return None, Response(
+            {"detail": f"Invalid voice_style. Must be one of: {TTS_VOICE_STYLES}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return voice_style, None
+
+
+def _wants_async_tts(request) -> bool:
+    """
+    Whether a cold cache miss should be queued instead of synthesized inline.
+
+    Enabled globally with TTS_ASYNC_ON_MISS, or per request by sending
+    the RFC 7240 header `Prefer: respond-async`.
+    """
+    if getattr(settings, 'TTS_ASYNC_ON_MISS', False):
+        return True
+    return 'respond-async' in request.headers.get('Prefer', '')
+
+
+def _tts_job_accepted(request, job) -> Response:
+    """202 response pointing the client at the job-status endpoint."""
+    status_url = request.build_absolute_uri(
+        reverse('speech:tts-job-status', kwargs={'job_id': job.id})
+    )
+    data = TTSJobService.to_status_dict(job)
+    data['status_url'] = status_url
+
+    response = Response({"data": data}, status=status.HTTP_202_ACCEPTED)
+    response['Location'] = status_url
+    response['Retry-After'] = '2'
+    return response
+
 
 class TextToSpeechView(APIView):
     """
@@ -40,6 +115,10 @@ class TextToSpeechView(APIView):
     - X-TTS-Language: HINDI
     - X-TTS-Tier: FREE/STANDARD/PREMIUM/anonymous
     - Content-Type: audio/wav
+
+    Async mode: send `Prefer: respond-async` (or set TTS_ASYNC_ON_MISS) and a
+    cold cache miss returns 202 with a job ID instead of blocking on synthesis.
+    Poll GET /api/v1/speech/tts/jobs/{job_id}/ for the audio URL.
     """
     # Use default authentication (JWT) but allow unauthenticated access
     # This enables tier-based TTS routing for authenticated users
@@ -65,47 +144,39 @@ class TextToSpeechView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        valid_languages = ['FIJI_HINDI', 'HINDI', 'TAMIL', 'GUJARATI', 'PUNJABI', 'TELUGU', 'MALAYALAM', 'BENGALI', 'KANNADA', 'MARATHI']
-        if language not in valid_languages:
-            return Response(
-                {"detail": f"Invalid language. Must be one of: {valid_languages}"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Kid-friendly voice styles for Indic Parler-TTS
-        valid_styles = [
-            'kid_friendly',   # Default: cheerful, high-pitched, like Miss Rachel
-            'calm_story',     # Soft, gentle for bedtime stories
-            'enthusiastic',   # High energy for games
-            'male_teacher',   # Friendly male teacher voice
-            'storyteller',    # Legacy: maps to kid_friendly
-            'calm',           # Legacy: maps to calm_story
-        ]
-        # Map legacy styles to new ones
-        style_mapping = {
-            'storyteller': 'kid_friendly',
-            'calm': 'calm_story',
-        }
-        voice_style = style_mapping.get(voice_style, voice_style)
-
-        if voice_style not in valid_styles:
-            return Response(
-                {"detail": f"Invalid voice_style. Must be one of: {valid_styles}"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        voice_style, error = _validate_tts_options(language, voice_style)
+        if error:
+            return error
 
         try:
             # Get authenticated user for tier-based routing (or None for anonymous)
             user = request.user if request.user.is_authenticated else None
             user_tier = getattr(user, 'subscription_tier', 'anonymous') if user else 'anonymous'
 
-            # text_to_speech returns (audio_bytes, was_cached) - legacy method
-            audio_bytes, was_cached = TTSService.text_to_speech(
-                text=text,
-                language=language,
-                voice_style=voice_style,
-                user=user
-            )
+            cache_key = TTSService.get_cache_key(text, language, voice_style)
+            cached_response = serve_cached_audio(request, cache_key, 'speech.mp3')
+            if cached_response:
+                cached_response['X-TTS-Cached'] = 'true'
+                cached_response['X-TTS-Language'] = language
+                cached_response['X-TTS-Tier'] = user_tier
+                return cached_response
+
+            audio_bytes = None
+            if _wants_async_tts(request):
+                audio_bytes = TTSService.get_cached_audio(text, language, voice_style)
+                if audio_bytes is None:
+                    job = TTSJobService.enqueue(text, language, voice_style, user=user)
+                    return _tts_job_accepted(request, job)
+                was_cached = True
+
+            if audio_bytes is None:
+                # text_to_speech returns (audio_bytes, was_cached) - legacy method
+                audio_bytes, was_cached = TTSService.text_to_speech(
+                    text=text,
+                    language=language,
+                    voice_style=voice_style,
+                    user=user
+                )
 
             # Google TTS returns MP3, so use correct content type
             response = HttpResponse(audio_bytes, content_type='audio/mpeg')
@@ -114,7 +185,7 @@ class TextToSpeechView(APIView):
             response['X-TTS-Cached'] = str(was_cached).lower()
             response['X-TTS-Language'] = language
             response['X-TTS-Tier'] = user_tier
-            response['Cache-Control'] = 'public, max-age=86400'  # Browser cache 24h
+            apply_cache_headers(response, cache_key)
 
             return response
 
@@ -126,6 +197,167 @@ class TextToSpeechView(APIView):
             )
 
 
+class BatchTTSView(APIView):
+    """
+    POST /api/v1/speech/tts/batch/
+
+    Resolve audio for many texts in one round-trip (a whole story or a
+    vocabulary theme) and return a manifest of audio URLs.
+
+    Request Body (one of texts / story_id / theme_id):
+    {
+        "texts": ["...", "..."],
+        "story_id": "uuid",       // all pages of a story
+        "theme_id": "uuid",       // all words of a vocabulary theme
+        "language": "HINDI",      // defaults to the story/theme language
+        "voice_style": "storyteller"
+    }
+
+    Response:
+    {
+        "data": {
+            "language": "HINDI",
+            "voice_style": "kid_friendly",
+            "items": [
+                {
+                    "text": "...",
+                    "page_number": 1,          // story_id requests
+                    "word_id": "uuid",         // theme_id requests
+                    "cache_key": "abc...",
+                    "audio_url": "https://.../audio_cache/abc.mp3",
+                    "duration_ms": 2100,
+                    "provider": "cache",
+                    "cached": true,
+                    "error": null
+                }
+            ],
+            "summary": {"total": 12, "cached": 10, "generated": 2, "queued": 0, "failed": 0}
+        }
+    }
+
+    Up to TTSService.BATCH_MAX_SYNTHESIZE misses are synthesized
+    concurrently; the rest (all of them in async mode, see
+    TextToSpeechView) are queued and the item carries a job_id/status_url
+    to poll.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'tts'
+
+    def post(self, request):
+        items, language, error = self._resolve_items(request)
+        if error:
+            return error
+
+        voice_style, error = _validate_tts_options(
+            language, request.data.get('voice_style', 'storyteller')
+        )
+        if error:
+            return error
+
+        if not items:
+            return Response(
+                {"detail": "Nothing to synthesize"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > TTSService.BATCH_MAX_TEXTS:
+            return Response(
+                {"detail": f"Too many texts (max {TTSService.BATCH_MAX_TEXTS})"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # The tts throttle counts one request for the whole batch, so only a
+        # few misses are synthesized inline; the rest are queued as jobs
+        entries = TTSService.get_audio_many(
+            [item['text'] for item in items],
+            language=language,
+            voice_profile=voice_style,
+            user=request.user,
+            max_synthesize=0 if _wants_async_tts(request) else TTSService.BATCH_MAX_SYNTHESIZE,
+        )
+
+        summary = {'total': len(entries), 'cached': 0, 'generated': 0, 'queued': 0, 'failed': 0}
+        manifest = []
+        for item, entry in zip(items, entries):
+            audio_cache = entry['audio_cache']
+            item.update({
+                'cache_key': entry['cache_key'],
+                'audio_url': stored_audio_url(audio_cache),
+                'duration_ms': audio_cache.audio_duration_ms if audio_cache else None,
+                'provider': entry['provider'],
+                'cached': entry['was_cached'],
+                'error': entry['error'],
+            })
+
+            if entry['error']:
+                summary['failed'] += 1
+            elif entry['provider'] is None:
+                summary['queued'] += 1
+                job = TTSJobService.enqueue(item['text'], language, voice_style, user=request.user)
+                item['job_id'] = str(job.id)
+                item['status_url'] = request.build_absolute_uri(
+                    reverse('speech:tts-job-status', kwargs={'job_id': job.id})
+                )
+            elif entry['was_cached']:
+                summary['cached'] += 1
+            else:
+                summary['generated'] += 1
+            manifest.append(item)
+
+        return Response({
+            "data": {
+                'language': language,
+                'voice_style': voice_style,
+                'items': manifest,
+                'summary': summary,
+            }
+        })
+
+    def _resolve_items(self, request):
+        """Texts to synthesize as manifest items: (items, language, error_response)."""
+        language = request.data.get('language')
+
+        if request.data.get('story_id'):
+            from apps.stories.models import Story
+
+            try:
+                story = Story.objects.filter(id=request.data['story_id']).first()
+            except (ValueError, DjangoValidationError):
+                story = None
+            if not story:
+                return None, None, Response(
+                    {"detail": "Story not found"},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            pages = story.pages.order_by('page_number').values_list('page_number', 'text_content')
+            items = [{'text': text, 'page_number': number} for number, text in pages]
+            return items, language or story.language, None
+
+        if request.data.get('theme_id'):
+            from apps.curriculum.models import VocabularyTheme
+
+            try:
+                theme = VocabularyTheme.objects.filter(id=request.data['theme_id']).first()
+            except (ValueError, DjangoValidationError):
+                theme = None
+            if not theme:
+                return None, None, Response(
+                    {"detail": "Theme not found"},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            words = theme.words.order_by('order').values_list('id', 'word')
+            items = [{'text': word, 'word_id': str(word_id)} for word_id, word in words]
+            return items, language or theme.language, None
+
+        texts = request.data.get('texts')
+        if not isinstance(texts, list):
+            return None, None, Response(
+                {"detail": "Provide texts (a list), story_id or theme_id"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return [{'text': text if isinstance(text, str) else ''} for text in texts], language or 'HINDI', None
+
+
 class StoryPageAudioView(APIView):
     """
     GET /api/v1/stories/{story_id}/pages/{page_number}/audio/
@@ -138,7 +370,8 @@ class StoryPageAudioView(APIView):
     Query Parameters:
     - voice_style: storyteller (default), calm, enthusiastic
 
-    Response: Audio file (WAV format)
+    Response: Audio file (WAV format), or 202 with a TTS job ID on a cold
+    cache miss when async mode is requested (see TextToSpeechView).
     """
     permission_classes = [IsAuthenticated]
     throttle_classes = [ScopedRateThrottle]
@@ -168,13 +401,38 @@ class StoryPageAudioView(APIView):
             )
 
         try:
-            # Use tier-based TTS with user context
-            audio_bytes, provider, was_cached = TTSService.get_audio(
-                text=page.text_content,
-                language=story.language,
-                voice_profile=voice_style,
-                user=request.user,  # Pass user for tier-based routing
+            cache_key = TTSService.get_cache_key(page.text_content, story.language, voice_style)
+            # The page URL outlives edits to its text, so clients revalidate
+            cached_response = serve_cached_audio(
+                request, cache_key, f"page_{page_number}.mp3", immutable=False
             )
+            if cached_response:
+                cached_response['X-TTS-Cached'] = 'true'
+                cached_response['X-TTS-Provider'] = 'cache'
+                cached_response['X-Story-ID'] = str(story_id)
+                cached_response['X-Page-Number'] = str(page_number)
+                return cached_response
+
+            audio_bytes = None
+            if _wants_async_tts(request):
+                audio_bytes = TTSService.get_cached_audio(
+                    page.text_content, story.language, voice_style
+                )
+                if audio_bytes is None:
+                    job = TTSJobService.enqueue(
+                        page.text_content, story.language, voice_style, user=request.user
+                    )
+                    return _tts_job_accepted(request, job)
+                provider, was_cached = 'cache', True
+
+            if audio_bytes is None:
+                # Use tier-based TTS with user context
+                audio_bytes, provider, was_cached = TTSService.get_audio(
+                    text=page.text_content,
+                    language=story.language,
+                    voice_profile=voice_style,
+                    user=request.user,  # Pass user for tier-based routing
+                )
 
             response = HttpResponse(audio_bytes, content_type='audio/mpeg')
             response['Content-Disposition'] = f'inline; filename="page_{page_number}.mp3"'
@@ -184,7 +442,7 @@ class StoryPageAudioView(APIView):
             response['X-Story-ID'] = str(story_id)
             response['X-Page-Number'] = str(page_number)
             response['X-Subscription-Tier'] = getattr(request.user, 'subscription_tier', 'FREE')
-            response['Cache-Control'] = 'public, max-age=604800'  # Browser cache 7 days
+            apply_cache_headers(response, cache_key, immutable=False)
 
             return response
 
@@ -196,6 +454,40 @@ class StoryPageAudioView(APIView):
             )
 
 
+class TTSJobStatusView(APIView):
+    """
+    GET /api/v1/speech/tts/jobs/{job_id}/
+
+    Poll a background TTS job queued on a cold cache miss.
+
+    Response:
+    {
+        "data": {
+            "job_id": "uuid",
+            "status": "PENDING" | "RUNNING" | "COMPLETED" | "FAILED",
+            "provider": "google_wavenet",
+            "audio_url": "https://.../audio_cache/abc.mp3",  // once COMPLETED
+            "error": null
+        }
+    }
+    """
+    # Job IDs are unguessable UUIDs handed out by the (public) TTS endpoint
+    permission_classes = [AllowAny]
+
+    def get(self, request, job_id):
+        job = TTSJobService.get_job(job_id)
+        if not job:
+            return Response(
+                {"detail": "Job not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        response = Response({"data": TTSJobService.to_status_dict(job)})
+        if not job.is_finished:
+            response['Retry-After'] = '2'
+        return response
+
+
 class TTSStatusView(APIView):
     """
     GET /api/v1/speech/status/
@@ -277,7 +569,11 @@ class CurriculumAudioView(APIView):
 
     Headers:
     - X-Audio-Cached: true (always, since this serves pre-generated content)
-    - Cache-Control: public, max-age=31536000 (1 year)
+    - Cache-Control: private, no-cache (the item's audio can be regenerated)
+    - ETag: cache key (send If-None-Match to get a 304)
+
+    With TTS_AUDIO_DELIVERY set to redirect/x-accel/x-sendfile the audio is
+    served by storage or the front proxy instead of through Django.
     """
     permission_classes = [AllowAny]
     throttle_classes = [ScopedRateThrottle]
@@ -308,6 +604,17 @@ class CurriculumAudioView(APIView):
                     status=status.HTTP_404_NOT_FOUND
                 )
 
+            if is_not_modified(request, audio_cache.cache_key):
+                return not_modified_response(audio_cache.cache_key, immutable=False)
+
+            # Hand off to storage / front proxy when URL-first delivery is on
+            delivered = deliver_audio_file(request, audio_cache, f"{content_id}.mp3", immutable=False)
+            if delivered:
+                delivered['X-Audio-Cached'] = 'true'
+                delivered['X-Content-Type'] = content_type
+                delivered['X-Content-ID'] = content_id
+                return delivered
+
             # Read audio file
             if audio_cache.audio_file:
                 audio_cache.audio_file.open('rb')
@@ -334,7 +641,7 @@ class CurriculumAudioView(APIView):
             response['X-Audio-Cached'] = 'true'
             response['X-Content-Type'] = content_type
             response['X-Content-ID'] = content_id
-            response['Cache-Control'] = 'public, max-age=31536000'  # 1 year cache
+            apply_cache_headers(response, audio_cache.cache_key, immutable=False)
 
             return response
 
@@ -439,9 +746,11 @@ from apps.speech.serializers import (
     MimicProgressSummarySerializer,
     MimicShareSerializer,
 )
-from apps.speech.services.pronunciation_scorer import pronunciation_scorer
+from apps.speech.services.audio_blob import AudioBlob, AudioFetchError
+from apps.speech.services.pronunciation_scorer import AudioAnalyzer, pronunciation_scorer
 from apps.speech.services.stt_service import stt_service
 from apps.children.models import Child
+from apps.gamification.services.points import PointsService
 
 
 class MimicChallengeListView(APIView):
@@ -544,6 +853,30 @@ class MimicChallengeDetailView(APIView):
         return Response(serializer.data)
 
 
+def _store_mimic_recording(request, audio: AudioBlob, child_id) -> tuple:
+    """Save a recording under mimic_recordings/; returns (saved_path, absolute_url)."""
+    import uuid
+    from django.core.files.storage import default_storage
+
+    unique_id = uuid.uuid4().hex[:12]
+    filename = f"mimic_recordings/{child_id or 'anon'}/{unique_id}.{audio.extension}"
+    saved_path = audio.save(filename)
+
+    # Get the URL
+    if hasattr(default_storage, 'url'):
+        audio_url = default_storage.url(saved_path)
+    else:
+        # Fallback for local storage
+        audio_url = f"/media/{saved_path}"
+
+    # Make URL absolute if needed
+    if audio_url.startswith('/'):
+        base_url = getattr(settings, 'SITE_URL', '') or request.build_absolute_uri('/').rstrip('/')
+        audio_url = f"{base_url.rstrip('/')}{audio_url}"
+
+    return saved_path, audio_url
+
+
 class MimicAttemptThrottle(ScopedRateThrottle):
     """Rate limit pronunciation attempts to prevent spam."""
     scope = 'mimic_attempts'
@@ -563,6 +896,12 @@ class MimicAttemptSubmitView(APIView):
         "child_id": "uuid"  // Required
     }
 
+    Or multipart/form-data with the recording itself in `audio` instead
+    of `audio_url`, saving the separate upload round-trip.
+
+    The recording is read once and the same buffer is shared by STT,
+    acoustic analysis and storage.
+
     Response:
     {
         "attempt_id": "uuid",
@@ -601,21 +940,46 @@ class MimicAttemptSubmitView(APIView):
         serializer = MimicAttemptSubmitSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        audio_url = serializer.validated_data['audio_url']
         duration_ms = serializer.validated_data.get('duration_ms', 3000)
 
         try:
-            # Step 1: Transcribe audio using STT
+            # Step 0: Read the recording once for every stage below
+            upload = serializer.validated_data.get('audio')
+            if upload:
+                audio = AudioBlob.from_upload(upload)
+                _, audio_url = _store_mimic_recording(request, audio, child.id)
+            else:
+                audio_url = serializer.validated_data['audio_url']
+                try:
+                    audio = AudioBlob.fetch(audio_url)
+                except AudioFetchError as e:
+                    # Let each stage apply its own fallback
+                    logger.warning(f"Mimic attempt audio unavailable: {e}")
+                    audio = None
+
+            # Step 1: Get expected duration from reference audio (if available),
+            # preferring its trimmed speech duration to match the attempt's
+            expected_duration_ms = None
+            if challenge.audio_cache:
+                expected_duration_ms = (
+                    challenge.audio_cache.speech_duration_ms
+                    or challenge.audio_cache.audio_duration_ms
+                    or None
+                )
+
+            # Step 2: Transcribe audio using STT, with acoustic analysis
+            # running in the background so latency is max(STT, analysis)
+            analysis_future = None
+            if audio is not None:
+                analysis_future = AudioAnalyzer.submit(audio, expected_duration_ms)
+
             stt_result = stt_service.transcribe(
                 audio_url=audio_url,
                 language=challenge.language,
-                expected_word=challenge.word  # For mock STT testing
+                expected_word=challenge.word,  # For mock STT testing
+                audio=audio,
             )
-
-            # Step 2: Get expected duration from reference audio (if available)
-            expected_duration_ms = None
-            if challenge.audio_cache and challenge.audio_cache.audio_duration_ms:
-                expected_duration_ms = challenge.audio_cache.audio_duration_ms
+            audio_analysis = AudioAnalyzer.wait(analysis_future) if analysis_future else None
 
             # Step 3: Score the pronunciation with V2 acoustic analysis
             score_result = pronunciation_scorer.score(
@@ -624,8 +988,10 @@ class MimicAttemptSubmitView(APIView):
                 stt_confidence=stt_result.confidence,
                 language_name=challenge.language,  # <--- ADDED THIS
                 expected_romanization=challenge.romanization,
-                audio_url=audio_url, 
-                expected_duration_ms=expected_duration_ms 
+                audio_url=audio_url,
+                expected_duration_ms=expected_duration_ms,
+                audio=audio,
+                audio_analysis=audio_analysis,
             )
 
             # Step 4: Get or create progress record
@@ -676,8 +1042,7 @@ class MimicAttemptSubmitView(APIView):
             progress.update_from_attempt(attempt)
 
             # Step 9: Update child's total points
-            child.total_points += points
-            child.save(update_fields=['total_points'])
+            PointsService.award(child, points, PointsService.Reason.MIMIC_ATTEMPT, attempt.id)
 
             # Step 10: Get Peppi feedback
             peppi_feedback = pronunciation_scorer.get_peppi_feedback(
@@ -850,11 +1215,6 @@ class AudioUploadView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        from django.core.files.storage import default_storage
-        from django.core.files.base import ContentFile
-        import uuid
-        import os
-
         audio_file = request.FILES.get('audio')
         child_id = request.data.get('child_id')
 
@@ -883,26 +1243,8 @@ class AudioUploadView(APIView):
             )
 
         try:
-            # Generate unique filename
-            ext = os.path.splitext(audio_file.name)[1] or '.webm'
-            unique_id = uuid.uuid4().hex[:12]
-            filename = f"mimic_recordings/{child_id or 'anon'}/{unique_id}{ext}"
-
-            # Save file
-            saved_path = default_storage.save(filename, ContentFile(audio_file.read()))
-
-            # Get the URL
-            if hasattr(default_storage, 'url'):
-                audio_url = default_storage.url(saved_path)
-            else:
-                # Fallback for local storage
-                audio_url = f"/media/{saved_path}"
-
-            # Make URL absolute if needed
-            if audio_url.startswith('/'):
-                from django.conf import settings
-                base_url = getattr(settings, 'SITE_URL', '') or request.build_absolute_uri('/').rstrip('/')
-                audio_url = f"{base_url.rstrip('/')}{audio_url}"
+            audio = AudioBlob.from_upload(audio_file)
+            saved_path, audio_url = _store_mimic_recording(request, audio, child_id)
 
             logger.info(f"Audio uploaded: {saved_path}, url: {audio_url}")
 
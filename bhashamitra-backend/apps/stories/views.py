@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from .models import Story
 from .serializers import StoryListSerializer, StoryDetailSerializer
+from apps.core.cache_service import cache_response
 from apps.core.validators import safe_limit
 
 
@@ -12,6 +13,8 @@ class StoryListView(APIView):
     """List stories with filters and tier-based access."""
     permission_classes = [IsAuthenticated]
 
+    # Per user: visible stories depend on tier and subscription state
+    @cache_response(ttl=300, key_prefix="stories", vary=('user',))
     def get(self, request):
         language = request.query_params.get('language')
         level = request.query_params.get('level')
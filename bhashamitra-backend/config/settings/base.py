@@ -162,6 +162,25 @@ TTS_SPACE_ID = os.getenv('TTS_SPACE_ID', 'parler-tts/parler_tts')
 TTS_CACHE_TTL = int(os.getenv('TTS_CACHE_TTL_SECONDS', 86400))  # 24 hours in Redis
 TTS_DEFAULT_VOICE_STYLE = os.getenv('TTS_DEFAULT_VOICE_STYLE', 'storyteller')
 
+# Queue cold-miss synthesis as a background TTSJob (202 + job ID) for every
+# request instead of only those sending `Prefer: respond-async`.
+# Requires `python manage.py run_tts_worker` to be running.
+TTS_ASYNC_ON_MISS = os.getenv('TTS_ASYNC_ON_MISS', 'false').lower() == 'true'
+
+# How cached audio is delivered: 'stream' (bytes through Django), 'redirect'
+# (to the storage URL), 'x-accel' (nginx X-Accel-Redirect) or 'x-sendfile'.
+TTS_AUDIO_DELIVERY = os.getenv('TTS_AUDIO_DELIVERY', 'stream')
+TTS_AUDIO_ACCEL_PREFIX = os.getenv('TTS_AUDIO_ACCEL_PREFIX', '/protected-media/')
+TTS_AUDIO_REDIRECT_MAX_AGE = int(os.getenv('TTS_AUDIO_REDIRECT_MAX_AGE', 3600))
+
+# Measure duration/sample rate/loudness of newly cached audio on a background
+# thread after commit ('false' probes inline, e.g. for management commands)
+TTS_AUDIO_PROBE_ASYNC = os.getenv('TTS_AUDIO_PROBE_ASYNC', 'true').lower() == 'true'
+
+# Per-worker in-memory cache tiers in front of Redis (bytes)
+LOCAL_CACHE_AUDIO_BYTES = int(os.getenv('LOCAL_CACHE_AUDIO_BYTES', 32 * 1024 * 1024))
+LOCAL_CACHE_CURRICULUM_BYTES = int(os.getenv('LOCAL_CACHE_CURRICULUM_BYTES', 8 * 1024 * 1024))
+
 # StoryWeaver API
 STORYWEAVER_BASE_URL = 'https://storyweaver.org.in/api/v1'
 
@@ -208,6 +227,18 @@ CACHE_TIMEOUT_STORY = 3600  # 1 hour
 CACHE_TIMEOUT_TTS = 86400   # 24 hours
 CACHE_TIMEOUT_PIPELINE = 3600  # 1 hour
 
+# First-turn Peppi curriculum-help replies (see PeppiResponseCache)
+PEPPI_RESPONSE_CACHE_TTL = 86400 * 7  # 7 days
+
+# External TTS/STT providers (see apps.core.provider_http)
+PROVIDER_HTTP_POOL_MAXSIZE = 10
+PROVIDER_CIRCUIT_FAILURE_THRESHOLD = 5  # failures within the window to open
+PROVIDER_CIRCUIT_RECOVERY_TIMEOUT = 30  # seconds open before a probe
+
+# Bulk offline progress sync (see apps.offline.sync_service)
+OFFLINE_SYNC_MAX_EVENTS = 1000  # events per request
+OFFLINE_SYNC_MAX_AGE_DAYS = 30  # older events are rejected
+
 # ===========================================
 # LANGUAGE CONFIGURATION
 # ===========================================
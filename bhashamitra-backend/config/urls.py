@@ -35,6 +35,7 @@ urlpatterns = [
     path('api/v1/parent/', include('apps.parent_engagement.urls', namespace='parent_engagement')),
     path('api/v1/family/', include('apps.family.urls', namespace='family')),
     path('api/v1/payments/', include('apps.payments.urls', namespace='payments')),
+    path('api/v1/offline/', include('apps.offline.urls', namespace='offline')),
 ]
 
 # Debug toolbar (development only)
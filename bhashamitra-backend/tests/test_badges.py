@@ -0,0 +1,76 @@
+"""Tests for incremental badge awarding."""
+import pytest
+
+from apps.gamification.models import Badge, BadgeCounter, ChildBadge
+from apps.gamification.services.badges import BadgeService
+from apps.progress.models import DailyActivity, Progress
+from apps.progress.services import ProgressService
+
+
+def _badge(criteria_type, value, **kwargs):
+    return Badge.objects.create(
+        name=f"{criteria_type} {value}", description='', icon='star',
+        criteria_type=criteria_type, criteria_value=value, **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestBadgeService:
+    """Test counters and threshold lookups."""
+
+    def test_counter_seeded_from_history_then_incremented(self, child, story):
+        """Test the first increment counts existing rows instead of adding to zero."""
+        Progress.objects.create(child=child, story=story, status=Progress.Status.COMPLETED)
+        _badge(Badge.CriteriaType.STORIES_COMPLETED, 2)
+
+        assert BadgeService.record(child, increments={Badge.CriteriaType.STORIES_COMPLETED: 1}) == []
+        counter = BadgeCounter.objects.get(child=child, criteria_type=Badge.CriteriaType.STORIES_COMPLETED)
+        assert counter.value == 1
+
+        new_badges = BadgeService.record(child, increments={Badge.CriteriaType.STORIES_COMPLETED: 1})
+        assert [b.badge.criteria_value for b in new_badges] == [2]
+
+    def test_only_changed_criteria_are_checked(self, child, django_assert_max_num_queries):
+        """Test unrelated badges aren't awarded and the check stays a few queries."""
+        for value in range(1, 30):
+            _badge(Badge.CriteriaType.STREAK_DAYS, value)
+        _badge(Badge.CriteriaType.POINTS_EARNED, 100, points_bonus=25)
+        child.total_points = 150
+        child.save()
+
+        # One badge lookup; the rest is the single award and its ledger entry
+        with django_assert_max_num_queries(10):
+            new_badges = BadgeService.record(
+                child, values={Badge.CriteriaType.POINTS_EARNED: child.total_points}
+            )
+
+        assert [b.badge.criteria_type for b in new_badges] == [Badge.CriteriaType.POINTS_EARNED]
+        assert ChildBadge.objects.filter(child=child).count() == 1
+        child.refresh_from_db()
+        assert child.total_points == 175
+
+    def test_time_counter_compares_minutes(self, child):
+        """Test time increments are seconds against minute thresholds."""
+        _badge(Badge.CriteriaType.TIME_SPENT_MINUTES, 2)
+        BadgeCounter.objects.create(child=child, criteria_type=Badge.CriteriaType.TIME_SPENT_MINUTES, value=60)
+
+        assert BadgeService.record(child, increments={Badge.CriteriaType.TIME_SPENT_MINUTES: 59}) == []
+        assert len(BadgeService.record(child, increments={Badge.CriteriaType.TIME_SPENT_MINUTES: 1})) == 1
+
+    def test_recompleting_story_does_not_count_twice(self, child, story):
+        """Test completing the same story again leaves the counter and points alone."""
+        _badge(Badge.CriteriaType.STORIES_COMPLETED, 2)
+        progress = ProgressService.start_story(child, story)
+
+        first = ProgressService.complete_story(progress)
+        child.refresh_from_db()
+        points_after_first = child.total_points
+        second = ProgressService.complete_story(progress)
+
+        counter = BadgeCounter.objects.get(child=child, criteria_type=Badge.CriteriaType.STORIES_COMPLETED)
+        assert counter.value == 1
+        assert first['new_badges'] == second['new_badges'] == []
+        assert second['points_awarded'] == 0
+        child.refresh_from_db()
+        assert child.total_points == points_after_first
+        assert DailyActivity.objects.get(child=child).stories_completed == 1
@@ -0,0 +1,50 @@
+"""Tests for the cache_response decorator."""
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+@pytest.mark.django_db
+class TestCacheResponse:
+    """Test response caching on the story list view."""
+
+    url = '/api/v1/stories/?language=HINDI'
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_second_request_served_from_cache(self, auth_client, story):
+        """Test the rendered response is cached and replayed byte-for-byte."""
+        first = auth_client.get(self.url)
+        second = auth_client.get(self.url)
+
+        assert first['X-Cache'] == 'MISS'
+        assert second['X-Cache'] == 'HIT'
+        assert second.status_code == status.HTTP_200_OK
+        assert second.content == first.content
+        assert second['Content-Type'] == first['Content-Type']
+
+    def test_matching_etag_returns_304(self, auth_client, story):
+        """Test conditional GETs are answered without a body."""
+        etag = auth_client.get(self.url)['ETag']
+
+        response = auth_client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b''
+
+    def test_entries_are_per_user(self, auth_client, story, django_user_model):
+        """Test another user's request does not reuse the cached entry."""
+        auth_client.get(self.url)
+
+        other = django_user_model.objects.create_user(
+            username='other@example.com', email='other@example.com', password='testpass123'
+        )
+        other_client = APIClient()
+        other_client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(other).access_token}'
+        )
+
+        assert other_client.get(self.url)['X-Cache'] == 'MISS'
@@ -0,0 +1,83 @@
+"""Tests for game analytics."""
+import pytest
+from django.core.cache import cache
+
+from apps.curriculum.models.games import Game, GameSession
+from apps.curriculum.services import GameAnalyticsService, GameService
+
+
+def _game(name, language='HINDI'):
+    return Game.objects.create(
+        name=name, description='', instructions='', game_type='MEMORY',
+        skill_focus='VOCABULARY', language=language, level=1,
+    )
+
+
+@pytest.mark.django_db
+class TestGameAnalytics:
+    """Test aggregate stats and incremental cache updates."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_stats_from_grouped_query(self, child, django_assert_num_queries):
+        """Test totals and favourite game without loading sessions."""
+        memory, quiz = _game('Memory'), _game('Quiz', language='TAMIL')
+        for _ in range(3):
+            GameSession.objects.create(
+                child=child, game=memory, score=10, questions_attempted=4,
+                questions_correct=3, time_taken_seconds=60, completed=True, points_earned=30,
+            )
+        GameSession.objects.create(child=child, game=quiz, score=20, questions_attempted=4)
+
+        with django_assert_num_queries(1):
+            stats = GameAnalyticsService.get_child_stats(str(child.id))
+
+        assert stats == {
+            'total_games_played': 4,
+            'total_points_earned': 90,
+            'total_time_seconds': 180,
+            'average_score': 12.5,
+            'average_accuracy': 56.2,
+            'completion_rate': 75.0,
+            'favorite_game': 'Memory',
+        }
+        assert GameAnalyticsService.get_child_stats(str(child.id), 'TAMIL')['favorite_game'] == 'Quiz'
+
+    def test_sessions_invalidate_cached_stats(self, child, django_capture_on_commit_callbacks, django_assert_num_queries):
+        """Test start, submit and delete each make the next read recompute."""
+        game = _game('Memory')
+        assert GameService.get_child_game_stats(str(child.id))['total_games_played'] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            session = GameService.start_game_session(child, game)
+        with django_capture_on_commit_callbacks(execute=True):
+            GameService.submit_game_session(
+                session, score=40, questions_attempted=5, questions_correct=4,
+                time_taken_seconds=90, completed=True,
+            )
+
+        stats = GameService.get_child_game_stats(str(child.id))
+        assert stats['total_games_played'] == 1
+        assert stats['total_points_earned'] == 4 * game.points_per_correct + game.bonus_completion
+        assert stats['average_accuracy'] == 80.0
+        assert stats['favorite_game'] == 'Memory'
+        with django_assert_num_queries(0):
+            assert GameService.get_child_game_stats(str(child.id)) == stats
+
+        with django_capture_on_commit_callbacks(execute=True):
+            session.delete()
+        assert GameService.get_child_game_stats(str(child.id))['total_games_played'] == 0
+
+    def test_cold_read_between_commit_and_callback(self, child, django_capture_on_commit_callbacks):
+        """Test a read that caches the new session before invalidation doesn't count it twice."""
+        game = _game('Memory')
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            GameService.start_game_session(child, game)
+        # Cold cache: this read already sees the committed session
+        assert GameService.get_child_game_stats(str(child.id))['total_games_played'] == 1
+
+        for callback in callbacks:
+            callback()
+        assert GameService.get_child_game_stats(str(child.id))['total_games_played'] == 1
@@ -0,0 +1,62 @@
+"""Tests for the in-process LocalCache tier."""
+from django.core.cache import cache
+
+from apps.core.cache_service import CurriculumCacheService
+from apps.core.local_cache import LocalCache, clear_local_caches
+
+
+class TestLocalCache:
+    """Test byte-bounded LRU and version invalidation."""
+
+    def setup_method(self):
+        cache.clear()
+        clear_local_caches()
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test the byte budget evicts the coldest entry and skips oversize values."""
+        tier = LocalCache('test:lru', max_bytes=25, max_item_bytes=20)
+        tier.set('a', b'x' * 10)
+        tier.set('b', b'x' * 10)
+        tier.get('a')
+        tier.set('c', b'x' * 10)
+
+        assert tier.get('b') is None
+        assert tier.get('a') == b'x' * 10
+        assert tier.set('huge', b'x' * 25) is False
+        assert tier.stats()['evictions'] == 1
+
+    def test_invalidation_reaches_other_workers(self):
+        """Test a version bump from one worker drops another worker's copy."""
+        worker_a = LocalCache('test:worker-a', max_bytes=1024, version_check_interval=0)
+        worker_b = LocalCache('test:worker-b', max_bytes=1024, version_check_interval=0)
+        # Same shared version stamp, as two processes with the same tier would have
+        worker_b._version_key = worker_a._version_key
+
+        worker_b.set('themes', ['animals'], scope='HINDI')
+        worker_a.invalidate('HINDI')
+
+        assert worker_b.get('themes', scope='HINDI') is None
+        assert worker_b.stats()['stale'] == 1
+
+    def test_evicted_stamp_does_not_revalidate_old_entries(self):
+        """Test a version stamp lost from Redis comes back above any earlier value."""
+        worker_a = LocalCache('test:worker-a', max_bytes=1024, version_check_interval=0)
+        worker_b = LocalCache('test:worker-b', max_bytes=1024, version_check_interval=0)
+        worker_b._version_key = worker_a._version_key
+
+        worker_a.invalidate('HINDI')
+        worker_b.set('themes', ['old'], scope='HINDI')
+        cache.delete(worker_a._version_key('HINDI'))  # evicted
+        worker_a.invalidate('HINDI')  # must not land back on the old stamp
+
+        assert worker_b.get('themes', scope='HINDI') is None
+
+    def test_curriculum_reads_skip_redis_until_invalidated(self):
+        """Test curriculum lists are served from memory and cleared per language."""
+        CurriculumCacheService.set_vocab_themes('HINDI', [{'name': 'Animals'}])
+        cache.clear()  # memory tier still has it
+
+        assert CurriculumCacheService.get_vocab_themes('HINDI') == [{'name': 'Animals'}]
+
+        CurriculumCacheService.invalidate_language('HINDI')
+        assert CurriculumCacheService.get_vocab_themes('HINDI') is None
@@ -0,0 +1,103 @@
+"""Tests for building content-addressed offline packages."""
+import io
+import json
+import zipfile
+
+import pytest
+from django.core.files.storage import default_storage
+
+from apps.offline.models import OfflinePackage
+from apps.offline.services import OfflinePackageBuilder
+
+
+def _read_zip(path):
+    with default_storage.open(path, 'rb') as f:
+        return zipfile.ZipFile(io.BytesIO(f.read()))
+
+
+@pytest.mark.django_db
+class TestOfflinePackageBuilder:
+    """Test bundles, versioning and deltas."""
+
+    @pytest.fixture(autouse=True)
+    def media_root(self, tmp_path, settings):
+        settings.MEDIA_ROOT = str(tmp_path)
+
+    def test_bundle_is_content_addressed(self, letter, vocabulary_word, story_with_pages):
+        """Test the manifest lists every file by chunk hash and the bundle holds the chunks."""
+        package, created = OfflinePackageBuilder.build('HINDI')
+
+        assert created
+        assert package.version == '1.0.0'
+        files = package.content_manifest['files']
+        assert {'letters.json', f"stories/{story_with_pages.id}.json", 'audio/index.json'} <= set(files)
+
+        bundle = _read_zip(package.bundle_path)
+        assert json.loads(bundle.read('manifest.json'))['content_hash'] == package.content_hash
+        story_file = files[f"stories/{story_with_pages.id}.json"]
+        data = b''.join(bundle.read(f"chunks/{chunk}") for chunk in story_file['chunks'])
+        assert len(json.loads(data)['pages']) == 5
+
+    def test_unchanged_content_keeps_version(self, story_with_pages):
+        """Test rebuilding identical content does not cut a new version."""
+        first, _ = OfflinePackageBuilder.build('HINDI')
+        again, created = OfflinePackageBuilder.build('HINDI')
+
+        assert not created
+        assert again.pk == first.pk
+
+    def test_delta_carries_only_changed_chunks(self, story_with_pages):
+        """Test a content edit produces a delta with just the new chunks."""
+        first, _ = OfflinePackageBuilder.build('HINDI')
+        page = story_with_pages.pages.first()
+        page.text_content = 'नया पाठ'
+        page.save()
+
+        second, created = OfflinePackageBuilder.build('HINDI')
+
+        assert created
+        assert second.version == '1.0.1'
+        assert not OfflinePackage.objects.get(pk=first.pk).is_active
+        delta = second.deltas['1.0.0']
+        delta_zip = _read_zip(delta['path'])
+        chunk_names = [name for name in delta_zip.namelist() if name.startswith('chunks/')]
+        # The edited story document and the audio index text set changed
+        assert 0 < len(chunk_names) < len(OfflinePackageBuilder._manifest_chunks(second.content_manifest))
+        assert json.loads(delta_zip.read('delta.json'))['from_version'] == '1.0.0'
+
+
+@pytest.mark.django_db
+class TestOfflinePackageDownload:
+    """Test the download endpoint picks delta or full bundle."""
+
+    def test_download_delta_then_not_modified(self, auth_client, user, story_with_pages, tmp_path, settings):
+        settings.MEDIA_ROOT = str(tmp_path)
+        user.subscription_tier = 'PREMIUM'
+        user.save()
+        OfflinePackageBuilder.build('HINDI')
+        story_with_pages.title = 'Changed title'
+        story_with_pages.save()
+        package, _ = OfflinePackageBuilder.build('HINDI')
+
+        url = f"/api/v1/offline/packages/{package.id}/download/"
+        response = auth_client.get(url, {'from_version': '1.0.0'})
+        assert response.status_code == 200
+        assert response['X-Bundle-Type'] == 'delta'
+
+        response = auth_client.get(url, {'from_version': '1.0.0'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        assert response.status_code == 304
+
+    def test_free_user_only_gets_free_tier(self, auth_client, story_with_pages, tmp_path, settings):
+        """Test FREE users can't list or download the full language pack."""
+        settings.MEDIA_ROOT = str(tmp_path)
+        language_pack, _ = OfflinePackageBuilder.build('HINDI')
+        free_pack, _ = OfflinePackageBuilder.build('HINDI', OfflinePackage.PackageType.FREE_TIER)
+
+        response = auth_client.get('/api/v1/offline/packages/')
+        assert [p['id'] for p in response.data['data']] == [str(free_pack.id)]
+
+        response = auth_client.get(f"/api/v1/offline/packages/{language_pack.id}/download/")
+        assert response.status_code == 404
+        response = auth_client.get(f"/api/v1/offline/packages/{free_pack.id}/download/")
+        assert response.status_code == 200
+        assert response['Cache-Control'].startswith('private')
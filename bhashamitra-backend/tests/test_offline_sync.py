@@ -0,0 +1,84 @@
+"""Tests for bulk offline progress sync."""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.curriculum.models import WordProgress
+from apps.gamification.models import Streak
+from apps.progress.models import DailyActivity, Progress
+
+SYNC_URL = '/api/v1/offline/children/{}/sync/'
+
+
+def _events(story, word):
+    now = timezone.now()
+    yesterday = now - timedelta(days=1)
+    return [
+        {'idempotency_key': 'e1', 'type': 'STORY_PAGE', 'occurred_at': yesterday.isoformat(),
+         'story_id': str(story.id), 'current_page': 3, 'time_spent_seconds': 60},
+        {'idempotency_key': 'e2', 'type': 'STORY_COMPLETE', 'occurred_at': now.isoformat(),
+         'story_id': str(story.id), 'time_spent_seconds': 30},
+        {'idempotency_key': 'e3', 'type': 'WORD_REVIEW', 'occurred_at': now.isoformat(),
+         'word_id': str(word.id), 'quality': 5},
+        {'idempotency_key': 'e4', 'type': 'WORD_REVIEW', 'occurred_at': now.isoformat(),
+         'word_id': str(word.id), 'quality': 4},
+    ]
+
+
+@pytest.mark.django_db
+class TestOfflineSync:
+    """Test batched, idempotent application of offline events."""
+
+    def test_batch_applies_progress_once(self, auth_client, child, story, vocabulary_word):
+        """Test a day of events lands in one request with derived totals."""
+        response = auth_client.post(
+            SYNC_URL.format(child.id), {'events': _events(story, vocabulary_word)}, format='json'
+        )
+
+        assert response.status_code == 200
+        data = response.data['data']
+        assert data['accepted'] == 4
+        assert data['cursor']
+        # Start 10 + 3 pages 15 + remaining 2 pages 10 + completion 50
+        assert data['points_awarded'] == 85
+        child.refresh_from_db()
+        assert child.total_points == 85
+
+        progress = Progress.objects.get(child=child, story=story)
+        assert progress.status == Progress.Status.COMPLETED
+        assert progress.time_spent_seconds == 90
+        assert WordProgress.objects.get(child=child, word=vocabulary_word).times_reviewed == 2
+        assert DailyActivity.objects.filter(child=child).count() == 2
+        assert Streak.objects.get(child=child).current_streak == 2
+
+    def test_retried_upload_is_not_double_counted(self, auth_client, child, story, vocabulary_word):
+        """Test resending the same keys reports duplicates and changes nothing."""
+        events = _events(story, vocabulary_word)
+        auth_client.post(SYNC_URL.format(child.id), {'events': events}, format='json')
+
+        response = auth_client.post(
+            SYNC_URL.format(child.id), {'events': events + [dict(events[0])]}, format='json'
+        )
+
+        data = response.data['data']
+        assert data['accepted'] == 0
+        assert sorted(data['duplicates']) == ['e1', 'e1', 'e2', 'e3', 'e4']
+        child.refresh_from_db()
+        assert child.total_points == 85
+
+    def test_invalid_events_are_rejected_individually(self, auth_client, child, story):
+        """Test a bad event doesn't block the rest of the batch."""
+        events = [
+            {'idempotency_key': 'ok', 'type': 'STORY_PAGE', 'occurred_at': timezone.now().isoformat(),
+             'story_id': str(story.id), 'current_page': 1},
+            {'idempotency_key': 'missing', 'type': 'STORY_PAGE', 'occurred_at': timezone.now().isoformat(),
+             'story_id': '00000000-0000-0000-0000-000000000000', 'current_page': 1},
+            {'idempotency_key': 'bad-type', 'type': 'DANCE', 'occurred_at': timezone.now().isoformat()},
+        ]
+
+        response = auth_client.post(SYNC_URL.format(child.id), {'events': events}, format='json')
+
+        data = response.data['data']
+        assert data['accepted'] == 1
+        assert {r['idempotency_key'] for r in data['rejected']} == {'missing', 'bad-type'}
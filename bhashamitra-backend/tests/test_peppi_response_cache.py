@@ -0,0 +1,100 @@
+"""Tests for the first-turn Peppi response cache."""
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from apps.peppi_chat.models import PeppiConversation
+from apps.peppi_chat.services import PeppiResponseCache
+from apps.peppi_chat.services.context_builder import ContextBuilder
+
+
+class TestNormalizeMessage:
+    """Test question normalization."""
+
+    def test_ignores_case_punctuation_and_spacing(self):
+        """Test trivially different phrasings share a key."""
+        assert (
+            PeppiResponseCache.normalize_message('What  is क?')
+            == PeppiResponseCache.normalize_message('what is क ।')
+        )
+
+
+class TestNameSubstitution:
+    """Test the child's name is swapped for the placeholder as a whole word only."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_short_name_inside_other_words(self):
+        """Test a short name isn't replaced inside longer words."""
+        PeppiResponseCache.set('peppi:response:test', 'An, Animals and Anar start with A!', 'An')
+        assert (
+            PeppiResponseCache.get('peppi:response:test', 'Ravi')
+            == 'Ravi, Animals and Anar start with A!'
+        )
+
+    def test_devanagari_name_prefix(self):
+        """Test a Devanagari name isn't replaced inside a longer name."""
+        PeppiResponseCache.set('peppi:response:test', 'रवि, रविन्द्र को नमस्ते!', 'रवि')
+        assert PeppiResponseCache.get('peppi:response:test', 'मीरा') == 'मीरा, रविन्द्र को नमस्ते!'
+
+
+@pytest.mark.django_db
+class TestCachedFirstTurn:
+    """Test cached replies through the send_message endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _ask(self, client, child, content, **extra):
+        conversation = PeppiConversation.objects.create(
+            child=child, mode='CURRICULUM_HELP', language='HINDI', messages_count=1
+        )
+        url = f'/api/v1/children/{child.id}/peppi-chat/{conversation.id}/messages/'
+        return client.post(url, {'content': content, **extra}, format='json')
+
+    def test_repeat_question_skips_model(self, auth_client, child):
+        """Test the second identical first turn is answered from cache with the name restored."""
+        reply = f'{child.name}, क से कबूतर!'
+        with mock.patch(
+            'apps.peppi_chat.views.GeminiAIService.generate_response_sync',
+            return_value=(reply, 10, 100),
+        ) as generate:
+            first = self._ask(auth_client, child, 'क क्या है?')
+            second = self._ask(auth_client, child, 'क क्या है')
+
+        assert generate.call_count == 1
+        assert 'cached' not in first.data
+        assert second.data['cached'] is True
+        assert second.data['assistant_message']['content_primary'] == reply
+
+    def test_personalized_turn_bypasses_cache(self, auth_client, child):
+        """Test the client can force a fresh model reply."""
+        with mock.patch(
+            'apps.peppi_chat.views.GeminiAIService.generate_response_sync',
+            return_value=('क से कबूतर!', 10, 100),
+        ) as generate:
+            self._ask(auth_client, child, 'क क्या है?')
+            self._ask(auth_client, child, 'क क्या है?', personalized=True)
+
+        assert generate.call_count == 2
+
+    def test_cacheable_prompt_leaves_out_child_progress(self, auth_client, child):
+        """Test a reply that will be shared isn't generated from this child's learning data."""
+        with mock.patch.object(
+            ContextBuilder, '_get_areas_to_improve', return_value='Practice these words: कमल'
+        ), mock.patch(
+            'apps.peppi_chat.views.GeminiAIService.generate_response_sync',
+            return_value=('क से कबूतर!', 10, 100),
+        ) as generate:
+            self._ask(auth_client, child, 'क क्या है?')
+            self._ask(auth_client, child, 'ख क्या है?', personalized=True)
+
+        shared_prompt = generate.call_args_list[0].kwargs['system_prompt']
+        personal_prompt = generate.call_args_list[1].kwargs['system_prompt']
+        assert 'कमल' not in shared_prompt
+        assert 'कमल' in personal_prompt
@@ -0,0 +1,54 @@
+"""Tests for streamed Peppi chat replies."""
+from unittest import mock
+
+import pytest
+
+from apps.peppi_chat.models import PeppiChatMessage, PeppiConversation
+from apps.peppi_chat.services import SentenceStreamModerator
+
+
+class TestSentenceStreamModerator:
+    """Test sentence-buffered output moderation."""
+
+    def test_releases_only_complete_sentences(self):
+        """Test text is held back until a sentence boundary arrives."""
+        moderator = SentenceStreamModerator()
+        assert moderator.feed('नमस्ते ') == []
+        assert moderator.feed('बच्चो! आज हम') == ['नमस्ते बच्चो! ']
+        assert moderator.feed(' पढ़ेंगे।') == ['आज हम पढ़ेंगे।']
+        assert moderator.flush() == []
+
+    def test_escalation_flag_is_stripped(self):
+        """Test the escalation marker never reaches the child."""
+        moderator = SentenceStreamModerator()
+        sent = moderator.feed('Please talk to a grown-up. [NEEDS_') + moderator.feed('ESCALATION]')
+        sent += moderator.flush()
+        assert '[NEEDS_ESCALATION]' not in ''.join(sent)
+        assert moderator.needs_escalation
+
+
+@pytest.mark.django_db
+class TestStreamMessage:
+    """Test the SSE endpoint over WSGI."""
+
+    def test_streams_sentences_and_saves_reply(self, auth_client, child):
+        """Test deltas arrive per sentence and the reply is persisted at the end."""
+        conversation = PeppiConversation.objects.create(
+            child=child, mode='CURRICULUM_HELP', language='HINDI'
+        )
+        url = f'/api/v1/children/{child.id}/peppi-chat/{conversation.id}/messages/stream/'
+
+        with mock.patch(
+            'apps.peppi_chat.views.GeminiAIService.build_conversation_contents', return_value=[]
+        ), mock.patch(
+            'apps.peppi_chat.views.GeminiAIService.stream_response_sync',
+            return_value=iter(['शाबाश! ', 'अब अगला ', 'अक्षर।']),
+        ):
+            response = auth_client.post(url, {'content': 'क क्या है?'}, format='json')
+            body = b''.join(response.streaming_content).decode()
+
+        assert response['Content-Type'] == 'text/event-stream'
+        assert body.index('event: start') < body.index('event: delta') < body.index('event: done')
+        assert body.count('event: delta') == 2
+        reply = PeppiChatMessage.objects.filter(conversation=conversation, role='assistant').get()
+        assert reply.content_primary == 'शाबाश! अब अगला अक्षर।'
@@ -0,0 +1,65 @@
+"""Tests for the points ledger."""
+import pytest
+
+from apps.children.models import Child
+from apps.gamification.models import PointsEvent
+from apps.gamification.services.points import PointsService
+
+
+@pytest.mark.django_db
+class TestPointsLedger:
+    """Test atomic awards and level thresholds."""
+
+    def test_stale_instances_do_not_lose_points(self, child):
+        """Test two copies of the same child both land their award."""
+        first = Child.objects.get(pk=child.pk)
+        second = Child.objects.get(pk=child.pk)
+
+        PointsService.award(first, 30, PointsService.Reason.PAGE_READ)
+        PointsService.award(second, 20, PointsService.Reason.VOICE_RECORDING)
+
+        child.refresh_from_db()
+        assert child.total_points == 50
+        assert second.total_points == 50
+        assert list(
+            PointsEvent.objects.filter(child=child).order_by('created_at').values_list('points', flat=True)
+        ) == [30, 20]
+
+    def test_level_follows_thresholds(self, child, settings):
+        """Test the award raises the level in the same update."""
+        settings.LEVEL_THRESHOLDS = {1: 0, 2: 100, 3: 500}
+
+        result = PointsService.award(child, 120, PointsService.Reason.STORY_COMPLETED)
+
+        assert result['level_up'] == {'leveled_up': True, 'old_level': 1, 'new_level': 2}
+        assert Child.objects.get(pk=child.pk).level == 2
+
+    def test_level_never_drops(self, child, settings):
+        """Test a child promoted by assessment keeps their level."""
+        settings.LEVEL_THRESHOLDS = {1: 0, 2: 100, 3: 500}
+        Child.objects.filter(pk=child.pk).update(level=3)
+        child.refresh_from_db()
+
+        assert not PointsService.award(child, 10)['level_up']['leveled_up']
+        assert child.level == 3
+
+    def test_level_up_assessment_promotes_once(self, child, settings):
+        """Test a LEVEL_UP pass whose points cross a threshold promotes one level, not two."""
+        from apps.curriculum.models import Assessment, AssessmentQuestion
+        from apps.curriculum.services import AssessmentService
+
+        settings.LEVEL_THRESHOLDS = {1: 0, 2: 10, 3: 500}
+        assessment = Assessment.objects.create(
+            name='Level 1', description='', assessment_type='LEVEL_UP', language='HINDI',
+            level=1, questions_count=1, randomize_questions=False,
+        )
+        question = AssessmentQuestion.objects.create(
+            assessment=assessment, question_type='MC', skill_tested='VOCABULARY',
+            question_text='क?', correct_answer='ka', points=40,
+        )
+        attempt = AssessmentService.start_assessment(child, assessment)
+
+        result = AssessmentService.submit_assessment(attempt, {str(question.id): 'ka'})
+
+        assert result['passed']
+        assert Child.objects.get(pk=child.pk).level == 2
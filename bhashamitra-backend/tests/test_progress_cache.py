@@ -0,0 +1,43 @@
+"""Tests for generation-stamped progress and homepage caches."""
+import pytest
+from django.core.cache import cache
+
+from apps.core.cache_service import HomepageCacheService, ProgressCacheService
+from apps.curriculum.services.srs_service import SRSService
+
+
+@pytest.mark.django_db
+class TestChildCacheGeneration:
+    """Test per-child O(1) invalidation."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_invalidation_clears_every_key_for_child(self, child, django_capture_on_commit_callbacks):
+        """Test one bump orphans summary, SRS and homepage entries."""
+        ProgressCacheService.set_child_summary(child.id, {'stories': 1})
+        ProgressCacheService.set_srs_due(child.id, ['w1'], theme_id='t1')
+        HomepageCacheService.set_stats(child.id, 'HINDI', {'xp': 10})
+
+        with django_capture_on_commit_callbacks(execute=True):
+            HomepageCacheService.invalidate_child(child.id)
+
+        assert ProgressCacheService.get_child_summary(child.id) is None
+        assert ProgressCacheService.get_srs_due(child.id, theme_id='t1') is None
+        assert HomepageCacheService.get_stats(child.id, 'HINDI') is None
+
+    def test_record_review_invalidates(self, child, vocabulary_word, django_capture_on_commit_callbacks):
+        """Test an SRS review bumps the child's generation after commit."""
+        ProgressCacheService.set_srs_due(child.id, ['stale'])
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SRSService.record_review(child.id, vocabulary_word.id, quality=4)
+
+        assert ProgressCacheService.get_srs_due(child.id) is None
+
+    def test_evicted_counter_does_not_revive_old_entries(self, child):
+        """Test a lost counter restarts above its previous value."""
+        ProgressCacheService.set_child_summary(child.id, {'stories': 1})
+        cache.delete(f"gen:child:{child.id}")
+
+        assert ProgressCacheService.get_child_summary(child.id) is None
@@ -0,0 +1,72 @@
+"""Tests for provider circuit breakers and pooled sessions."""
+import time
+from unittest import mock
+
+import pytest
+import requests
+from django.core.cache import cache
+
+from apps.core.provider_http import CircuitBreaker, provider_request, provider_session
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestCircuitBreaker:
+    """Test closed → open → half-open → closed transitions."""
+
+    def test_opens_after_threshold_and_probes_once(self):
+        """Test the breaker skips a failing provider, then lets one probe through."""
+        breaker = CircuitBreaker('test_provider', failure_threshold=3, recovery_timeout=30)
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == 'open'
+        assert not breaker.allow_request()
+
+        # Jump past recovery_timeout, but not past the marker's cache TTL
+        with mock.patch('time.time', return_value=time.time() + 45):
+            assert breaker.state == 'half_open'
+            assert breaker.allow_request()
+            assert not breaker.allow_request()
+            breaker.record_success()
+
+        assert breaker.state == 'closed'
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self):
+        """Test a failing half-open probe opens the breaker again."""
+        breaker = CircuitBreaker('test_provider', failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure()
+        with mock.patch('time.time', return_value=time.time() + 45):
+            assert breaker.allow_request()
+            breaker.record_failure()
+            assert breaker.state == 'open'
+
+
+class TestProviderRequest:
+    """Test outcome recording through the pooled session."""
+
+    def test_server_errors_count_but_client_errors_do_not(self):
+        """Test only 5xx/transport errors trip the breaker."""
+        breaker = CircuitBreaker.get('outcome_test')
+        session = provider_session('outcome_test')
+        with mock.patch.object(session, 'request', return_value=mock.Mock(status_code=400)):
+            for _ in range(breaker.failure_threshold):
+                provider_request('outcome_test', 'POST', 'https://example.com')
+        assert breaker.state == 'closed'
+
+        with mock.patch.object(session, 'request', side_effect=requests.ConnectionError):
+            for _ in range(breaker.failure_threshold):
+                with pytest.raises(requests.ConnectionError):
+                    provider_request('outcome_test', 'POST', 'https://example.com')
+        assert breaker.state == 'open'
+
+    def test_session_is_reused(self):
+        """Test one keep-alive session per provider."""
+        assert provider_session('google_tts') is provider_session('google_tts')
+        assert provider_session('google_tts') is not provider_session('google_stt')
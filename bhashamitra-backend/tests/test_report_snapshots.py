@@ -0,0 +1,105 @@
+"""Tests for report card snapshots."""
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.gamification.services.points import PointsService
+from apps.progress.models import DailyProgress, ReportSnapshot
+from apps.progress.snapshot_service import ReportSnapshotService
+
+
+@pytest.fixture
+def active_child(child):
+    DailyProgress.objects.create(
+        child=child, date=timezone.now().date(), time_spent_minutes=20, points_earned=15,
+    )
+    return child
+
+
+@pytest.mark.django_db
+class TestReportSnapshots:
+    """Test snapshot freshness and regeneration."""
+
+    def test_report_card_served_from_snapshot(
+        self, auth_client, active_child, django_assert_max_num_queries
+    ):
+        """Test the second request is a snapshot read, not a rebuild."""
+        url = f'/api/v1/parent/children/{active_child.id}/report-card/'
+        first = auth_client.get(url)
+        assert first.status_code == 200
+        assert first.data['snapshot']['stale'] is False
+
+        with django_assert_max_num_queries(4):
+            second = auth_client.get(url)
+
+        assert second.data['overall_stats'] == first.data['overall_stats']
+        assert second.data['snapshot']['generated_at'] == first.data['snapshot']['generated_at']
+
+    def test_activity_marks_snapshot_stale(self, active_child, django_capture_on_commit_callbacks):
+        """Test a points award invalidates and the next read rebuilds."""
+        kind = ReportSnapshotService.ReportType.MONTHLY
+        ReportSnapshotService.get(active_child, kind, 3)
+        snapshot = ReportSnapshot.objects.get(child=active_child, report_type=kind, period=3)
+        assert ReportSnapshotService.is_fresh(snapshot)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            PointsService.award(active_child, 10)
+        assert not ReportSnapshotService.is_fresh(snapshot)
+
+        report = ReportSnapshotService.get(active_child, kind, 3)
+        assert report['snapshot']['stale'] is False
+        assert report['months'][0]['days_active'] == 1
+
+    def test_writes_without_points_mark_snapshot_stale(self, active_child, django_capture_on_commit_callbacks):
+        """Test zero-point awards, DailyProgress days and game sessions all invalidate."""
+        from apps.curriculum.models.games import Game, GameSession
+        from apps.progress.rollup_service import ActivityRollupService
+
+        kind = ReportSnapshotService.ReportType.MONTHLY
+        game = Game.objects.create(
+            name='Memory', description='', instructions='', game_type='MEMORY',
+            skill_focus='VOCABULARY', language='HINDI', level=1,
+        )
+        daily = DailyProgress.objects.get(child=active_child)
+        writes = [
+            lambda: PointsService.award(active_child, 0),
+            lambda: ActivityRollupService.record_day(daily),
+            lambda: GameSession.objects.create(child=active_child, game=game),
+        ]
+        for write in writes:
+            ReportSnapshotService.get(active_child, kind, 3)
+            snapshot = ReportSnapshot.objects.get(child=active_child, report_type=kind, period=3)
+            assert ReportSnapshotService.is_fresh(snapshot)
+
+            with django_capture_on_commit_callbacks(execute=True):
+                write()
+            assert not ReportSnapshotService.is_fresh(snapshot)
+
+    def test_concurrent_rebuild_serves_stale_copy(self, active_child):
+        """Test a request that loses the rebuild race gets the old snapshot."""
+        kind = ReportSnapshotService.ReportType.COMPREHENSIVE
+        ReportSnapshotService.get(active_child, kind, 30)
+        ReportSnapshot.objects.filter(child=active_child).update(
+            generated_at=timezone.now() - timedelta(days=1)
+        )
+        flight_key = f'report:{active_child.id}:{kind}:30'
+        from apps.core.single_flight import SingleFlight
+        leader = SingleFlight(flight_key)
+        assert leader.acquire()
+        try:
+            report = ReportSnapshotService.get(active_child, kind, 30)
+        finally:
+            leader.release()
+
+        assert report['snapshot']['stale'] is True
+
+    def test_batch_command_builds_defaults(self, active_child):
+        """Test the batch command builds default reports for active children."""
+        call_command('refresh_report_snapshots', '--chunk-size', '1')
+
+        assert set(ReportSnapshot.objects.filter(child=active_child).values_list('report_type', 'period')) == {
+            ('COMPREHENSIVE', 30), ('MONTHLY', 3),
+        }
+        assert ReportSnapshotService.refresh_stale(active_child) == 0
@@ -0,0 +1,63 @@
+"""Tests for the single-flight cache lock."""
+import threading
+
+from django.core.cache import cache
+
+from apps.core.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test request coalescing with SingleFlight."""
+
+    def setup_method(self):
+        cache.clear()
+
+    def test_leader_computes_and_releases_lock(self):
+        """Test the first caller computes and frees the lock afterwards."""
+        flight = SingleFlight('test:leader')
+        result = flight.run(compute=lambda: 'value', fetch=lambda: None)
+        assert result == 'value'
+        assert not flight.is_locked()
+
+    def test_follower_reuses_leader_result(self):
+        """Test concurrent callers share one computation."""
+        calls = []
+        follower_waiting = threading.Event()
+
+        def compute():
+            calls.append(1)
+            follower_waiting.wait(timeout=5)
+            cache.set('test:result', 'audio')
+            return 'audio'
+
+        def fetch():
+            follower_waiting.set()
+            return cache.get('test:result')
+
+        leader_flight = SingleFlight('test:shared')
+        assert leader_flight.acquire()
+
+        results = []
+        follower = threading.Thread(
+            target=lambda: results.append(
+                SingleFlight('test:shared', poll_interval=0.01).run(compute, fetch)
+            )
+        )
+        follower.start()
+        try:
+            results.append(compute())
+        finally:
+            leader_flight.release()
+        follower.join()
+
+        assert results == ['audio', 'audio']
+        assert len(calls) == 1
+
+    def test_follower_computes_after_timeout(self):
+        """Test a follower falls back to computing when the leader is stuck."""
+        held = SingleFlight('test:stuck')
+        assert held.acquire()
+
+        flight = SingleFlight('test:stuck', wait_timeout=0.05, poll_interval=0.01)
+        assert flight.run(compute=lambda: 'local', fetch=lambda: None) == 'local'
+        held.release()